@@ -0,0 +1,277 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from array import array
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from pydantic.v1 import BaseModel
+
+from airbyte_cdk.destinations.vector_db_based.config import ProcessingConfigModel
+from airbyte_cdk.destinations.vector_db_based.document_processor import METADATA_RECORD_ID_FIELD, Chunk
+from airbyte_cdk.destinations.vector_db_based.embedder import Document, Embedder
+from airbyte_cdk.destinations.vector_db_based.indexer import Indexer
+from airbyte_cdk.destinations.vector_db_based.writer import Writer
+from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog, DestinationSyncMode
+
+
+logger = logging.getLogger("airbyte")
+
+CACHED_EMBEDDING_MODES = {"openai", "azure_openai", "cohere", "openai_compatible"}
+"""
+The embedding modes calling an embedding API. The embeddings of the other modes are taken from the records
+or are not computed at all, caching them would not save anything.
+"""
+
+# SQLite limits the number of the parameters of a statement
+_MAX_PARAMETERS = 500
+
+
+def config_key(config: BaseModel) -> str:
+    """Hash of the configuration without the secrets, so a new API key does not invalidate the cache"""
+
+    def public_values(value: Any) -> Any:
+        if isinstance(value, BaseModel):
+            return {
+                name: public_values(getattr(value, name))
+                for name, field in value.__fields__.items()
+                if not field.field_info.extra.get("airbyte_secret")
+            }
+        if isinstance(value, list):
+            return [public_values(item) for item in value]
+        return value
+
+    return hashlib.sha256(json.dumps(public_values(config), sort_keys=True, default=str).encode()).hexdigest()
+
+
+def text_key(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Embeddings of the chunks written by the previous syncs, keyed by the embedding model and the hash of the chunk text,
+    stored in a local SQLite file. The embeddings are stored as float32, the precision of the vectors in the vector stores.
+    The least recently used embeddings are dropped once there are more than `max_entries` of them.
+
+    The file also keeps a fingerprint of the chunks of each record written to a deduplicated stream,
+    so the records which did not change since the previous sync can be skipped altogether.
+    """
+
+    def __init__(self, path: str, max_entries: int):
+        self.max_entries = max_entries
+        self._connection = sqlite3.connect(path, isolation_level=None)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (model TEXT, text_hash TEXT, embedding BLOB, used_at REAL, PRIMARY KEY (model, text_hash))"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS embeddings_used_at ON embeddings (used_at)")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS records "
+            "(destination TEXT, namespace TEXT, stream TEXT, record_id TEXT, fingerprint TEXT, PRIMARY KEY (destination, namespace, stream, record_id))"
+        )
+        (self._size,) = self._connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        self._prune()
+
+    def get_embeddings(self, model: str, text_hashes: Iterable[str]) -> Dict[str, List[float]]:
+        embeddings: Dict[str, List[float]] = {}
+        for batch in _batches(sorted(set(text_hashes))):
+            rows = self._connection.execute(
+                f"SELECT text_hash, embedding FROM embeddings WHERE model = ? AND text_hash IN ({', '.join('?' * len(batch))})",
+                (model, *batch),
+            ).fetchall()
+            for text_hash, embedding in rows:
+                embeddings[text_hash] = array("f", embedding).tolist()
+        if embeddings:
+            self._connection.executemany(
+                "UPDATE embeddings SET used_at = ? WHERE model = ? AND text_hash = ?",
+                [(time.time(), model, text_hash) for text_hash in embeddings],
+            )
+        return embeddings
+
+    def set_embeddings(self, model: str, embeddings: Mapping[str, List[float]]):
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?)",
+            [(model, text_hash, array("f", embedding).tobytes(), time.time()) for text_hash, embedding in embeddings.items()],
+        )
+        self._size += len(embeddings)
+        self._prune()
+
+    def get_fingerprints(self, destination: str, namespace: Optional[str], stream: str, record_ids: Iterable[str]) -> Dict[str, str]:
+        fingerprints: Dict[str, str] = {}
+        for batch in _batches(sorted(set(record_ids))):
+            rows = self._connection.execute(
+                "SELECT record_id, fingerprint FROM records "
+                f"WHERE destination = ? AND namespace = ? AND stream = ? AND record_id IN ({', '.join('?' * len(batch))})",
+                (destination, namespace or "", stream, *batch),
+            ).fetchall()
+            fingerprints.update(rows)
+        return fingerprints
+
+    def set_fingerprints(self, destination: str, fingerprints: Mapping[Tuple[Optional[str], str, str], Optional[str]]):
+        """Store the fingerprints of the written records, None for the deleted records"""
+        self._connection.executemany(
+            "DELETE FROM records WHERE destination = ? AND namespace = ? AND stream = ? AND record_id = ?",
+            [(destination, namespace or "", stream, record_id) for (namespace, stream, record_id) in fingerprints],
+        )
+        self._connection.executemany(
+            "INSERT INTO records VALUES (?, ?, ?, ?, ?)",
+            [
+                (destination, namespace or "", stream, record_id, fingerprint)
+                for (namespace, stream, record_id), fingerprint in fingerprints.items()
+                if fingerprint is not None
+            ],
+        )
+
+    def forget_stream(self, destination: str, namespace: Optional[str], stream: str):
+        self._connection.execute(
+            "DELETE FROM records WHERE destination = ? AND namespace = ? AND stream = ?", (destination, namespace or "", stream)
+        )
+
+    def _prune(self):
+        # INSERT OR REPLACE of a known embedding is counted as well, the size is only an upper bound until the next count
+        if self._size <= self.max_entries:
+            return
+        (self._size,) = self._connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        if self._size > self.max_entries:
+            self._connection.execute(
+                "DELETE FROM embeddings WHERE rowid IN (SELECT rowid FROM embeddings ORDER BY used_at LIMIT ?)",
+                (self._size - self.max_entries,),
+            )
+            self._size = self.max_entries
+
+
+def _batches(items: List[str]) -> Iterable[List[str]]:
+    for start in range(0, len(items), _MAX_PARAMETERS):
+        yield items[start : start + _MAX_PARAMETERS]
+
+
+class CachedEmbedder(Embedder):
+    """
+    Embedder which only sends the chunks missing from the cache to the wrapped embedder.
+    The chunks with the same text are embedded once.
+    """
+
+    def __init__(self, embedder: Embedder, cache: EmbeddingCache, model: str):
+        super().__init__()
+        self.embedder = embedder
+        self.cache = cache
+        self.model = model
+        self.hits = 0
+        self.misses = 0
+
+    def check(self) -> Optional[str]:
+        return self.embedder.check()
+
+    def embed_documents(self, documents: List[Document]) -> List[Optional[List[float]]]:
+        text_hashes = [text_key(document.page_content) for document in documents]
+        embeddings: Dict[str, Optional[List[float]]] = dict(self.cache.get_embeddings(self.model, text_hashes))
+        missing = {text_hash: document for text_hash, document in zip(text_hashes, documents) if text_hash not in embeddings}
+        self.hits += len(documents) - len(missing)
+        self.misses += len(missing)
+        if missing:
+            new_embeddings = dict(zip(missing, self.embedder.embed_documents(list(missing.values()))))
+            self.cache.set_embeddings(
+                self.model, {text_hash: embedding for text_hash, embedding in new_embeddings.items() if embedding is not None}
+            )
+            embeddings.update(new_embeddings)
+        return [embeddings[text_hash] for text_hash in text_hashes]
+
+    @property
+    def embedding_dimensions(self) -> int:
+        return self.embedder.embedding_dimensions
+
+
+class CachedWriter(Writer):
+    """
+    Writer embedding the chunks through the embedding cache.
+
+    With `skip_unchanged_records`, the records of the deduplicated streams whose chunks are the same as the chunks written
+    by a previous sync are neither deleted nor upserted again. This relies on the cache file: the chunks deleted from
+    the vector store by other means are not written again as long as the records do not change.
+    """
+
+    def __init__(
+        self,
+        processing_config: ProcessingConfigModel,
+        indexer: Indexer,
+        embedder: Embedder,
+        batch_size: int,
+        omit_raw_text: bool,
+        embedding_config: BaseModel,
+        indexing_config: BaseModel,
+        cache_path: str,
+        cache_max_entries: int,
+        skip_unchanged_records: bool = False,
+    ):
+        self.cache = EmbeddingCache(cache_path, max_entries=cache_max_entries)
+        model = config_key(embedding_config)
+        if getattr(embedding_config, "mode", None) in CACHED_EMBEDDING_MODES:
+            embedder = CachedEmbedder(embedder, self.cache, model)
+        super().__init__(processing_config, indexer, embedder, batch_size=batch_size, omit_raw_text=omit_raw_text)
+        self.skip_unchanged_records = skip_unchanged_records
+        self.destination = config_key(indexing_config)
+        # the stored chunks change with the embedding model and the processing too
+        self.fingerprint_salt = f"{model}\n{config_key(processing_config)}\n{omit_raw_text}"
+        self.skipped_records = 0
+
+    def write(self, configured_catalog: ConfiguredAirbyteCatalog, input_messages: Iterable[AirbyteMessage]) -> Iterable[AirbyteMessage]:
+        # the indexer deletes all chunks of the overwritten streams before the sync
+        for configured_stream in configured_catalog.streams:
+            if configured_stream.destination_sync_mode == DestinationSyncMode.overwrite:
+                self.cache.forget_stream(self.destination, configured_stream.stream.namespace, configured_stream.stream.name)
+        yield from super().write(configured_catalog, input_messages)
+        if isinstance(self.embedder, CachedEmbedder):
+            logger.info(
+                f"Embedding cache: {self.embedder.misses} chunks embedded, {self.embedder.hits} chunks not sent to the embedding API"
+            )
+        if self.skip_unchanged_records:
+            logger.info(f"Skipped {self.skipped_records} unchanged records")
+
+    def _process_batch(self) -> None:
+        fingerprints = self._skip_unchanged_records() if self.skip_unchanged_records else {}
+        super()._process_batch()
+        self.cache.set_fingerprints(self.destination, fingerprints)
+
+    def _skip_unchanged_records(self) -> Dict[Tuple[Optional[str], str, str], Optional[str]]:
+        """Drop the unchanged records from the batch, return the fingerprints of the records written by the batch"""
+        fingerprints: Dict[Tuple[Optional[str], str, str], Optional[str]] = {}
+        for (namespace, stream), ids in list(self.ids_to_delete.items()):
+            chunks_by_record: Dict[str, List[Chunk]] = defaultdict(list)
+            for chunk in self.chunks.get((namespace, stream), []):
+                chunks_by_record[chunk.metadata.get(METADATA_RECORD_ID_FIELD)].append(chunk)
+            stored_fingerprints = self.cache.get_fingerprints(self.destination, namespace, stream, ids)
+            unchanged = set()
+            for record_id in set(ids):
+                # records without chunks (e.g. deleted records) are always deleted
+                fingerprint = self._fingerprint(chunks_by_record[record_id]) if chunks_by_record.get(record_id) else None
+                if fingerprint is not None and stored_fingerprints.get(record_id) == fingerprint:
+                    unchanged.add(record_id)
+                else:
+                    fingerprints[(namespace, stream, record_id)] = fingerprint
+            if not unchanged:
+                continue
+            self.skipped_records += len(unchanged)
+            # the indexers are not called with empty lists, an empty delete might match all chunks
+            remaining_ids = [record_id for record_id in ids if record_id not in unchanged]
+            if remaining_ids:
+                self.ids_to_delete[(namespace, stream)] = remaining_ids
+            else:
+                del self.ids_to_delete[(namespace, stream)]
+            remaining_chunks = [
+                chunk for chunk in self.chunks[(namespace, stream)] if chunk.metadata.get(METADATA_RECORD_ID_FIELD) not in unchanged
+            ]
+            if remaining_chunks:
+                self.chunks[(namespace, stream)] = remaining_chunks
+            else:
+                del self.chunks[(namespace, stream)]
+        return fingerprints
+
+    def _fingerprint(self, chunks: List[Chunk]) -> str:
+        content = json.dumps([(chunk.page_content, chunk.metadata) for chunk in chunks], sort_keys=True, default=str)
+        return hashlib.sha256(f"{self.fingerprint_salt}\n{content}".encode()).hexdigest()
@@ -7,7 +7,8 @@ import os
 from multiprocessing import Process
 from typing import Optional
 
-from pymilvus import Collection, CollectionSchema, DataType, FieldSchema, connections, utility
+from pymilvus import Collection, CollectionSchema, DataType, FieldSchema, MilvusException, connections, utility
+from pymilvus.exceptions import ErrorCode
 
 from airbyte_cdk.destinations.vector_db_based.document_processor import METADATA_RECORD_ID_FIELD, METADATA_STREAM_FIELD
 from airbyte_cdk.destinations.vector_db_based.indexer import Indexer
@@ -19,6 +20,12 @@ from destination_milvus.config import MilvusIndexingConfigModel
 
 CLOUD_DEPLOYMENT_MODE = "cloud"
 
+DELETE_BATCH_SIZE = 1000
+"""Number of record ids in the expression of a single delete request, to keep the expressions below the size limit of Milvus"""
+
+UNSUPPORTED_DELETE_EXPRESSION_ERRORS = ("only support to delete by pk", "only pk in [1, 2] supported")
+"""The errors of Milvus before 2.3 for the delete expressions on other fields than the primary key, reported as unexpected errors"""
+
 
 class MilvusIndexer(Indexer):
     config: MilvusIndexingConfigModel
@@ -26,6 +33,7 @@ class MilvusIndexer(Indexer):
     def __init__(self, config: MilvusIndexingConfigModel, embedder_dimensions: int):
         super().__init__(config)
         self.embedder_dimensions = embedder_dimensions
+        self._deletes_by_expression = True
 
     def _connect(self):
         connections.connect(
@@ -140,7 +148,30 @@ class MilvusIndexer(Indexer):
         self._collection.insert(entities)
 
     def delete(self, delete_ids, namespace, stream):
-        if len(delete_ids) > 0:
-            id_list_expr = ", ".join([f'"{id}"' for id in delete_ids])
+        for start in range(0, len(delete_ids), DELETE_BATCH_SIZE):
+            id_list_expr = ", ".join([f'"{id}"' for id in delete_ids[start : start + DELETE_BATCH_SIZE]])
             id_expr = f"{METADATA_RECORD_ID_FIELD} in [{id_list_expr}]"
-            self._delete_for_filter(id_expr)
+            self._delete_for_expression(id_expr)
+
+    def _delete_for_expression(self, expr: str) -> None:
+        """
+        Milvus 2.3 resolves the primary keys of the entities matching the expression itself, so the entities are deleted with a single
+        request instead of querying their primary keys page by page first. Like the inserts, the deletes are applied asynchronously
+        in the order of their timestamps, the entities inserted later are not affected.
+        The older versions only delete by primary key, the primary keys are queried then. Any other error is raised.
+        """
+        if self._deletes_by_expression:
+            try:
+                self._collection.delete(expr=expr)
+                return
+            except MilvusException as e:
+                if not self._is_unsupported_delete_expression(e):
+                    raise
+                self._deletes_by_expression = False
+        self._delete_for_filter(expr)
+
+    @staticmethod
+    def _is_unsupported_delete_expression(error: MilvusException) -> bool:
+        return error.code == ErrorCode.UNEXPECTED_ERROR and any(
+            message in (error.message or "") for message in UNSUPPORTED_DELETE_EXPRESSION_ERRORS
+        )
@@ -95,6 +95,45 @@ class TestDestinationMilvus(unittest.TestCase):
         MockedWriter.assert_called_once_with(self.config_model.processing, mock_indexer, mock_embedder, batch_size=128, omit_raw_text=False)
         mock_writer.write.assert_called_once_with(configured_catalog, input_messages)
 
+    @patch("destination_milvus.destination.CachedWriter")
+    @patch("destination_milvus.destination.Writer")
+    @patch("destination_milvus.destination.MilvusIndexer")
+    @patch("destination_milvus.destination.create_from_config")
+    def test_write_with_embedding_cache(self, MockedEmbedder, MockedMilvusIndexer, MockedWriter, MockedCachedWriter):
+        mock_embedder = Mock()
+        mock_indexer = Mock()
+        MockedEmbedder.return_value = mock_embedder
+        MockedMilvusIndexer.return_value = mock_indexer
+        MockedCachedWriter.return_value.write.return_value = []
+        config = {**self.config, "embedding_cache_path": "/local/embedding_cache.sqlite"}
+
+        configured_catalog = MagicMock()
+        input_messages = []
+
+        destination = DestinationMilvus()
+        list(destination.write(config, configured_catalog, input_messages))
+
+        config_model = ConfigModel.parse_obj(config)
+        MockedCachedWriter.assert_called_once_with(
+            config_model.processing,
+            mock_indexer,
+            mock_embedder,
+            batch_size=128,
+            omit_raw_text=False,
+            embedding_config=config_model.embedding,
+            indexing_config=config_model.indexing,
+            cache_path="/local/embedding_cache.sqlite",
+            cache_max_entries=1_000_000,
+            skip_unchanged_records=False,
+        )
+        MockedCachedWriter.return_value.write.assert_called_once_with(configured_catalog, input_messages)
+        MockedWriter.assert_not_called()
+
+    def test_skip_unchanged_records_requires_embedding_cache(self):
+        with self.assertRaises(ValueError):
+            ConfigModel.parse_obj({**self.config, "skip_unchanged_records": True})
+        ConfigModel.parse_obj({**self.config, "skip_unchanged_records": True, "embedding_cache_path": "/local/embedding_cache.sqlite"})
+
     def test_spec(self):
         destination = DestinationMilvus()
         result = destination.spec()
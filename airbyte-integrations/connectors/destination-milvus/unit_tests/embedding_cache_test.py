@@ -0,0 +1,209 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+from functools import partial
+from itertools import count
+from unittest.mock import MagicMock, patch
+
+import pytest
+from destination_milvus.embedding_cache import CachedEmbedder, CachedWriter, EmbeddingCache, config_key
+from pydantic.v1 import BaseModel, Field
+
+from airbyte_cdk.destinations.vector_db_based.config import CohereEmbeddingConfigModel, OpenAIEmbeddingConfigModel, ProcessingConfigModel
+from airbyte_cdk.destinations.vector_db_based.document_processor import METADATA_RECORD_ID_FIELD, METADATA_STREAM_FIELD, Chunk
+from airbyte_cdk.destinations.vector_db_based.embedder import Document
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStream,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    SyncMode,
+    Type,
+)
+
+
+class IndexingConfigModel(BaseModel):
+    collection: str
+    api_key: str = Field(..., airbyte_secret=True)
+
+
+def create_writer(tmp_path, indexer, embedder, skip_unchanged_records=False) -> CachedWriter:
+    return CachedWriter(
+        ProcessingConfigModel(text_fields=["text"], metadata_fields=[], chunk_size=1000),
+        indexer,
+        embedder,
+        batch_size=32,
+        omit_raw_text=False,
+        embedding_config=OpenAIEmbeddingConfigModel(openai_key="mykey"),
+        indexing_config=IndexingConfigModel(collection="test2", api_key="mykey"),
+        cache_path=str(tmp_path / "embedding_cache.sqlite"),
+        cache_max_entries=10,
+        skip_unchanged_records=skip_unchanged_records,
+    )
+
+
+def create_embedder():
+    embedder = MagicMock()
+    embedder.embed_documents.side_effect = lambda documents: [[float(len(document.page_content)), 0.5] for document in documents]
+    return embedder
+
+
+def documents(*texts):
+    return [Document(page_content=text, record=MagicMock()) for text in texts]
+
+
+def embedded_texts(embedder):
+    return [[document.page_content for document in documents] for ((documents,), _) in embedder.embed_documents.call_args_list]
+
+
+def test_only_missing_chunks_are_embedded(tmp_path):
+    embedder = create_embedder()
+    path = str(tmp_path / "embedding_cache.sqlite")
+
+    first_embeddings = CachedEmbedder(embedder, EmbeddingCache(path, max_entries=10), "model").embed_documents(documents("a", "bb", "a"))
+    # the cache of the next sync
+    cached_embedder = CachedEmbedder(embedder, EmbeddingCache(path, max_entries=10), "model")
+    second_embeddings = cached_embedder.embed_documents(documents("bb", "ccc"))
+
+    assert first_embeddings == [[1.0, 0.5], [2.0, 0.5], [1.0, 0.5]]
+    assert second_embeddings == [[2.0, 0.5], [3.0, 0.5]]
+    assert embedded_texts(embedder) == [["a", "bb"], ["ccc"]]
+    assert (cached_embedder.hits, cached_embedder.misses) == (1, 1)
+
+
+def test_embeddings_of_other_model_are_not_used(tmp_path):
+    embedder = create_embedder()
+    cache = EmbeddingCache(str(tmp_path / "embedding_cache.sqlite"), max_entries=10)
+
+    CachedEmbedder(embedder, cache, "model").embed_documents(documents("a"))
+    CachedEmbedder(embedder, cache, "other model").embed_documents(documents("a"))
+
+    assert embedded_texts(embedder) == [["a"], ["a"]]
+
+
+def test_embeddings_not_returned_by_embedder_are_not_cached(tmp_path):
+    embedder = MagicMock()
+    embedder.embed_documents.return_value = [None]
+    cached_embedder = CachedEmbedder(embedder, EmbeddingCache(str(tmp_path / "embedding_cache.sqlite"), max_entries=10), "model")
+
+    assert cached_embedder.embed_documents(documents("a")) == [None]
+    assert cached_embedder.embed_documents(documents("a")) == [None]
+    assert embedder.embed_documents.call_count == 2
+
+
+@patch("time.time", side_effect=count())
+def test_least_recently_used_embeddings_are_dropped(time_mock, tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "embedding_cache.sqlite"), max_entries=2)
+    cache.set_embeddings("model", {"a": [1.0], "b": [2.0]})
+    cache.get_embeddings("model", ["a"])
+
+    cache.set_embeddings("model", {"c": [3.0]})
+
+    assert cache.get_embeddings("model", ["a", "b", "c"]) == {"a": [1.0], "c": [3.0]}
+
+
+def test_config_key_ignores_secrets():
+    assert config_key(OpenAIEmbeddingConfigModel(openai_key="key")) == config_key(OpenAIEmbeddingConfigModel(openai_key="new key"))
+    assert config_key(OpenAIEmbeddingConfigModel(openai_key="key")) != config_key(CohereEmbeddingConfigModel(cohere_key="key"))
+
+
+def create_catalog(destination_sync_mode=DestinationSyncMode.append_dedup):
+    return ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name="example_stream", json_schema={}, supported_sync_modes=[SyncMode.incremental]),
+                sync_mode=SyncMode.incremental,
+                destination_sync_mode=destination_sync_mode,
+                primary_key=[["id"]],
+            )
+        ]
+    )
+
+
+def process(record, dedup):
+    """The chunks of the document processor, without splitting the text"""
+    record_id = str(record.data["id"]) if dedup else None
+    if record.data.get("_ab_cdc_deleted_at"):
+        return [], record_id
+    metadata = {METADATA_STREAM_FIELD: record.stream}
+    if record_id:
+        metadata[METADATA_RECORD_ID_FIELD] = record_id
+    return [Chunk(page_content=f"text: {record.data['text']}", metadata=metadata, record=record)], record_id
+
+
+def sync(tmp_path, catalog, records, skip_unchanged_records=False):
+    indexer, embedder = MagicMock(), create_embedder()
+    messages = [
+        AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="example_stream", data=data, emitted_at=0)) for data in records
+    ]
+    with patch("airbyte_cdk.destinations.vector_db_based.writer.DocumentProcessor") as document_processor:
+        dedup = catalog.streams[0].destination_sync_mode == DestinationSyncMode.append_dedup
+        document_processor.return_value.process.side_effect = partial(process, dedup=dedup)
+        list(create_writer(tmp_path, indexer, embedder, skip_unchanged_records).write(catalog, messages))
+    written = [[chunk.page_content for chunk in chunks] for ((chunks, _, _), _) in indexer.index.call_args_list]
+    deleted = [ids for ((ids, _, _), _) in indexer.delete.call_args_list]
+    return written, deleted, embedded_texts(embedder)
+
+
+@pytest.mark.parametrize("skip_unchanged_records", [False, True])
+def test_unchanged_records_are_skipped(tmp_path, skip_unchanged_records):
+    first_sync = sync(
+        tmp_path, create_catalog(), [{"id": 1, "text": "one"}, {"id": 2, "text": "two"}], skip_unchanged_records=skip_unchanged_records
+    )
+
+    written, deleted, embedded = sync(
+        tmp_path, create_catalog(), [{"id": 1, "text": "one"}, {"id": 2, "text": "second"}], skip_unchanged_records=skip_unchanged_records
+    )
+
+    assert first_sync == ([["text: one", "text: two"]], [["1", "2"]], [["text: one", "text: two"]])
+    assert embedded == [["text: second"]]
+    if skip_unchanged_records:
+        assert (written, deleted) == ([["text: second"]], [["2"]])
+    else:
+        assert (written, deleted) == ([["text: one", "text: second"]], [["1", "2"]])
+
+
+def test_indexer_is_not_called_for_unchanged_batch(tmp_path):
+    sync(tmp_path, create_catalog(), [{"id": 1, "text": "one"}], skip_unchanged_records=True)
+
+    assert sync(tmp_path, create_catalog(), [{"id": 1, "text": "one"}], skip_unchanged_records=True) == ([], [], [])
+
+
+def test_deleted_records_are_written_again(tmp_path):
+    sync(tmp_path, create_catalog(), [{"id": 1, "text": "one"}], skip_unchanged_records=True)
+    sync(tmp_path, create_catalog(), [{"id": 1, "_ab_cdc_deleted_at": "2024-01-01T00:00:00Z"}], skip_unchanged_records=True)
+
+    written, deleted, _ = sync(tmp_path, create_catalog(), [{"id": 1, "text": "one"}], skip_unchanged_records=True)
+
+    assert (written, deleted) == ([["text: one"]], [["1"]])
+
+
+def test_overwritten_streams_are_written_again(tmp_path):
+    sync(tmp_path, create_catalog(), [{"id": 1, "text": "one"}], skip_unchanged_records=True)
+    sync(tmp_path, create_catalog(DestinationSyncMode.overwrite), [{"id": 1, "text": "one"}], skip_unchanged_records=True)
+
+    written, _, embedded = sync(tmp_path, create_catalog(), [{"id": 1, "text": "one"}], skip_unchanged_records=True)
+
+    assert written == [["text: one"]]
+    # the embedding is still cached
+    assert embedded == []
+
+
+def test_secrets_of_indexing_config_do_not_change_the_destination(tmp_path):
+    first_writer = create_writer(tmp_path, MagicMock(), create_embedder())
+    second_writer = CachedWriter(
+        ProcessingConfigModel(text_fields=["text"], metadata_fields=[], chunk_size=1000),
+        MagicMock(),
+        create_embedder(),
+        batch_size=32,
+        omit_raw_text=False,
+        embedding_config=OpenAIEmbeddingConfigModel(openai_key="new key"),
+        indexing_config=IndexingConfigModel(collection="test2", api_key="new key"),
+        cache_path=str(tmp_path / "embedding_cache.sqlite"),
+        cache_max_entries=10,
+    )
+
+    assert (first_writer.destination, first_writer.fingerprint_salt) == (second_writer.destination, second_writer.fingerprint_salt)
@@ -8,7 +8,7 @@ from unittest.mock import Mock, call, patch
 
 from destination_milvus.config import MilvusIndexingConfigModel, NoAuth, TokenAuth
 from destination_milvus.indexer import MilvusIndexer
-from pymilvus import DataType
+from pymilvus import DataType, MilvusException
 
 from airbyte_cdk.models.airbyte_protocol import AirbyteStream, DestinationSyncMode, SyncMode
 
@@ -158,11 +158,55 @@ class TestMilvusIndexer(unittest.TestCase):
         self.milvus_indexer._collection.insert.assert_called_with([{"key": "value", "vector": [1, 2, 3], "text": "some content", "_id": 5}])
 
     def test_index_calls_delete(self, mock_Collection, mock_utility, mock_connections):
+        self.milvus_indexer.delete(["some_id", "another_id"], None, "some_stream")
+
+        self.milvus_indexer._collection.delete.assert_called_once_with(expr='_ab_record_id in ["some_id", "another_id"]')
+        self.milvus_indexer._collection.query_iterator.assert_not_called()
+
+    def test_delete_is_split_in_batches(self, mock_Collection, mock_utility, mock_connections):
+        with patch("destination_milvus.indexer.DELETE_BATCH_SIZE", 2):
+            self.milvus_indexer.delete(["id_1", "id_2", "id_3"], None, "some_stream")
+
+        self.milvus_indexer._collection.delete.assert_has_calls(
+            [call(expr='_ab_record_id in ["id_1", "id_2"]'), call(expr='_ab_record_id in ["id_3"]')], any_order=False
+        )
+
+    def test_index_calls_delete_by_primary_key(self, mock_Collection, mock_utility, mock_connections):
+        """Milvus before 2.3 only deletes by primary key, the primary keys of the records are queried"""
         mock_iterator = Mock()
-        mock_iterator.next.side_effect = [[{"id": "123"}, {"id": "456"}], [{"id": "789"}], []]
+        mock_iterator.next.side_effect = [[{"id": "123"}, {"id": "456"}], [{"id": "789"}], [], [{"id": "1"}], []]
         self.milvus_indexer._collection.query_iterator.return_value = mock_iterator
+        self.milvus_indexer._collection.delete.side_effect = [
+            MilvusException(message='invalid expression, we only support to delete by pk, expr: _ab_record_id in ["some_id"]'),
+            None,
+            None,
+            None,
+        ]
 
         self.milvus_indexer.delete(["some_id"], None, "some_stream")
+        self.milvus_indexer.delete(["another_id"], None, "some_stream")
 
-        self.milvus_indexer._collection.query_iterator.assert_called_with(expr='_ab_record_id in ["some_id"]')
-        self.milvus_indexer._collection.delete.assert_has_calls([call(expr="id in [123, 456]"), call(expr="id in [789]")], any_order=False)
+        assert self.milvus_indexer._collection.query_iterator.call_args_list == [
+            call(expr='_ab_record_id in ["some_id"]'),
+            call(expr='_ab_record_id in ["another_id"]'),
+        ]
+        assert self.milvus_indexer._collection.delete.call_args_list == [
+            call(expr='_ab_record_id in ["some_id"]'),
+            call(expr="id in [123, 456]"),
+            call(expr="id in [789]"),
+            call(expr="id in [1]"),
+        ]
+
+    def test_delete_raises_other_errors(self, mock_Collection, mock_utility, mock_connections):
+        self.milvus_indexer._collection.delete.side_effect = [MilvusException(message="rpc deadline exceeded"), None]
+
+        with self.assertRaises(MilvusException):
+            self.milvus_indexer.delete(["some_id"], None, "some_stream")
+        self.milvus_indexer.delete(["another_id"], None, "some_stream")
+
+        # the records are still deleted by expression
+        self.milvus_indexer._collection.query_iterator.assert_not_called()
+        assert self.milvus_indexer._collection.delete.call_args_list == [
+            call(expr='_ab_record_id in ["some_id"]'),
+            call(expr='_ab_record_id in ["another_id"]'),
+        ]
@@ -0,0 +1,81 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+"""A background worker which writes the stream buffers, while the next records are parsed."""
+
+from __future__ import annotations
+
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging import getLogger
+from typing import Deque, Iterator, Tuple
+
+from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog
+from destination_motherduck.processors.duckdb import DuckDBSqlProcessor
+from destination_motherduck.record_buffer import ArrowRecordBuffer
+
+
+logger = getLogger("airbyte")
+
+
+class BackgroundFlushWorker:
+    """Write the stream buffers to the destination in a background thread.
+
+    The buffers are double-buffered: while one buffer is written, the records are collected into the next one.
+    Submitting a buffer waits for the previous write to finish, so at most one write is in flight and the
+    memory stays bounded. The writes are done in the order they are submitted.
+
+    The state messages are deferred until all the writes submitted before them are committed. An error raised
+    by a write is re-raised in the caller's thread, so the state messages after it are never emitted.
+    """
+
+    def __init__(self, processor: DuckDBSqlProcessor, configured_catalog: ConfiguredAirbyteCatalog) -> None:
+        self._processor = processor
+        self._sync_modes = {s.stream.name: s.destination_sync_mode for s in configured_catalog.streams}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="motherduck-flush")
+        self._in_flight: Future[None] | None = None
+        self._deferred_messages: Deque[Tuple[Future[None] | None, AirbyteMessage]] = deque()
+        self._records_processed: dict[str, int] = defaultdict(int)
+
+    def _write(self, stream_name: str, stream_buffer: ArrowRecordBuffer) -> None:
+        self._processor.write_stream_data_from_table(stream_buffer.to_arrow_table(), stream_name, self._sync_modes[stream_name])
+        self._records_processed[stream_name] += stream_buffer.record_count
+        logger.info(
+            f"Records loaded successfully. Total '{stream_name}' records processed: {self._records_processed[stream_name]:,}",
+        )
+
+    def wait(self) -> None:
+        """Wait for the write in flight, if any, re-raising its error."""
+        if self._in_flight is not None:
+            self._in_flight.result()
+
+    def submit(self, stream_name: str, stream_buffer: ArrowRecordBuffer) -> None:
+        """Write the stream buffer in the background, once the previous write is done.
+
+        The Arrow table of the buffer is built in the background as well.
+        """
+        self.wait()
+        logger.info(f"Loading {stream_buffer.record_count:,} records from '{stream_name}' stream buffer...")
+        self._in_flight = self._executor.submit(self._write, stream_name, stream_buffer)
+
+    def defer(self, message: AirbyteMessage) -> None:
+        """Hold the message until all the writes submitted so far are committed."""
+        self._deferred_messages.append((self._in_flight, message))
+
+    def committed_messages(self) -> Iterator[AirbyteMessage]:
+        """Yield the deferred messages, which are covered by the committed writes, without waiting."""
+        while self._deferred_messages:
+            write, message = self._deferred_messages[0]
+            if write is not None:
+                if not write.done():
+                    return
+                write.result()
+            self._deferred_messages.popleft()
+            yield message
+
+    def drain(self) -> Iterator[AirbyteMessage]:
+        """Wait for the writes to finish, then yield all the deferred messages."""
+        self.wait()
+        yield from self.committed_messages()
+
+    def close(self) -> None:
+        """Wait for the write in flight, without raising its error, and stop the worker thread."""
+        self._executor.shutdown(wait=True)
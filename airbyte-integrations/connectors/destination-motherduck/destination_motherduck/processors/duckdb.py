@@ -5,8 +5,10 @@ from __future__ import annotations
 
 import logging
 import warnings
+from contextlib import contextmanager
+from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Literal, Sequence
+from typing import TYPE_CHECKING, Any, Dict, Generator, Literal, Sequence
 from urllib.parse import parse_qsl, urlparse
 
 import pyarrow as pa
@@ -125,6 +127,28 @@ class DuckDBSqlProcessor(SqlProcessorBase):
     supports_merge_insert = False
     sql_config: DuckDBConfig
 
+    @cached_property
+    def _sql_engine(self) -> Engine:
+        """The engine shared by all connections of the processor.
+
+        Creating a new engine for each query means a new connection, which is expensive for MotherDuck.
+        """
+        return self.get_sql_engine()
+
+    @contextmanager
+    @overrides
+    def get_sql_connection(self) -> Generator[Connection, None, None]:
+        """A context manager which returns a connection from the processor's connection pool."""
+        with self._sql_engine.begin() as connection:
+            self._init_connection_settings(connection)
+            yield connection
+
+    def close(self) -> None:
+        """Close the connections held by the processor."""
+        engine = self.__dict__.pop("_sql_engine", None)
+        if engine is not None:
+            engine.dispose()
+
     def _execute_sql(self, sql: str | TextClause | Executable) -> Sequence[Any]:
         """Execute the given SQL statement."""
         if isinstance(sql, str):
@@ -206,37 +230,6 @@ class DuckDBSqlProcessor(SqlProcessorBase):
         with self.get_sql_connection() as new_conn:
             new_conn.execute(text("CHECKPOINT"))
 
-    def _executemany(self, sql: str | TextClause | Executable, params: list[list[Any]]) -> None:
-        """Execute the given SQL statement."""
-        if isinstance(sql, str):
-            sql = text(sql)
-
-        with self.get_sql_connection() as conn:
-            try:
-                entries = list(params)
-                conn.engine.pool.connect().executemany(str(sql), entries)  # type: ignore
-            except (
-                ProgrammingError,
-                SQLAlchemyError,
-            ) as ex:
-                msg = f"Error when executing SQL:\n{sql}\n{type(ex).__name__}{ex!s}"
-                raise SQLRuntimeError(msg) from None  # from ex
-
-    def _write_with_executemany(self, buffer: Dict[str, Dict[str, List[Any]]], stream_name: str, table_name: str) -> None:
-        column_names_list = list(buffer[stream_name].keys())
-        column_names_str = ", ".join(map(self._quote_identifier, column_names_list))
-        params = ", ".join(["?"] * len(column_names_list))
-        sql = f"""
-        -- Write with executemany
-        INSERT INTO {self._fully_qualified(table_name)}
-            ({column_names_str})
-        VALUES ({params})
-        """
-        entries_to_write = buffer[stream_name]
-        num_entries = len(entries_to_write[column_names_list[0]])
-        parameters = [[entries_to_write[column_name][n] for column_name in column_names_list] for n in range(num_entries)]
-        self._executemany(sql, parameters)
-
     def _write_from_pa_table(self, table_name: str, stream_name: str, pa_table: pa.Table) -> None:
         full_table_name = self._fully_qualified(table_name)
         columns = list(self._get_sql_column_definitions(stream_name).keys())
@@ -346,25 +339,23 @@ class DuckDBSqlProcessor(SqlProcessorBase):
         self._ensure_table_exists(stream_name=stream_name, table_name=table_name, sync_mode=sync_mode)
         self._ensure_compatible_table_schema(stream_name=stream_name, table_name=table_name)
 
-    def write_stream_data_from_buffer(
+    def write_stream_data_from_table(
         self,
-        buffer: Dict[str, Dict[str, List[Any]]],
+        pa_table: pa.Table,
         stream_name: str,
         sync_mode: DestinationSyncMode,
     ) -> None:
+        """Write the stream records, already collected into the PyArrow table."""
         temp_table_name = self._create_table_for_loading(stream_name, batch_id=None)
-        try:
-            pa_table = pa.Table.from_pydict(buffer[stream_name])
-        except Exception:
-            logger.exception(
-                "Writing with PyArrow table failed, falling back to writing with executemany. Expect some performance degradation."
-            )
-            self._write_with_executemany(buffer, stream_name, temp_table_name)
-        else:
-            # DuckDB will automatically find and SELECT from the `pa_table`
-            # local variable defined above.
-            self._write_from_pa_table(temp_table_name, stream_name, pa_table)
+        self._write_from_pa_table(temp_table_name, stream_name, pa_table)
+        self._write_temp_table_to_stream_table(temp_table_name, stream_name, sync_mode)
 
+    def _write_temp_table_to_stream_table(
+        self,
+        temp_table_name: str,
+        stream_name: str,
+        sync_mode: DestinationSyncMode,
+    ) -> None:
         temp_table_name_dedup = self._drop_duplicates(temp_table_name, stream_name)
         final_table_name = self.normalizer.normalize(stream_name)
 
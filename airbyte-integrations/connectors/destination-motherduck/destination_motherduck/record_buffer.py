@@ -0,0 +1,115 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+"""A columnar buffer which collects the records of a stream into a PyArrow table."""
+
+from __future__ import annotations
+
+import datetime
+import os
+from typing import Any, Dict, List, Mapping
+
+import numpy as np
+import orjson
+import pyarrow as pa
+import sqlalchemy
+
+from airbyte_cdk.sql.constants import AB_EXTRACTED_AT_COLUMN, AB_INTERNAL_COLUMNS, AB_META_COLUMN, AB_RAW_ID_COLUMN
+
+
+# The nested values are serialized to JSON strings, which DuckDB casts to the `JSON` columns.
+# Dates and times are passed as strings too, DuckDB parses them when inserting into the target columns.
+# So are the numbers of the `DECIMAL` columns, which would lose their precision as float64 values.
+ARROW_TYPES_MAP: list[tuple[type[sqlalchemy.types.TypeEngine[Any]], pa.DataType]] = [
+    (sqlalchemy.types.JSON, pa.string()),
+    (sqlalchemy.types.Boolean, pa.bool_()),
+    (sqlalchemy.types.Integer, pa.int64()),
+    (sqlalchemy.types.Numeric, pa.string()),
+    (sqlalchemy.types.String, pa.string()),
+]
+
+_UUID_DASH_POSITIONS = [8, 12, 16, 20]
+
+
+def get_arrow_types(sql_column_definitions: Mapping[str, Any]) -> Dict[str, pa.DataType]:
+    """Return the Arrow types of the record columns, derived from the SQL column types of the stream.
+
+    The internal Airbyte columns are excluded, because they are generated for the whole batch.
+    """
+    arrow_types: Dict[str, pa.DataType] = {}
+    for column_name, sql_type in sql_column_definitions.items():
+        if column_name in AB_INTERNAL_COLUMNS:
+            continue
+        arrow_types[column_name] = next(
+            (arrow_type for sql_class, arrow_type in ARROW_TYPES_MAP if isinstance(sql_type, sql_class)),
+            pa.string(),
+        )
+    return arrow_types
+
+
+def _to_json_string(value: Any) -> str | None:
+    if value is None:
+        return None
+    return orjson.dumps(value).decode()
+
+
+def _to_arrow_array(values: List[Any], arrow_type: pa.DataType) -> pa.Array:
+    """Convert the column values to the Arrow array of the given type.
+
+    When the values don't match the type (e.g. a float in the integer column), the type is inferred from the
+    values, or as the last resort the values are passed as strings, so that DuckDB casts them when inserting.
+    """
+    try:
+        return pa.array(values, type=arrow_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        pass
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        return pa.array([value if isinstance(value, str) else _to_json_string(value) for value in values], type=pa.string())
+
+
+def random_uuids(count: int) -> pa.Array:
+    """Generate the random (version 4) UUID strings for the whole batch at once."""
+    raw = np.frombuffer(bytearray(os.urandom(16 * count)), dtype=np.uint8).reshape(count, 16)
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+    hex_chars = np.frombuffer(raw.tobytes().hex().encode(), dtype=np.uint8).reshape(count, 32)
+    uuid_chars = np.insert(hex_chars, _UUID_DASH_POSITIONS, ord("-"), axis=1)
+    offsets = np.arange(0, 36 * (count + 1), 36, dtype=np.int32)
+    return pa.StringArray.from_buffers(count, pa.py_buffer(offsets), pa.py_buffer(uuid_chars.tobytes()))
+
+
+class ArrowRecordBuffer:
+    """Collect the records of a single stream batch, column by column.
+
+    Appending a record only appends its values to the column lists, and its extraction time. The values are
+    converted to the typed Arrow arrays, and the other internal Airbyte columns are generated, once for the whole batch.
+    """
+
+    def __init__(self, arrow_types: Mapping[str, pa.DataType]) -> None:
+        self._arrow_types = arrow_types
+        self._columns: Dict[str, List[Any]] = {column_name: [] for column_name in arrow_types}
+        self._appenders = [(column_name, values.append) for column_name, values in self._columns.items()]
+        self._extracted_at: List[datetime.datetime] = []
+        self.record_count = 0
+
+    def append(self, data: Mapping[str, Any]) -> None:
+        """Append the record values, the missing ones are set to `None`."""
+        self._extracted_at.append(datetime.datetime.now())
+        get = data.get
+        for column_name, append in self._appenders:
+            append(get(column_name))
+        self.record_count += 1
+
+    def to_arrow_table(self) -> pa.Table:
+        """Build the Arrow table of the batch, including the internal Airbyte columns."""
+        arrays: Dict[str, pa.Array] = {}
+        for column_name, arrow_type in self._arrow_types.items():
+            values = self._columns[column_name]
+            if arrow_type == pa.string():
+                values = [value if value is None or isinstance(value, str) else _to_json_string(value) for value in values]
+            arrays[column_name] = _to_arrow_array(values, arrow_type)
+
+        arrays[AB_RAW_ID_COLUMN] = random_uuids(self.record_count)
+        arrays[AB_EXTRACTED_AT_COLUMN] = pa.array(self._extracted_at, type=pa.timestamp("us"))
+        arrays[AB_META_COLUMN] = pa.array(["{}"] * self.record_count, type=pa.string())
+        return pa.Table.from_pydict(arrays)
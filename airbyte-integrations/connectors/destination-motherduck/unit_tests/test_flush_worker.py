@@ -0,0 +1,125 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+from __future__ import annotations
+
+import tempfile
+import threading
+from datetime import datetime
+from unittest.mock import Mock
+
+import pyarrow as pa
+import pytest
+from destination_motherduck.destination import DestinationMotherDuck
+from destination_motherduck.flush_worker import BackgroundFlushWorker
+from destination_motherduck.record_buffer import ArrowRecordBuffer
+
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStateMessage,
+    AirbyteStateType,
+    AirbyteStream,
+    AirbyteStreamState,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    StreamDescriptor,
+    SyncMode,
+    Type,
+)
+
+
+def _configured_catalog(*stream_names: str) -> ConfiguredAirbyteCatalog:
+    return ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(
+                    name=stream_name,
+                    json_schema={"type": "object", "properties": {"id": {"type": "integer"}}},
+                    supported_sync_modes=[SyncMode.incremental],
+                ),
+                sync_mode=SyncMode.incremental,
+                destination_sync_mode=DestinationSyncMode.append,
+            )
+            for stream_name in stream_names
+        ]
+    )
+
+
+def _record(stream_name: str, record_id: int) -> AirbyteMessage:
+    return AirbyteMessage(
+        type=Type.RECORD,
+        record=AirbyteRecordMessage(stream=stream_name, data={"id": record_id}, emitted_at=int(datetime.now().timestamp()) * 1000),
+    )
+
+
+def _buffer(*record_ids: int) -> ArrowRecordBuffer:
+    stream_buffer = ArrowRecordBuffer({"id": pa.int64()})
+    for record_id in record_ids:
+        stream_buffer.append({"id": record_id})
+    return stream_buffer
+
+
+def _state(stream_name: str) -> AirbyteMessage:
+    return AirbyteMessage(
+        type=Type.STATE,
+        state=AirbyteStateMessage(
+            type=AirbyteStateType.STREAM,
+            stream=AirbyteStreamState(stream_descriptor=StreamDescriptor(name=stream_name), stream_state={"id": 1}),
+        ),
+    )
+
+
+def test_state_is_deferred_until_flush_commits() -> None:
+    write_started, write_released = threading.Event(), threading.Event()
+    processor = Mock()
+    processor.write_stream_data_from_table.side_effect = lambda *_: write_started.set() or write_released.wait(5)
+    worker = BackgroundFlushWorker(processor, _configured_catalog("users"))
+    state = _state("users")
+
+    worker.submit("users", _buffer(1))
+    worker.defer(state)
+    write_started.wait(5)
+    assert list(worker.committed_messages()) == []
+
+    write_released.set()
+    assert list(worker.drain()) == [state]
+    processor.write_stream_data_from_table.assert_called_once()
+    pa_table, stream_name, sync_mode = processor.write_stream_data_from_table.call_args.args
+    assert (pa_table.column("id").to_pylist(), stream_name, sync_mode) == ([1], "users", DestinationSyncMode.append)
+    worker.close()
+
+
+def test_state_is_not_emitted_after_failed_flush() -> None:
+    processor = Mock()
+    processor.write_stream_data_from_table.side_effect = RuntimeError("flush failed")
+    worker = BackgroundFlushWorker(processor, _configured_catalog("users"))
+
+    worker.submit("users", _buffer(1))
+    worker.defer(_state("users"))
+    with pytest.raises(RuntimeError, match="flush failed"):
+        list(worker.drain())
+    worker.close()
+
+
+def test_write_keeps_other_streams_buffered_on_state(monkeypatch) -> None:
+    monkeypatch.setattr(DestinationMotherDuck, "_get_destination_path", lambda _, x: x)
+    config = {"destination_path": f"{tempfile.mkdtemp()}/test_flush.duckdb", "schema": "test_schema"}
+    catalog = _configured_catalog("users", "orders")
+    messages = [
+        _record("users", 1),
+        _record("orders", 1),
+        _state("users"),
+        _record("users", 2),
+        _record("orders", 2),
+        _state("orders"),
+    ]
+
+    destination = DestinationMotherDuck()
+    result = list(destination.write(config, catalog, messages))
+
+    assert [message.state.stream.stream_descriptor.name for message in result] == ["users", "orders"]
+    assert [message.state.destinationStats.recordCount for message in result] == [1.0, 2.0]
+
+    processor = destination._get_sql_processor(configured_catalog=catalog, schema_name="test_schema", db_path=config["destination_path"])
+    assert processor._execute_sql("SELECT id FROM test_schema.users ORDER BY id") == [(1,), (2,)]
+    assert processor._execute_sql("SELECT id FROM test_schema.orders ORDER BY id") == [(1,), (2,)]
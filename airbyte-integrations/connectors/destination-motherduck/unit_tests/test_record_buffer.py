@@ -0,0 +1,78 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+from __future__ import annotations
+
+import datetime
+import uuid
+
+import pyarrow as pa
+import sqlalchemy
+from destination_motherduck.record_buffer import ArrowRecordBuffer, get_arrow_types, random_uuids
+
+from airbyte_cdk.sql.constants import AB_EXTRACTED_AT_COLUMN, AB_META_COLUMN, AB_RAW_ID_COLUMN
+
+
+def test_get_arrow_types() -> None:
+    arrow_types = get_arrow_types(
+        {
+            "id": sqlalchemy.types.BIGINT(),
+            "price": sqlalchemy.types.DECIMAL(38, 9),
+            "active": sqlalchemy.types.BOOLEAN(),
+            "name": sqlalchemy.types.VARCHAR(),
+            "tags": sqlalchemy.types.JSON(),
+            "updated_at": sqlalchemy.types.TIMESTAMP(),
+            AB_RAW_ID_COLUMN: sqlalchemy.types.VARCHAR(),
+        }
+    )
+
+    assert arrow_types == {
+        "id": pa.int64(),
+        "price": pa.string(),
+        "active": pa.bool_(),
+        "name": pa.string(),
+        "tags": pa.string(),
+        "updated_at": pa.string(),
+    }
+
+
+def test_record_buffer_to_arrow_table() -> None:
+    stream_buffer = ArrowRecordBuffer({"id": pa.int64(), "name": pa.string(), "tags": pa.string()})
+    before = datetime.datetime.now()
+    stream_buffer.append({"id": 1, "name": "first", "tags": ["a", "b"]})
+    stream_buffer.append({"id": 2, "unknown": "ignored"})
+    after = datetime.datetime.now()
+
+    pa_table = stream_buffer.to_arrow_table()
+
+    assert stream_buffer.record_count == 2
+    assert pa_table.column("id").type == pa.int64()
+    assert pa_table.column("id").to_pylist() == [1, 2]
+    assert pa_table.column("name").to_pylist() == ["first", None]
+    assert pa_table.column("tags").to_pylist() == ['["a","b"]', None]
+    assert pa_table.column(AB_META_COLUMN).to_pylist() == ["{}", "{}"]
+    extracted_at = pa_table.column(AB_EXTRACTED_AT_COLUMN).to_pylist()
+    assert before <= extracted_at[0] <= extracted_at[1] <= after
+    assert len(set(pa_table.column(AB_RAW_ID_COLUMN).to_pylist())) == 2
+
+
+def test_record_buffer_falls_back_on_unexpected_values() -> None:
+    stream_buffer = ArrowRecordBuffer({"id": pa.int64()})
+    stream_buffer.append({"id": 1})
+    stream_buffer.append({"id": "not a number"})
+
+    assert stream_buffer.to_arrow_table().column("id").to_pylist() == ["1", "not a number"]
+
+
+def test_record_buffer_keeps_the_precision_of_numbers() -> None:
+    price = get_arrow_types({"price": sqlalchemy.types.DECIMAL(38, 9)})["price"]
+    stream_buffer = ArrowRecordBuffer({"price": price})
+    for value in (2**60 + 1, 0.1, "12.5", None):
+        stream_buffer.append({"price": value})
+
+    assert stream_buffer.to_arrow_table().column("price").to_pylist() == ["1152921504606846977", "0.1", "12.5", None]
+
+
+def test_random_uuids() -> None:
+    uuids = random_uuids(1000).to_pylist()
+
+    assert len(set(uuids)) == 1000
+    assert all(str(uuid.UUID(value)) == value and uuid.UUID(value).version == 4 for value in uuids)
@@ -8,3 +8,6 @@ CHUNK_ID_COLUMN = "chunk_id"
 METADATA_COLUMN = "metadata"
 DOCUMENT_CONTENT_COLUMN = "document_content"
 EMBEDDING_COLUMN = "embedding"
+
+EMBEDDING_BATCH_SIZE = 256
+"""The number of chunks accumulated across records before they are embedded at once."""
@@ -3,16 +3,25 @@
 
 from __future__ import annotations
 
+import gzip
+import io
+import struct
 import uuid
+from collections.abc import Iterable, Iterator
+from functools import cached_property
 from pathlib import Path
 from textwrap import dedent
 from typing import Any
 
 import dpath
+import orjson
 import sqlalchemy
+from airbyte import exceptions as exc
 from airbyte._processors.file.jsonl import JsonlWriter
 from airbyte.secrets import SecretString
+from airbyte.strategies import WriteStrategy
 from airbyte_cdk.destinations.vector_db_based import embedder
+from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk
 from airbyte_cdk.destinations.vector_db_based.document_processor import (
     DocumentProcessor as DocumentSplitter,
 )
@@ -30,10 +39,45 @@ from destination_pgvector.globals import (
     CHUNK_ID_COLUMN,
     DOCUMENT_CONTENT_COLUMN,
     DOCUMENT_ID_COLUMN,
+    EMBEDDING_BATCH_SIZE,
     EMBEDDING_COLUMN,
     METADATA_COLUMN,
 )
 
+PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+"""The header of the PostgreSQL binary `COPY` format: signature, flags and header extension length."""
+
+PGCOPY_TRAILER = struct.pack(">h", -1)
+"""The trailer of the PostgreSQL binary `COPY` format."""
+
+PGCOPY_NULL = struct.pack(">i", -1)
+"""The field length which marks the NULL value in the PostgreSQL binary `COPY` format."""
+
+
+class IterableByteStream(io.RawIOBase):
+    """A read-only file-like object over an iterable of byte strings.
+
+    Used to stream the `COPY ... FROM STDIN` payload without materializing it in memory.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
 
 class PostgresConfig(SqlConfig):
     """Configuration for the Postgres cache.
@@ -98,6 +142,7 @@ class PGVectorProcessor(SqlProcessorBase):
         """Initialize the PGVector processor."""
         self.splitter_config = splitter_config
         self.embedder_config = embedder_config
+        self._pending_chunks: list[tuple[AirbyteRecordMessage, str, Chunk]] = []
         super().__init__(
             sql_config=sql_config,
             catalog_provider=catalog_provider,
@@ -122,6 +167,84 @@ class PGVectorProcessor(SqlProcessorBase):
             EMBEDDING_COLUMN: Vector(self.embedding_dimensions),
         }
 
+    @staticmethod
+    def _encode_copy_field(value: Any, sql_type: sqlalchemy.types.TypeEngine) -> bytes:
+        """Encode a single field in the PostgreSQL binary `COPY` format.
+
+        The binary format is type specific, so only the column types of vector index tables are
+        supported and any other type is rejected instead of being sent as text.
+        """
+        if value is None:
+            return PGCOPY_NULL
+        if isinstance(sql_type, Vector):
+            # pgvector binary format: dimensions (int16), unused (int16), then float4 values
+            data = struct.pack(f">hh{len(value)}f", len(value), 0, *value)
+        elif isinstance(sql_type, sqlalchemy.types.JSON):
+            data = orjson.dumps(value)
+        elif isinstance(sql_type, sqlalchemy.types.String):
+            data = str(value).encode("utf-8")
+        else:
+            raise exc.PyAirbyteInternalError(
+                message="Column type is not supported by the binary COPY format.",
+                context={
+                    "sql_type": str(sql_type),
+                },
+            )
+        return struct.pack(">i", len(data)) + data
+
+    def _iter_copy_rows(
+        self,
+        files: list[Path],
+        sql_column_definitions: dict[str, sqlalchemy.types.TypeEngine],
+    ) -> Iterator[bytes]:
+        """Yield the binary `COPY` payload for the given JSONL files, one row at a time."""
+        field_count = struct.pack(">h", len(sql_column_definitions))
+        yield PGCOPY_HEADER
+        for file_path in files:
+            with gzip.open(file_path, "rb") as jsonl_file:
+                for line in jsonl_file:
+                    if not line.strip():
+                        continue
+                    record = orjson.loads(line)
+                    yield field_count + b"".join(
+                        self._encode_copy_field(record.get(column_name), sql_type)
+                        for column_name, sql_type in sql_column_definitions.items()
+                    )
+        yield PGCOPY_TRAILER
+
+    def _write_files_to_new_table(
+        self,
+        files: list[Path],
+        stream_name: str,
+        batch_id: str,
+    ) -> str:
+        """Write the files to a new table, streaming the rows with `COPY ... FROM STDIN`.
+
+        This replaces the generic DataFrame based implementation, which loads each file into memory
+        and inserts it row by row.
+        """
+        temp_table_name = self._create_table_for_loading(stream_name, batch_id)
+        sql_column_definitions = self._get_sql_column_definitions(stream_name)
+        columns_list = ", ".join(
+            self._quote_identifier(column_name) for column_name in sql_column_definitions
+        )
+        copy_statement = (
+            f"COPY {self._fully_qualified(temp_table_name)} ({columns_list}) "
+            "FROM STDIN WITH (FORMAT BINARY)"
+        )
+
+        with self.get_sql_connection() as conn:
+            cursor = conn.connection.cursor()
+            try:
+                cursor.copy_expert(
+                    copy_statement,
+                    IterableByteStream(self._iter_copy_rows(files, sql_column_definitions)),
+                )
+            finally:
+                cursor.close()
+
+        return temp_table_name
+
     def _emulated_merge_temp_table_to_final_table(
         self,
         stream_name: str,
@@ -174,21 +297,33 @@ class PGVectorProcessor(SqlProcessorBase):
         We override the SQLProcessor implementation in order to handle chunking, embedding, etc.
 
         This method is called for each record message, before the record is written to local file.
+        The chunks are accumulated across records and embedded in batches of `EMBEDDING_BATCH_SIZE`.
         """
         document_chunks, id_to_delete = self.splitter.process(record_msg)
 
         _ = id_to_delete  # unused
 
+        document_id = self._create_document_id(record_msg)
+        self._pending_chunks.extend((record_msg, document_id, chunk) for chunk in document_chunks)
+        if len(self._pending_chunks) >= EMBEDDING_BATCH_SIZE:
+            self._embed_pending_chunks()
+
+    def _embed_pending_chunks(self) -> None:
+        """Embed the accumulated chunks with a single embedder call, then write them to local files."""
+        if not self._pending_chunks:
+            return
+
+        pending_chunks, self._pending_chunks = self._pending_chunks, []
         embeddings = self.embedder.embed_documents(
-            documents=document_chunks,
+            documents=[chunk for _, _, chunk in pending_chunks],
         )
-        for i, chunk in enumerate(document_chunks, start=0):
+        for (record_msg, document_id, chunk), embedding in zip(pending_chunks, embeddings):
             new_data: dict[str, Any] = {
-                DOCUMENT_ID_COLUMN: self._create_document_id(record_msg),
+                DOCUMENT_ID_COLUMN: document_id,
                 CHUNK_ID_COLUMN: str(uuid.uuid4().int),
                 METADATA_COLUMN: chunk.metadata,
                 DOCUMENT_CONTENT_COLUMN: chunk.page_content,
-                EMBEDDING_COLUMN: embeddings[i],
+                EMBEDDING_COLUMN: embedding,
             }
 
             self.file_writer.process_record_message(
@@ -213,6 +348,11 @@ class PGVectorProcessor(SqlProcessorBase):
                 },
             )
 
+    def write_all_stream_data(self, write_strategy: WriteStrategy) -> None:
+        """Embed the remaining chunks before finalizing any pending writes."""
+        self._embed_pending_chunks()
+        super().write_all_stream_data(write_strategy=write_strategy)
+
     def _add_missing_columns_to_table(
         self,
         stream_name: str,
@@ -222,9 +362,8 @@ class PGVectorProcessor(SqlProcessorBase):
 
         This is a no-op because metadata scans do not work with the `VECTOR` data type.
         """
-        pass
 
-    @property
+    @cached_property
     def embedder(self) -> embedder.Embedder:
         return embedder.create_from_config(
             embedding_config=self.embedder_config,  # type: ignore [arg-type]  # No common base class
@@ -236,7 +375,7 @@ class PGVectorProcessor(SqlProcessorBase):
         """Return the number of dimensions for the embeddings."""
         return self.embedder.embedding_dimensions
 
-    @property
+    @cached_property
     def splitter(self) -> DocumentSplitter:
         return DocumentSplitter(
             config=self.splitter_config,
@@ -0,0 +1,113 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import gzip
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import orjson
+import sqlalchemy
+from airbyte import exceptions as exc
+from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk
+from airbyte_cdk.models import AirbyteRecordMessage
+from pgvector.sqlalchemy import Vector
+
+from destination_pgvector.globals import EMBEDDING_BATCH_SIZE
+from destination_pgvector.pgvector_processor import (
+    PGCOPY_HEADER,
+    PGCOPY_NULL,
+    PGCOPY_TRAILER,
+    IterableByteStream,
+    PGVectorProcessor,
+)
+
+
+class TestPGVectorProcessor(unittest.TestCase):
+    def setUp(self):
+        with patch.object(PGVectorProcessor, "_ensure_schema_exists"):
+            self.processor = PGVectorProcessor(
+                sql_config=MagicMock(),
+                splitter_config=MagicMock(),
+                embedder_config=MagicMock(),
+                catalog_provider=MagicMock(),
+                temp_dir=Path(tempfile.mkdtemp()),
+            )
+        self.processor.__dict__["embedder"] = MagicMock()
+        self.processor.__dict__["splitter"] = MagicMock()
+        self.processor.file_writer = MagicMock()
+        self.processor._get_primary_keys = MagicMock(return_value=[["id"]])
+
+    def _record(self, record_id: int) -> AirbyteRecordMessage:
+        return AirbyteRecordMessage(stream="mystream", data={"id": record_id}, emitted_at=0)
+
+    def test_embeddings_are_batched_across_records(self):
+        chunks_per_record = 2
+        self.processor.splitter.process.side_effect = lambda record: (
+            [Chunk(page_content="text", metadata={}, record=record)] * chunks_per_record,
+            None,
+        )
+        self.processor.embedder.embed_documents.side_effect = lambda documents: [
+            [0.1, 0.2] for _ in documents
+        ]
+
+        records_count = EMBEDDING_BATCH_SIZE // chunks_per_record + 1
+        for record_id in range(records_count):
+            self.processor.process_record_message(self._record(record_id), stream_schema={})
+
+        # a single embedding call for the full batch, the rest is pending
+        self.processor.embedder.embed_documents.assert_called_once()
+        self.assertEqual(
+            len(self.processor.embedder.embed_documents.call_args.kwargs["documents"]),
+            EMBEDDING_BATCH_SIZE,
+        )
+        self.assertEqual(len(self.processor._pending_chunks), chunks_per_record)
+
+        self.processor._embed_pending_chunks()
+        self.assertEqual(self.processor.embedder.embed_documents.call_count, 2)
+        self.assertEqual(
+            self.processor.file_writer.process_record_message.call_count,
+            records_count * chunks_per_record,
+        )
+        written = self.processor.file_writer.process_record_message.call_args.kwargs["record_msg"]
+        self.assertEqual(written.data["document_id"], f"Stream_mystream_Key_{records_count - 1}")
+        self.assertEqual(written.data["embedding"], [0.1, 0.2])
+
+    def test_encode_copy_field(self):
+        self.assertEqual(
+            PGVectorProcessor._encode_copy_field([1.0, 2.0], Vector(2)),
+            struct.pack(">i", 12) + struct.pack(">hhff", 2, 0, 1.0, 2.0),
+        )
+        self.assertEqual(
+            PGVectorProcessor._encode_copy_field({"a": 1}, sqlalchemy.types.JSON()),
+            struct.pack(">i", 7) + b'{"a":1}',
+        )
+        self.assertEqual(
+            PGVectorProcessor._encode_copy_field("abc", sqlalchemy.types.VARCHAR()),
+            struct.pack(">i", 3) + b"abc",
+        )
+        self.assertEqual(
+            PGVectorProcessor._encode_copy_field(None, Vector(2)),
+            PGCOPY_NULL,
+        )
+
+    def test_encode_copy_field_rejects_unsupported_type(self):
+        with self.assertRaises(exc.PyAirbyteInternalError):
+            PGVectorProcessor._encode_copy_field(1, sqlalchemy.types.BIGINT())
+
+    def test_iter_copy_rows(self):
+        file_path = Path(tempfile.mkdtemp()) / "batch.jsonl.gz"
+        with gzip.open(file_path, "w") as jsonl_file:
+            jsonl_file.write(orjson.dumps({"document_id": "1", "embedding": [1.0]}) + b"\n")
+            jsonl_file.write(orjson.dumps({"document_id": "2", "embedding": None}) + b"\n")
+
+        columns = {"document_id": sqlalchemy.types.VARCHAR(), "embedding": Vector(1)}
+        payload = IterableByteStream(self.processor._iter_copy_rows([file_path], columns)).read()
+
+        first_row = struct.pack(">h", 2) + struct.pack(">i", 1) + b"1"
+        first_row += struct.pack(">i", 8) + struct.pack(">hhf", 1, 0, 1.0)
+        second_row = struct.pack(">h", 2) + struct.pack(">i", 1) + b"2" + PGCOPY_NULL
+        self.assertEqual(payload, PGCOPY_HEADER + first_row + second_row + PGCOPY_TRAILER)
@@ -15,6 +15,7 @@ from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, Configur
 from airbyte_cdk.models.airbyte_protocol import DestinationSyncMode
 from airbyte_protocol.models.airbyte_protocol import AirbyteLogMessage, Level
 from destination_pinecone.config import ConfigModel
+from destination_pinecone.embedding_cache import CachedWriter
 from destination_pinecone.indexer import PineconeIndexer
 
 
@@ -38,9 +39,23 @@ class DestinationPinecone(Destination):
         try:
             config_model = ConfigModel.parse_obj(config)
             self._init_indexer(config_model)
-            writer = Writer(
-                config_model.processing, self.indexer, self.embedder, batch_size=BATCH_SIZE, omit_raw_text=config_model.omit_raw_text
-            )
+            if config_model.embedding_cache_path:
+                writer = CachedWriter(
+                    config_model.processing,
+                    self.indexer,
+                    self.embedder,
+                    batch_size=BATCH_SIZE,
+                    omit_raw_text=config_model.omit_raw_text,
+                    embedding_config=config_model.embedding,
+                    indexing_config=config_model.indexing,
+                    cache_path=config_model.embedding_cache_path,
+                    cache_max_entries=config_model.embedding_cache_max_entries,
+                    skip_unchanged_records=config_model.skip_unchanged_records,
+                )
+            else:
+                writer = Writer(
+                    config_model.processing, self.indexer, self.embedder, batch_size=BATCH_SIZE, omit_raw_text=config_model.omit_raw_text
+                )
             yield from writer.write(configured_catalog, input_messages)
         except Exception as e:
             log_message = AirbyteLogMessage(level=Level.ERROR, message=str(e))
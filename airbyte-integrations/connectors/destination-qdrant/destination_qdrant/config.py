@@ -3,9 +3,9 @@
 #
 
 
-from typing import Literal, Union
+from typing import Literal, Optional, Union
 
-from pydantic.v1 import BaseModel, Field
+from pydantic.v1 import BaseModel, Field, root_validator
 
 from airbyte_cdk.destinations.vector_db_based.config import VectorDBConfigModel
 
@@ -51,3 +51,29 @@ class QdrantIndexingConfigModel(BaseModel):
 
 class ConfigModel(VectorDBConfigModel):
     indexing: QdrantIndexingConfigModel
+    embedding_cache_path: Optional[str] = Field(
+        default=None,
+        title="Embedding cache file",
+        group="advanced",
+        description="Path of a local SQLite file keeping the embeddings of the chunks between syncs, keyed by the embedding model and the hash of the chunk text. Only the chunks missing from the cache are sent to the embedding API. The file must be on a volume kept between syncs. If not set, all chunks are embedded on every sync.",
+        examples=["/local/embedding_cache.sqlite"],
+    )
+    embedding_cache_max_entries: int = Field(
+        default=1_000_000,
+        title="Embedding cache size",
+        group="advanced",
+        description="Maximum number of embeddings kept in the embedding cache file, the least recently used embeddings are dropped first.",
+        minimum=1,
+    )
+    skip_unchanged_records: bool = Field(
+        default=False,
+        title="Skip unchanged records",
+        group="advanced",
+        description="Requires the embedding cache file, the configuration is rejected without it. Do not delete and write again the chunks of the records of deduplicated streams which did not change since the previous sync. The written records are tracked in the embedding cache file, so the chunks must not be deleted from the destination by other means.",
+    )
+
+    @root_validator(skip_on_failure=True)
+    def skip_unchanged_records_requires_embedding_cache(cls, values):
+        if values.get("skip_unchanged_records") and not values.get("embedding_cache_path"):
+            raise ValueError("Skipping the unchanged records requires the embedding cache file")
+        return values
@@ -13,6 +13,7 @@ from airbyte_cdk.destinations.vector_db_based.writer import Writer
 from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, ConnectorSpecification, Status
 from airbyte_cdk.models.airbyte_protocol import DestinationSyncMode
 from destination_qdrant.config import ConfigModel
+from destination_qdrant.embedding_cache import CachedWriter
 from destination_qdrant.indexer import QdrantIndexer
 
 
@@ -32,9 +33,23 @@ class DestinationQdrant(Destination):
     ) -> Iterable[AirbyteMessage]:
         config_model = ConfigModel.parse_obj(config)
         self._init_indexer(config_model)
-        writer = Writer(
-            config_model.processing, self.indexer, self.embedder, batch_size=BATCH_SIZE, omit_raw_text=config_model.omit_raw_text
-        )
+        if config_model.embedding_cache_path:
+            writer = CachedWriter(
+                config_model.processing,
+                self.indexer,
+                self.embedder,
+                batch_size=BATCH_SIZE,
+                omit_raw_text=config_model.omit_raw_text,
+                embedding_config=config_model.embedding,
+                indexing_config=config_model.indexing,
+                cache_path=config_model.embedding_cache_path,
+                cache_max_entries=config_model.embedding_cache_max_entries,
+                skip_unchanged_records=config_model.skip_unchanged_records,
+            )
+        else:
+            writer = Writer(
+                config_model.processing, self.indexer, self.embedder, batch_size=BATCH_SIZE, omit_raw_text=config_model.omit_raw_text
+            )
         yield from writer.write(configured_catalog, input_messages)
 
     def check(self, logger: logging.Logger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
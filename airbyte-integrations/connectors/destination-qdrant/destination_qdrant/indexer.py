@@ -24,6 +24,9 @@ DISTANCE_METRIC_MAP = {
     "euc": Distance.EUCLID,
 }
 
+DELETE_BATCH_SIZE = 1000
+"""Number of record ids matched by a single delete request, to stay below the request size limit of Qdrant"""
+
 
 class QdrantIndexer(Indexer):
     config: QdrantIndexingConfigModel
@@ -90,15 +93,17 @@ class QdrantIndexer(Indexer):
             )
 
     def delete(self, delete_ids, namespace, stream):
-        if len(delete_ids) > 0:
-            self._delete_for_filter(
-                models.FilterSelector(
-                    filter=models.Filter(
-                        should=[
-                            models.FieldCondition(key=METADATA_RECORD_ID_FIELD, match=models.MatchValue(value=_id)) for _id in delete_ids
-                        ]
-                    )
-                )
+        # a single condition matching any of the ids is resolved through the keyword index of the record id field.
+        # Like the uploads, the deletes are not awaited: Qdrant applies the operations of a collection in the order they were sent,
+        # so the deletes of a batch queue up behind the upserts of the previous batch while the chunks of the batch are embedded
+        for start in range(0, len(delete_ids), DELETE_BATCH_SIZE):
+            ids = delete_ids[start : start + DELETE_BATCH_SIZE]
+            self._client.delete(
+                collection_name=self.config.collection,
+                points_selector=models.FilterSelector(
+                    filter=models.Filter(must=[models.FieldCondition(key=METADATA_RECORD_ID_FIELD, match=models.MatchAny(any=ids))])
+                ),
+                wait=False,
             )
 
     def index(self, document_chunks, namespace, stream):
@@ -3,7 +3,7 @@
 #
 
 import unittest
-from unittest.mock import Mock, call
+from unittest.mock import Mock, call, patch
 
 from destination_qdrant.config import QdrantIndexingConfigModel
 from destination_qdrant.indexer import QdrantIndexer
@@ -164,14 +164,25 @@ class TestQdrantIndexer(unittest.TestCase):
             collection_name=self.mock_config.collection,
             points_selector=models.FilterSelector(
                 filter=models.Filter(
-                    should=[
-                        models.FieldCondition(key="_ab_record_id", match=models.MatchValue(value="some_id")),
-                        models.FieldCondition(key="_ab_record_id", match=models.MatchValue(value="another_id")),
-                    ]
+                    must=[models.FieldCondition(key="_ab_record_id", match=models.MatchAny(any=["some_id", "another_id"]))]
                 )
             ),
+            wait=False,
         )
 
+    @patch("destination_qdrant.indexer.DELETE_BATCH_SIZE", 2)
+    def test_delete_is_split_in_batches(self):
+        self.qdrant_indexer.delete(["id_1", "id_2", "id_3"], None, "some_stream")
+
+        assert [
+            kwargs["points_selector"].filter.must[0].match.any for (_, kwargs) in self.qdrant_indexer._client.delete.call_args_list
+        ] == [["id_1", "id_2"], ["id_3"]]
+
+    def test_delete_without_ids(self):
+        self.qdrant_indexer.delete([], None, "some_stream")
+
+        self.qdrant_indexer._client.delete.assert_not_called()
+
     def test_post_sync_calls_close(self):
         result = self.qdrant_indexer.post_sync()
         self.qdrant_indexer._client.close.assert_called_once()
@@ -6,6 +6,8 @@
 from airbyte_cdk.destinations.vector_db_based.config import VectorDBConfigModel
 from pydantic import BaseModel, Field
 
+from destination_snowflake_cortex.globals import DEFAULT_UPLOAD_PARALLELISM
+
 
 class PasswordBasedAuthorizationModel(BaseModel):
     password: str = Field(
@@ -67,6 +69,14 @@ class SnowflakeCortexIndexingModel(BaseModel):
     )
 
     credentials: PasswordBasedAuthorizationModel
+    upload_parallelism: int = Field(
+        default=DEFAULT_UPLOAD_PARALLELISM,
+        title="Upload Parallelism",
+        order=8,
+        ge=1,
+        le=16,
+        description="The number of batch files uploaded to the Snowflake stage concurrently. The uploaded files are loaded with `COPY INTO` in groups of this size.",
+    )
 
     class Config:
         title = "Snowflake Connection"
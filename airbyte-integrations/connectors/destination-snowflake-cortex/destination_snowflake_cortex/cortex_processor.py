@@ -4,16 +4,21 @@
 from __future__ import annotations
 
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from functools import cached_property
 from pathlib import Path
 from textwrap import dedent, indent
 from typing import TYPE_CHECKING, Any
 
 import dpath
 import sqlalchemy
+import ulid
 from airbyte._processors.file.jsonl import JsonlWriter
 from airbyte.secrets import SecretString
+from airbyte.strategies import WriteStrategy
 from airbyte.types import SQLTypeConverter
 from airbyte_cdk.destinations.vector_db_based import embedder
+from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk
 from airbyte_cdk.destinations.vector_db_based.document_processor import (
     DocumentProcessor as DocumentSplitter,
 )
@@ -32,8 +37,10 @@ from destination_snowflake_cortex.common.catalog.catalog_providers import Catalo
 from destination_snowflake_cortex.common.sql.sql_processor import SqlConfig, SqlProcessorBase
 from destination_snowflake_cortex.globals import (
     CHUNK_ID_COLUMN,
+    DEFAULT_UPLOAD_PARALLELISM,
     DOCUMENT_CONTENT_COLUMN,
     DOCUMENT_ID_COLUMN,
+    EMBEDDING_BATCH_SIZE,
     EMBEDDING_COLUMN,
     METADATA_COLUMN,
 )
@@ -52,6 +59,8 @@ class SnowflakeCortexConfig(SqlConfig):
     database: str
     role: str
     schema_name: str = Field(default="PUBLIC")
+    upload_parallelism: int = Field(default=DEFAULT_UPLOAD_PARALLELISM)
+    """The number of batch files uploaded to the stage concurrently."""
 
     @property
     def cortex_embedding_model(self) -> str | None:
@@ -157,6 +166,9 @@ class SnowflakeCortexSqlProcessor(SqlProcessorBase):
         """Initialize the Snowflake processor."""
         self.splitter_config = splitter_config
         self.embedder_config = embedder_config
+        self._pending_chunks: list[tuple[AirbyteRecordMessage, str, Chunk]] = []
+        self._staged_files: dict[Path, Future[None]] = {}
+        self._stage_path = f"@~/airbyte_cortex/{ulid.ULID()}"
         super().__init__(
             sql_config=sql_config,
             catalog_provider=catalog_provider,
@@ -181,6 +193,54 @@ class SnowflakeCortexSqlProcessor(SqlProcessorBase):
             EMBEDDING_COLUMN: f"VECTOR(FLOAT, {self.embedding_dimensions})",
         }
 
+    @cached_property
+    def _upload_executor(self) -> ThreadPoolExecutor:
+        """Return the thread pool which uploads the batch files to the stage."""
+        return ThreadPoolExecutor(
+            max_workers=self.sql_config.upload_parallelism,
+            thread_name_prefix="cortex-stage-upload",
+        )
+
+    def _put_file(self, file_path: Path) -> None:
+        """Upload a single batch file to the internal stage of this processor."""
+        path_str = str(file_path.absolute()).replace("\\", "\\\\")
+        self._execute_sql(f"PUT 'file://{path_str}' {self._stage_path};")
+
+    def _stage_file(self, file_path: Path) -> Future[None]:
+        """Schedule the upload of the file to the stage, unless it is already scheduled."""
+        if file_path not in self._staged_files:
+            self._staged_files[file_path] = self._upload_executor.submit(self._put_file, file_path)
+        return self._staged_files[file_path]
+
+    def _remove_staged_files(self, files: list[Path]) -> None:
+        """Remove the files from the stage, once their uploads are done."""
+        wait([
+            self._staged_files[file_path] for file_path in files if file_path in self._staged_files
+        ])
+        for file_path in files:
+            self._execute_sql(f"REMOVE {self._stage_path}/{file_path.name};")
+
+    def _shutdown_upload_executor(self) -> None:
+        """Stop the uploads, removing the files staged for the batches which were never loaded."""
+        upload_executor: ThreadPoolExecutor | None = self.__dict__.pop("_upload_executor", None)
+        if upload_executor is None:
+            return
+
+        upload_executor.shutdown(wait=True, cancel_futures=True)
+        try:
+            self._remove_staged_files(list(self._staged_files))
+        finally:
+            self._staged_files.clear()
+
+    def _stage_completed_batches(self, stream_name: str) -> None:
+        """Start uploading the batch files which are no longer written to.
+
+        This lets the uploads run in the background, while the next batch is being embedded.
+        """
+        for batch_handle in self.file_writer.get_pending_batches(stream_name):
+            for file_path in batch_handle.files:
+                self._stage_file(file_path)
+
     @overrides
     def _write_files_to_new_table(
         self,
@@ -190,23 +250,55 @@ class SnowflakeCortexSqlProcessor(SqlProcessorBase):
     ) -> str:
         """Write files to a new table.
 
-        This is the same as PyAirbyte's SnowflakeSqlProcessor implementation, migrated here for
-        stability. The main differences lie within `_get_sql_column_definitions()`, whose logic is
-        abstracted out of this method.
+        This is based on PyAirbyte's SnowflakeSqlProcessor implementation, migrated here for
+        stability. Unlike the original, the files are uploaded to the stage concurrently (most of
+        them while the records are still being processed), and each group of
+        `upload_parallelism` uploaded files is loaded with its own `COPY INTO`, without waiting for
+        the rest of the uploads.
         """
         temp_table_name = self._create_table_for_loading(
             stream_name=stream_name,
             batch_id=batch_id,
         )
-        internal_sf_stage_name = f"@%{temp_table_name}"
+        uploads = {self._stage_file(file_path): file_path for file_path in files}
+        copied_files: set[Path] = set()
+
+        try:
+            uploaded_files: list[Path] = []
+            for upload in as_completed(uploads):
+                upload.result()
+                uploaded_files.append(uploads[upload])
+                if len(uploaded_files) >= self.sql_config.upload_parallelism:
+                    self._copy_staged_files(temp_table_name, stream_name, uploaded_files)
+                    copied_files.update(uploaded_files)
+                    uploaded_files = []
+
+            if uploaded_files:
+                self._copy_staged_files(temp_table_name, stream_name, uploaded_files)
+                copied_files.update(uploaded_files)
+        finally:
+            # the copied files are purged from the stage, the rest would stay there after a failure
+            try:
+                self._remove_staged_files([
+                    file_path for file_path in files if file_path not in copied_files
+                ])
+            finally:
+                for file_path in files:
+                    self._staged_files.pop(file_path, None)
 
-        def path_str(path: Path) -> str:
-            return str(path.absolute()).replace("\\", "\\\\")
+        return temp_table_name
 
-        for file_path in files:
-            query = f"PUT 'file://{path_str(file_path)}' {internal_sf_stage_name};"
-            self._execute_sql(query)
+    def _copy_staged_files(
+        self,
+        temp_table_name: str,
+        stream_name: str,
+        files: list[Path],
+    ) -> None:
+        """Load the staged files into the table, removing them from the stage once loaded.
 
+        The main differences with PyAirbyte's SnowflakeSqlProcessor lie within
+        `_get_sql_column_definitions()`, whose logic is abstracted out of this method.
+        """
         columns_list = [
             self._quote_identifier(c)
             for c in list(self._get_sql_column_definitions(stream_name).keys())
@@ -231,15 +323,15 @@ class SnowflakeCortexSqlProcessor(SqlProcessorBase):
             )
             FROM (
                 SELECT {variant_cols_str}
-                FROM {internal_sf_stage_name}
+                FROM {self._stage_path}
             )
             FILES = ( {files_list} )
             FILE_FORMAT = ( TYPE = JSON, COMPRESSION = GZIP )
+            PURGE = TRUE
             ;
             """
         )
         self._execute_sql(copy_statement)
-        return temp_table_name
 
     @overrides
     def _init_connection_settings(self, connection: Connection) -> None:
@@ -311,27 +403,41 @@ class SnowflakeCortexSqlProcessor(SqlProcessorBase):
         We override the SQLProcessor implementation in order to handle chunking, embedding, etc.
 
         This method is called for each record message, before the record is written to local file.
+        The chunks are accumulated across records and embedded in batches of `EMBEDDING_BATCH_SIZE`.
         """
         document_chunks, id_to_delete = self.splitter.process(record_msg)
 
         # TODO: Decide if we need to incorporate this into the final implementation:
         _ = id_to_delete
 
+        document_id = self._create_document_id(record_msg)
+        self._pending_chunks.extend((record_msg, document_id, chunk) for chunk in document_chunks)
+        if len(self._pending_chunks) >= EMBEDDING_BATCH_SIZE:
+            self._embed_pending_chunks()
+
+    def _embed_pending_chunks(self) -> None:
+        """Embed the accumulated chunks with a single embedder call, then write them to local files.
+
+        The batch files completed by these writes start uploading to the stage right away.
+        """
+        if not self._pending_chunks:
+            return
+
+        pending_chunks, self._pending_chunks = self._pending_chunks, []
+        embeddings: list[list[float] | None] = [None] * len(pending_chunks)
         if not self.sql_config.cortex_embedding_model:
-            embeddings = self.embedder.embed_documents(
+            embeddings = self.embedder.embed_documents(  # type: ignore [assignment]
                 # TODO: Check this: Expects a list of documents, not chunks (docs are inconsistent)
-                documents=document_chunks,
+                documents=[chunk for _, _, chunk in pending_chunks],
             )
-        for i, chunk in enumerate(document_chunks, start=0):
+        for (record_msg, document_id, chunk), embedding in zip(pending_chunks, embeddings):
             new_data: dict[str, Any] = {
-                DOCUMENT_ID_COLUMN: self._create_document_id(record_msg),
+                DOCUMENT_ID_COLUMN: document_id,
                 CHUNK_ID_COLUMN: str(uuid.uuid4().int),
                 METADATA_COLUMN: chunk.metadata,
                 DOCUMENT_CONTENT_COLUMN: chunk.page_content,
-                EMBEDDING_COLUMN: None,
+                EMBEDDING_COLUMN: embedding,
             }
-            if not self.sql_config.cortex_embedding_model:
-                new_data[EMBEDDING_COLUMN] = embeddings[i]
 
             self.file_writer.process_record_message(
                 record_msg=AirbyteRecordMessage(
@@ -355,6 +461,20 @@ class SnowflakeCortexSqlProcessor(SqlProcessorBase):
                 },
             )
 
+        for stream_name in {record_msg.stream for record_msg, _, _ in pending_chunks}:
+            self._stage_completed_batches(stream_name)
+
+    def write_all_stream_data(self, write_strategy: WriteStrategy) -> None:
+        """Embed the remaining chunks before finalizing any pending writes.
+
+        The upload threads are shut down once all the files are loaded, or the loading has failed.
+        """
+        try:
+            self._embed_pending_chunks()
+            super().write_all_stream_data(write_strategy=write_strategy)
+        finally:
+            self._shutdown_upload_executor()
+
     def _get_table_by_name(
         self,
         table_name: str,
@@ -395,7 +515,7 @@ class SnowflakeCortexSqlProcessor(SqlProcessorBase):
         """
         pass
 
-    @property
+    @cached_property
     def embedder(self) -> embedder.Embedder:
         return embedder.create_from_config(
             embedding_config=self.embedder_config,  # type: ignore [arg-type]  # No common base class
@@ -407,7 +527,7 @@ class SnowflakeCortexSqlProcessor(SqlProcessorBase):
         """Return the number of dimensions for the embeddings."""
         return self.embedder.embedding_dimensions
 
-    @property
+    @cached_property
     def splitter(self) -> DocumentSplitter:
         return DocumentSplitter(
             config=self.splitter_config,
@@ -42,6 +42,7 @@ class DestinationSnowflakeCortex(Destination):
                 schema_name=config.indexing.default_schema,
                 username=config.indexing.username,
                 password=SecretString(config.indexing.credentials.password),
+                upload_parallelism=config.indexing.upload_parallelism,
             ),
             splitter_config=config.processing,
             embedder_config=config.embedding,  # type: ignore [arg-type]  # No common base class
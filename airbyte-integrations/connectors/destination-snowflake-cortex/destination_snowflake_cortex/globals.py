@@ -8,3 +8,9 @@ CHUNK_ID_COLUMN = "chunk_id"
 METADATA_COLUMN = "metadata"
 DOCUMENT_CONTENT_COLUMN = "document_content"
 EMBEDDING_COLUMN = "embedding"
+
+EMBEDDING_BATCH_SIZE = 256
+"""The number of chunks accumulated across records before they are embedded at once."""
+
+DEFAULT_UPLOAD_PARALLELISM = 4
+"""The default number of batch files uploaded to the Snowflake stage concurrently."""
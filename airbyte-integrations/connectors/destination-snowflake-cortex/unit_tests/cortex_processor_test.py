@@ -0,0 +1,157 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk
+from airbyte_cdk.models import AirbyteRecordMessage
+
+from destination_snowflake_cortex.cortex_processor import SnowflakeCortexSqlProcessor
+from destination_snowflake_cortex.globals import EMBEDDING_BATCH_SIZE
+
+
+class TestSnowflakeCortexSqlProcessor(unittest.TestCase):
+    def setUp(self):
+        sql_config = MagicMock()
+        sql_config.cortex_embedding_model = None
+        sql_config.upload_parallelism = 2
+        with patch.object(SnowflakeCortexSqlProcessor, "_ensure_schema_exists"):
+            self.processor = SnowflakeCortexSqlProcessor(
+                sql_config=sql_config,
+                splitter_config=MagicMock(),
+                embedder_config=MagicMock(),
+                catalog_provider=MagicMock(),
+                temp_dir=Path(tempfile.mkdtemp()),
+            )
+        self.processor.__dict__["embedder"] = MagicMock(embedding_dimensions=2)
+        self.processor.__dict__["splitter"] = MagicMock()
+        self.processor.file_writer = MagicMock()
+        self.processor.file_writer.get_pending_batches.return_value = []
+        self.processor._get_primary_keys = MagicMock(return_value=[["id"]])
+        self.processor._create_table_for_loading = MagicMock(return_value="temp_table")
+        self.processor._execute_sql = MagicMock()
+
+    def _record(self, record_id: int) -> AirbyteRecordMessage:
+        return AirbyteRecordMessage(stream="mystream", data={"id": record_id}, emitted_at=0)
+
+    def _executed_sql(self, statement: str) -> list[str]:
+        return [
+            call.args[0]
+            for call in self.processor._execute_sql.call_args_list
+            if call.args[0].strip().startswith(statement)
+        ]
+
+    def test_embeddings_are_batched_across_records(self):
+        chunks_per_record = 2
+        self.processor.splitter.process.side_effect = lambda record: (
+            [Chunk(page_content="text", metadata={}, record=record)] * chunks_per_record,
+            None,
+        )
+        self.processor.embedder.embed_documents.side_effect = lambda documents: [
+            [0.1, 0.2] for _ in documents
+        ]
+
+        records_count = EMBEDDING_BATCH_SIZE // chunks_per_record + 1
+        for record_id in range(records_count):
+            self.processor.process_record_message(self._record(record_id), stream_schema={})
+
+        # a single embedding call for the full batch, the rest is pending
+        self.processor.embedder.embed_documents.assert_called_once()
+        self.assertEqual(
+            len(self.processor.embedder.embed_documents.call_args.kwargs["documents"]),
+            EMBEDDING_BATCH_SIZE,
+        )
+        self.assertEqual(len(self.processor._pending_chunks), chunks_per_record)
+
+        self.processor._embed_pending_chunks()
+        self.assertEqual(self.processor.embedder.embed_documents.call_count, 2)
+        self.assertEqual(
+            self.processor.file_writer.process_record_message.call_count,
+            records_count * chunks_per_record,
+        )
+        written = self.processor.file_writer.process_record_message.call_args.kwargs["record_msg"]
+        self.assertEqual(written.data["document_id"], f"Stream_mystream_Key_{records_count - 1}")
+        self.assertEqual(written.data["embedding"], [0.1, 0.2])
+
+    def test_completed_batches_are_uploaded_while_processing(self):
+        self.processor.splitter.process.return_value = (
+            [Chunk(page_content="text", metadata={}, record=self._record(1))]
+            * EMBEDDING_BATCH_SIZE,
+            None,
+        )
+        self.processor.embedder.embed_documents.side_effect = lambda documents: [
+            [0.1, 0.2] for _ in documents
+        ]
+        completed_batch = MagicMock(files=[Path("/tmp/mystream_1.jsonl.gz")])
+        self.processor.file_writer.get_pending_batches.return_value = [completed_batch]
+
+        self.processor.process_record_message(self._record(1), stream_schema={})
+        self.processor._staged_files[Path("/tmp/mystream_1.jsonl.gz")].result()
+
+        self.processor.file_writer.get_pending_batches.assert_called_once_with("mystream")
+        puts = self._executed_sql("PUT")
+        self.assertEqual(len(puts), 1)
+        self.assertIn("file:///tmp/mystream_1.jsonl.gz", puts[0])
+        self.assertIn(self.processor._stage_path, puts[0])
+
+    def test_write_files_to_new_table_copies_per_group(self):
+        files = [Path(f"/tmp/mystream_{i}.jsonl.gz") for i in range(5)]
+
+        temp_table_name = self.processor._write_files_to_new_table(
+            files=files,
+            stream_name="mystream",
+            batch_id="1",
+        )
+
+        self.assertEqual(temp_table_name, "temp_table")
+        self.assertEqual(len(self._executed_sql("PUT")), len(files))
+        copies = self._executed_sql("COPY INTO")
+        # groups of `upload_parallelism` files, the remainder is copied at the end
+        self.assertEqual(len(copies), 3)
+        for file_path in files:
+            self.assertEqual(sum(f"'{file_path.name}'" in copy for copy in copies), 1)
+        self.assertTrue(all("PURGE = TRUE" in copy for copy in copies))
+        self.assertEqual(self.processor._staged_files, {})
+
+    def test_files_not_copied_are_removed_from_the_stage(self):
+        files = [Path(f"/tmp/mystream_{i}.jsonl.gz") for i in range(3)]
+
+        def execute_sql(sql: str) -> None:
+            if sql.strip().startswith("COPY INTO"):
+                raise RuntimeError("COPY failed")
+
+        self.processor._execute_sql.side_effect = execute_sql
+
+        with self.assertRaises(RuntimeError):
+            self.processor._write_files_to_new_table(
+                files=files,
+                stream_name="mystream",
+                batch_id="1",
+            )
+
+        self.assertEqual(len(self._executed_sql("PUT")), len(files))
+        self.assertEqual(
+            sorted(self._executed_sql("REMOVE")),
+            [f"REMOVE {self.processor._stage_path}/{file_path.name};" for file_path in files],
+        )
+        self.assertEqual(self.processor._staged_files, {})
+
+    def test_write_all_stream_data_shuts_down_the_uploads(self):
+        self.processor.catalog_provider.stream_names = []
+        staged_file = Path("/tmp/mystream_1.jsonl.gz")
+        self.processor._stage_file(staged_file).result()
+        upload_executor = self.processor._upload_executor
+
+        self.processor.write_all_stream_data(write_strategy=MagicMock())
+
+        self.assertTrue(upload_executor._shutdown)
+        self.assertNotIn("_upload_executor", self.processor.__dict__)
+        # the file staged for the batch which was never loaded is removed
+        self.assertEqual(
+            self._executed_sql("REMOVE"),
+            [f"REMOVE {self.processor._stage_path}/{staged_file.name};"],
+        )
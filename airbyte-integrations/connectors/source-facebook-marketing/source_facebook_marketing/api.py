@@ -4,8 +4,10 @@
 
 import json
 import logging
+import threading
 from dataclasses import dataclass
 from time import sleep
+from typing import Optional
 
 import backoff
 import pendulum
@@ -48,11 +50,18 @@ class MyFacebookAdsApi(FacebookAdsApi):
 
     # Insights async jobs throttle
     _ads_insights_throttle: Throttle
+    # Insights async jobs throttle of the last call of each thread, the threads may call the API for different accounts
+    _last_call = threading.local()
 
     @property
     def ads_insights_throttle(self) -> Throttle:
         return self._ads_insights_throttle
 
+    @property
+    def last_call_ads_insights_throttle(self) -> Optional[Throttle]:
+        """Insights throttle of the last call made by the current thread, None if its response had no throttle header"""
+        return getattr(self._last_call, "ads_insights_throttle", None)
+
     @staticmethod
     def _parse_call_rate_header(headers):
         usage = 0
@@ -145,6 +154,7 @@ class MyFacebookAdsApi(FacebookAdsApi):
                 per_application=ads_insights_throttle.get("app_id_util_pct", 0),
                 per_account=ads_insights_throttle.get("acc_id_util_pct", 0),
             )
+            self._last_call.ads_insights_throttle = self._ads_insights_throttle
 
     def _should_restore_default_page_size(self, params):
         """
@@ -168,6 +178,7 @@ class MyFacebookAdsApi(FacebookAdsApi):
         """Makes an API call, delegate actual work to parent class and handles call rates"""
         if self._should_restore_default_page_size(params):
             params.update(**{"limit": self.default_page_size})
+        self._last_call.ads_insights_throttle = None
         response = super().call(method, path, params, headers, files, url_override, api_version)
         self._update_insights_throttle_limit(response)
         self._handle_call_rate_limit(response, params)
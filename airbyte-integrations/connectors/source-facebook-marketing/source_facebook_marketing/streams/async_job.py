@@ -6,6 +6,7 @@ import copy
 import logging
 from abc import ABC, abstractmethod
 from enum import Enum
+from itertools import chain, islice
 from typing import Any, Iterator, List, Mapping, Optional, Type, Union
 
 import backoff
@@ -59,6 +60,9 @@ def update_in_batch(api: FacebookAdsApi, jobs: List["AsyncJob"]):
         batch = batch.execute()
 
 
+EDGE_CLASSES = {"account": AdAccount, "campaign": Campaign, "adset": AdSet, "ad": Ad}
+
+
 class Status(str, Enum):
     """Async job statuses"""
 
@@ -73,6 +77,9 @@ class Status(str, Enum):
 class AsyncJob(ABC):
     """Abstract AsyncJob base class"""
 
+    # Rows of the result downloaded in advance are kept in memory until consumed, the next rows are read while consuming them.
+    MAX_DOWNLOADED_ROWS = 2000
+
     def __init__(self, api: FacebookAdsApi, interval: pendulum.Period):
         """Init generic async job
 
@@ -122,6 +129,13 @@ class AsyncJob(ABC):
     def get_result(self) -> Iterator[Any]:
         """Retrieve result of the finished job."""
 
+    @abstractmethod
+    def download_result(self, max_rows: Optional[int] = None) -> int:
+        """Download the first pages of the result of the finished job in advance, up to max_rows rows (MAX_DOWNLOADED_ROWS by default).
+
+        :return: number of rows downloaded
+        """
+
     @abstractmethod
     def split_job(self) -> List["AsyncJob"]:
         """Split existing job in few smaller ones"""
@@ -135,6 +149,11 @@ class ParentAsyncJob(AsyncJob):
         super().__init__(**kwargs)
         self._jobs = jobs
 
+    @property
+    def jobs(self) -> List["InsightAsyncJob"]:
+        """The jobs of the group"""
+        return list(self._jobs)
+
     def start(self):
         """Start each job in the group."""
         for job in self._jobs:
@@ -168,6 +187,16 @@ class ParentAsyncJob(AsyncJob):
         for job in self._jobs:
             yield from job.get_result()
 
+    def download_result(self, max_rows: Optional[int] = None) -> int:
+        """Download results of the jobs in the group in turn, up to max_rows rows for the whole group."""
+        max_rows = self.MAX_DOWNLOADED_ROWS if max_rows is None else max_rows
+        downloaded_rows = 0
+        for job in self._jobs:
+            if downloaded_rows >= max_rows:
+                break
+            downloaded_rows += job.download_result(max_rows - downloaded_rows)
+        return downloaded_rows
+
     def split_job(self) -> List["AsyncJob"]:
         """Split existing job in few smaller ones."""
         new_jobs = []
@@ -220,6 +249,19 @@ class InsightAsyncJob(AsyncJob):
         self._start_time = None
         self._finish_time = None
         self._failed = False
+        self._result: Optional[Iterator[Any]] = None
+
+    @property
+    def edge_level(self) -> str:
+        """Level of the edge object: account, campaign, adset or ad"""
+        for level, edge_class in EDGE_CLASSES.items():
+            if isinstance(self._edge_object, edge_class):
+                return level
+        raise RuntimeError("Unsupported edge_object.")  # pragma: no cover
+
+    def split_job_to_level(self, level: str) -> List["AsyncJob"]:
+        """Split existing job straight to the jobs of the given level, i.e. Account -> AdSet"""
+        return self._split_by_edge_class(EDGE_CLASSES[level])
 
     def split_job(self) -> List["AsyncJob"]:
         """Split existing job in few smaller ones grouped by ParentAsyncJob class."""
@@ -289,6 +331,7 @@ class InsightAsyncJob(AsyncJob):
 
         self._job = None
         self._failed = False
+        self._result = None
         self._start_time = None
         self._finish_time = None
         self.start()
@@ -378,8 +421,19 @@ class InsightAsyncJob(AsyncJob):
         """Retrieve result of the finished job."""
         if not self._job or self.failed:
             raise RuntimeError(f"{self}: Incorrect usage of get_result - the job is not started or failed")
+        if self._result is not None:
+            # the result was downloaded in advance, release it once consumed
+            result, self._result = self._result, None
+            return result
         return self._job.get_result(params={"limit": self.page_size})
 
+    def download_result(self, max_rows: Optional[int] = None) -> int:
+        """Download the first pages of the result, the first get_result call returns them before reading the next pages."""
+        result = iter(self.get_result())
+        rows = list(islice(result, self.MAX_DOWNLOADED_ROWS if max_rows is None else max_rows))
+        self._result = chain(rows, result)
+        return len(rows)
+
     def __str__(self) -> str:
         """String representation of the job wrapper."""
         job_id = self._job["report_run_id"] if self._job else "<None>"
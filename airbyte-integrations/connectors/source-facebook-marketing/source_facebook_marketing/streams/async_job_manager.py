@@ -4,11 +4,14 @@
 
 import logging
 import time
-from typing import TYPE_CHECKING, Iterator, List
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 
 from source_facebook_marketing.streams.common import JobException
 
 from .async_job import AsyncJob, ParentAsyncJob, update_in_batch
+from .async_job_stats import InsightJobStats
 
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -19,87 +22,172 @@ logger = logging.getLogger("airbyte")
 
 class InsightAsyncJobManager:
     """
-    Class for managing Ads Insights async jobs. Before running next job it
-    checks current insight throttle value and if it greater than THROTTLE_LIMIT variable, no new jobs added.
-    To consume completed jobs use completed_job generator, jobs will be returned in the order they finished.
+    Class for managing Ads Insights async jobs of one or many accounts. The jobs of all accounts are kept
+    in flight at the same time, new jobs are taken from the accounts in turns. Before running next job of an account it
+    checks current insight throttle value of the account and if it greater than THROTTLE_LIMIT variable, no new jobs
+    added for the account.
+    Status of running jobs is polled with a backoff, which grows while no job is completed. Results of completed jobs
+    are downloaded by a pool of workers while other jobs are still running.
+    To consume completed jobs use completed_jobs generator, jobs will be returned in the order they finished.
     """
 
     # When current insights throttle hit this value no new jobs added.
     THROTTLE_LIMIT = 70
     MAX_NUMBER_OF_ATTEMPTS = 20
-    # Time to wait before checking job status update again.
+    # Time to wait before checking job status update again, it grows from the minimum up to the maximum while no job is completed.
+    MIN_JOB_STATUS_UPDATE_SLEEP_SECONDS = 5
     JOB_STATUS_UPDATE_SLEEP_SECONDS = 30
+    JOB_STATUS_UPDATE_BACKOFF_FACTOR = 2
     # Maximum of concurrent jobs that could be scheduled. Since throttling
     # limit is not reliable indicator of async workload capability we still have to use this parameter.
     MAX_JOBS_IN_QUEUE = 100
+    # Results of completed jobs are kept in memory until consumed, so the number of downloads ahead is limited,
+    # each download keeps up to AsyncJob.MAX_DOWNLOADED_ROWS rows.
+    RESULT_DOWNLOAD_WORKERS = 4
+    MAX_RESULT_DOWNLOADS = 8
 
-    def __init__(self, api: "API", jobs: Iterator[AsyncJob], account_id: str):
+    def __init__(
+        self,
+        api: "API",
+        jobs: Union[Iterable[AsyncJob], Mapping[str, Iterable[AsyncJob]]],
+        account_id: Optional[str] = None,
+        job_stats: Optional[Mapping[str, InsightJobStats]] = None,
+    ):
         """Init
 
         :param api:
-        :param jobs:
+        :param jobs: jobs of the account, or jobs of each account keyed by account id
+        :param account_id: account id of the jobs, when jobs of a single account are passed
+        :param job_stats: stats of each account to record the failures and durations of the jobs to
         """
         self._api = api
-        self._account_id = account_id
-        self._jobs = iter(jobs)
-        self._running_jobs = []
+        self._job_stats = job_stats or {}
+        account_jobs = jobs if isinstance(jobs, Mapping) else {account_id: jobs}
+        # accounts that may have more jobs to start, in the order they take turns
+        self._pending_accounts: Deque[Tuple[str, Iterator[AsyncJob]]] = deque(
+            (account_id, iter(jobs)) for account_id, jobs in account_jobs.items()
+        )
+        self._account_throttles: Dict[str, float] = {}
+        self._running_jobs: List[Tuple[str, AsyncJob]] = []
+        self._completed_jobs: Deque[Tuple[str, AsyncJob]] = deque()
+        self._downloads: Deque[Tuple[str, AsyncJob, Future]] = deque()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._sleep_seconds = self.MIN_JOB_STATUS_UPDATE_SLEEP_SECONDS
 
     def _start_jobs(self):
-        """Enqueue new jobs."""
+        """Enqueue new jobs, one job of each account in turn."""
+        if not self._pending_accounts:
+            return
 
-        self._update_api_throttle_limit()
-        self._wait_throttle_limit_down()
         prev_jobs_count = len(self._running_jobs)
-        while self._get_current_throttle_value() < self.THROTTLE_LIMIT and len(self._running_jobs) < self.MAX_JOBS_IN_QUEUE:
-            job = next(self._jobs, None)
+        throttled_accounts = []
+        while self._pending_accounts and len(self._running_jobs) < self.MAX_JOBS_IN_QUEUE:
+            account_id, jobs = self._pending_accounts.popleft()
+            # a throttled account is checked at most once per call, as it is set aside until the next one
+            if account_id not in self._account_throttles or self._get_current_throttle_value(account_id) >= self.THROTTLE_LIMIT:
+                self._update_api_throttle_limit(account_id)
+            if self._get_current_throttle_value(account_id) >= self.THROTTLE_LIMIT:
+                throttled_accounts.append((account_id, jobs))
+                continue
+            job = next(jobs, None)
             if not job:
-                self._empty = True
-                break
+                continue
             job.start()
-            self._running_jobs.append(job)
+            self._record_account_throttle(account_id)
+            self._running_jobs.append((account_id, job))
+            self._pending_accounts.append((account_id, jobs))
+        self._pending_accounts.extend(throttled_accounts)
 
         logger.info(
             f"Added: {len(self._running_jobs) - prev_jobs_count} jobs. "
             f"Current throttle limit is {self._api.api.ads_insights_throttle}, "
+            f"{len(throttled_accounts)} account(s) throttled, "
             f"{len(self._running_jobs)}/{self.MAX_JOBS_IN_QUEUE} job(s) in queue"
         )
 
     def completed_jobs(self) -> Iterator[AsyncJob]:
-        """Wait until job is ready and return it. If job
+        """Wait until job is ready and return it.
+
+        :yield: completed jobs
+        """
+        for _, job in self.completed_account_jobs():
+            yield job
+
+    def completed_account_jobs(self) -> Iterator[Tuple[str, AsyncJob]]:
+        """Wait until job is ready and its result is downloaded and return it. If job
             failed try to restart it for FAILED_JOBS_RESTART_COUNT times. After job
             is completed new jobs added according to current throttling limit.
 
-        :yield: completed jobs
+        :yield: account id and completed job
         """
         if not self._running_jobs:
             self._start_jobs()
 
-        while self._running_jobs:
-            completed_jobs = self._check_jobs_status_and_restart()
-            while not completed_jobs:
-                logger.info(f"No jobs ready to be consumed, wait for {self.JOB_STATUS_UPDATE_SLEEP_SECONDS} seconds")
-                time.sleep(self.JOB_STATUS_UPDATE_SLEEP_SECONDS)
-                completed_jobs = self._check_jobs_status_and_restart()
-            yield from completed_jobs
-            self._start_jobs()
+        self._executor = ThreadPoolExecutor(max_workers=self.RESULT_DOWNLOAD_WORKERS, thread_name_prefix="insights-result")
+        try:
+            while self._running_jobs or self._pending_accounts or self._completed_jobs or self._downloads:
+                if self._running_jobs:
+                    self._check_jobs_status_and_restart()
+                self._start_downloads()
+                self._start_jobs()
+                self._wait_for_downloads()
+                if not self._is_download_done():
+                    self._sleep_seconds = min(
+                        self._sleep_seconds * self.JOB_STATUS_UPDATE_BACKOFF_FACTOR, self.JOB_STATUS_UPDATE_SLEEP_SECONDS
+                    )
+                    continue
+                self._sleep_seconds = self.MIN_JOB_STATUS_UPDATE_SLEEP_SECONDS
+                # the jobs are taken from the downloads one at a time, none is lost if the jobs are not consumed to the end
+                while self._is_download_done():
+                    yield self._pop_downloaded_job()
+        finally:
+            # the downloads not started yet are cancelled when the jobs are not consumed to the end, e.g. on error,
+            # their results are read while consuming the jobs
+            self._executor.shutdown(wait=False, cancel_futures=True)
 
-    def _check_jobs_status_and_restart(self) -> List[AsyncJob]:
-        """Checks jobs status in advance and restart if some failed.
+    def _start_downloads(self):
+        """Download results of completed jobs in the background."""
+        while self._completed_jobs and len(self._downloads) < self.MAX_RESULT_DOWNLOADS:
+            account_id, job = self._completed_jobs.popleft()
+            self._downloads.append((account_id, job, self._executor.submit(job.download_result)))
 
-        :return: list of completed jobs
-        """
-        completed_jobs = []
+    def _wait_for_downloads(self):
+        """Wait for the oldest download or for the next status update, whatever comes first."""
+        if self._downloads:
+            wait([self._downloads[0][2]], timeout=self._sleep_seconds)
+        elif self._running_jobs or self._pending_accounts:
+            logger.info(f"No jobs ready to be consumed, wait for {self._sleep_seconds} seconds")
+            time.sleep(self._sleep_seconds)
+
+    def _is_download_done(self) -> bool:
+        """Tell if the oldest download is done, the jobs are returned in the order they completed"""
+        return bool(self._downloads) and self._downloads[0][2].done()
+
+    def _pop_downloaded_job(self) -> Tuple[str, AsyncJob]:
+        account_id, job, download = self._downloads.popleft()
+        if download.cancelled():
+            # the result is read while consuming the job
+            logger.info(f"{job}: the download of the result in advance was cancelled")
+        elif download.exception():
+            # the result will be read again while consuming the job
+            logger.warning(f"{job}: failed to download the result in advance: {download.exception()}")
+        return account_id, job
+
+    def _check_jobs_status_and_restart(self):
+        """Checks jobs status in advance and restart if some failed, completed jobs are queued for download."""
         running_jobs = []
+        completed_num = 0
         failed_num = 0
 
-        update_in_batch(api=self._api.api, jobs=self._running_jobs)
-        self._wait_throttle_limit_down()
-        for job in self._running_jobs:
+        update_in_batch(api=self._api.api, jobs=[job for _, job in self._running_jobs])
+        for account_id, job in self._running_jobs:
+            if job.failed or job.completed:
+                self._record_job_stats(account_id, job)
             if job.failed:
                 if isinstance(job, ParentAsyncJob):
                     # if this job is a ParentAsyncJob, it holds X number of jobs
                     # we want to check that none of these nested jobs have exceeded MAX_NUMBER_OF_ATTEMPTS
-                    for nested_job in job._jobs:
+                    for nested_job in job.jobs:
                         if nested_job.attempt_number >= self.MAX_NUMBER_OF_ATTEMPTS:
                             raise JobException(f"{nested_job}: failed more than {self.MAX_NUMBER_OF_ATTEMPTS} times. Terminating...")
                 if job.attempt_number >= self.MAX_NUMBER_OF_ATTEMPTS:
@@ -111,45 +199,61 @@ class InsightAsyncJobManager:
                     )
                     smaller_jobs = job.split_job()
                     grouped_jobs = ParentAsyncJob(api=self._api.api, jobs=smaller_jobs, interval=job.interval)
-                    running_jobs.append(grouped_jobs)
+                    running_jobs.append((account_id, grouped_jobs))
                     grouped_jobs.start()
                 else:
                     logger.info("%s: failed, restarting", job)
                     job.restart()
-                    running_jobs.append(job)
+                    running_jobs.append((account_id, job))
                 failed_num += 1
             elif job.completed:
-                completed_jobs.append(job)
+                self._completed_jobs.append((account_id, job))
+                completed_num += 1
             else:
-                running_jobs.append(job)
+                running_jobs.append((account_id, job))
 
         self._running_jobs = running_jobs
-        logger.info(f"Completed jobs: {len(completed_jobs)}, Failed jobs: {failed_num}, Running jobs: {len(self._running_jobs)}")
+        logger.info(f"Completed jobs: {completed_num}, Failed jobs: {failed_num}, Running jobs: {len(self._running_jobs)}")
 
-        return completed_jobs
+    def _record_job_stats(self, account_id: str, job: AsyncJob):
+        """Record the outcome of the finished job, the completed jobs of a failed group are recorded once the group completes."""
+        stats = self._job_stats.get(account_id)
+        if not stats:
+            return
+        for finished_job in job.jobs if isinstance(job, ParentAsyncJob) else [job]:
+            if finished_job.failed:
+                stats.record(finished_job.edge_level, failed=True)
+            elif not job.failed:
+                days = finished_job.interval.in_days() + 1
+                stats.record(finished_job.edge_level, failed=False, seconds_per_day=finished_job.elapsed_time.total_seconds() / days)
 
-    def _wait_throttle_limit_down(self):
-        while self._get_current_throttle_value() > self.THROTTLE_LIMIT:
-            logger.info(f"Current throttle is {self._api.api.ads_insights_throttle}, wait {self.JOB_STATUS_UPDATE_SLEEP_SECONDS} seconds")
-            time.sleep(self.JOB_STATUS_UPDATE_SLEEP_SECONDS)
-            self._update_api_throttle_limit()
-
-    def _get_current_throttle_value(self) -> float:
+    def _get_current_throttle_value(self, account_id: str) -> float:
         """
         Get current ads insights throttle value based on app id and account id.
         It evaluated as minimum of those numbers cause when account id throttle
         hit 100 it cools down very slowly (i.e. it still says 100 despite no jobs
         running and it capable serve new requests). Because of this behaviour
         facebook throttle limit is not reliable metric to estimate async workload.
+        The application throttle is shared by all accounts, the account throttle is the last one seen for the account.
         """
         throttle = self._api.api.ads_insights_throttle
 
-        return min(throttle.per_account, throttle.per_application)
+        return min(self._account_throttles.get(account_id, 0), throttle.per_application)
 
-    def _update_api_throttle_limit(self):
+    def _update_api_throttle_limit(self, account_id: str):
         """
         Sends <ACCOUNT_ID>/insights GET request with no parameters, so it would
         respond with empty list of data so api use "x-fb-ads-insights-throttle"
         header to update current insights throttle limit.
         """
-        self._api.get_account(account_id=self._account_id).get_insights()
+        self._api.get_account(account_id=account_id).get_insights()
+        self._record_account_throttle(account_id)
+
+    def _record_account_throttle(self, account_id: str):
+        """
+        Keep the account throttle of the last call of this thread, which was made for the account. The global throttle of the API
+        may come from the calls of the threads downloading the results of other accounts.
+        """
+        throttle = self._api.api.last_call_ads_insights_throttle
+        if throttle:
+            self._account_throttles[account_id] = throttle.per_account
@@ -0,0 +1,77 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+from typing import Any, Mapping, MutableMapping, Optional, Tuple
+
+
+class InsightJobStats:
+    """
+    Failures and durations of the insight jobs of an account, collected over the syncs and saved in the stream state.
+    Before the jobs are submitted they are used to plan the jobs of the account:
+        - when the jobs of a level used to fail, the jobs are split to the next level (campaign, adset, ad) upfront,
+          instead of running the jobs that are doomed to fail twice before they are split;
+        - when the account jobs used to be fast and reliable, a job covers a few periods at once.
+    The stats are exponentially weighted averages per level of the jobs, so the latest syncs matter the most.
+    They are only valid for the breakdowns they were collected with.
+    """
+
+    LEVELS = ["account", "campaign", "adset", "ad"]
+    # weight of the latest observation in the averages
+    SMOOTHING = 0.3
+    # jobs of the level are split upfront when they fail this often
+    MAX_FAILURE_RATE = 0.5
+    # decay of the failure rate of a skipped level per sync, a failing level is tried again after about 7 syncs
+    SKIPPED_LEVEL_DECAY = 0.1
+    # periods are merged into jobs expected to run that long, but no more than MAX_PERIODS_PER_JOB periods per job
+    TARGET_JOB_SECONDS = 300
+    MAX_PERIODS_PER_JOB = 7
+
+    def __init__(self, breakdowns: str, levels: Optional[Mapping[str, Mapping[str, float]]] = None):
+        self._breakdowns = breakdowns
+        self._levels: MutableMapping[str, MutableMapping[str, float]] = {
+            level: dict(stats) for level, stats in (levels or {}).items() if level in self.LEVELS
+        }
+
+    @classmethod
+    def from_state(cls, state: Optional[Mapping[str, Any]], breakdowns: str) -> "InsightJobStats":
+        """Load the stats from the account state, the stats of other breakdowns are dropped"""
+        if state and state.get("breakdowns") == breakdowns:
+            return cls(breakdowns=breakdowns, levels=state.get("levels"))
+        return cls(breakdowns=breakdowns)
+
+    def to_state(self) -> Optional[Mapping[str, Any]]:
+        """Stats to save in the account state, None if there are no stats yet"""
+        if not self._levels:
+            return None
+        return {"breakdowns": self._breakdowns, "levels": self._levels}
+
+    def record(self, level: str, failed: bool, seconds_per_day: Optional[float] = None):
+        """Record the outcome of a job of the level, the duration is known for the completed jobs only"""
+        stats = self._levels.setdefault(level, {"failure_rate": 0.0})
+        stats["failure_rate"] += self.SMOOTHING * (float(failed) - stats["failure_rate"])
+        if seconds_per_day is not None:
+            previous = stats.get("seconds_per_day", seconds_per_day)
+            stats["seconds_per_day"] = previous + self.SMOOTHING * (seconds_per_day - previous)
+
+    def plan(self, period_days: int) -> Tuple[str, int]:
+        """Choose the level to split the jobs to and the number of periods per job for the next sync.
+        The failure rates of the skipped levels are decayed, so these levels are tried again after a few syncs.
+
+        :param period_days: number of days in a period (time increment)
+        :return: level and number of periods per job
+        """
+        for level in self.LEVELS[:-1]:
+            failure_rate = self._levels.get(level, {}).get("failure_rate", 0.0)
+            if failure_rate < self.MAX_FAILURE_RATE:
+                break
+            self._levels[level]["failure_rate"] = failure_rate * (1 - self.SKIPPED_LEVEL_DECAY)
+        else:
+            level = self.LEVELS[-1]
+
+        periods_per_job = 1
+        account_stats = self._levels.get(self.LEVELS[0], {})
+        if level == self.LEVELS[0] and account_stats.get("seconds_per_day") and account_stats["failure_rate"] < self.MAX_FAILURE_RATE / 2:
+            expected_periods = self.TARGET_JOB_SECONDS // (account_stats["seconds_per_day"] * period_days)
+            periods_per_job = int(max(1, min(expected_periods, self.MAX_PERIODS_PER_JOB)))
+        return level, periods_per_job
@@ -14,8 +14,9 @@ from airbyte_cdk.models import FailureType, SyncMode
 from airbyte_cdk.sources.streams.core import package_name_from_class
 from airbyte_cdk.sources.utils.schema_helpers import ResourceSchemaLoader
 from airbyte_cdk.utils import AirbyteTracedException
-from source_facebook_marketing.streams.async_job import AsyncJob, InsightAsyncJob
+from source_facebook_marketing.streams.async_job import AsyncJob, InsightAsyncJob, ParentAsyncJob
 from source_facebook_marketing.streams.async_job_manager import InsightAsyncJobManager
+from source_facebook_marketing.streams.async_job_stats import InsightJobStats
 from source_facebook_marketing.streams.common import traced_exception
 
 from .base_streams import FBMarketingIncrementalStream
@@ -101,6 +102,7 @@ class AdsInsights(FBMarketingIncrementalStream):
         self._cursor_values: Optional[Mapping[str, pendulum.Date]] = None  # latest period that was read for each account
         self._next_cursor_values = self._get_start_date()
         self._completed_slices = {account_id: set() for account_id in self._account_ids}
+        self._job_stats = {account_id: InsightJobStats(breakdowns=self._job_stats_breakdowns) for account_id in self._account_ids}
 
     @cached_property
     def name(self) -> str:
@@ -136,6 +138,11 @@ class AdsInsights(FBMarketingIncrementalStream):
     def insights_job_timeout(self):
         return pendulum.duration(minutes=self._insights_job_timeout)
 
+    @property
+    def _job_stats_breakdowns(self) -> str:
+        """The stats of the jobs are only valid for the same breakdowns"""
+        return f"{','.join(self.breakdowns)}|{','.join(self.action_breakdowns)}"
+
     def _transform_breakdown(self, record: Mapping[str, Any]) -> Mapping[str, Any]:
         for breakdown in self.breakdowns:
             if breakdown in self.object_breakdowns.keys():
@@ -175,8 +182,10 @@ class AdsInsights(FBMarketingIncrementalStream):
         except FacebookRequestError as exc:
             raise traced_exception(exc)
 
-        self._completed_slices[account_id].add(job.interval.start)
-        if job.interval.start == self._next_cursor_values[account_id]:
+        # the job may cover a few periods
+        interval_starts = set(job.interval.range("days", self.time_increment))
+        self._completed_slices[account_id].update(interval_starts)
+        if self._next_cursor_values[account_id] in interval_starts:
             self._advance_cursor(account_id)
 
     @property
@@ -190,12 +199,14 @@ class AdsInsights(FBMarketingIncrementalStream):
                     new_state[account_id] = {self.cursor_field: self._cursor_values[account_id].isoformat()}
 
                 new_state[account_id]["slices"] = sorted(list({d.isoformat() for d in self._completed_slices[account_id]}))
+                self._add_job_stats(new_state[account_id], account_id)
             new_state["time_increment"] = self.time_increment
             return new_state
 
         if self._completed_slices:
             for account_id in self._account_ids:
                 new_state[account_id]["slices"] = sorted(list({d.isoformat() for d in self._completed_slices[account_id]}))
+                self._add_job_stats(new_state[account_id], account_id)
 
             new_state["time_increment"] = self.time_increment
             return new_state
@@ -223,9 +234,18 @@ class AdsInsights(FBMarketingIncrementalStream):
             account_id: set(pendulum.parse(v).date() for v in transformed_state.get(account_id, {}).get("slices", []))
             for account_id in self._account_ids
         }
+        self._job_stats = {
+            account_id: InsightJobStats.from_state(transformed_state.get(account_id, {}).get("job_stats"), self._job_stats_breakdowns)
+            for account_id in self._account_ids
+        }
 
         self._next_cursor_values = self._get_start_date()
 
+    def _add_job_stats(self, account_state: MutableMapping[str, Any], account_id: str):
+        job_stats = self._job_stats[account_id].to_state()
+        if job_stats:
+            account_state["job_stats"] = job_stats
+
     def _date_intervals(self, account_id: str) -> Iterator[pendulum.Date]:
         """Get date period to sync"""
         if self._end_date < self._next_cursor_values[account_id]:
@@ -246,28 +266,50 @@ class AdsInsights(FBMarketingIncrementalStream):
                 self._cursor_values = {account_id: ts_start}
 
     def _generate_async_jobs(self, params: Mapping, account_id: str) -> Iterator[AsyncJob]:
-        """Generator of async jobs
+        """Generator of async jobs, planned by the stats of the previous jobs of the account
 
         :param params:
         :return:
         """
-
-        self._next_cursor_values = self._get_start_date()
+        split_level, periods_per_job = self._job_stats[account_id].plan(period_days=self.time_increment)
+        if split_level != "account":
+            logger.info(f"The jobs of account {account_id} used to fail, split them by {split_level} upfront.")
+        elif periods_per_job > 1:
+            logger.info(f"The jobs of account {account_id} used to be fast, run {periods_per_job} periods per job.")
+
+        period = pendulum.duration(days=self.time_increment)
+        starts = []
         for ts_start in self._date_intervals(account_id):
             if (
                 ts_start in self._completed_slices.get(account_id, [])
                 and ts_start < self._next_cursor_values.get(account_id, self._start_date) - self.insights_lookback_period
             ):
                 continue
-            ts_end = ts_start + pendulum.duration(days=self.time_increment - 1)
-            interval = pendulum.Period(ts_start, ts_end)
-            yield InsightAsyncJob(
-                api=self._api.api,
-                edge_object=self._api.get_account(account_id=account_id),
-                interval=interval,
-                params=params,
-                job_timeout=self.insights_job_timeout,
-            )
+            if starts and (len(starts) == periods_per_job or ts_start != starts[-1] + period):
+                yield self._plan_async_job(params=params, account_id=account_id, interval_starts=starts, split_level=split_level)
+                starts = []
+            starts.append(ts_start)
+        if starts:
+            yield self._plan_async_job(params=params, account_id=account_id, interval_starts=starts, split_level=split_level)
+
+    def _plan_async_job(self, params: Mapping, account_id: str, interval_starts: List[pendulum.Date], split_level: str) -> AsyncJob:
+        """Create an async job for the consecutive periods, split to the given level upfront"""
+        ts_end = interval_starts[-1] + pendulum.duration(days=self.time_increment - 1)
+        interval = pendulum.Period(interval_starts[0], ts_end)
+        job = InsightAsyncJob(
+            api=self._api.api,
+            edge_object=self._api.get_account(account_id=account_id),
+            interval=interval,
+            params=params,
+            job_timeout=self.insights_job_timeout,
+        )
+        if split_level == "account":
+            return job
+        smaller_jobs = job.split_job_to_level(split_level)
+        if not smaller_jobs:
+            # nothing to split, there is no data for the period
+            return job
+        return ParentAsyncJob(api=self._api.api, jobs=smaller_jobs, interval=interval)
 
     def check_breakdowns(self, account_id: str):
         """
@@ -293,7 +335,8 @@ class AdsInsights(FBMarketingIncrementalStream):
         cursor_field: List[str] = None,
         stream_state: Mapping[str, Any] = None,
     ) -> Iterable[Optional[Mapping[str, Any]]]:
-        """Slice by date periods and schedule async job for each period, run at most MAX_ASYNC_JOBS jobs at the same time.
+        """Slice by date periods and schedule async job for each period and account, run at most MAX_ASYNC_JOBS jobs at the same time.
+        The jobs of all accounts run at the same time, the results are downloaded while other jobs are still running.
         This solution for Async was chosen because:
         1. we should commit state after each successful job
         2. we should run as many job as possible before checking for result
@@ -308,17 +351,22 @@ class AdsInsights(FBMarketingIncrementalStream):
         if stream_state:
             self.state = stream_state
 
-        for account_id in self._account_ids:
-            try:
-                manager = InsightAsyncJobManager(
-                    api=self._api,
-                    jobs=self._generate_async_jobs(params=self.request_params(), account_id=account_id),
-                    account_id=account_id,
-                )
-                for job in manager.completed_jobs():
-                    yield {"insight_job": job, "account_id": account_id}
-            except FacebookRequestError as exc:
-                raise traced_exception(exc)
+        # the jobs of all accounts are generated lazily and interleaved, so the start dates are computed once upfront
+        self._next_cursor_values = self._get_start_date()
+        params = self.request_params()
+        try:
+            # accounts take turns in a stable order, the account ids come from a set in the config
+            manager = InsightAsyncJobManager(
+                api=self._api,
+                jobs={
+                    account_id: self._generate_async_jobs(params=params, account_id=account_id) for account_id in sorted(self._account_ids)
+                },
+                job_stats=self._job_stats,
+            )
+            for account_id, job in manager.completed_account_jobs():
+                yield {"insight_job": job, "account_id": account_id}
+        except FacebookRequestError as exc:
+            raise traced_exception(exc)
 
     def _get_start_date(self) -> Mapping[str, pendulum.Date]:
         """Get start date to begin sync with. It is not that trivial as it might seem.
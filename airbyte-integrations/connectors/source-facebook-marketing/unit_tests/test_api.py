@@ -2,6 +2,8 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import threading
+
 import pendulum
 import pytest
 import source_facebook_marketing
@@ -172,6 +174,22 @@ class TestMyFacebookAdsApi:
                 f"Facebook API Utilization is too high ({usage})%, pausing for {fb_api._compute_pause_interval.return_value}"
             )
 
+    def test_last_call_ads_insights_throttle_of_each_thread(self, mocker, fb_api):
+        def call(account_throttle):
+            response = mocker.Mock()
+            response.headers.return_value = {
+                "x-fb-ads-insights-throttle": f'{{"app_id_util_pct": 10, "acc_id_util_pct": {account_throttle}}}'
+            }
+            fb_api._update_insights_throttle_limit(response)
+
+        call(account_throttle=20)
+        thread = threading.Thread(target=call, args=(90,))
+        thread.start()
+        thread.join()
+
+        assert fb_api.ads_insights_throttle.per_account == 90
+        assert fb_api.last_call_ads_insights_throttle.per_account == 20
+
     def test_find_account(self, api, account_id, requests_mock):
         requests_mock.register_uri(
             "GET",
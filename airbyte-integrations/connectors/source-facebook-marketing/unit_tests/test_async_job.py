@@ -344,6 +344,36 @@ class TestInsightAsyncJob:
         # in case this is not retried, an error will be raised
         job.get_result()
 
+    def test_download_result(self, job, adreport, api):
+        job.start()
+        api.call().json.return_value = {"data": [{"some_data": 123}, {"some_data": 77}]}
+
+        job.download_result()
+        result = job.get_result()
+
+        adreport.get_result.assert_called_once()
+        assert [row.export_all_data() for row in result] == [{"some_data": 123}, {"some_data": 77}]
+        # the downloaded result is released once consumed, the next call reads it again
+        job.get_result()
+        assert adreport.get_result.call_count == 2
+
+    def test_download_result_up_to_max_rows(self, job, mocker):
+        job.start()
+        pages_read = []
+
+        def read_pages():
+            for page in range(3):
+                pages_read.append(page)
+                yield from range(page * 100, (page + 1) * 100)
+
+        mocker.patch.object(job._job, "get_result", return_value=read_pages())
+
+        assert job.download_result(max_rows=150) == 150
+        # the rows after the first ones are read while consuming the result
+        assert pages_read == [0, 1]
+        assert list(job.get_result()) == list(range(300))
+        assert pages_read == [0, 1, 2]
+
     def test_get_result_when_job_is_not_started(self, job):
         with pytest.raises(
             RuntimeError,
@@ -425,6 +455,11 @@ class TestInsightAsyncJob:
 
 
 class TestParentAsyncJob:
+    def test_jobs(self, parent_job, grouped_jobs):
+        assert parent_job.jobs == grouped_jobs
+        parent_job.jobs.clear()
+        assert parent_job.jobs == grouped_jobs, "the jobs of the group can't be changed"
+
     def test_start(self, parent_job, grouped_jobs):
         parent_job.start()
         for job in grouped_jobs:
@@ -480,6 +515,25 @@ class TestParentAsyncJob:
         assert isinstance(generator, Iterator)
         assert list(generator) == list(range(3, 8)) + list(range(4, 11))
 
+    def test_download_result(self, parent_job, grouped_jobs):
+        for job in grouped_jobs:
+            job.download_result.return_value = 10
+
+        assert parent_job.download_result() == 100
+
+        for job in grouped_jobs:
+            job.download_result.assert_called_once()
+
+    def test_download_result_up_to_max_rows(self, parent_job, grouped_jobs):
+        for job in grouped_jobs:
+            job.download_result.side_effect = lambda max_rows: min(max_rows, 40)
+
+        assert parent_job.download_result(max_rows=100) == 100
+
+        assert [job.download_result.call_args.args[0] for job in grouped_jobs[:3]] == [100, 60, 20]
+        for job in grouped_jobs[3:]:
+            job.download_result.assert_not_called()
+
     def test_split_job(self, parent_job, grouped_jobs, mocker):
         grouped_jobs[0].failed = True
         grouped_jobs[0].split_job.return_value = [
@@ -510,9 +564,9 @@ class TestParentAsyncJob:
         count = 0
         while count < 10:
             split_jobs = parent_job.split_job()
-            assert len(split_jobs) == len(
-                grouped_jobs
-            ), "attempted to split job at smallest size so should just restart job meaning same no. of jobs"
+            assert len(split_jobs) == len(grouped_jobs), (
+                "attempted to split job at smallest size so should just restart job meaning same no. of jobs"
+            )
             grouped_jobs[0].attempt_number += 1
             count += 1
 
@@ -2,11 +2,13 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import pendulum
 import pytest
 from facebook_business.api import FacebookAdsApiBatch
 from source_facebook_marketing.api import MyFacebookAdsApi
 from source_facebook_marketing.streams.async_job import InsightAsyncJob, ParentAsyncJob
 from source_facebook_marketing.streams.async_job_manager import InsightAsyncJobManager
+from source_facebook_marketing.streams.async_job_stats import InsightJobStats
 from source_facebook_marketing.streams.common import JobException
 
 
@@ -14,6 +16,7 @@ from source_facebook_marketing.streams.common import JobException
 def api_fixture(mocker):
     api = mocker.Mock()
     api.api.ads_insights_throttle = MyFacebookAdsApi.Throttle(0, 0)
+    api.api.last_call_ads_insights_throttle = MyFacebookAdsApi.Throttle(0, 0)
     api.api.new_batch.return_value = mocker.MagicMock(spec=FacebookAdsApiBatch)
     return api
 
@@ -69,7 +72,7 @@ class TestInsightAsyncManager:
 
         job = next(manager.completed_jobs(), None)
         assert job == jobs[0]
-        time_mock.sleep.assert_called_with(InsightAsyncJobManager.JOB_STATUS_UPDATE_SLEEP_SECONDS)
+        time_mock.sleep.assert_called_with(InsightAsyncJobManager.MIN_JOB_STATUS_UPDATE_SLEEP_SECONDS)
 
         job = next(manager.completed_jobs(), None)
         assert job is None
@@ -173,7 +176,7 @@ class TestInsightAsyncManager:
             mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True),
             mocker.Mock(
                 spec=ParentAsyncJob,
-                _jobs=sub_jobs,
+                jobs=sub_jobs,
                 attempt_number=1,
                 failed=False,
                 completed=False,
@@ -183,3 +186,131 @@ class TestInsightAsyncManager:
 
         with pytest.raises(JobException):
             next(manager.completed_jobs(), None)
+
+    def test_jobs_of_accounts_run_at_the_same_time(self, api, mocker, time_mock, update_job_mock):
+        """Manager should start jobs of all accounts in turns and return them with their account ids"""
+        account_jobs = {
+            account_id: [mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False) for _ in range(2)]
+            for account_id in ("first", "second")
+        }
+
+        def update_job_behaviour():
+            # all jobs are running before the first one completes
+            assert all(job.start.called for jobs in account_jobs.values() for job in jobs)
+            account_jobs["second"][0].completed = True
+            yield
+            for jobs in account_jobs.values():
+                for job in jobs:
+                    job.completed = True
+            yield
+
+        update_job_mock.side_effect = update_job_behaviour()
+        manager = InsightAsyncJobManager(api=api, jobs=account_jobs)
+
+        completed_jobs = list(manager.completed_account_jobs())
+
+        assert completed_jobs == [
+            ("second", account_jobs["second"][0]),
+            ("first", account_jobs["first"][0]),
+            ("first", account_jobs["first"][1]),
+            ("second", account_jobs["second"][1]),
+        ]
+        for jobs in account_jobs.values():
+            for job in jobs:
+                job.download_result.assert_called_once()
+
+    def test_throttled_account_waits(self, api, mocker, time_mock, update_job_mock):
+        """Manager should not start jobs of the account which hit the throttle limit, while other accounts go on"""
+        throttled_job = mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True)
+        job = mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True)
+
+        def get_account(account_id):
+            api.api.ads_insights_throttle = api.api.last_call_ads_insights_throttle = MyFacebookAdsApi.Throttle(
+                per_application=90, per_account=90 if account_id == "throttled" else 0
+            )
+            return mocker.Mock()
+
+        api.get_account.side_effect = get_account
+        manager = InsightAsyncJobManager(api=api, jobs={"throttled": [throttled_job], "other": [job]})
+
+        assert next(manager.completed_account_jobs()) == ("other", job)
+        throttled_job.start.assert_not_called()
+
+        api.api.ads_insights_throttle = MyFacebookAdsApi.Throttle(per_application=10, per_account=90)
+        api.get_account.side_effect = None
+        assert list(manager.completed_account_jobs()) == [("throttled", throttled_job)]
+
+    def test_status_update_backoff(self, api, mocker, time_mock, update_job_mock, some_config):
+        """Manager should wait longer between status updates while no job is completed"""
+
+        def update_job_behaviour():
+            yield from range(5)
+            job.completed = True
+            yield
+
+        update_job_mock.side_effect = update_job_behaviour()
+        job = mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False)
+        manager = InsightAsyncJobManager(api=api, jobs=[job], account_id=some_config["account_ids"][0])
+
+        assert list(manager.completed_jobs()) == [job]
+        assert [call.args[0] for call in time_mock.sleep.call_args_list] == [5, 10, 20, 30, 30]
+
+    def test_account_throttle_of_own_calls(self, api, mocker, time_mock, update_job_mock):
+        """Manager should keep the throttle of the calls made for the account, not the last throttle seen by any thread"""
+        job = mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True)
+        # a thread downloading the result of another account saw a high throttle
+        api.api.ads_insights_throttle = MyFacebookAdsApi.Throttle(per_application=10, per_account=90)
+        manager = InsightAsyncJobManager(api=api, jobs={"account": [job]})
+
+        assert list(manager.completed_account_jobs()) == [("account", job)]
+        job.start.assert_called_once()
+
+    def test_downloads_stop_when_jobs_are_not_consumed(self, api, mocker, time_mock, update_job_mock):
+        """Manager should stop the download workers when the completed jobs are not consumed to the end"""
+        jobs = [mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True) for _ in range(3)]
+        manager = InsightAsyncJobManager(api=api, jobs={"account": jobs})
+
+        completed_jobs = manager.completed_account_jobs()
+        next(completed_jobs)
+        completed_jobs.close()
+
+        assert manager._executor._shutdown
+        # the remaining jobs are returned by the next call
+        assert [job for _, job in manager.completed_account_jobs()] == jobs[1:]
+
+    def test_failed_download_is_read_again(self, api, mocker, time_mock, some_config):
+        """Manager should return the job even if its result failed to download in advance"""
+        job = mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True)
+        job.download_result.side_effect = RuntimeError("download failed")
+        manager = InsightAsyncJobManager(api=api, jobs=[job], account_id=some_config["account_ids"][0])
+
+        assert list(manager.completed_jobs()) == [job]
+
+    def test_job_stats_recorded(self, api, mocker, time_mock, update_job_mock, some_config):
+        """Manager should record failures and durations of the finished jobs to the stats of the account"""
+        interval = pendulum.Period(pendulum.Date(2024, 1, 1), pendulum.Date(2024, 1, 2))
+        job = mocker.Mock(
+            spec=InsightAsyncJob,
+            attempt_number=1,
+            failed=False,
+            completed=True,
+            edge_level="account",
+            interval=interval,
+            elapsed_time=pendulum.duration(seconds=100),
+        )
+        failed_job = mocker.Mock(spec=InsightAsyncJob, attempt_number=2, failed=True, completed=True, edge_level="campaign")
+        completed_job = mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True, edge_level="campaign")
+        failed_job.split_job.return_value = []
+        group = ParentAsyncJob(api=api.api, jobs=[failed_job, completed_job], interval=interval)
+        group._attempt_number = 2
+        stats = mocker.Mock(spec=InsightJobStats)
+        account_id = some_config["account_ids"][0]
+        manager = InsightAsyncJobManager(api=api, jobs=[job, group], account_id=account_id, job_stats={account_id: stats})
+
+        assert next(manager.completed_jobs()) == job
+
+        # the completed job of the failed group is not recorded, it ran alongside the failed one
+        assert stats.record.call_args_list == [
+            mocker.call("account", failed=False, seconds_per_day=50),
+            mocker.call("campaign", failed=True),
+        ]
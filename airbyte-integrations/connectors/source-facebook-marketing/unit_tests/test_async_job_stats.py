@@ -0,0 +1,79 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import pytest
+from source_facebook_marketing.streams.async_job_stats import InsightJobStats
+
+
+class TestInsightJobStats:
+    def test_no_stats(self):
+        """Without stats the jobs are planned as before: account level, one period per job"""
+        stats = InsightJobStats(breakdowns="|action_type")
+
+        assert stats.plan(period_days=1) == ("account", 1)
+        assert stats.to_state() is None
+
+    def test_record(self):
+        stats = InsightJobStats(breakdowns="|action_type")
+
+        stats.record("account", failed=True)
+        stats.record("campaign", failed=False, seconds_per_day=100)
+        stats.record("campaign", failed=False, seconds_per_day=200)
+
+        assert stats.to_state() == {
+            "breakdowns": "|action_type",
+            "levels": {
+                "account": {"failure_rate": pytest.approx(0.3)},
+                "campaign": {"failure_rate": 0.0, "seconds_per_day": pytest.approx(130)},
+            },
+        }
+
+    def test_split_level_of_failing_jobs(self):
+        """Jobs are split upfront to the first level which does not fail too often"""
+        stats = InsightJobStats(
+            breakdowns="|action_type",
+            levels={"account": {"failure_rate": 0.9}, "campaign": {"failure_rate": 0.6}, "adset": {"failure_rate": 0.1}},
+        )
+
+        assert stats.plan(period_days=1) == ("adset", 1)
+
+    def test_skipped_levels_are_tried_again(self):
+        """Failure rates of the skipped levels decay, so the bigger jobs are tried again after a few syncs"""
+        stats = InsightJobStats(breakdowns="|action_type", levels={"account": {"failure_rate": 1.0}})
+
+        levels = [stats.plan(period_days=1)[0] for _ in range(8)]
+
+        assert levels == ["campaign"] * 7 + ["account"]
+
+    def test_smallest_level_when_all_levels_fail(self):
+        stats = InsightJobStats(breakdowns="|action_type", levels={level: {"failure_rate": 1.0} for level in InsightJobStats.LEVELS})
+
+        assert stats.plan(period_days=1) == ("ad", 1)
+
+    @pytest.mark.parametrize(
+        "account_stats, period_days, expected_periods_per_job",
+        [
+            ({"failure_rate": 0.0, "seconds_per_day": 60}, 1, 5),
+            ({"failure_rate": 0.0, "seconds_per_day": 60}, 2, 2),
+            ({"failure_rate": 0.0, "seconds_per_day": 1}, 1, InsightJobStats.MAX_PERIODS_PER_JOB),
+            ({"failure_rate": 0.0, "seconds_per_day": 1000}, 1, 1),
+            ({"failure_rate": 0.3, "seconds_per_day": 60}, 1, 1),
+            ({"failure_rate": 0.0}, 1, 1),
+        ],
+    )
+    def test_periods_per_job(self, account_stats, period_days, expected_periods_per_job):
+        """Periods are merged only for the fast and reliable account jobs"""
+        stats = InsightJobStats(breakdowns="|action_type", levels={"account": account_stats})
+
+        assert stats.plan(period_days=period_days) == ("account", expected_periods_per_job)
+
+    def test_from_state(self):
+        state = {"breakdowns": "|action_type", "levels": {"account": {"failure_rate": 0.9}, "unknown": {"failure_rate": 1.0}}}
+
+        assert InsightJobStats.from_state(state, breakdowns="|action_type").to_state() == {
+            "breakdowns": "|action_type",
+            "levels": {"account": {"failure_rate": 0.9}},
+        }
+        assert InsightJobStats.from_state(state, breakdowns="age|action_type").to_state() is None
+        assert InsightJobStats.from_state(None, breakdowns="|action_type").to_state() is None
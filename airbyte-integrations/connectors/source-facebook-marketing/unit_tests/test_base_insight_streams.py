@@ -6,11 +6,12 @@ from datetime import datetime
 
 import pendulum
 import pytest
+from facebook_business.adobjects.adaccount import AdAccount
 from freezegun import freeze_time
 from pendulum import duration
 from source_facebook_marketing.spec import ValidBreakdowns
 from source_facebook_marketing.streams import AdsInsights
-from source_facebook_marketing.streams.async_job import AsyncJob, InsightAsyncJob
+from source_facebook_marketing.streams.async_job import AsyncJob, InsightAsyncJob, ParentAsyncJob
 
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams.core import package_name_from_class
@@ -319,7 +320,7 @@ class TestBaseInsightsStream:
             end_date=end_date,
             insights_lookback_window=28,
         )
-        async_manager_mock.completed_jobs.return_value = [1, 2, 3]
+        async_manager_mock.completed_account_jobs.return_value = [("unknown_account", 1), ("unknown_account", 2), ("unknown_account", 3)]
 
         slices = list(stream.stream_slices(stream_state=None, sync_mode=SyncMode.incremental))
 
@@ -330,7 +331,7 @@ class TestBaseInsightsStream:
         ]
         async_manager_mock.assert_called_once()
         args, kwargs = async_manager_mock.call_args
-        generated_jobs = list(kwargs["jobs"])
+        generated_jobs = list(kwargs["jobs"]["unknown_account"])
         assert len(generated_jobs) == (end_date - start_date).days + 1
         assert generated_jobs[0].interval.start == start_date.date()
         assert generated_jobs[1].interval.start == start_date.date() + duration(days=1)
@@ -346,7 +347,7 @@ class TestBaseInsightsStream:
             end_date=end_date,
             insights_lookback_window=28,
         )
-        async_manager_mock.completed_jobs.return_value = [1, 2, 3]
+        async_manager_mock.completed_account_jobs.return_value = [("unknown_account", 1), ("unknown_account", 2), ("unknown_account", 3)]
 
         slices = list(stream.stream_slices(stream_state=None, sync_mode=SyncMode.incremental))
 
@@ -357,7 +358,7 @@ class TestBaseInsightsStream:
         ]
         async_manager_mock.assert_called_once()
         args, kwargs = async_manager_mock.call_args
-        generated_jobs = list(kwargs["jobs"])
+        generated_jobs = list(kwargs["jobs"]["unknown_account"])
         assert len(generated_jobs) == (end_date - start_date).days + 1
         assert generated_jobs[0].interval.start == start_date.date()
         assert generated_jobs[1].interval.start == start_date.date() + duration(days=1)
@@ -374,7 +375,7 @@ class TestBaseInsightsStream:
             end_date=end_date,
             insights_lookback_window=28,
         )
-        async_manager_mock.completed_jobs.return_value = [1, 2, 3]
+        async_manager_mock.completed_account_jobs.return_value = [("unknown_account", 1), ("unknown_account", 2), ("unknown_account", 3)]
 
         slices = list(stream.stream_slices(stream_state=state, sync_mode=SyncMode.incremental))
 
@@ -385,7 +386,7 @@ class TestBaseInsightsStream:
         ]
         async_manager_mock.assert_called_once()
         args, kwargs = async_manager_mock.call_args
-        generated_jobs = list(kwargs["jobs"])
+        generated_jobs = list(kwargs["jobs"]["unknown_account"])
         # assert that we sync all periods including insight_lookback_period
         assert len(generated_jobs) == (end_date.date() - start_date).days + 1
         assert generated_jobs[0].interval.start == start_date.date()
@@ -404,7 +405,7 @@ class TestBaseInsightsStream:
             end_date=end_date,
             insights_lookback_window=28,
         )
-        async_manager_mock.completed_jobs.return_value = [1, 2, 3]
+        async_manager_mock.completed_account_jobs.return_value = [("unknown_account", 1), ("unknown_account", 2), ("unknown_account", 3)]
 
         slices = list(stream.stream_slices(stream_state=state, sync_mode=SyncMode.incremental))
 
@@ -415,7 +416,7 @@ class TestBaseInsightsStream:
         ]
         async_manager_mock.assert_called_once()
         args, kwargs = async_manager_mock.call_args
-        generated_jobs = list(kwargs["jobs"])
+        generated_jobs = list(kwargs["jobs"]["unknown_account"])
         assert len(generated_jobs) == (end_date.date() - start_date).days + 1
         assert generated_jobs[0].interval.start == start_date.date()
         assert generated_jobs[1].interval.start == start_date.date() + duration(days=1)
@@ -451,7 +452,7 @@ class TestBaseInsightsStream:
             end_date=end_date,
             insights_lookback_window=28,
         )
-        async_manager_mock.completed_jobs.return_value = [1, 2, 3]
+        async_manager_mock.completed_account_jobs.return_value = [("unknown_account", 1), ("unknown_account", 2), ("unknown_account", 3)]
 
         slices = list(stream.stream_slices(stream_state=state, sync_mode=SyncMode.incremental))
 
@@ -462,13 +463,104 @@ class TestBaseInsightsStream:
         ]
         async_manager_mock.assert_called_once()
         args, kwargs = async_manager_mock.call_args
-        generated_jobs = list(kwargs["jobs"])
+        generated_jobs = list(kwargs["jobs"]["unknown_account"])
         assert (
             len(generated_jobs) == (end_date.date() - (cursor_value.date() - stream.insights_lookback_period)).days + 1
         ), "should be 37 slices because we ignore slices which are within insights_lookback_period"
         assert generated_jobs[0].interval.start == cursor_value.date() - stream.insights_lookback_period
         assert generated_jobs[1].interval.start == cursor_value.date() - stream.insights_lookback_period + duration(days=1)
 
+    def test_stream_slices_split_upfront(self, mocker, api, async_manager_mock, start_date, some_config):
+        """Stream will split the jobs of the account upfront when they used to fail"""
+        end_date = start_date + duration(days=1)
+        state = {
+            "unknown_account": {
+                "job_stats": {
+                    "breakdowns": "|action_type,action_target_id,action_destination",
+                    "levels": {"account": {"failure_rate": 0.9}},
+                }
+            }
+        }
+        api.get_account.return_value = mocker.Mock(spec=AdAccount)
+        api.get_account.return_value.get_insights.return_value = [{"campaign_id": "1"}, {"campaign_id": "2"}]
+        stream = AdsInsights(
+            api=api,
+            account_ids=some_config["account_ids"],
+            start_date=start_date,
+            end_date=end_date,
+            insights_lookback_window=28,
+        )
+        async_manager_mock.completed_account_jobs.return_value = []
+
+        list(stream.stream_slices(stream_state=state, sync_mode=SyncMode.incremental))
+
+        args, kwargs = async_manager_mock.call_args
+        assert kwargs["job_stats"]["unknown_account"].to_state() == state["unknown_account"]["job_stats"]
+        generated_jobs = list(kwargs["jobs"]["unknown_account"])
+        assert len(generated_jobs) == 2
+        assert all(isinstance(job, ParentAsyncJob) for job in generated_jobs)
+        assert [sorted(nested_job._edge_object["id"] for nested_job in job.jobs) for job in generated_jobs] == [["1", "2"], ["1", "2"]]
+        assert generated_jobs[1].interval == pendulum.Period(end_date.date(), end_date.date())
+
+    def test_stream_slices_merge_periods(self, api, async_manager_mock, start_date, some_config):
+        """Stream will merge consecutive periods into one job when the jobs of the account used to be fast"""
+        end_date = start_date + duration(days=11)
+        state = {
+            "unknown_account": {
+                "job_stats": {
+                    "breakdowns": "|action_type,action_target_id,action_destination",
+                    "levels": {"account": {"failure_rate": 0.0, "seconds_per_day": 60}},
+                },
+            }
+        }
+        stream = AdsInsights(
+            api=api,
+            account_ids=some_config["account_ids"],
+            start_date=start_date,
+            end_date=end_date,
+            insights_lookback_window=28,
+        )
+        async_manager_mock.completed_account_jobs.return_value = []
+
+        list(stream.stream_slices(stream_state=state, sync_mode=SyncMode.incremental))
+
+        args, kwargs = async_manager_mock.call_args
+        generated_jobs = list(kwargs["jobs"]["unknown_account"])
+        # periods of 60 seconds are merged into jobs of 5 minutes
+        assert [(job.interval.start, job.interval.end) for job in generated_jobs] == [
+            (start_date.date(), start_date.date() + duration(days=4)),
+            (start_date.date() + duration(days=5), start_date.date() + duration(days=9)),
+            (start_date.date() + duration(days=10), start_date.date() + duration(days=11)),
+        ]
+
+    def test_read_records_of_merged_periods(self, mocker, api, start_date, some_config):
+        """Stream will advance the cursor past all periods of the job"""
+        job = mocker.Mock(spec=InsightAsyncJob)
+        job.get_result.return_value = []
+        job.interval = pendulum.Period(start_date.date(), start_date.date() + duration(days=2))
+        stream = AdsInsights(
+            api=api,
+            account_ids=some_config["account_ids"],
+            start_date=start_date,
+            end_date=start_date + duration(days=10),
+            insights_lookback_window=28,
+        )
+        stream._job_stats["unknown_account"].record("account", failed=False, seconds_per_day=10)
+
+        list(stream.read_records(sync_mode=SyncMode.incremental, stream_slice={"insight_job": job, "account_id": "unknown_account"}))
+
+        assert stream.state == {
+            "time_increment": 1,
+            "unknown_account": {
+                "date_start": (start_date.date() + duration(days=2)).isoformat(),
+                "slices": [],
+                "job_stats": {
+                    "breakdowns": "|action_type,action_target_id,action_destination",
+                    "levels": {"account": {"failure_rate": 0.0, "seconds_per_day": 10}},
+                },
+            },
+        }
+
     def test_get_json_schema(self, api, some_config):
         stream = AdsInsights(
             api=api,
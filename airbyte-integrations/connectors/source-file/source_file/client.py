@@ -3,9 +3,10 @@
 #
 
 
+import io
 import json
 import logging
-import os
+import shutil
 import sys
 import tempfile
 import traceback
@@ -19,9 +20,15 @@ from zipfile import BadZipFile
 import backoff
 import boto3
 import botocore
+import fastparquet
 import google
 import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 import smart_open
 import smart_open.ssh
 from azure.storage.blob import BlobServiceClient
@@ -32,6 +39,7 @@ from openpyxl import load_workbook
 from openpyxl.utils.exceptions import InvalidFileException
 from pandas.errors import ParserError
 from paramiko import SSHException
+from pyarrow import orc
 from urllib3.exceptions import ProtocolError
 from yaml import safe_load
 
@@ -44,6 +52,26 @@ from .utils import LOCAL_STORAGE_NAME, backoff_handler
 
 SSH_TIMEOUT = 60
 
+# Default ceiling of the memory used by a single chunk read from the binary (parquet, feather, orc) files
+DEFAULT_MAX_MEMORY_MB = 512
+# Size of the blocks used to copy the remote streams to the local temp files
+COPY_BUFFER_SIZE = 8 * 1024 * 1024
+# Size of the blocks parsed at once by the pyarrow engine, for CSV and JSON Lines files
+ARROW_BLOCK_SIZE = 16 * 1024 * 1024
+# The pandas.read_csv options, which have an equivalent in the pyarrow CSV reader
+ARROW_CSV_READER_OPTIONS = {
+    "sep",
+    "delimiter",
+    "encoding",
+    "quotechar",
+    "escapechar",
+    "doublequote",
+    "skiprows",
+    "names",
+    "header",
+    "na_values",
+}
+
 # Force the log level of the smart-open logger to ERROR - https://github.com/airbytehq/airbyte/pull/27157
 logging.getLogger("smart_open").setLevel(logging.ERROR)
 
@@ -253,22 +281,74 @@ class URLFile:
         return smart_open.open(url, transport_params=dict(client=client), **self.args)
 
 
+class ZipMemberReader(io.BufferedReader):
+    """Reads the file of the zip archive as a stream, the archive is closed together with the stream"""
+
+    def __init__(self, zip_ref: zipfile.ZipFile, member: zipfile.ZipInfo):
+        self._zip_ref = zip_ref
+        super().__init__(zip_ref.open(member))
+
+    def close(self):
+        try:
+            super().close()
+        finally:
+            self._zip_ref.close()
+
+
 class Client:
     """Class that manages reading and parsing data from streams"""
 
     CSV_CHUNK_SIZE = 10_000
     binary_formats = {"excel", "excel_binary", "feather", "parquet", "orc", "pickle"}
-
-    def __init__(self, dataset_name: str, url: str, provider: dict, format: str = None, reader_options: dict = None):
+    arrow_formats = {"csv", "jsonl", "parquet"}
+
+    def __init__(
+        self,
+        dataset_name: str,
+        url: str,
+        provider: dict,
+        format: str = None,
+        reader_options: dict = None,
+        max_memory_mb: int = None,
+        reader_engine: str = None,
+    ):
         self._dataset_name = dataset_name
         self._url = url
         self._provider = provider
         self._reader_format = format or "csv"
         self._reader_options = reader_options or {}
         self._is_zip = url.lower().endswith(".zip")
-        self.binary_source = self._reader_format in self.binary_formats or self._is_zip
+        self._max_memory_bytes = (max_memory_mb or DEFAULT_MAX_MEMORY_MB) * 1024 * 1024
+        self._arrow_engine = reader_engine == "pyarrow" and self._supports_arrow_engine()
+        self._cache_source = self._reader_format in self.binary_formats or self._is_zip
+        self.binary_source = self._cache_source or self._arrow_engine
         self.encoding = self._reader_options.get("encoding")
 
+    def _supports_arrow_engine(self) -> bool:
+        """Check whether the format and the reader options can be handled by the pyarrow engine, otherwise pandas is used."""
+        options = self._reader_options
+        unsupported = set()
+        if self._reader_format == "csv":
+            unsupported = set(options) - ARROW_CSV_READER_OPTIONS
+            if len(options.get("sep", options.get("delimiter", ","))) != 1:
+                unsupported.add("sep")
+            if not isinstance(options.get("skiprows", 0), int):
+                unsupported.add("skiprows")
+            if options.get("header", 0) is None and not options.get("names"):
+                # pandas names the columns by their indexes
+                unsupported.add("header")
+            if isinstance(options.get("na_values"), dict):
+                unsupported.add("na_values")
+        elif self._reader_format == "parquet":
+            unsupported = set(options) - {"columns"}
+        if self._reader_format not in self.arrow_formats or unsupported:
+            logger.warning(
+                f"The pyarrow engine doesn't support the {self._reader_format} format with the reader options {sorted(unsupported)}, "
+                "falling back to the pandas engine."
+            )
+            return False
+        return True
+
     @property
     def reader_class(self):
         if is_cloud_environment():
@@ -335,9 +415,9 @@ class Client:
             "excel": pd.read_excel,
             "excel_binary": pd.read_excel,
             "fwf": pd.read_fwf,
-            "feather": pd.read_feather,
-            "parquet": pd.read_parquet,
-            "orc": pd.read_orc,
+            "feather": self.feather_batch_reader,
+            "parquet": self.parquet_batch_reader,
+            "orc": self.orc_batch_reader,
             "pickle": pd.read_pickle,
         }
 
@@ -364,9 +444,8 @@ class Client:
             elif self._reader_format == "excel_binary":
                 reader_options["engine"] = "pyxlsb"
                 yield reader(fp, **reader_options)
-            elif self._reader_format == "parquet":
-                reader_options["engine"] = "fastparquet"
-                yield reader(fp, **reader_options)
+            elif self._reader_format in ("parquet", "feather", "orc"):
+                yield from reader(fp, skip_data=skip_data, read_sample_chunk=read_sample_chunk, **reader_options)
             elif self._reader_format == "excel":
                 try:
                     for df_chunk in self.openpyxl_chunk_reader(fp, **reader_options):
@@ -418,7 +497,9 @@ class Client:
         """Read data from the stream"""
         with self.reader.open() as fp:
             try:
-                if self._reader_format in ["json", "jsonl"]:
+                if self._arrow_engine:
+                    yield from self.read_arrow(fp, fields=fields)
+                elif self._reader_format in ["json", "jsonl"]:
                     yield from self.load_nested_json(fp)
                 elif self._reader_format == "yaml":
                     fields = set(fields) if fields else None
@@ -428,7 +509,7 @@ class Client:
                     yield from df[list(columns)].to_dict(orient="records")
                 else:
                     fields = set(fields) if fields else None
-                    if self.binary_source:
+                    if self._cache_source:
                         fp = self._cache_stream(fp)
                     if self._is_zip:
                         fp = self._unzip(fp)
@@ -447,24 +528,247 @@ class Client:
                 raise AirbyteTracedException(message=error_msg, internal_message=error_msg, failure_type=FailureType.config_error) from err
 
     def _unzip(self, fp):
-        tmp_dir = tempfile.TemporaryDirectory()
-        with zipfile.ZipFile(str(fp.name), "r") as zip_ref:
-            zip_ref.extractall(tmp_dir.name)
-
-        logger.info("Temp dir content: " + str(os.listdir(tmp_dir.name)))
-        final_file: str = os.path.join(tmp_dir.name, os.listdir(tmp_dir.name)[0])
-        logger.info("Pick up first file: " + final_file)
-        fp_tmp = open(final_file, "rb")
-        return fp_tmp
+        """open the first file of the archive as a stream, the archive is not extracted.
+        The Parquet file is read at random positions, so it is copied to the temp file instead.
+        """
+        zip_ref = zipfile.ZipFile(fp, "r")
+        members = [member for member in zip_ref.infolist() if not member.is_dir()]
+        logger.info("Archive content: " + str([member.filename for member in members]))
+        logger.info("Pick up first file: " + members[0].filename)
+        if self._reader_format == "parquet":
+            with zip_ref:
+                return self._cache_stream(zip_ref.open(members[0]))
+        return ZipMemberReader(zip_ref, members[0])
 
     def _cache_stream(self, fp):
-        """cache stream to file"""
+        """cache stream to file, block by block, so the whole file is never held in memory"""
         fp_tmp = tempfile.NamedTemporaryFile(mode="w+b")
-        fp_tmp.write(fp.read())
+        shutil.copyfileobj(fp, fp_tmp, min(COPY_BUFFER_SIZE, self._max_memory_bytes))
         fp_tmp.seek(0)
         fp.close()
         return fp_tmp
 
+    @staticmethod
+    def _to_dataframe(data) -> pd.DataFrame:
+        # keep the nanosecond timestamps of pandas, the date-time columns are detected by `dtype_to_json_type`
+        return data.to_pandas(coerce_temporal_nanoseconds=True)
+
+    @staticmethod
+    def _empty_batch(schema: pa.Schema, columns=None) -> pa.RecordBatch:
+        if columns:
+            schema = pa.schema([schema.field(name) for name in columns], metadata=schema.metadata)
+        return pa.RecordBatch.from_pylist([], schema=schema)
+
+    def _bounded_batches(self, batches: Iterable[pa.RecordBatch], read_sample_chunk: bool = False) -> Iterable[pa.RecordBatch]:
+        """Slice the record batches which exceed the memory ceiling."""
+        for batch in batches:
+            rows_per_chunk = max(1, batch.num_rows * self._max_memory_bytes // max(batch.nbytes, 1))
+            for offset in range(0, max(batch.num_rows, 1), rows_per_chunk):
+                yield batch.slice(offset, rows_per_chunk)
+                if read_sample_chunk:
+                    return
+
+    def parquet_batch_reader(self, fp, skip_data: bool = False, read_sample_chunk: bool = False, columns=None, **kwargs):
+        """Read the Parquet file row group by row group with the fastparquet engine, in chunks bounded by the memory ceiling.
+
+        Only the `columns` option can be applied to the row groups,
+        the files read with any other options are loaded at once with `pandas.read_parquet`.
+        """
+        if kwargs:
+            yield pd.read_parquet(fp, engine="fastparquet", columns=columns, **kwargs)
+            return
+        parquet_file = fastparquet.ParquetFile(fp)
+        if skip_data or not parquet_file.row_groups:
+            yield parquet_file[:0].to_pandas(columns=columns)
+            return
+        for df in parquet_file.iter_row_groups(columns=columns):
+            rows_per_chunk = max(1, len(df) * self._max_memory_bytes // max(df.memory_usage(deep=True).sum(), 1))
+            for offset in range(0, max(len(df), 1), rows_per_chunk):
+                yield df.iloc[offset : offset + rows_per_chunk]
+                if read_sample_chunk:
+                    return
+
+    def _parquet_record_batches(
+        self, fp, skip_data: bool = False, read_sample_chunk: bool = False, columns=None
+    ) -> Iterable[pa.RecordBatch]:
+        parquet_file = pq.ParquetFile(fp)
+        metadata = parquet_file.metadata
+        if skip_data or metadata.num_rows == 0:
+            yield self._empty_batch(parquet_file.schema_arrow, columns)
+            return
+        uncompressed_size = sum(metadata.row_group(i).total_byte_size for i in range(metadata.num_row_groups))
+        batch_size = max(1, metadata.num_rows * self._max_memory_bytes // max(uncompressed_size, 1))
+        batches = parquet_file.iter_batches(batch_size=batch_size, columns=columns, use_pandas_metadata=True)
+        yield from self._bounded_batches(batches, read_sample_chunk=read_sample_chunk)
+
+    def feather_batch_reader(self, fp, skip_data: bool = False, read_sample_chunk: bool = False, columns=None, **kwargs):
+        """Read the Feather (Arrow IPC) file record batch by record batch, in chunks bounded by the memory ceiling.
+
+        The legacy Feather V1 files, or the files read with any options except `columns`, are loaded at once with `pandas.read_feather`.
+        """
+        ipc_reader = None
+        if not kwargs:
+            try:
+                ipc_reader = pa.ipc.open_file(fp)
+            except pa.ArrowInvalid:
+                fp.seek(0)
+        if ipc_reader is None:
+            yield pd.read_feather(fp, columns=columns, **kwargs)
+            return
+        if skip_data or ipc_reader.num_record_batches == 0:
+            yield self._to_dataframe(self._empty_batch(ipc_reader.schema, columns))
+            return
+        batches = (ipc_reader.get_batch(i) for i in range(ipc_reader.num_record_batches))
+        if columns:
+            batches = (batch.select(columns) for batch in batches)
+        yield from map(self._to_dataframe, self._bounded_batches(batches, read_sample_chunk=read_sample_chunk))
+
+    def orc_batch_reader(self, fp, skip_data: bool = False, read_sample_chunk: bool = False, columns=None, **kwargs):
+        """Read the ORC file stripe by stripe, in chunks bounded by the memory ceiling.
+
+        The files read with any options except `columns` are loaded at once with `pandas.read_orc`.
+        """
+        if kwargs:
+            yield pd.read_orc(fp, columns=columns, **kwargs)
+            return
+        orc_file = orc.ORCFile(fp)
+        if skip_data or orc_file.nstripes == 0:
+            yield self._to_dataframe(self._empty_batch(orc_file.schema, columns))
+            return
+        batches = (orc_file.read_stripe(i, columns=columns) for i in range(orc_file.nstripes))
+        yield from map(self._to_dataframe, self._bounded_batches(batches, read_sample_chunk=read_sample_chunk))
+
+    def _arrow_csv_options(self) -> tuple:
+        """Translate the pandas.read_csv reader options to the pyarrow CSV reader options."""
+        options = self._reader_options
+        names, header = options.get("names"), options.get("header", "infer")
+        skip_rows = options.get("skiprows", 0)
+        if header not in (None, "infer"):
+            # the header row is replaced by the names, if any
+            skip_rows += header + 1 if names else header
+        na_values = options.get("na_values", [])
+        read_options = pa_csv.ReadOptions(
+            skip_rows=skip_rows,
+            column_names=names,
+            encoding=options.get("encoding") or "utf8",
+            block_size=min(ARROW_BLOCK_SIZE, self._max_memory_bytes),
+        )
+        parse_options = pa_csv.ParseOptions(
+            delimiter=options.get("sep", options.get("delimiter", ",")),
+            quote_char=options.get("quotechar", '"'),
+            double_quote=options.get("doublequote", True),
+            escape_char=options.get("escapechar") or False,
+        )
+        convert_options = pa_csv.ConvertOptions(
+            null_values=pa_csv.ConvertOptions().null_values + ([na_values] if isinstance(na_values, str) else list(na_values)),
+            strings_can_be_null=True,
+        )
+        return read_options, parse_options, convert_options
+
+    @staticmethod
+    def _pandas_column_names(names: list) -> list:
+        """Name the columns of the CSV header the way pandas does: `Unnamed: <index>` for the empty names, `<name>.<n>` for the duplicates."""
+        occurrences = {}
+        column_names = []
+        for index, name in enumerate(names):
+            name = name or f"Unnamed: {index}"
+            if name in occurrences:
+                occurrences[name] += 1
+                name = f"{name}.{occurrences[name]}"
+            else:
+                occurrences[name] = 0
+            column_names.append(name)
+        return column_names
+
+    def _csv_record_batches(self, fp, skip_data: bool = False, read_sample_chunk: bool = False) -> Iterable[pa.RecordBatch]:
+        if not fp.seekable():
+            fp = self._cache_stream(fp)
+        read_options, parse_options, convert_options = self._arrow_csv_options()
+        reader = pa_csv.open_csv(fp, read_options=read_options, parse_options=parse_options, convert_options=convert_options)
+        # pandas keeps the dates and times as they are written, so these columns are read again as strings
+        temporal_columns = {field.name: pa.string() for field in reader.schema if pa.types.is_temporal(field.type)}
+        if temporal_columns:
+            fp.seek(0)
+            convert_options.column_types = temporal_columns
+            reader = pa_csv.open_csv(fp, read_options=read_options, parse_options=parse_options, convert_options=convert_options)
+        names = self._pandas_column_names(reader.schema.names)
+        batches = [self._empty_batch(reader.schema)] if skip_data else self._bounded_batches(reader, read_sample_chunk=read_sample_chunk)
+        for batch in batches:
+            yield pa.RecordBatch.from_arrays(batch.columns, names=names)
+
+    def load_record_batches(self, fp, skip_data: bool = False, read_sample_chunk: bool = False) -> Iterable[pa.RecordBatch]:
+        """load the CSV or Parquet file as Arrow record batches, with the pyarrow engine.
+
+        :param fp: file-like object to read from
+        :param skip_data: limit reading data
+        :param read_sample_chunk: indicates whether a single batch should only be read to generate schema
+        :return: the record batches, bounded by the memory ceiling
+        """
+        if self._cache_source:
+            fp = self._cache_stream(fp)
+        if self._is_zip:
+            fp = self._unzip(fp)
+        if self._reader_format == "parquet":
+            yield from self._parquet_record_batches(fp, skip_data, read_sample_chunk, self._reader_options.get("columns"))
+        else:
+            yield from self._csv_record_batches(fp, skip_data, read_sample_chunk)
+
+    def load_jsonl_blocks(self, fp) -> Iterable[dict]:
+        """Decode the JSON Lines file block by block, the records are kept as they are written."""
+        for lines in iter(lambda: fp.readlines(ARROW_BLOCK_SIZE), []):
+            yield from map(orjson.loads, filter(bytes.strip, lines))
+
+    @staticmethod
+    def _nan_to_null(batch: pa.RecordBatch) -> pa.RecordBatch:
+        columns = [
+            pc.if_else(pc.is_nan(column), pa.scalar(None, column.type), column) if pa.types.is_floating(column.type) else column
+            for column in batch.columns
+        ]
+        return pa.RecordBatch.from_arrays(columns, schema=batch.schema)
+
+    @staticmethod
+    def _column_to_pylist(column: pa.Array) -> list:
+        """Convert the Arrow column to the Python values, the primitive types go through numpy, which is much faster than `to_pylist`."""
+        if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+            return column.to_numpy(zero_copy_only=False).tolist()
+        is_boolean = pa.types.is_boolean(column.type)
+        if not (is_boolean or pa.types.is_integer(column.type) or pa.types.is_floating(column.type)):
+            return column.to_pylist()
+        values = column.fill_null(False if is_boolean else 0).to_numpy(zero_copy_only=False).tolist()
+        if column.null_count:
+            for index in np.flatnonzero(column.is_null().to_numpy(zero_copy_only=False)):
+                values[index] = None
+        return values
+
+    @classmethod
+    def _batch_to_records(cls, batch: pa.RecordBatch) -> Iterable[dict]:
+        names = batch.schema.names
+        for values in zip(*map(cls._column_to_pylist, batch.columns)):
+            yield dict(zip(names, values))
+
+    def read_arrow(self, fp, fields: Iterable = None) -> Iterable[dict]:
+        """Read the records with the pyarrow engine.
+
+        The columns are projected and the NaN values replaced with nulls in Arrow,
+        then the record batches are converted to dicts one by one.
+        """
+        if self._reader_format == "jsonl":
+            yield from self.load_jsonl_blocks(fp)
+            return
+        fields = set(fields) if fields else None
+        try:
+            for batch in self.load_record_batches(fp):
+                if fields:
+                    batch = batch.select([name for name in batch.schema.names if name in fields])
+                yield from self._batch_to_records(self._nan_to_null(batch))
+        except pa.ArrowInvalid as err:
+            error_msg = (
+                f"File {fp} can not be parsed with the pyarrow engine. "
+                f"Please check your reader_options, or use the pandas engine for the files with mixed column types. {err}"
+            )
+            logger.error(f"{error_msg}\n{traceback.format_exc()}")
+            raise AirbyteTracedException(message=error_msg, internal_message=error_msg, failure_type=FailureType.config_error) from err
+
     def _stream_properties(self, fp, empty_schema: bool = False, read_sample_chunk: bool = False):
         """
         empty_schema param is used to check connectivity, i.e. we only read a header and do not produce stream properties
@@ -472,8 +776,10 @@ class Client:
         """
         if self._reader_format == "yaml":
             df_list = [self.load_yaml(fp)]
+        elif self._arrow_engine:
+            df_list = map(self._to_dataframe, self.load_record_batches(fp, skip_data=empty_schema, read_sample_chunk=read_sample_chunk))
         else:
-            if self.binary_source:
+            if self._cache_source:
                 fp = self._cache_stream(fp)
             if self._is_zip:
                 fp = self._unzip(fp)
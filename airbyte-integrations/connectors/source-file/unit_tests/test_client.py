@@ -2,7 +2,8 @@
 # Copyright (c) 2024 Airbyte, Inc., all rights reserved.
 #
 
-
+import zipfile
+from io import BytesIO
 from tempfile import NamedTemporaryFile
 from unittest.mock import patch, sentinel
 
@@ -10,7 +11,7 @@ import pandas as pd
 import pytest
 from pandas import read_csv, read_excel, testing
 from paramiko import SSHException
-from source_file.client import Client, URLFile
+from source_file.client import Client, URLFile, ZipMemberReader
 from source_file.utils import backoff_handler
 from urllib3.exceptions import ProtocolError
 
@@ -139,6 +140,119 @@ def test_unzip_stream(client, absolute_path, test_files):
         assert client._unzip(file)
 
 
+def test_cache_stream_copies_in_blocks(config):
+    client = Client(**config, max_memory_mb=1)
+    content = b"x" * (3 * 1024 * 1024 + 1)
+    source = BytesIO(content)
+    with patch.object(source, "read", wraps=source.read) as read:
+        cached = client._cache_stream(source)
+    assert cached.read() == content
+    assert all(call.args and call.args[0] == 1024 * 1024 for call in read.call_args_list)
+
+
+def test_unzip_stream_reads_first_file_without_extracting(client, absolute_path, test_files):
+    f = f"{absolute_path}/{test_files}/test.csv.zip"
+    with open(f, mode="rb") as file, patch("zipfile.ZipFile.extractall") as extractall, patch("zipfile.ZipFile.close") as close:
+        with client._unzip(file) as unzipped:
+            content = unzipped.read()
+        # the archive is closed together with the stream
+        close.assert_called_once()
+    extractall.assert_not_called()
+    with open(f"{absolute_path}/{test_files}/test.csv", mode="rb") as expected:
+        assert content == expected.read()
+
+
+def test_unzip_parquet_to_temp_file(config, tmp_path):
+    df = pd.DataFrame({"id": range(10), "name": ["name"] * 10})
+    df.to_parquet(tmp_path / "test.parquet")
+    with zipfile.ZipFile(tmp_path / "test.parquet.zip", "w") as zip_ref:
+        zip_ref.write(tmp_path / "test.parquet", "test.parquet")
+    config.update(format="parquet", url=str(tmp_path / "test.parquet.zip"), provider={"storage": "local"})
+    client = Client(**config)
+
+    with open(tmp_path / "test.parquet.zip", mode="rb") as file:
+        unzipped = client._unzip(file)
+    assert not isinstance(unzipped, ZipMemberReader)
+    assert list(client.read()) == df.to_dict(orient="records")
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "feather", "orc"])
+def test_load_dataframes_binary_in_bounded_chunks(config, tmp_path, file_format):
+    df = pd.DataFrame({"id": range(100_000), "name": ["name"] * 100_000})
+    file_path = tmp_path / f"test.{file_format}"
+    getattr(df, f"to_{file_format}")(file_path)
+    config["format"] = file_format
+    client = Client(**config, max_memory_mb=1)
+
+    with open(file_path, mode="rb") as file:
+        chunks = list(client.load_dataframes(fp=file))
+    assert len(chunks) > 1
+    assert pd.concat(chunks, ignore_index=True).equals(df)
+
+    with open(file_path, mode="rb") as file:
+        (sample,) = client.load_dataframes(fp=file, read_sample_chunk=True)
+    assert sample.equals(chunks[0])
+
+    with open(file_path, mode="rb") as file:
+        (empty,) = client.load_dataframes(fp=file, skip_data=True)
+    assert empty.empty and list(empty.columns) == ["id", "name"]
+
+
+@pytest.mark.parametrize(
+    "file_format, file_path, reader_options",
+    [
+        ("csv", "test.csv", {}),
+        ("csv", "test_nan.csv", {}),
+        ("csv", "test.csv.zip", {}),
+        ("csv", "test_utf16.csv", {"encoding": "utf_16"}),
+        ("csv", "formats/csv/demo.csv", {}),
+        ("parquet", "formats/parquet/demo.parquet", {}),
+        ("parquet", "formats/parquet/demo.parquet", {"columns": ["a", "f"]}),
+        ("jsonl", "formats/jsonl/jsonl_nested.jsonl", {}),
+    ],
+)
+def test_arrow_engine_reads_same_records_as_pandas(absolute_path, test_files, file_format, file_path, reader_options):
+    config = {
+        "dataset_name": "test",
+        "format": file_format,
+        "url": f"{absolute_path}/{test_files}/{file_path}",
+        "provider": {"storage": "local"},
+    }
+    pandas_client = Client(**config, reader_options=dict(reader_options))
+    arrow_client = Client(**config, reader_options=dict(reader_options), reader_engine="pyarrow")
+
+    assert arrow_client._arrow_engine
+    assert list(arrow_client.read()) == list(pandas_client.read())
+    assert next(arrow_client.streams()).json_schema == next(pandas_client.streams()).json_schema
+
+
+def test_arrow_engine_csv_projection_and_nulls(config, tmp_path):
+    file_path = tmp_path / "test.csv"
+    file_path.write_text("id,,id,created_at,score\n1,a,2,2024-01-01,NaN\n3,,4,2024-01-02 10:00,1.5\n")
+    config.update(format="csv", url=str(file_path), provider={"storage": "local"})
+    client = Client(**config, reader_engine="pyarrow")
+
+    assert list(client.read(fields=["id", "Unnamed: 1", "created_at", "score"])) == [
+        {"id": 1, "Unnamed: 1": "a", "created_at": "2024-01-01", "score": None},
+        {"id": 3, "Unnamed: 1": None, "created_at": "2024-01-02 10:00", "score": 1.5},
+    ]
+
+
+@pytest.mark.parametrize(
+    "file_format, reader_options",
+    [
+        ("excel", {}),
+        ("csv", {"sep": "\\s+"}),
+        ("csv", {"header": None}),
+        ("csv", {"chunksize": 10}),
+        ("parquet", {"filters": [("a", "=", "a")]}),
+    ],
+)
+def test_arrow_engine_falls_back_to_pandas(config, file_format, reader_options):
+    config.update(format=file_format, reader_options=reader_options)
+    assert not Client(**config, reader_engine="pyarrow")._arrow_engine
+
+
 def test_unzip_canonical_ext(absolute_path, test_files):
     config = {
         "dataset_name": "BBB",
@@ -6,7 +6,7 @@ import json
 import logging
 import tempfile
 from datetime import datetime, timedelta
-from io import IOBase, StringIO
+from io import IOBase
 from typing import Iterable, List, Optional
 
 import pytz
@@ -18,6 +18,7 @@ from airbyte_cdk.sources.file_based.exceptions import ErrorListingFiles, FileBas
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
 from source_gcs.config import Config
 from source_gcs.helpers import GCSRemoteFile
+from source_gcs.streaming_file import StreamingFile
 from source_gcs.zip_helper import ZipHelper
 
 
@@ -38,6 +39,8 @@ class SourceGCSStreamReader(AbstractFileBasedStreamReader):
     def __init__(self):
         super().__init__()
         self._gcs_client = None
+        self._credentials = None
+        self._bucket = None
         self._config = None
         self.tmp_dir = tempfile.TemporaryDirectory()
 
@@ -49,15 +52,17 @@ class SourceGCSStreamReader(AbstractFileBasedStreamReader):
     def config(self, value: Config):
         assert isinstance(value, Config), "Config must be an instance of the expected Config class."
         self._config = value
+        self._bucket = None
 
     def _initialize_gcs_client(self):
         if self.config is None:
             raise ValueError("Source config is missing; cannot create the GCS client.")
         if self._gcs_client is None:
-            credentials = self._get_credentials()
+            # the credentials also sign the URLs of the files
+            self._credentials = self._get_credentials()
             # using default project to avoid getting project from env, applies only for OAuth creds
-            project = getattr(credentials, "project_id", "default")
-            self._gcs_client = storage.Client(project=project, credentials=credentials)
+            project = getattr(self._credentials, "project_id", "default")
+            self._gcs_client = storage.Client(project=project, credentials=self._credentials)
         return self._gcs_client
 
     def _get_credentials(self):
@@ -77,6 +82,13 @@ class SourceGCSStreamReader(AbstractFileBasedStreamReader):
     def gcs_client(self) -> storage.Client:
         return self._initialize_gcs_client()
 
+    @property
+    def bucket(self) -> storage.Bucket:
+        """The bucket handle, fetched once for all the prefixes and globs"""
+        if self._bucket is None:
+            self._bucket = self.gcs_client.get_bucket(self.config.bucket)
+        return self._bucket
+
     def get_matching_files(self, globs: List[str], prefix: Optional[str], logger: logging.Logger) -> Iterable[GCSRemoteFile]:
         """
         Retrieve all files matching the specified glob patterns in GCS.
@@ -92,8 +104,7 @@ class SourceGCSStreamReader(AbstractFileBasedStreamReader):
                 prefixes = [""]
 
             for prefix, glob in itertools.product(prefixes, globs):
-                bucket = self.gcs_client.get_bucket(self.config.bucket)
-                blobs = bucket.list_blobs(prefix=prefix, match_glob=glob)
+                blobs = self.bucket.list_blobs(prefix=prefix, match_glob=glob)
                 for blob in blobs:
                     last_modified = blob.updated.astimezone(pytz.utc).replace(tzinfo=None)
 
@@ -101,7 +112,7 @@ class SourceGCSStreamReader(AbstractFileBasedStreamReader):
                         if self.config.credentials.auth_type == "Client":
                             uri = f"gs://{blob.bucket.name}/{blob.name}"
                         else:
-                            uri = blob.generate_signed_url(expiration=timedelta(days=7), version="v4")
+                            uri = blob.generate_signed_url(expiration=timedelta(days=7), version="v4", credentials=self._credentials)
 
                         file_extension = ".".join(blob.name.split(".")[1:])
                         remote_file = GCSRemoteFile(uri=uri, last_modified=last_modified, mime_type=file_extension)
@@ -135,12 +146,21 @@ class SourceGCSStreamReader(AbstractFileBasedStreamReader):
         else:
             compression = "disable"
 
-        try:
-            result = smart_open.open(
-                file.uri, mode=mode.value, compression=compression, encoding=encoding, transport_params={"client": self.gcs_client}
+        def open_stream(stream_mode: str) -> IOBase:
+            return smart_open.open(
+                file.uri,
+                mode=stream_mode,
+                compression=compression,
+                encoding=None if "b" in stream_mode else encoding,
+                transport_params={"client": self.gcs_client},
             )
-            if not result.seekable():
-                result = StringIO(result.read())
+
+        try:
+            result = open_stream(mode.value)
+            # The compressed files are decompressed as the parser reads them. Seeking in them decompresses them again from the
+            # start, and fails when the transport cannot seek, e.g. a signed URL of a server without range requests.
+            if compression != "disable" or not result.seekable():
+                result = StreamingFile(result, open_stream, mode.value, encoding, self.tmp_dir.name)
         except OSError as oe:
             logger.warning(ERROR_MESSAGE_ACCESS.format(uri=file.uri, bucket=self.config.bucket))
             logger.exception(oe)
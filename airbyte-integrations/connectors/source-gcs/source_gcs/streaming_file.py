@@ -0,0 +1,113 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+import io
+import shutil
+import tempfile
+from typing import IO, Any, Callable, Iterator, List, Optional, Union
+
+
+class StreamingFile:
+    """
+    File object over a non-seekable stream, e.g. a compressed file decompressed while it is downloaded.
+
+    The parsers reading the file forward get the data as it is decompressed, without keeping the file in memory.
+    Rewinding to the start of the file opens the stream again, as the CSV parser does after reading the header.
+    Any other seek, or asking for the position, spills the decompressed file to a temporary file on disk,
+    which is read from then on.
+    """
+
+    SPILL_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, stream: IO, open_stream: Callable[[str], IO], mode: str, encoding: Optional[str], tmp_dir: str):
+        """
+        :param stream: the stream opened in `mode`, not read yet
+        :param open_stream: opens the stream again from its start, in the given mode
+        """
+        self._stream = stream
+        self._open_stream = open_stream
+        self._mode = mode
+        self._encoding = encoding
+        self._tmp_dir = tmp_dir
+        self._spilled = False
+        # number of characters (text mode) or bytes (binary mode) read so far
+        self._position = 0
+
+    def read(self, size: int = -1) -> Union[str, bytes]:
+        data = self._stream.read(size)
+        self._position += len(data)
+        return data
+
+    def readline(self, size: int = -1) -> Union[str, bytes]:
+        line = self._stream.readline(size)
+        self._position += len(line)
+        return line
+
+    def readlines(self, hint: int = -1) -> List[Union[str, bytes]]:
+        lines = self._stream.readlines(hint)
+        self._position += sum(len(line) for line in lines)
+        return lines
+
+    def __iter__(self) -> Iterator[Union[str, bytes]]:
+        return self
+
+    def __next__(self) -> Union[str, bytes]:
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if not self._spilled:
+            if (offset, whence) == (0, io.SEEK_SET):
+                self._stream.close()
+                self._stream = self._open_stream(self._mode)
+                self._position = 0
+                return 0
+            self._spill()
+        return self._stream.seek(offset, whence)
+
+    def tell(self) -> int:
+        if not self._spilled:
+            self._spill()
+        return self._stream.tell()
+
+    def seekable(self) -> bool:
+        return True
+
+    def readable(self) -> bool:
+        return True
+
+    def _spill(self) -> None:
+        """Copy the whole stream to a temporary file and move to the position of the stream in the file"""
+        spill_file = tempfile.TemporaryFile(dir=self._tmp_dir)
+        with self._open_stream("rb") as binary_stream:
+            shutil.copyfileobj(binary_stream, spill_file, self.SPILL_CHUNK_SIZE)
+        spill_file.seek(0)
+        self._stream.close()
+        self._stream = io.TextIOWrapper(spill_file, encoding=self._encoding) if "b" not in self._mode else spill_file
+        self._spilled = True
+        if "b" in self._mode:
+            self._stream.seek(self._position)
+            return
+        # the characters may take several bytes, they are read again to move to the position
+        remaining = self._position
+        while remaining:
+            skipped = len(self._stream.read(min(remaining, self.SPILL_CHUNK_SIZE)))
+            if not skipped:
+                break
+            remaining -= skipped
+
+    def close(self) -> None:
+        self._stream.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._stream.closed
+
+    def __enter__(self) -> "StreamingFile":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
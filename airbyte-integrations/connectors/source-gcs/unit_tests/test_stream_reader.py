@@ -1,14 +1,23 @@
 # Copyright (c) 2024 Airbyte, Inc., all rights reserved.
 
 import datetime
-from unittest.mock import Mock
+import gzip
+import io
+import time
+import tracemalloc
+from unittest.mock import Mock, patch
 
 import pytest
 from source_gcs import Config, SourceGCSStreamReader
 from source_gcs.config import ServiceAccountCredentials
+from source_gcs.helpers import GCSRemoteFile
+from source_gcs.streaming_file import StreamingFile
 
+from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.exceptions import ErrorListingFiles
 from airbyte_cdk.sources.file_based.file_based_stream_reader import FileReadMode
+from airbyte_cdk.sources.file_based.file_types.csv_parser import CsvParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 
 
@@ -46,3 +55,87 @@ def test_open_file_without_compression(remote_file, logger):
 
     with pytest.raises(OSError):
         reader.open_file(remote_file, FileReadMode.READ, None, logger)
+
+
+def test_get_matching_files_gets_bucket_once(logger, mocked_reader):
+    mocked_reader._config = Config(
+        credentials=ServiceAccountCredentials(service_account='{"type": "service_account"}', auth_type="Service"),
+        bucket="test_bucket",
+        streams=[],
+    )
+    mocked_reader._credentials = credentials = Mock()
+    blob = Mock(updated=datetime.datetime(2024, 1, 1), size=1)
+    blob.name = "a/file.csv"
+    blob.generate_signed_url.return_value = "https://storage.googleapis.com/test_bucket/a/file.csv?signature"
+    mocked_reader._gcs_client.get_bucket.return_value.list_blobs.return_value = [blob]
+
+    files = list(mocked_reader.get_matching_files(["a/*.csv", "b/*.csv"], None, logger))
+    files += list(mocked_reader.get_matching_files(["a/*.csv"], None, logger))
+
+    assert [file.uri for file in files] == [blob.generate_signed_url.return_value] * 5
+    assert mocked_reader._gcs_client.get_bucket.call_count == 1
+    assert {call.kwargs["credentials"] for call in blob.generate_signed_url.call_args_list} == {credentials}
+
+
+def _write_gzip_csv(path, rows):
+    with gzip.open(path, "wt", encoding="utf8") as f:
+        f.write("id,name,description\n")
+        for n in range(rows):
+            f.write(f"{n},name {n},{'description of the record ' * 4}{n}\n")
+
+
+def _read_csv_records(reader, file, logger):
+    csv_format = CsvFormat()
+    stream_config = FileBasedStreamConfig(name="test_stream", format=csv_format)
+    return CsvParser().parse_records(stream_config, file, reader, logger, discovered_schema=None)
+
+
+def test_open_file_streams_compressed_file(tmp_path, logger):
+    path = tmp_path / "file.csv.gz"
+    _write_gzip_csv(path, rows=10)
+    reader = SourceGCSStreamReader()
+    reader._gcs_client = Mock()
+    reader._config = Mock()
+    file = GCSRemoteFile(uri=str(path), last_modified=datetime.datetime.now(), mime_type="csv.gz")
+
+    with reader.open_file(file, FileReadMode.READ, "utf8", logger) as fp:
+        assert isinstance(fp, StreamingFile)
+        assert fp.readline() == "id,name,description\n"
+    records = list(_read_csv_records(reader, file, logger))
+
+    assert [record["id"] for record in records] == [str(n) for n in range(10)]
+
+
+def test_open_file_memory_benchmark(tmp_path, logger):
+    """Parse a compressed CSV file of about 7 MB once decompressed, buffered in memory before and streamed now"""
+    path = tmp_path / "file.csv.gz"
+    _write_gzip_csv(path, rows=50_000)
+    reader = SourceGCSStreamReader()
+    reader._gcs_client = Mock()
+    reader._config = Mock()
+    file = GCSRemoteFile(uri=str(path), last_modified=datetime.datetime.now(), mime_type="csv.gz")
+    open_file = reader.open_file
+
+    def open_in_memory(*args, **kwargs):
+        return io.StringIO(open_file(*args, **kwargs).read())
+
+    results = {}
+    for name, patched_open_file in (("in memory", open_in_memory), ("streamed", open_file)):
+        with patch.object(reader, "open_file", side_effect=patched_open_file):
+            tracemalloc.start()
+            started = time.perf_counter()
+            records = sum(1 for _ in _read_csv_records(reader, file, logger))
+            seconds = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        results[name] = (records, peak, seconds)
+
+    print(
+        "\nMemory benchmark of the parsing of a compressed CSV file:\n"
+        + "\n".join(
+            f"{name}: {records} records, {peak / 1024 / 1024:.1f} MB peak memory, {seconds:.2f} s"
+            for name, (records, peak, seconds) in results.items()
+        )
+    )
+    assert results["in memory"][0] == results["streamed"][0] == 50_000
+    assert results["streamed"][1] < results["in memory"][1] / 5
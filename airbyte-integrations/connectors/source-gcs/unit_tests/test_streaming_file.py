@@ -0,0 +1,65 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+import gzip
+import io
+from unittest.mock import Mock
+
+import pytest
+from source_gcs.streaming_file import StreamingFile
+
+
+_CONTENT = "héader\nfirst\nsécond\nthird\n"
+
+
+def _streaming_file(tmp_path, mode):
+    path = tmp_path / "file.csv.gz"
+    with gzip.open(path, "wt", encoding="utf8") as f:
+        f.write(_CONTENT)
+
+    def open_stream(stream_mode):
+        return gzip.open(path, stream_mode, encoding=None if "b" in stream_mode else "utf8")
+
+    open_stream = Mock(side_effect=open_stream)
+    return StreamingFile(open_stream(mode), open_stream, mode, "utf8", str(tmp_path)), open_stream
+
+
+def test_forward_reads_do_not_spill(tmp_path):
+    file, open_stream = _streaming_file(tmp_path, "rt")
+
+    assert file.readline() == "héader\n"
+    assert list(file) == ["first\n", "sécond\n", "third\n"]
+    assert open_stream.call_count == 1
+    assert not list(tmp_path.glob("tmp*"))
+
+
+def test_rewind_opens_the_stream_again(tmp_path):
+    file, open_stream = _streaming_file(tmp_path, "rt")
+    file.readline()
+
+    assert file.seek(0) == 0
+    assert file.read() == _CONTENT
+    assert open_stream.call_count == 2
+
+
+@pytest.mark.parametrize("mode, expected", [("rt", "sécond\nthird\n"), ("rb", "sécond\nthird\n".encode())])
+def test_seek_spills_to_disk_at_the_read_position(tmp_path, mode, expected):
+    file, open_stream = _streaming_file(tmp_path, mode)
+    file.readline()
+    file.readline()
+
+    position = file.tell()
+
+    assert file.read() == expected
+    assert file.seek(position) == position
+    assert file.read() == expected
+    assert file.seek(0, io.SEEK_END) == len(_CONTENT.encode())
+    assert open_stream.call_args.args == ("rb",)
+
+
+def test_context_manager_closes_stream(tmp_path):
+    file, _ = _streaming_file(tmp_path, "rb")
+
+    with file as f:
+        f.read(1)
+
+    assert file.closed
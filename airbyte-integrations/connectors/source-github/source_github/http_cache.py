@@ -0,0 +1,153 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Mapping, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
+
+
+# the stored body is decoded, the headers describing the encoding of the original body do not apply to it
+_SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "set-cookie"}
+
+
+@dataclass
+class CachedResponse:
+    etag: Optional[str]
+    last_modified: Optional[str]
+    headers: Mapping[str, str]
+    body: bytes
+
+
+class ConditionalRequestCache:
+    """
+    Validators (ETag, Last-Modified) and bodies of the responses of the previous syncs, keyed by the URL and the token of the request.
+    The token is part of the key because GitHub only answers 304 to the conditional requests made with the same token,
+    only a hash of the token and the URL is stored.
+    The cache is stored in the REQUEST_CACHE_PATH directory, there is no cache if it is not set.
+    The least recently used responses are dropped when the cache is opened, once there are more than MAX_ENTRIES of them.
+
+    Limitations:
+    - the requests are only answered with 304 when the page was cached by a previous sync, so the cache only saves requests when
+      the REQUEST_CACHE_PATH directory is kept between the syncs, it is not on the platforms which start every sync in a new container;
+    - with several tokens, a page is requested with the token picked by MultipleTokenAuthenticatorWithRateLimiter, which is not
+      necessarily the token the page was cached with, so most requests miss the cache as the number of tokens grows.
+    """
+
+    MAX_ENTRIES = 100_000
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, headers TEXT, body BLOB, used_at REAL)"
+        )
+        self._connection.execute(
+            "DELETE FROM responses WHERE key NOT IN (SELECT key FROM responses ORDER BY used_at DESC LIMIT ?)", (self.MAX_ENTRIES,)
+        )
+
+    @classmethod
+    def from_env(cls, filename: str) -> Optional["ConditionalRequestCache"]:
+        """The cache in the REQUEST_CACHE_PATH directory, None if it is not set: the pages are only reused by the next syncs"""
+        cache_dir = os.getenv(ENV_REQUEST_CACHE_PATH)
+        if not cache_dir:
+            return None
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        return cls(str(Path(cache_dir) / filename))
+
+    @staticmethod
+    def key(request: requests.PreparedRequest) -> str:
+        return hashlib.sha256(f"{request.headers.get('Authorization', '')}\n{request.url}".encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._connection.execute("SELECT etag, last_modified, headers, body FROM responses WHERE key = ?", (key,)).fetchone()
+            if row:
+                self._connection.execute("UPDATE responses SET used_at = ? WHERE key = ?", (time.time(), key))
+        if not row:
+            return None
+        etag, last_modified, headers, body = row
+        return CachedResponse(etag=etag, last_modified=last_modified, headers=json.loads(headers), body=body)
+
+    def set(self, key: str, response: requests.Response):
+        headers = {name: value for name, value in response.headers.items() if name.lower() not in _SKIPPED_HEADERS}
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    json.dumps(headers),
+                    response.content,
+                    time.time(),
+                ),
+            )
+
+
+class ConditionalRequestAdapter(HTTPAdapter):
+    """
+    Transport adapter which sends the GET requests with the validators of the cached response (If-None-Match, If-Modified-Since).
+    A 304 response is replaced with the cached response, updated with the headers of the 304 response (e.g. current rate limits),
+    so the streams read it as usual. The conditional requests answered with 304 do not count against the GitHub rate limit,
+    `on_not_modified` is called with such requests.
+    """
+
+    def __init__(
+        self,
+        cache: ConditionalRequestCache,
+        on_not_modified: Optional[Callable[[requests.PreparedRequest], None]] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self._cache = cache
+        self._on_not_modified = on_not_modified
+
+    def send(self, request: requests.PreparedRequest, stream: bool = False, **kwargs) -> requests.Response:
+        if request.method != "GET" or stream:
+            return super().send(request, stream=stream, **kwargs)
+
+        key = self._cache.key(request)
+        cached_response = self._cache.get(key)
+        if cached_response:
+            if cached_response.etag:
+                request.headers["If-None-Match"] = cached_response.etag
+            if cached_response.last_modified:
+                request.headers["If-Modified-Since"] = cached_response.last_modified
+
+        response = super().send(request, stream=stream, **kwargs)
+        if response.status_code == requests.codes.NOT_MODIFIED and cached_response:
+            if self._on_not_modified:
+                self._on_not_modified(request)
+            return self._replay(response, cached_response)
+        if response.status_code == requests.codes.OK and ("ETag" in response.headers or "Last-Modified" in response.headers):
+            self._cache.set(key, response)
+        return response
+
+    @staticmethod
+    def _replay(response: requests.Response, cached_response: CachedResponse) -> requests.Response:
+        replayed_response = requests.Response()
+        replayed_response.status_code = requests.codes.OK
+        replayed_response.reason = "OK"
+        replayed_response.headers = CaseInsensitiveDict(cached_response.headers)
+        replayed_response.headers.update({name: value for name, value in response.headers.items() if name.lower() not in _SKIPPED_HEADERS})
+        replayed_response._content = cached_response.body
+        replayed_response.encoding = requests.utils.get_encoding_from_headers(replayed_response.headers)
+        replayed_response.url = response.url
+        replayed_response.request = response.request
+        replayed_response.connection = response.connection
+        replayed_response.elapsed = response.elapsed
+        return replayed_response
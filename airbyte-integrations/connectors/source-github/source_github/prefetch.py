@@ -0,0 +1,144 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Iterable, Iterator, Mapping, MutableMapping, Optional, Tuple, Union
+
+import requests
+
+
+Page = Tuple[requests.PreparedRequest, requests.Response]
+
+
+class _SlicePages:
+    """Pages of a slice fetched by a worker thread, None marks the end of the pages"""
+
+    def __init__(self, max_pages: int, poll_seconds: float):
+        self.pages: "queue.Queue[Union[Page, Exception, None]]" = queue.Queue(maxsize=max_pages)
+        self.cancelled = threading.Event()
+        self._poll_seconds = poll_seconds
+
+    def put(self, item: Union[Page, Exception, None]) -> bool:
+        """Wait for a free place for the item, False if the slice was cancelled meanwhile"""
+        while not self.cancelled.is_set():
+            try:
+                self.pages.put(item, timeout=self._poll_seconds)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+
+class PagePrefetcher:
+    """
+    Fetches the pages of the next slices of a stream in worker threads, while the records of the current slice are read,
+    so the requests of several repositories (or organizations) are in flight at once. The pages of a slice are still
+    fetched one after another, the token of the next page is only known from the previous page.
+
+    The stream reads the slices and parses the records in the main thread as before, only the pages are handed over:
+    a prefetched page is used if it is the page the stream requests, otherwise the stream fetches the page itself.
+    This way the state and the checkpoints are the same as in the sequential read.
+    The errors of the worker threads are raised in the main thread when the stream requests the failed page.
+
+    The slices are fetched by an executor of `num_workers` threads, including the thread of the current slice,
+    and at most MAX_PREFETCHED_PAGES pages of a slice wait to be read.
+    The executor is shut down once the slices are read, or the read stops early.
+    """
+
+    MAX_PREFETCHED_PAGES = 10
+    # how often the workers waiting for the stream to read the prefetched pages check if their slice was cancelled
+    POLL_SECONDS = 1.0
+
+    def __init__(
+        self,
+        fetch_page: Callable[[Mapping[str, Any], Mapping[str, Any], Optional[Mapping[str, Any]]], Page],
+        next_page_token: Callable[[requests.Response], Optional[Mapping[str, Any]]],
+        num_workers: int,
+    ):
+        self._fetch_page = fetch_page
+        self._next_page_token = next_page_token
+        self._num_workers = num_workers
+        self._slices: MutableMapping[str, _SlicePages] = {}
+        self._current_key: Optional[str] = None
+
+    @staticmethod
+    def _key(stream_slice: Optional[Mapping[str, Any]]) -> str:
+        return json.dumps(dict(stream_slice or {}), sort_keys=True, default=str)
+
+    def prefetch_slices(
+        self, stream_slices: Iterable[Optional[Mapping[str, Any]]], stream_state: Optional[Mapping[str, Any]] = None
+    ) -> Iterator[Optional[Mapping[str, Any]]]:
+        """Yield the slices, the pages of the next slices are fetched while the stream reads the current one"""
+        window: Deque[Optional[Mapping[str, Any]]] = deque()
+        executor = ThreadPoolExecutor(max_workers=self._num_workers, thread_name_prefix="page_prefetcher")
+        try:
+            for stream_slice in stream_slices:
+                window.append(stream_slice)
+                self._start(executor, stream_slice, stream_state or {})
+                if len(window) >= self._num_workers:
+                    yield self._next_slice(window)
+            while window:
+                yield self._next_slice(window)
+        finally:
+            self._current_key = None
+            for key in list(self._slices):
+                self._cancel(key)
+            # the cancelled workers stop within POLL_SECONDS, the slices not started yet are dropped
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_page(self, stream_slice: Optional[Mapping[str, Any]], url: str) -> Optional[Page]:
+        """
+        The next prefetched page of the slice if it was requested with the url.
+        None if the slice is not prefetched or the stream requests another page, the prefetching of the slice stops then.
+        """
+        key = self._key(stream_slice)
+        slice_pages = self._slices.get(key)
+        if not slice_pages:
+            return None
+        page = slice_pages.pages.get()
+        if isinstance(page, Exception):
+            self._cancel(key)
+            raise page
+        if page is None or page[0].url != url:
+            self._cancel(key)
+            return None
+        return page
+
+    def _next_slice(self, window: Deque[Optional[Mapping[str, Any]]]) -> Optional[Mapping[str, Any]]:
+        # the previous slice is read or skipped, its remaining pages are not needed
+        if self._current_key:
+            self._cancel(self._current_key)
+        stream_slice = window.popleft()
+        self._current_key = self._key(stream_slice)
+        return stream_slice
+
+    def _start(self, executor: ThreadPoolExecutor, stream_slice: Optional[Mapping[str, Any]], stream_state: Mapping[str, Any]):
+        key = self._key(stream_slice)
+        self._cancel(key)
+        slice_pages = _SlicePages(max_pages=self.MAX_PREFETCHED_PAGES, poll_seconds=self.POLL_SECONDS)
+        self._slices[key] = slice_pages
+        executor.submit(self._fetch_pages, stream_slice, stream_state, slice_pages)
+
+    def _cancel(self, key: str):
+        slice_pages = self._slices.pop(key, None)
+        if slice_pages:
+            slice_pages.cancelled.set()
+
+    def _fetch_pages(self, stream_slice: Optional[Mapping[str, Any]], stream_state: Mapping[str, Any], slice_pages: _SlicePages):
+        next_page_token = None
+        try:
+            while not slice_pages.cancelled.is_set():
+                page = self._fetch_page(stream_slice, stream_state, next_page_token)
+                if not slice_pages.put(page):
+                    return
+                next_page_token = self._next_page_token(page[1])
+                if not next_page_token:
+                    slice_pages.put(None)
+                    return
+        except Exception as e:
+            slice_pages.put(e)
@@ -239,12 +239,14 @@ class SourceGithub(AbstractSource):
         page_size = config.get("page_size_for_large_streams", constants.DEFAULT_PAGE_SIZE_FOR_LARGE_STREAM)
         access_token_type, _ = self.get_access_token(config)
         max_waiting_time = config.get("max_waiting_time", 10) * 60
+        num_workers = config.get("num_workers", 1)
         organization_args = {
             "authenticator": authenticator,
             "organizations": organizations,
             "api_url": config.get("api_url"),
             "access_token_type": access_token_type,
             "max_waiting_time": max_waiting_time,
+            "num_workers": num_workers,
         }
         start_date = config.get("start_date")
         organization_args_with_start_date = {**organization_args, "start_date": start_date}
@@ -256,6 +258,7 @@ class SourceGithub(AbstractSource):
             "page_size_for_large_streams": page_size,
             "access_token_type": access_token_type,
             "max_waiting_time": max_waiting_time,
+            "num_workers": num_workers,
         }
         repository_args_with_start_date = {**repository_args, "start_date": start_date}
 
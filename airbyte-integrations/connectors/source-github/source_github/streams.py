@@ -2,24 +2,31 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import os
 import re
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
+from pathlib import Path
+from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 from urllib import parse
 
 import pendulum
 import requests
+from requests.auth import AuthBase
 
 from airbyte_cdk import BackoffStrategy, StreamSlice
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level, SyncMode
 from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.message import InMemoryMessageRepository
 from airbyte_cdk.sources.streams.availability_strategy import AvailabilityStrategy
+from airbyte_cdk.sources.streams.call_rate import APIBudget, CachedLimiterSession, LimiterSession
 from airbyte_cdk.sources.streams.checkpoint.substream_resumable_full_refresh_cursor import SubstreamResumableFullRefreshCursor
 from airbyte_cdk.sources.streams.core import CheckpointMixin, Stream
 from airbyte_cdk.sources.streams.http import HttpStream
 from airbyte_cdk.sources.streams.http.error_handlers import ErrorHandler, ErrorResolution, HttpStatusErrorHandler, ResponseAction
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, UserDefinedBackoffException
+from airbyte_cdk.sources.streams.http.http_client import MAX_CONNECTION_POOL_SIZE, HttpClient
 from airbyte_cdk.utils import AirbyteTracedException
+from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
 from airbyte_protocol.models import FailureType
 
 from . import constants
@@ -39,7 +46,9 @@ from .graphql import (
     get_query_pull_requests,
     get_query_reviews,
 )
-from .utils import GitHubAPILimitException, getter
+from .http_cache import ConditionalRequestAdapter, ConditionalRequestCache
+from .prefetch import PagePrefetcher
+from .utils import GitHubAPILimitException, MultipleTokenAuthenticatorWithRateLimiter, getter
 
 
 class GithubStreamABC(HttpStream, ABC):
@@ -49,8 +58,11 @@ class GithubStreamABC(HttpStream, ABC):
     large_stream = False
     max_retries: int = 5
     stream_base_params = {}
+    # Send conditional requests with the validators of the responses of the previous syncs, for the full refresh streams
+    # whose data rarely changes. The unchanged pages are answered with 304 which does not count against the rate limit.
+    use_conditional_requests = False
 
-    def __init__(self, api_url: str = "https://api.github.com", access_token_type: str = "", **kwargs):
+    def __init__(self, api_url: str = "https://api.github.com", access_token_type: str = "", num_workers: int = 1, **kwargs):
         if kwargs.get("authenticator"):
             kwargs["authenticator"].max_time = kwargs.pop("max_waiting_time", self.max_time)
         super().__init__(**kwargs)
@@ -62,6 +74,85 @@ class GithubStreamABC(HttpStream, ABC):
         if not self.supports_incremental:
             self.cursor = SubstreamResumableFullRefreshCursor()
 
+        conditional_request_cache = (
+            ConditionalRequestCache.from_env(f"{self.name}.conditional_requests.sqlite") if self.use_conditional_requests else None
+        )
+        if conditional_request_cache:
+            self._http_client = self._conditional_requests_http_client(conditional_request_cache, kwargs.get("authenticator"))
+
+        # The pages of the next slices (repositories, organizations) are fetched in worker threads while the current slice is read.
+        # The GraphQL streams are read sequentially, some of them keep the cursors of the nested pages in the stream.
+        self._page_prefetcher = None
+        if num_workers > 1 and self.http_method == "GET":
+            self._page_prefetcher = PagePrefetcher(
+                fetch_page=super()._fetch_next_page, next_page_token=self.next_page_token, num_workers=num_workers
+            )
+
+    def stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
+        stream_slices = self._stream_slices(**kwargs)
+        if self._page_prefetcher:
+            return self._page_prefetcher.prefetch_slices(stream_slices, stream_state=kwargs.get("stream_state"))
+        return stream_slices
+
+    def _stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
+        """
+        The slices of the stream, the streams override this method instead of `stream_slices`,
+        which prefetches the pages of the slices returned by this method.
+        """
+        return super().stream_slices(**kwargs)
+
+    def _fetch_next_page(
+        self,
+        stream_slice: Optional[Mapping[str, Any]] = None,
+        stream_state: Optional[Mapping[str, Any]] = None,
+        next_page_token: Optional[Mapping[str, Any]] = None,
+    ) -> Tuple[requests.PreparedRequest, requests.Response]:
+        if self._page_prefetcher:
+            expected_request = requests.PreparedRequest()
+            expected_request.prepare_url(
+                self._join_url(
+                    self.url_base, self.path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+                ),
+                self.request_params(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+            )
+            page = self._page_prefetcher.get_page(stream_slice, expected_request.url)
+            if page:
+                return page
+        return super()._fetch_next_page(stream_slice=stream_slice, stream_state=stream_state, next_page_token=next_page_token)
+
+    def _conditional_requests_http_client(self, cache: ConditionalRequestCache, authenticator: Optional[AuthBase]) -> HttpClient:
+        """
+        The HTTP client of the stream with a session which sends conditional requests, see ConditionalRequestCache for their limits.
+        The session is otherwise the one of the CDK, with the request cache of the sync if the stream `use_cache`.
+        """
+        adapter = ConditionalRequestAdapter(
+            cache=cache,
+            # the requests answered with 304 are not counted against the rate limit
+            on_not_modified=(
+                authenticator.release_request if isinstance(authenticator, MultipleTokenAuthenticatorWithRateLimiter) else None
+            ),
+            pool_connections=MAX_CONNECTION_POOL_SIZE,
+            pool_maxsize=MAX_CONNECTION_POOL_SIZE,
+        )
+        api_budget = APIBudget(policies=[])
+        if self.use_cache:
+            cache_path = str(Path(os.environ[ENV_REQUEST_CACHE_PATH]) / self.cache_filename)
+            session = CachedLimiterSession(cache_path, backend="sqlite", api_budget=api_budget)
+        else:
+            session = LimiterSession(api_budget=api_budget)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return HttpClient(
+            self.name,
+            self.logger,
+            error_handler=self.get_error_handler(),
+            api_budget=api_budget,
+            session=session,
+            authenticator=authenticator,
+            backoff_strategy=self.get_backoff_strategy(),
+            message_repository=InMemoryMessageRepository(),
+        )
+
     @property
     def url_base(self) -> str:
         return self.api_url
@@ -200,7 +291,7 @@ class GithubStream(GithubStreamABC):
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
         return f"repos/{stream_slice['repository']}/{self.name}"
 
-    def stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
+    def _stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
         for repository in self.repositories:
             yield {"repository": repository}
 
@@ -332,9 +423,9 @@ class SemiIncrementalMixin(CheckpointMixin):
             elif self.is_sorted == "desc" and cursor_value < start_point:
                 break
 
-    def stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
+    def _stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
         self._starting_point_cache.clear()
-        yield from super().stream_slices(**kwargs)
+        yield from super()._stream_slices(**kwargs)
 
 
 class IncrementalMixin(SemiIncrementalMixin):
@@ -367,12 +458,16 @@ class Assignees(GithubStream):
     API docs: https://docs.github.com/en/rest/issues/assignees?apiVersion=2022-11-28#list-assignees
     """
 
+    use_conditional_requests = True
+
 
 class Branches(GithubStream):
     """
     API docs: https://docs.github.com/en/rest/branches/branches?apiVersion=2022-11-28#list-branches
     """
 
+    use_conditional_requests = True
+
     primary_key = ["repository", "name"]
 
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
@@ -384,12 +479,16 @@ class Collaborators(GithubStream):
     API docs: https://docs.github.com/en/rest/collaborators/collaborators?apiVersion=2022-11-28#list-repository-collaborators
     """
 
+    use_conditional_requests = True
+
 
 class IssueLabels(GithubStream):
     """
     API docs: https://docs.github.com/en/rest/issues/labels?apiVersion=2022-11-28#list-labels-for-a-repository
     """
 
+    use_conditional_requests = True
+
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
         return f"repos/{stream_slice['repository']}/labels"
 
@@ -407,7 +506,7 @@ class Organizations(GithubStreamABC):
         self.organizations = organizations
         self.access_token_type = access_token_type
 
-    def stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
+    def _stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
         for organization in self.organizations:
             yield {"organization": organization}
 
@@ -452,6 +551,8 @@ class Tags(GithubStream):
     API docs: https://docs.github.com/en/rest/repos/repos?apiVersion=2022-11-28#list-repository-tags
     """
 
+    use_conditional_requests = True
+
     primary_key = ["repository", "name"]
 
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
@@ -464,6 +565,7 @@ class Teams(Organizations):
     """
 
     use_cache = True
+    use_conditional_requests = True
 
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
         return f"orgs/{stream_slice['organization']}/teams"
@@ -690,9 +792,9 @@ class Commits(IncrementalMixin, GithubStream):
         params["sha"] = stream_slice["branch"]
         return params
 
-    def stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
+    def _stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
         self._validate_branches_to_pull()
-        for stream_slice in super().stream_slices(**kwargs):
+        for stream_slice in super()._stream_slices(**kwargs):
             repository = stream_slice["repository"]
             for branch in self.branches_to_repos.get(repository, []):
                 yield {"branch": branch, "repository": repository}
@@ -932,7 +1034,7 @@ class PullRequestCommits(GithubStream):
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
         return f"repos/{stream_slice['repository']}/pulls/{stream_slice['pull_number']}/commits"
 
-    def stream_slices(
+    def _stream_slices(
         self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
     ) -> Iterable[Optional[Mapping[str, Any]]]:
         parent_stream_slices = self.parent.stream_slices(
@@ -1022,8 +1124,8 @@ class ReactionStream(GithubStream, CheckpointMixin, ABC):
         parent_path = self._parent_stream.path(stream_slice=stream_slice, **kwargs)
         return f"{parent_path}/{stream_slice[self.copy_parent_key]}/reactions"
 
-    def stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
-        for stream_slice in super().stream_slices(**kwargs):
+    def _stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
+        for stream_slice in super()._stream_slices(**kwargs):
             for parent_record in self._parent_stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice=stream_slice):
                 yield {self.copy_parent_key: parent_record[self.parent_key], "repository": stream_slice["repository"]}
 
@@ -1291,7 +1393,7 @@ class ProjectColumns(GithubStream):
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
         return f"projects/{stream_slice['project_id']}/columns"
 
-    def stream_slices(
+    def _stream_slices(
         self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
     ) -> Iterable[Optional[Mapping[str, Any]]]:
         parent_stream_slices = self.parent.stream_slices(
@@ -1362,7 +1464,7 @@ class ProjectCards(GithubStream):
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
         return f"projects/columns/{stream_slice['column_id']}/cards"
 
-    def stream_slices(
+    def _stream_slices(
         self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
     ) -> Iterable[Optional[Mapping[str, Any]]]:
         parent_stream_slices = self.parent.stream_slices(
@@ -1562,7 +1664,7 @@ class TeamMembers(GithubStream):
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
         return f"orgs/{stream_slice['organization']}/teams/{stream_slice['team_slug']}/members"
 
-    def stream_slices(
+    def _stream_slices(
         self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
     ) -> Iterable[Optional[Mapping[str, Any]]]:
         parent_stream_slices = self.parent.stream_slices(
@@ -1595,7 +1697,7 @@ class TeamMemberships(GithubStream):
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
         return f"orgs/{stream_slice['organization']}/teams/{stream_slice['team_slug']}/memberships/{stream_slice['username']}"
 
-    def stream_slices(
+    def _stream_slices(
         self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
     ) -> Iterable[Optional[Mapping[str, Any]]]:
         parent_stream_slices = self.parent.stream_slices(
@@ -1697,7 +1799,7 @@ class IssueTimelineEvents(GithubStream):
     def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
         return f"repos/{stream_slice['repository']}/issues/{stream_slice['number']}/timeline"
 
-    def stream_slices(
+    def _stream_slices(
         self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
     ) -> Iterable[Optional[Mapping[str, Any]]]:
         parent_stream_slices = self.parent.stream_slices(
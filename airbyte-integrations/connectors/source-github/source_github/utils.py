@@ -2,10 +2,12 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from itertools import cycle
-from typing import Any, List, Mapping
+from typing import Any, List, Mapping, Optional
 
 import pendulum
 import requests
@@ -49,10 +51,13 @@ class Token:
 
 class MultipleTokenAuthenticatorWithRateLimiter(AbstractHeaderAuthenticator):
     """
-    Each token in the cycle is checked against the rate limiter.
-    If a token exceeds the capacity limit, the system switches to another token.
+    Each request takes a token with remaining capacity for its kind (REST or GraphQL).
+    The active token is used until it exhausts its capacity, then the system switches to another token.
+    When another token has fewer requests in flight than the active token, the request takes that token,
+    so the concurrent requests (see `num_workers`) are spread over the tokens instead of using one token at a time.
     If all tokens are exhausted, the system will enter a sleep state until
     the first token becomes available again.
+    The authenticator is shared by the streams and their worker threads.
     """
 
     DURATION = pendulum.duration(seconds=3600)  # Duration at which the current rate limit window resets
@@ -61,6 +66,8 @@ class MultipleTokenAuthenticatorWithRateLimiter(AbstractHeaderAuthenticator):
         self._auth_method = auth_method
         self._auth_header = auth_header
         self._tokens = {t: Token() for t in tokens}
+        self._in_flight = {t: 0 for t in tokens}
+        self._lock = threading.Lock()
         self.check_all_tokens()
         self._tokens_iter = cycle(self._tokens)
         self._active_token = next(self._tokens_iter)
@@ -78,16 +85,14 @@ class MultipleTokenAuthenticatorWithRateLimiter(AbstractHeaderAuthenticator):
 
     def __call__(self, request):
         """Attach the HTTP headers required to authenticate on the HTTP request"""
-        while True:
-            current_token = self._tokens[self.current_active_token]
-            if "graphql" in request.path_url:
-                if self.process_token(current_token, "count_graphql", "reset_at_graphql"):
-                    break
-            else:
-                if self.process_token(current_token, "count_rest", "reset_at_rest"):
-                    break
+        if "graphql" in request.path_url:
+            token = self.acquire_token("count_graphql", "reset_at_graphql")
+        else:
+            token = self.acquire_token("count_rest", "reset_at_rest")
 
-        request.headers.update(self.get_auth_header())
+        if self.auth_header:
+            request.headers[self.auth_header] = f"{self._auth_method} {token}"
+        request.register_hook("response", self._response_hook(token))
 
         return request
 
@@ -96,7 +101,8 @@ class MultipleTokenAuthenticatorWithRateLimiter(AbstractHeaderAuthenticator):
         return self._active_token
 
     def update_token(self) -> None:
-        self._active_token = next(self._tokens_iter)
+        with self._lock:
+            self._active_token = next(self._tokens_iter)
 
     @property
     def token(self) -> str:
@@ -134,21 +140,67 @@ class MultipleTokenAuthenticatorWithRateLimiter(AbstractHeaderAuthenticator):
             pendulum.from_timestamp(remaining_info_graphql.get("reset")),
         )
 
+    def release_request(self, request: requests.PreparedRequest) -> None:
+        """Give the request back to its token, the request was not counted against the rate limit (e.g. answered with 304)"""
+        token = request.headers.get(self.auth_header, "").removeprefix(f"{self._auth_method} ")
+        if token in self._tokens:
+            count_attr = "count_graphql" if "graphql" in request.path_url else "count_rest"
+            with self._lock:
+                setattr(self._tokens[token], count_attr, getattr(self._tokens[token], count_attr) + 1)
+
     def check_all_tokens(self):
-        for token in self._tokens:
-            self._check_token_limits(token)
-
-    def process_token(self, current_token, count_attr, reset_attr):
-        if getattr(current_token, count_attr) > 0:
-            setattr(current_token, count_attr, getattr(current_token, count_attr) - 1)
-            return True
-        elif all(getattr(x, count_attr) == 0 for x in self._tokens.values()):
-            min_time_to_wait = min((getattr(x, reset_attr) - pendulum.now()).in_seconds() for x in self._tokens.values())
-            if min_time_to_wait < self.max_time:
-                time.sleep(min_time_to_wait if min_time_to_wait > 0 else 0)
-                self.check_all_tokens()
-            else:
-                raise GitHubAPILimitException(f"Rate limits for all tokens ({count_attr}) were reached")
+        """Fetch the rate limits of all tokens at once"""
+        with ThreadPoolExecutor(max_workers=len(self._tokens), thread_name_prefix="rate_limit") as executor:
+            list(executor.map(self._check_token_limits, self._tokens))
+
+    def acquire_token(self, count_attr: str, reset_attr: str) -> str:
+        """
+        Take a request from the capacity of a token and return the token.
+        The lock is not held while waiting for the reset, so the requests of the other kind are not blocked.
+        """
+        while True:
+            with self._lock:
+                token = self._select_token(count_attr)
+                if token:
+                    return token
+                time_to_wait = self._time_to_reset(reset_attr)
+                if time_to_wait >= self.max_time:
+                    raise GitHubAPILimitException(f"Rate limits for all tokens ({count_attr}) were reached")
+            time.sleep(time_to_wait if time_to_wait > 0 else 0)
+            with self._lock:
+                # the tokens are checked once, by the first of the waiting requests
+                if all(getattr(x, count_attr) == 0 for x in self._tokens.values()):
+                    self.check_all_tokens()
+
+    def _select_token(self, count_attr: str) -> Optional[str]:
+        """The token with capacity and the fewest requests in flight, the active token is preferred, None if all tokens are exhausted"""
+        for _ in range(len(self._tokens)):
+            if getattr(self._tokens[self._active_token], count_attr) > 0:
+                break
+            self._active_token = next(self._tokens_iter)
         else:
-            self.update_token()
-        return False
+            return None
+
+        token = min(
+            (token for token, token_info in self._tokens.items() if getattr(token_info, count_attr) > 0),
+            key=lambda token: (self._in_flight[token], token != self._active_token),
+        )
+        setattr(self._tokens[token], count_attr, getattr(self._tokens[token], count_attr) - 1)
+        self._in_flight[token] += 1
+        return token
+
+    def _time_to_reset(self, reset_attr: str) -> int:
+        return min((getattr(x, reset_attr) - pendulum.now()).in_seconds() for x in self._tokens.values())
+
+    def _response_hook(self, token: str):
+        """The request is not in flight anymore once the first response is received, the retries reuse the request"""
+        released = False
+
+        def release_token(response: requests.Response, **kwargs):
+            nonlocal released
+            with self._lock:
+                if not released:
+                    released = True
+                    self._in_flight[token] -= 1
+
+        return release_token
@@ -1,12 +1,13 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 
-import os
-
 import pytest
 import responses
 
 
-os.environ["REQUEST_CACHE_PATH"] = "REQUEST_CACHE_PATH"
+@pytest.fixture(autouse=True)
+def request_cache_path(monkeypatch, tmp_path):
+    # the request caches of the tests are not written into the connector directory, nor shared between the tests
+    monkeypatch.setenv("REQUEST_CACHE_PATH", str(tmp_path))
 
 
 @pytest.fixture(name="rate_limit_mock_response")
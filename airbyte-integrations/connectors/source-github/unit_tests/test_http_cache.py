@@ -0,0 +1,132 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import responses
+from responses import matchers
+from source_github.streams import Assignees, Tags
+from source_github.utils import MultipleTokenAuthenticatorWithRateLimiter, read_full_refresh
+
+
+_TAGS_URL = "https://api.github.com/repos/organization/repository/tags"
+
+
+def _tags_stream(authenticator=None):
+    return Tags(repositories=["organization/repository"], page_size_for_large_streams=100, authenticator=authenticator)
+
+
+def _add_tags_pages():
+    responses.add(
+        "GET",
+        _TAGS_URL,
+        match=[matchers.query_param_matcher({"per_page": "100"})],
+        json=[{"name": "v1"}],
+        headers={"ETag": '"page-1"', "Link": f'<{_TAGS_URL}?per_page=100&page=2>; rel="next"'},
+    )
+    responses.add(
+        "GET",
+        _TAGS_URL,
+        match=[matchers.query_param_matcher({"per_page": "100", "page": "2"})],
+        json=[{"name": "v2"}],
+        headers={"ETag": '"page-2"'},
+    )
+
+
+@responses.activate
+def test_unchanged_pages_are_replayed():
+    """The pages are requested with the validators of the previous sync, the cached pages are read on 304"""
+    _add_tags_pages()
+    first_sync_records = list(read_full_refresh(_tags_stream()))
+
+    responses.reset()
+    responses.add(
+        "GET", _TAGS_URL, match=[matchers.header_matcher({"If-None-Match": '"page-1"'})], status=304, headers={"ETag": '"page-1"'}
+    )
+    responses.add(
+        "GET", _TAGS_URL, match=[matchers.header_matcher({"If-None-Match": '"page-2"'})], status=304, headers={"ETag": '"page-2"'}
+    )
+    second_sync_records = list(read_full_refresh(_tags_stream()))
+
+    assert (
+        first_sync_records
+        == second_sync_records
+        == [
+            {"name": "v1", "repository": "organization/repository"},
+            {"name": "v2", "repository": "organization/repository"},
+        ]
+    )
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_changed_page_is_cached_again():
+    """The changed page replaces the cached one, the validator may be Last-Modified as well"""
+    responses.add("GET", _TAGS_URL, json=[{"name": "v1"}], headers={"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+    list(read_full_refresh(_tags_stream()))
+
+    responses.reset()
+    responses.add(
+        "GET",
+        _TAGS_URL,
+        match=[matchers.header_matcher({"If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"})],
+        json=[{"name": "v2"}],
+        headers={"Last-Modified": "Tue, 02 Jan 2024 00:00:00 GMT"},
+    )
+    records = list(read_full_refresh(_tags_stream()))
+    responses.reset()
+    responses.add("GET", _TAGS_URL, match=[matchers.header_matcher({"If-Modified-Since": "Tue, 02 Jan 2024 00:00:00 GMT"})], status=304)
+
+    assert records == list(read_full_refresh(_tags_stream())) == [{"name": "v2", "repository": "organization/repository"}]
+
+
+@responses.activate
+def test_validators_are_not_shared_between_tokens(rate_limit_mock_response):
+    """GitHub only answers 304 to the requests made with the same token"""
+    _add_tags_pages()
+    list(read_full_refresh(_tags_stream(authenticator=MultipleTokenAuthenticatorWithRateLimiter(tokens=["token_1"]))))
+
+    list(read_full_refresh(_tags_stream(authenticator=MultipleTokenAuthenticatorWithRateLimiter(tokens=["token_2"]))))
+
+    tags_requests = [call.request for call in responses.calls if call.request.url.startswith(_TAGS_URL)]
+    assert [request.headers.get("If-None-Match") for request in tags_requests] == [None, None, None, None]
+
+
+@responses.activate
+def test_not_modified_request_is_given_back_to_token(rate_limit_mock_response):
+    """The requests answered with 304 are not counted against the rate limit"""
+    authenticator = MultipleTokenAuthenticatorWithRateLimiter(tokens=["token_1"])
+    _add_tags_pages()
+    list(read_full_refresh(_tags_stream(authenticator=authenticator)))
+    assert authenticator._tokens["token_1"].count_rest == 4998
+
+    responses.reset()
+    responses.add("GET", _TAGS_URL, match=[matchers.header_matcher({"If-None-Match": '"page-1"'})], status=304)
+    responses.add("GET", _TAGS_URL, match=[matchers.header_matcher({"If-None-Match": '"page-2"'})], json=[{"name": "v3"}])
+    list(read_full_refresh(_tags_stream(authenticator=authenticator)))
+
+    # one of two requests is given back
+    assert authenticator._tokens["token_1"].count_rest == 4997
+
+
+@responses.activate
+def test_streams_without_validators_are_not_cached():
+    responses.add("GET", "https://api.github.com/repos/organization/repository/assignees", json=[{"id": 1}])
+    stream = Assignees(repositories=["organization/repository"], page_size_for_large_streams=100)
+
+    list(read_full_refresh(stream))
+    list(read_full_refresh(stream))
+
+    assert [call.request.headers.get("If-None-Match") for call in responses.calls] == [None, None]
+
+
+@responses.activate
+def test_no_conditional_requests_without_request_cache_path(monkeypatch, tmp_path):
+    """The pages are only reused by the next syncs, they are not cached if the cache is not kept"""
+    monkeypatch.delenv("REQUEST_CACHE_PATH")
+    _add_tags_pages()
+
+    list(read_full_refresh(_tags_stream()))
+    list(read_full_refresh(_tags_stream()))
+
+    assert [call.request.headers.get("If-None-Match") for call in responses.calls] == [None, None, None, None]
+    assert not list(tmp_path.iterdir())
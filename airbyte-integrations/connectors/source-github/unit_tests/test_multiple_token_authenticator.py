@@ -7,8 +7,10 @@ from unittest.mock import patch
 
 import pendulum
 import pytest
+import requests
 import responses
 from freezegun import freeze_time
+from requests.hooks import dispatch_hook
 from source_github import SourceGithub
 from source_github.streams import Organizations
 from source_github.utils import MultipleTokenAuthenticatorWithRateLimiter, read_full_refresh
@@ -146,3 +148,28 @@ def test_multiple_token_authenticator_with_rate_limiter_and_sleep(sleep_mock, ca
     list(read_full_refresh(stream))
     sleep_mock.assert_called_once_with(ACCEPTED_WAITING_TIME_IN_SECONDS)
     assert [(x.count_rest, x.count_graphql) for x in authenticator._tokens.values()] == [(500, 500), (500, 500), (498, 500)]
+
+
+@responses.activate
+def test_concurrent_requests_are_spread_over_tokens(rate_limit_mock_response):
+    """
+    This test ensures that:
+     1. The requests in flight at once take the tokens with the fewest requests in flight.
+     2. Once the requests are answered, the active token is used again, even if the request was retried.
+    """
+    authenticator = MultipleTokenAuthenticatorWithRateLimiter(tokens=["token1", "token2", "token3"])
+
+    requests_in_flight = [authenticator(requests.Request("GET", "https://api.github.com/orgs/org1").prepare()) for _ in range(4)]
+    assert [request.headers["Authorization"] for request in requests_in_flight] == [
+        "token token1",
+        "token token2",
+        "token token3",
+        "token token1",
+    ]
+
+    for request in requests_in_flight:
+        dispatch_hook("response", request.hooks, requests.Response())
+        dispatch_hook("response", request.hooks, requests.Response())
+    request = authenticator(requests.Request("GET", "https://api.github.com/orgs/org1").prepare())
+    assert request.headers["Authorization"] == "token token1"
+    assert [x.count_rest for x in authenticator._tokens.values()] == [4997, 4999, 4999]
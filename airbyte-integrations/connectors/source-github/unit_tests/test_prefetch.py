@@ -0,0 +1,117 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+import time
+from unittest.mock import patch
+from urllib import parse
+
+import requests
+import responses
+from responses import matchers
+from source_github.streams import Assignees, PullRequests
+from source_github.utils import MultipleTokenAuthenticatorWithRateLimiter, read_full_refresh
+
+from .utils import read_incremental
+
+
+_REPOSITORIES = [f"organization/repository_{n}" for n in range(5)]
+
+
+def _add_assignees_pages(repository: str, pages: int = 2):
+    url = f"https://api.github.com/repos/{repository}/assignees"
+
+    def request_callback(request):
+        page = int(dict(parse.parse_qsl(parse.urlparse(request.url).query)).get("page", 1))
+        headers = {"Link": f'<{url}?per_page=100&page={page + 1}>; rel="next"'} if page < pages else {}
+        return 200, headers, f'[{{"id": {page}}}]'
+
+    responses.add_callback("GET", url, callback=request_callback, content_type="application/json")
+
+
+@responses.activate
+def test_concurrent_read():
+    """The records are read in the same order as in the sequential read"""
+    for repository in _REPOSITORIES:
+        _add_assignees_pages(repository)
+
+    sequential_records = list(read_full_refresh(Assignees(repositories=_REPOSITORIES, page_size_for_large_streams=100)))
+    concurrent_records = list(read_full_refresh(Assignees(repositories=_REPOSITORIES, page_size_for_large_streams=100, num_workers=3)))
+
+    assert concurrent_records == sequential_records == [{"id": page, "repository": r} for r in _REPOSITORIES for page in (1, 2)]
+    # each page is requested once per read
+    assert len(responses.calls) == 2 * 2 * len(_REPOSITORIES)
+
+
+@responses.activate
+@patch("time.sleep")
+def test_concurrent_read_unavailable_repository(time_mock, caplog):
+    """The errors of the worker threads are handled by the stream as before"""
+    _add_assignees_pages(_REPOSITORIES[0])
+    responses.add("GET", f"https://api.github.com/repos/{_REPOSITORIES[1]}/assignees", status=requests.codes.NOT_FOUND, json={})
+    _add_assignees_pages(_REPOSITORIES[2])
+    stream = Assignees(repositories=_REPOSITORIES[:3], page_size_for_large_streams=100, num_workers=3)
+
+    records = list(read_full_refresh(stream))
+
+    assert [record["repository"] for record in records] == [_REPOSITORIES[0]] * 2 + [_REPOSITORIES[2]] * 2
+    assert f"Syncing `Assignees` stream isn't available for repository `{_REPOSITORIES[1]}`." in caplog.messages
+
+
+@responses.activate
+def test_prefetched_page_of_another_request_is_not_used():
+    """
+    Pull requests are read in descending order once there is a state, but the order is only known once the read started.
+    The pages prefetched in ascending order are dropped and the stream requests the pages itself.
+    """
+    for repository in _REPOSITORIES[:2]:
+        url = f"https://api.github.com/repos/{repository}/pulls"
+        for direction, updated_at in (("asc", "2022-01-01T00:00:00Z"), ("desc", "2022-02-01T00:00:00Z")):
+            responses.add(
+                "GET",
+                url,
+                match=[matchers.query_param_matcher({"per_page": "100", "state": "all", "sort": "updated", "direction": direction})],
+                json=[{"id": 1, "updated_at": updated_at}],
+            )
+    stream = PullRequests(repositories=_REPOSITORIES[:2], page_size_for_large_streams=100, start_date="", num_workers=2)
+    stream_state = {repository: {"updated_at": "2022-01-15T00:00:00Z"} for repository in _REPOSITORIES[:2]}
+
+    records = read_incremental(stream, stream_state)
+
+    assert [(record["repository"], record["updated_at"]) for record in records] == [
+        (_REPOSITORIES[0], "2022-02-01T00:00:00Z"),
+        (_REPOSITORIES[1], "2022-02-01T00:00:00Z"),
+    ]
+
+
+@responses.activate
+def test_concurrent_read_with_fixed_number_of_workers(rate_limit_mock_response):
+    """The requests of several repositories are in flight at once, never more than the workers, and share the tokens"""
+    repositories = [f"organization/repository_{n}" for n in range(12)]
+    lock = threading.Lock()
+    in_flight = []
+    max_in_flight = 0
+
+    def request_callback(request):
+        nonlocal max_in_flight
+        with lock:
+            in_flight.append(request.url)
+            max_in_flight = max(max_in_flight, len(in_flight))
+        time.sleep(0.05)
+        with lock:
+            in_flight.remove(request.url)
+        return 200, {}, '[{"id": 1}]'
+
+    for repository in repositories:
+        responses.add_callback(
+            "GET", f"https://api.github.com/repos/{repository}/assignees", callback=request_callback, content_type="application/json"
+        )
+    authenticator = MultipleTokenAuthenticatorWithRateLimiter(tokens=["token_1", "token_2", "token_3"])
+    stream = Assignees(repositories=repositories, page_size_for_large_streams=100, authenticator=authenticator, num_workers=4)
+
+    records = list(read_full_refresh(stream))
+
+    assert len(records) == len(repositories)
+    assert 1 < max_in_flight <= 4
+    assert sum(token.count_rest < 5000 for token in authenticator._tokens.values()) > 1
@@ -4,6 +4,8 @@
 
 import logging
 import os
+import subprocess
+import sys
 from unittest.mock import MagicMock
 
 import pytest
@@ -288,3 +290,10 @@ def test_user_friendly_message(error_message, expected_user_friendly_message):
     source = SourceGithub()
     user_friendly_error_message = source.user_friendly_error_message(error_message)
     assert user_friendly_error_message == expected_user_friendly_message
+
+
+def test_spec_does_not_load_graphql_schema():
+    # the GraphQL schema is loaded once the first query is built, a new interpreter is needed to check that
+    code = "import logging; from source_github import SourceGithub; SourceGithub().spec(logging.getLogger()); import sys; print('source_github.github_schema' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    assert output.split()[-1] == "False"
@@ -7,8 +7,9 @@ import json
 import logging
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from itertools import groupby
-from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 import anyascii
 import requests
@@ -358,8 +359,15 @@ class KeysToSnakeCaseGoogleAdsTransformation(RecordTransformation):
     """
     Transforms keys in a Google Ads record to snake_case.
     The difference with KeysToSnakeCaseTransformation is that this transformation doesn't add underscore before digits.
+    Every row of the GAQL query results nests the same resources (`campaign`, `segments`, `metrics`, ...) with the same
+    camelCase fields, so the snake_case keys are kept in a bounded LRU cache, one per stream.
     """
 
+    # The number of translated keys kept, well above the number of fields of the widest GAQL query
+    KEY_CACHE_SIZE: ClassVar[int] = 4096
+    # The number of result rows transformed between the debug logs of the hits and misses of the cache
+    CACHE_LOG_INTERVAL: ClassVar[int] = 100_000
+
     token_pattern: re.Pattern[str] = re.compile(
         r"""
             \d*[A-Z]+[a-z]*\d*        # uppercase word (with optional leading/trailing digits)
@@ -369,6 +377,10 @@ class KeysToSnakeCaseGoogleAdsTransformation(RecordTransformation):
         re.VERBOSE,
     )
 
+    def __post_init__(self) -> None:
+        self._translate_key = lru_cache(maxsize=self.KEY_CACHE_SIZE)(self.process_key)
+        self._transformed_records = 0
+
     def transform(
         self,
         record: Dict[str, Any],
@@ -380,10 +392,18 @@ class KeysToSnakeCaseGoogleAdsTransformation(RecordTransformation):
         record.clear()
         record.update(transformed_record)
 
+        self._transformed_records += 1
+        if self._transformed_records % self.CACHE_LOG_INTERVAL == 0 and logger.isEnabledFor(logging.DEBUG):
+            cache_info = self._translate_key.cache_info()
+            logger.debug(
+                f"Keys to snake case after {self._transformed_records} records: {cache_info.hits} hits, "
+                f"{cache_info.misses} misses, {cache_info.currsize} keys cached."
+            )
+
     def _transform_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
         transformed_record = {}
         for key, value in record.items():
-            transformed_key = self.process_key(key)
+            transformed_key = self._translate_key(key)
             transformed_value = value
 
             if isinstance(value, dict):
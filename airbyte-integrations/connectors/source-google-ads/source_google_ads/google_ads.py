@@ -3,15 +3,20 @@
 #
 
 
+import threading
 from enum import Enum
-from typing import Any, Iterable, Iterator, List, Mapping, MutableMapping
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Type
 
 import backoff
+import proto
 from google.ads.googleads.client import GoogleAdsClient
 from google.ads.googleads.v20.services.types.google_ads_service import GoogleAdsRow, SearchGoogleAdsResponse
 from google.api_core.exceptions import InternalServerError, ServerError, ServiceUnavailable, TooManyRequests
 from google.auth import exceptions
 from google.protobuf import json_format
+from google.protobuf.descriptor import Descriptor, FieldDescriptor
 from google.protobuf.message import Message
 from proto.marshal.collections import Repeated, RepeatedComposite
 
@@ -43,6 +48,8 @@ class GoogleAds:
         credentials["use_proto_plus"] = True
         self.clients = {}
         self.ga_services = {}
+        # the clients and services are created on first use, by the threads reading several customers at once too
+        self._clients_lock = threading.Lock()
         self.credentials = credentials
 
         self.clients["default"] = self.get_google_ads_client(credentials)
@@ -53,15 +60,19 @@ class GoogleAds:
     def get_client(self, login_customer_id="default"):
         if login_customer_id in self.clients:
             return self.clients[login_customer_id]
-        new_creds = self.credentials.copy()
-        new_creds["login_customer_id"] = login_customer_id
-        self.clients[login_customer_id] = self.get_google_ads_client(new_creds)
+        with self._clients_lock:
+            if login_customer_id not in self.clients:
+                new_creds = self.credentials.copy()
+                new_creds["login_customer_id"] = login_customer_id
+                self.clients[login_customer_id] = self.get_google_ads_client(new_creds)
         return self.clients[login_customer_id]
 
     def ga_service(self, login_customer_id="default"):
         if login_customer_id in self.ga_services:
             return self.ga_services[login_customer_id]
-        self.ga_services[login_customer_id] = self.clients[login_customer_id].get_service("GoogleAdsService")
+        with self._clients_lock:
+            if login_customer_id not in self.ga_services:
+                self.ga_services[login_customer_id] = self.clients[login_customer_id].get_service("GoogleAdsService")
         return self.ga_services[login_customer_id]
 
     @staticmethod
@@ -266,7 +277,93 @@ class GoogleAds:
 
     @staticmethod
     def parse_single_result(schema: Mapping[str, Any], result: GoogleAdsRow):
-        props = schema.get("properties")
-        fields = GoogleAds.get_fields_from_schema(schema)
-        single_record = {field: GoogleAds.get_field_value(result, field, props.get(field)) for field in fields}
-        return single_record
+        return GoogleAds.get_row_decoder(tuple(schema.get("properties")))(result)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_row_decoder(fields: Tuple[str, ...]) -> "GoogleAdsRowDecoder":
+        """The decoder of the rows of the fields of a stream, built once per list of fields"""
+        return GoogleAdsRowDecoder(fields)
+
+
+class GoogleAdsRowDecoder:
+    """
+    Decodes the rows of a query into records, with the same values as GoogleAds.get_field_value for each field.
+
+    The fields are resolved once per type of row against its protobuf descriptor. Each field is then read from the protobuf
+    message underlying the row with an attrgetter of its path, without wrapping every nested message with proto-plus,
+    and converted according to the type of the field: enums are mapped to their names with a dict built from the enum
+    descriptor, repeated fields are converted in one go. The fields which can't be resolved, and the rows which are not
+    proto-plus messages, are decoded with GoogleAds.get_field_value.
+    """
+
+    def __init__(self, fields: Iterable[str]):
+        self.fields = tuple(fields)
+        self._compiled_fields: Dict[Type, List[Tuple[str, Optional[Callable], Optional[Callable]]]] = {}
+
+    def __call__(self, row: GoogleAdsRow) -> Dict[str, Any]:
+        row_type = type(row)
+        compiled_fields = self._compiled_fields.get(row_type)
+        if compiled_fields is None:
+            compiled_fields = self._compiled_fields[row_type] = self._compile(row_type)
+
+        message = row._pb if isinstance(row, proto.Message) else None
+        record = {}
+        for field, getter, convert in compiled_fields:
+            if getter is None:
+                record[field] = GoogleAds.get_field_value(row, field, None)
+                continue
+            value = getter(message)
+            record[field] = convert(value) if convert else value
+        return record
+
+    def _compile(self, row_type: Type) -> List[Tuple[str, Optional[Callable], Optional[Callable]]]:
+        """Resolve the getter and the conversion of each field, the getter is None for the fields read with get_field_value"""
+        if not (isinstance(row_type, type) and issubclass(row_type, proto.Message)):
+            return [(field, None, None) for field in self.fields]
+        descriptor = row_type.pb().DESCRIPTOR
+        return [(field, *self._compile_field(descriptor, field)) for field in self.fields]
+
+    @staticmethod
+    def _compile_field(descriptor: Descriptor, field: str) -> Tuple[Optional[Callable], Optional[Callable]]:
+        field_descriptor = None
+        path = []
+        for level_attr in field.split("."):
+            # only the last level may be a repeated field or a scalar
+            if descriptor is None or field_descriptor is not None and field_descriptor.label == FieldDescriptor.LABEL_REPEATED:
+                return None, None
+            # the names of some fields end with an underscore, e.g. 'ad_group_ad.ad.type' is 'ad_group_ad.ad.type_'
+            field_descriptor = descriptor.fields_by_name.get(level_attr) or descriptor.fields_by_name.get(level_attr + "_")
+            if field_descriptor is None:
+                return None, None
+            path.append(field_descriptor.name)
+            descriptor = field_descriptor.message_type
+
+        getter = attrgetter(".".join(path))
+        enum_descriptor = field_descriptor.enum_type
+        if field_descriptor.label == FieldDescriptor.LABEL_REPEATED:
+            if descriptor is not None and descriptor.GetOptions().map_entry:
+                return None, None
+            if descriptor is not None:
+                return getter, GoogleAdsRowDecoder._messages_to_json
+            # repeated enums are given as their numbers, like str() of the proto-plus enums
+            return getter, GoogleAdsRowDecoder._values_to_str
+        if enum_descriptor is not None:
+            names = {value.number: value.name for value in enum_descriptor.values}
+            return getter, lambda number: names.get(number, number)
+        if descriptor is not None:
+            # proto-plus converts the well known types, e.g. Timestamp, to python types
+            if descriptor.full_name.startswith("google.protobuf."):
+                return None, None
+            return getter, str
+        if field_descriptor.type == FieldDescriptor.TYPE_BYTES:
+            return getter, str
+        return getter, None
+
+    @staticmethod
+    def _messages_to_json(messages: Iterable[Message]) -> List[str]:
+        return [json_format.MessageToJson(message, indent=0).replace("\n", "") for message in messages]
+
+    @staticmethod
+    def _values_to_str(values: Iterable[Any]) -> List[str]:
+        return [str(value) for value in values]
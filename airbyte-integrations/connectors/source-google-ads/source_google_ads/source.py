@@ -3,6 +3,7 @@
 #
 
 
+from functools import partial
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional
 
 from pendulum import parse, today
@@ -17,7 +18,7 @@ from .models import CustomerModel
 from .streams import (
     CustomerClient,
 )
-from .utils import logger
+from .utils import logger, read_concurrently
 
 
 class SourceGoogleAds(YamlDeclarativeSource):
@@ -26,6 +27,9 @@ class SourceGoogleAds(YamlDeclarativeSource):
 
     # Raise exceptions on missing streams
     raise_exception_on_missing_stream = True
+    # The customers read at once, with the same default and maximum as the concurrency level of the manifest
+    DEFAULT_CONCURRENT_CUSTOMERS = 3
+    MAX_CONCURRENT_CUSTOMERS = 40
 
     @staticmethod
     def _validate_and_transform(config: Mapping[str, Any]):
@@ -64,23 +68,31 @@ class SourceGoogleAds(YamlDeclarativeSource):
         )
         return incremental_stream_config
 
-    def get_all_accounts(self, google_api: GoogleAds, customers: List[CustomerModel], customer_status_filter: List[str]) -> List[str]:
+    def get_all_accounts(
+        self, google_api: GoogleAds, customers: List[CustomerModel], customer_status_filter: List[str], concurrent_customers: int = 1
+    ) -> List[str]:
+        """The customers are read `concurrent_customers` at a time, their records are returned in the order of the customers"""
         customer_clients_stream = CustomerClient(api=google_api, customers=customers, customer_status_filter=customer_status_filter)
-        for slice in customer_clients_stream.stream_slices():
-            for record in customer_clients_stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice=slice):
-                yield record
+        yield from read_concurrently(
+            (
+                partial(customer_clients_stream.read_records, sync_mode=SyncMode.full_refresh, stream_slice=slice)
+                for slice in customer_clients_stream.stream_slices()
+            ),
+            max_workers=concurrent_customers,
+        )
 
     def _get_all_connected_accounts(
-        self, google_api: GoogleAds, customer_status_filter: List[str]
+        self, google_api: GoogleAds, customer_status_filter: List[str], concurrent_customers: int = 1
     ) -> Iterable[Iterable[Mapping[str, Any]]]:
         customer_ids = [customer_id for customer_id in google_api.get_accessible_accounts()]
         dummy_customers = [CustomerModel(id=_id, login_customer_id=_id) for _id in customer_ids]
 
-        yield from self.get_all_accounts(google_api, dummy_customers, customer_status_filter)
+        yield from self.get_all_accounts(google_api, dummy_customers, customer_status_filter, concurrent_customers)
 
     def get_customers(self, google_api: GoogleAds, config: Mapping[str, Any]) -> List[CustomerModel]:
         customer_status_filter = config.get("customer_status_filter", [])
-        accounts = self._get_all_connected_accounts(google_api, customer_status_filter)
+        concurrent_customers = min(config.get("num_workers", self.DEFAULT_CONCURRENT_CUSTOMERS), self.MAX_CONCURRENT_CUSTOMERS)
+        accounts = self._get_all_connected_accounts(google_api, customer_status_filter, concurrent_customers)
 
         # filter only selected accounts
         if config.get("customer_ids"):
@@ -37,8 +37,9 @@ class GoogleAdsStream(Stream, ABC):
         return query
 
     def parse_response(self, response: SearchPager, stream_slice: Optional[Mapping[str, Any]] = None) -> Iterable[Mapping]:
+        schema = self.get_json_schema()
         for result in response:
-            yield self.google_ads_client.parse_single_result(self.get_json_schema(), result)
+            yield self.google_ads_client.parse_single_result(schema, result)
 
     def stream_slices(self, stream_state: Mapping[str, Any] = None, **kwargs) -> Iterable[Optional[Mapping[str, any]]]:
         for customer in self.customers:
@@ -8,9 +8,11 @@ import queue
 import re
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, Generator, Iterable, MutableMapping, Optional, Tuple, Type, Union
+from typing import Any, Callable, Generator, Iterable, List, MutableMapping, Optional, Tuple, Type, Union
 
 import pendulum
 from google.ads.googleads.errors import GoogleAdsException
@@ -210,118 +212,169 @@ def generator_backoff(
     return decorator
 
 
+class BatchedQueue:
+    """
+    Hands the records read by a thread over to the consumer in batches, instead of one item and one event per record.
+    At most `max_pending_batches` batches wait to be consumed: the thread stops reading while the consumer falls behind,
+    so that the records read ahead stay bounded in memory.
+    """
+
+    # The time (in seconds) the consumer waits for a full batch before taking the records read so far, for the slow reads
+    FLUSH_INTERVAL_SECONDS = 1
+    # The time (in seconds) between the checks of the cancellation while the queue is full
+    PUT_TIMEOUT_SECONDS = 0.1
+    _END = object()
+
+    def __init__(self, batch_size: int, max_pending_batches: int):
+        self._batch_size = batch_size
+        self._batches = queue.Queue(maxsize=max_pending_batches)
+        self._batch = []
+        # held while a record is added to the batch and while a batch is queued,
+        # so that the records taken by the consumer from an unfinished batch never overtake a queued batch
+        self._batch_lock = threading.Lock()
+        self.cancelled = threading.Event()
+
+    def produce(self, read: Callable[[], Iterable[Any]]) -> None:
+        """
+        Runs in the thread: reads the records and puts them in batches, followed by the end of the records.
+        The exception raised while reading is put after the records read before it, to be raised by the consumer.
+        """
+        try:
+            for record in read():
+                # the consumer stopped, e.g. on timeout, no more data must be produced
+                if self.cancelled.is_set():
+                    return
+                with self._batch_lock:
+                    self._batch.append(record)
+                    if len(self._batch) >= self._batch_size:
+                        self._put(self._take_batch())
+            self._put_last(self._END)
+        except Exception as e:
+            self._put_last(e)
+
+    def _take_batch(self) -> List[Any]:
+        batch, self._batch = self._batch, []
+        return batch
+
+    def _put_last(self, item: Any) -> None:
+        with self._batch_lock:
+            if self._batch:
+                self._put(self._take_batch())
+            self._put(item)
+
+    def _put(self, item: Any) -> None:
+        while not self.cancelled.is_set():
+            try:
+                self._batches.put(item, timeout=self.PUT_TIMEOUT_SECONDS)
+                return
+            except queue.Full:
+                continue
+
+    def _get(self, timeout_seconds: Optional[float]) -> Any:
+        """
+        Returns the next batch, or the records of the unfinished batch when no batch is queued within FLUSH_INTERVAL_SECONDS.
+        :raise queue.Empty: if no record is received within `timeout_seconds`
+        """
+        deadline = None if timeout_seconds is None else time.monotonic() + timeout_seconds
+        while True:
+            wait = self.FLUSH_INTERVAL_SECONDS if deadline is None else min(self.FLUSH_INTERVAL_SECONDS, deadline - time.monotonic())
+            try:
+                return self._batches.get(timeout=max(wait, 0))
+            except queue.Empty:
+                # the lock is busy while the producer waits to queue a batch, which is then taken from the queue
+                if self._batch_lock.acquire(timeout=self.PUT_TIMEOUT_SECONDS):
+                    try:
+                        # a batch queued meanwhile is consumed first
+                        if not self._batches.empty():
+                            continue
+                        if self._batch:
+                            return self._take_batch()
+                    finally:
+                        self._batch_lock.release()
+                if deadline is not None and time.monotonic() >= deadline and self._batches.empty():
+                    raise
+
+    def consume(self, timeout_seconds: Optional[float] = None) -> Iterable[Any]:
+        """
+        Yields the records of the batches until the end of the records, and cancels the reading once stopped.
+        :raise queue.Empty: if no record is received within `timeout_seconds`
+        """
+        try:
+            while True:
+                batch = self._get(timeout_seconds)
+                if batch is self._END:
+                    return
+                if isinstance(batch, Exception):
+                    raise batch
+                yield from batch
+        finally:
+            self.cancelled.set()
+
+
 class RunAsThread:
     """
     The `RunAsThread` decorator is designed to run a generator function in a separate thread with a specified timeout.
     This is particularly useful when dealing with functions that involve potentially time-consuming operations,
     and you want to enforce a time limit for their execution.
+    The results are passed from the thread in bounded batches, see BatchedQueue.
     """
 
-    def __init__(self, timeout_minutes):
+    def __init__(self, timeout_minutes, batch_size: int = 100, max_pending_batches: int = 10):
         """
         :param timeout_minutes: The maximum allowed time (in minutes) for the generator function to idle.
                                 If the timeout is reached, a TimeoutError is raised.
+        :param batch_size: The number of results passed from the thread at once.
+        :param max_pending_batches: The number of batches the thread produces ahead of the caller before waiting.
         """
         self._timeout_seconds = timeout_minutes * 60
+        self._batch_size = batch_size
+        self._max_pending_batches = max_pending_batches
 
     def __call__(self, generator_func):
         @functools.wraps(generator_func)
         def wrapper(*args, **kwargs):
-            """
-            The wrapper function sets up threading components, starts a separate thread to run the generator function.
-            It uses events and a queue for communication and synchronization between the main thread and the thread running the generator function.
-            """
-            # Event and Queue initialization
-            write_event = threading.Event()
-            exit_event = threading.Event()
-            the_queue = queue.Queue()
-
-            # Thread initialization and start
-            thread = threading.Thread(
-                target=self.target, args=(the_queue, write_event, exit_event, generator_func, args, kwargs), daemon=True
-            )
+            batches = BatchedQueue(self._batch_size, self._max_pending_batches)
+            thread = threading.Thread(target=batches.produce, args=(functools.partial(generator_func, *args, **kwargs),), daemon=True)
             thread.start()
-
-            # Records the starting time for the timeout calculation.
-            start_time = time.time()
-            while thread.is_alive() or not the_queue.empty():
-                # The main thread waits for the `write_event` to be set or until the specified timeout.
-                if the_queue.empty():
-                    write_event.wait(self._timeout_seconds)
-                try:
-                    # The main thread yields the result obtained from reading the queue.
-                    yield self.read(the_queue)
-                    # The timer is reset since a new result has been received, preventing the timeout from occurring.
-                    start_time = time.time()
-                except queue.Empty:
-                    # If exit_event is set it means that the generator function in the thread has completed its execution.
-                    if exit_event.is_set():
-                        break
-                    # Check if the timeout has been reached without new results.
-                    if time.time() - start_time > self._timeout_seconds:
-                        # The thread may continue to run for some time after reaching a timeout and even come to life and continue working.
-                        # That is why the exit event is set to signal the generator function to stop producing data.
-                        exit_event.set()
-                        raise TimeoutError(f"Method '{generator_func.__name__}' timed out after {self._timeout_seconds / 60.0} minutes")
-                    # The write event is cleared to reset it for the next iteration.
-                    write_event.clear()
+            try:
+                yield from batches.consume(self._timeout_seconds)
+            except queue.Empty:
+                # The thread may continue to run for some time after reaching a timeout and even come to life and continue working.
+                # That is why the reading is cancelled, to signal the generator function to stop producing data.
+                raise TimeoutError(f"Method '{generator_func.__name__}' timed out after {self._timeout_seconds / 60.0} minutes")
 
         return wrapper
 
-    def target(self, the_queue, write_event, exit_event, func, args, kwargs):
-        """
-        This is a target function for the thread.
-        It runs the actual generator function, writing its results to a queue.
-        Exceptions raised during execution are also written to the queue.
-        :param the_queue: A queue used for communication between the main thread and the thread running the generator function.
-        :param write_event: An event signaling the availability of new data in the queue.
-        :param exit_event: An event indicating whether the generator function should stop producing data due to a timeout.
-        :param func: The generator function to be executed.
-        :param args: Positional arguments for the generator function.
-        :param kwargs: Keyword arguments for the generator function.
-        :return: None
-        """
-        try:
-            for value in func(*args, **kwargs):
-                # If the timeout has been reached we must stop producing any data
-                if exit_event.is_set():
-                    break
-                self.write(the_queue, value, write_event)
-            else:
-                # Notify the main thread that the generator function has completed its execution.
-                exit_event.set()
-                # Notify the main thread (even if the generator didn't produce any data) to prevent waiting for no reason.
-                if not write_event.is_set():
-                    write_event.set()
-        except Exception as e:
-            self.write(the_queue, e, write_event)
 
-    @staticmethod
-    def write(the_queue, value, write_event):
-        """
-        Puts a value into the queue and sets a write event to notify the main thread that new data is available.
-        :param the_queue: A queue used for communication between the main thread and the thread running the generator function.
-        :param value: The value to be put into the communication queue.
-                      This can be any type of data produced by the generator function, including results or exceptions.
-        :param write_event: An event signaling the availability of new data in the queue.
-        :return: None
-        """
-        the_queue.put(value)
-        write_event.set()
-
-    @staticmethod
-    def read(the_queue, timeout=0.001):
-        """
-        Retrieves a value from the queue, handling the case where the value is an exception, and raising it.
-        :param the_queue: A queue used for communication between the main thread and the thread running the generator function.
-        :param timeout: A time in seconds to wait for a value to be available in the queue.
-                        If the timeout is reached and no new data is available, a `queue.Empty` exception is raised.
-        :return: a value retrieved from the queue
-        """
-        value = the_queue.get(block=True, timeout=timeout)
-        if isinstance(value, Exception):
-            raise value
-        return value
+def read_concurrently(
+    reads: Iterable[Callable[[], Iterable[Any]]], max_workers: int, batch_size: int = 100, max_pending_batches: int = 10
+) -> Iterable[Any]:
+    """
+    Runs up to `max_workers` reads at once, e.g. of the slices of several customers, and yields the records of each read
+    in the order of the reads. Each read is read ahead in at most `max_pending_batches` batches, see BatchedQueue.
+    """
+    reads = iter(reads)
+    pending = deque()
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="google-ads-read")
+
+    def submit_next_read() -> None:
+        read = next(reads, None)
+        if read is not None:
+            batches = BatchedQueue(batch_size, max_pending_batches)
+            executor.submit(batches.produce, read)
+            pending.append(batches)
+
+    try:
+        for _ in range(max_workers):
+            submit_next_read()
+        while pending:
+            yield from pending[0].consume()
+            pending.popleft()
+            submit_next_read()
+    finally:
+        for batches in pending:
+            batches.cancelled.set()
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 detached = RunAsThread
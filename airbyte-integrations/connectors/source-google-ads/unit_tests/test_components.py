@@ -2,10 +2,16 @@
 # Copyright (c) 2025 Airbyte, Inc., all rights reserved.
 #
 
-from unittest.mock import Mock
+import logging
+from unittest.mock import Mock, patch
 
 import pytest
-from source_google_ads.components import ClickViewHttpRequester, CustomGAQueryHttpRequester, CustomGAQuerySchemaLoader
+from source_google_ads.components import (
+    ClickViewHttpRequester,
+    CustomGAQueryHttpRequester,
+    CustomGAQuerySchemaLoader,
+    KeysToSnakeCaseGoogleAdsTransformation,
+)
 
 from airbyte_cdk import AirbyteTracedException
 from airbyte_cdk.sources.declarative.schema import InlineSchemaLoader
@@ -288,3 +294,39 @@ class TestClickViewHttpRequester:
         assert request_body == {
             "query": "SELECT ad_group.name, click_view.gclid, click_view.ad_group_ad, segments.date FROM click_view WHERE segments.date = '2025-07-18'"
         }
+
+
+class TestKeysToSnakeCaseGoogleAdsTransformation:
+    @staticmethod
+    def _records(count):
+        keys = [f"Metrics.CostPerConversion{n}" for n in range(100)] + ["Café", "This is a full sentence"]
+        return [{key: n for key in keys} | {"Nested Record": {"firstName": n}} for n in range(count)]
+
+    def test_keys_are_translated_once(self, caplog):
+        transformation = KeysToSnakeCaseGoogleAdsTransformation()
+        transformation.CACHE_LOG_INTERVAL = 2
+        records = self._records(3)
+
+        with caplog.at_level(logging.DEBUG, logger="airbyte"):
+            for record in records:
+                transformation.transform(record)
+
+        assert records[2] == {f"metrics_cost_per_conversion{n}": 2 for n in range(100)} | {
+            "cafe": 2,
+            "this_is_a_full_sentence": 2,
+            "nested_record": {"first_name": 2},
+        }
+        assert transformation._translate_key.cache_info()[:2] == (2 * 104, 104)
+        assert "Keys to snake case after 2 records: 104 hits, 104 misses, 104 keys cached." in caplog.messages
+
+    def test_keys_cache_evicts_keys_at_max_size(self):
+        with patch.object(KeysToSnakeCaseGoogleAdsTransformation, "KEY_CACHE_SIZE", 2):
+            transformation = KeysToSnakeCaseGoogleAdsTransformation()
+        records = [{"firstName": 1}, {"lastName": 2}, {"middleName": 3}, {"firstName": 4}]
+
+        for record in records:
+            transformation.transform(record)
+
+        assert records == [{"first_name": 1}, {"last_name": 2}, {"middle_name": 3}, {"first_name": 4}]
+        # the least recently used key is evicted, so the first key is translated again
+        assert transformation._translate_key.cache_info()[:4] == (0, 4, 2, 2)
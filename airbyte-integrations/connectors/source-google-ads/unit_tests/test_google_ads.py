@@ -5,11 +5,14 @@
 
 import json
 from datetime import date
+from pathlib import Path
 
 import pendulum
 import pytest
+import yaml
 from google.ads.googleads.v20.services.types.google_ads_service import GoogleAdsRow
 from google.auth import exceptions
+from google.protobuf.descriptor import FieldDescriptor
 from source_google_ads.google_ads import GoogleAds
 from source_google_ads.streams import chunk_date_range
 
@@ -291,3 +294,67 @@ def test_get_fields_metadata(mocker):
     assert set(response.keys()) == set(fields)
     for field in fields:
         assert response[field].name == field
+
+
+def _fill_row(fields, row_number):
+    """A row of a report with a value set for each field, recorded as bytes as the API sends it"""
+    row = GoogleAdsRow.pb()()
+    for field in fields:
+        *path, name = field.split(".")
+        message = row
+        for level_attr in path:
+            message = getattr(message, level_attr)
+        field_descriptor = message.DESCRIPTOR.fields_by_name.get(name) or message.DESCRIPTOR.fields_by_name[name + "_"]
+        name = field_descriptor.name
+        if field_descriptor.label == FieldDescriptor.LABEL_REPEATED:
+            if field_descriptor.message_type:
+                getattr(message, name).add().SetInParent()
+            elif field_descriptor.enum_type:
+                getattr(message, name).extend([value.number for value in field_descriptor.enum_type.values[-2:]])
+            else:
+                getattr(message, name).extend([f"{name} {row_number}", "second"])
+        elif field_descriptor.message_type:
+            getattr(message, name).SetInParent()
+        elif field_descriptor.enum_type:
+            setattr(message, name, field_descriptor.enum_type.values[-1].number)
+        elif field_descriptor.type == FieldDescriptor.TYPE_STRING:
+            setattr(message, name, f"{name} {row_number}")
+        elif field_descriptor.type == FieldDescriptor.TYPE_BOOL:
+            setattr(message, name, True)
+        elif field_descriptor.type in (FieldDescriptor.TYPE_DOUBLE, FieldDescriptor.TYPE_FLOAT):
+            setattr(message, name, row_number / 3)
+        else:
+            setattr(message, name, row_number)
+    return row.SerializeToString()
+
+
+def _report_fields(stream_name):
+    manifest = yaml.safe_load((Path(__file__).parent.parent / "source_google_ads" / "manifest.yaml").read_text())
+    return list(manifest["schemas"][stream_name]["properties"])
+
+
+def test_parse_single_result_is_get_field_value_of_each_field():
+    fields = _report_fields("ad_group_ad_legacy") + [
+        "ad_group.excluded_parent_asset_field_types",
+        "ad_group_ad.ad.responsive_display_ad.long_headline",
+        "ad_group.unknown_field",
+        "ad_group.id.real",
+    ]
+    schema = {"properties": {field: {} for field in fields}}
+    row = GoogleAdsRow.deserialize(_fill_row([field for field in fields[:-2] if field.split(".")[0] in GoogleAdsRow.meta.fields], 7))
+
+    record = GoogleAds.parse_single_result(schema, row)
+
+    assert record == {field: GoogleAds.get_field_value(row, field, {}) for field in fields}
+    assert record["ad_group_ad.ad.type"] == GoogleAds.get_field_value(row, "ad_group_ad.ad.type", {}) != "UNSPECIFIED"
+    assert list(record) == list(schema["properties"])
+
+
+def test_parse_single_result_reuses_compiled_decoder_for_all_rows():
+    fields = [field for field in _report_fields("ad_group_ad_legacy") if field.split(".")[0] in GoogleAdsRow.meta.fields]
+    schema = {"properties": {field: {} for field in fields}}
+    rows = [GoogleAdsRow.deserialize(_fill_row(fields, row_number)) for row_number in range(30)]
+
+    records = [GoogleAds.parse_single_result(schema, row) for row in rows]
+
+    assert records == [{field: GoogleAds.get_field_value(row, field, {}) for field in fields} for row in rows]
@@ -0,0 +1,129 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from source_google_ads.google_ads import GoogleAds
+from source_google_ads.utils import BatchedQueue, RunAsThread, read_concurrently
+
+
+def test_run_as_thread_yields_the_results_in_batches():
+    produced = []
+
+    @RunAsThread(timeout_minutes=1, batch_size=10, max_pending_batches=2)
+    def generate(count):
+        for n in range(count):
+            produced.append(n)
+            yield n
+
+    results = generate(1000)
+
+    assert next(results) == 0
+    time.sleep(0.2)
+    # the thread is stopped once the pending batches are full, instead of reading all the results ahead
+    assert len(produced) <= 10 * (2 + 2)
+    assert list(results) == list(range(1, 1000))
+
+
+def test_run_as_thread_raises_the_exception_of_the_thread():
+    @RunAsThread(timeout_minutes=1)
+    def generate():
+        yield 1
+        raise ValueError("failed")
+
+    results = generate()
+
+    with pytest.raises(ValueError, match="failed"):
+        list(results)
+
+
+def test_run_as_thread_times_out_and_stops_the_thread():
+    stopped = threading.Event()
+
+    @RunAsThread(timeout_minutes=0.001, batch_size=1)
+    def generate():
+        yield 1
+        time.sleep(0.5)
+        yield 2
+        yield 3
+        stopped.set()
+
+    results = generate()
+
+    assert next(results) == 1
+    with pytest.raises(TimeoutError):
+        next(results)
+    time.sleep(0.6)
+    assert not stopped.is_set()
+
+
+def test_read_concurrently_keeps_the_order_of_the_reads():
+    running, max_running = [0], [0]
+    lock = threading.Lock()
+
+    def read(customer_id):
+        with lock:
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        return [f"{customer_id}-{n}" for n in range(3)]
+
+    records = list(read_concurrently((lambda customer_id=customer_id: read(customer_id) for customer_id in range(8)), max_workers=3))
+
+    assert records == [f"{customer_id}-{n}" for customer_id in range(8) for n in range(3)]
+    assert max_running[0] == 3
+
+
+def test_read_concurrently_raises_the_exception_of_a_read():
+    def failing_read():
+        raise ValueError("failed")
+
+    records = read_concurrently([lambda: [1, 2], failing_read, lambda: [3]], max_workers=2)
+
+    assert next(records) == 1
+    with pytest.raises(ValueError, match="failed"):
+        list(records)
+
+
+def test_run_as_thread_hands_over_the_records_of_a_slow_read_before_the_batch_is_full(mocker):
+    mocker.patch.object(BatchedQueue, "FLUSH_INTERVAL_SECONDS", 0.05)
+    resume = threading.Event()
+
+    @RunAsThread(timeout_minutes=1, batch_size=100)
+    def generate():
+        yield 1
+        yield 2
+        # resumed by the consumer once it got the first records
+        yield resume.wait(5)
+
+    results = generate()
+
+    assert [next(results), next(results)] == [1, 2]
+    resume.set()
+    assert list(results) == [True]
+
+
+def test_get_client_creates_one_client_per_login_customer_from_concurrent_reads(mocker):
+    get_google_ads_client = mocker.patch.object(GoogleAds, "get_google_ads_client", side_effect=lambda credentials: MagicMock())
+    google_ads = GoogleAds(credentials={"developer_token": "token"})
+    barrier = threading.Barrier(8)
+
+    def get_client():
+        barrier.wait()
+        return google_ads.get_client("123"), google_ads.ga_service("123")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: get_client(), range(8)))
+
+    assert len({id(client) for client, _ in results}) == 1
+    assert len({id(ga_service) for _, ga_service in results}) == 1
+    # the default client and the client of the login customer
+    assert get_google_ads_client.call_count == 2
@@ -5,10 +5,12 @@
 import logging
 from dataclasses import InitVar, dataclass, field
 from datetime import timedelta
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Union
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 import dpath
 import requests
+from jsonschema import ValidationError
 
 from airbyte_cdk import (
     BearerAuthenticator,
@@ -45,6 +47,21 @@ from airbyte_cdk.utils.datetime_helpers import AirbyteDateTime, ab_datetime_form
 
 logger = logging.getLogger("airbyte")
 
+# The Python types of the values of each JSON schema type, booleans are checked apart as bool is a subclass of int
+JSON_SCHEMA_PYTHON_TYPES = {
+    "array": (list,),
+    "boolean": (bool,),
+    "integer": (int,),
+    "null": (type(None),),
+    "number": (int, float),
+    "object": (dict,),
+    "string": (str,),
+}
+# The number of date and datetime strings kept formatted, every property of CRM objects is read twice, nested and flattened
+DATETIME_CACHE_SIZE = 4096
+# The casts of TypeTransformer.default_convert which are compiled, the other conversions are delegated to default_convert
+DEFAULT_CASTS = {"string": str, "number": float, "integer": int}
+
 
 @dataclass
 class NewtoLegacyFieldTransformation(RecordTransformation):
@@ -386,92 +403,236 @@ class EntitySchemaNormalization(TypeTransformer):
     Strings like "true"/"false" with boolean type converts to boolean else the original value is returned.
     Date and Datetime fields converts to format datetime string. Set __ab_apply_cast_datetime: false in field definition, if you don't need to format datetime strings.
 
+    CRM objects can have hundreds of custom properties, so instead of deriving the conversion of every value from its field schema
+    while walking the record with a jsonschema validator, each stream schema is compiled once into a converter per field, and the
+    records are normalized with a single lookup per field. The compiled normalization walks the record like the validator does,
+    which also means the values of nested objects are converted twice, and logs the same warnings for values of unexpected types.
+    The validator of TypeTransformer only checks the "type" keyword, while following "properties", "items" and "$ref", so the
+    other keywords ("required", "enum", "oneOf", ...) are not reported by either, and only "type" is compiled into a check.
     """
 
+    # The number of schemas kept compiled, a transformer normalizes the records of a single stream
+    COMPILED_SCHEMAS_CACHE_SIZE = 8
+
     def __init__(self, *args, **kwargs):
         config = TransformConfig.CustomSchemaNormalization
         super().__init__(config)
+        self._converters: Dict[int, Tuple[Mapping[str, Any], Callable[[Any], Any]]] = {}
+        self._compiled_schemas: Dict[int, Tuple[Mapping[str, Any], Optional[Callable[[Any, Tuple], None]]]] = {}
         self.registerCustomTransform(self.get_transform_function())
 
     def get_transform_function(self):
         def transform_function(original_value: str, field_schema: Dict[str, Any]) -> Any:
-            target_type = field_schema.get("type")
-            target_format = field_schema.get("format")
-
-            # Handle oneOf schema structures by extracting and flattening all types
-            if target_type is None and "oneOf" in field_schema:
-                all_types = set()
-                for one_of_item in field_schema["oneOf"]:
-                    item_type = one_of_item.get("type", [])
-                    if isinstance(item_type, list):
-                        all_types.update(item_type)
-                    elif isinstance(item_type, str):
-                        all_types.add(item_type)
-                target_type = list(all_types)
-
-            if target_type is None:
-                target_type = []
-            elif isinstance(target_type, str):
-                target_type = [target_type]
-
-            if "null" in target_type:
-                # Sometimes hubspot output empty string on field with format set.
-                # Set it to null to avoid errors on destination' normalization stage.
-                if target_format and original_value == "":
-                    return None
+            return self._get_converter(field_schema)(original_value)
+
+        return transform_function
+
+    def transform(self, record: Dict[str, Any], schema: Mapping[str, Any]) -> None:
+        normalize_record = self._get_compiled_schema(schema)
+        if normalize_record is None:
+            # Schemas with references or keywords the compiled normalization does not handle are walked by the validator
+            super().transform(record, schema)
+        else:
+            normalize_record(record, ())
+
+    def _get_compiled_schema(self, schema: Mapping[str, Any]) -> Optional[Callable[[Any, Tuple], None]]:
+        # The schema is kept with its compiled normalization so that its id can't be reused by another schema
+        compiled_schema = self._compiled_schemas.get(id(schema))
+        if compiled_schema is None or compiled_schema[0] is not schema:
+            normalize_record = self._compile_schema(schema) if self._is_compilable(schema) else None
+            if len(self._compiled_schemas) >= self.COMPILED_SCHEMAS_CACHE_SIZE:
+                self._compiled_schemas.pop(next(iter(self._compiled_schemas)))
+            compiled_schema = self._compiled_schemas[id(schema)] = (schema, normalize_record)
+        return compiled_schema[1]
+
+    @classmethod
+    def _is_compilable(cls, schema: Any) -> bool:
+        if not isinstance(schema, Mapping) or "$ref" in schema:
+            return False
+        if "type" in schema:
+            target_type = schema["type"]
+            target_types = [target_type] if isinstance(target_type, str) else target_type
+            if not isinstance(target_types, list) or not set(target_types).issubset(JSON_SCHEMA_PYTHON_TYPES):
+                return False
+        if "properties" in schema:
+            if not isinstance(schema["properties"], Mapping) or not all(map(cls._is_compilable, schema["properties"].values())):
+                return False
+        return "items" not in schema or cls._is_compilable(schema["items"])
+
+    def _compile_schema(self, schema: Mapping[str, Any]) -> Callable[[Any, Tuple], None]:
+        is_valid = self._compile_type_check(schema)
+        normalize_children = self._compile_children(schema)
+
+        def normalize_record(record: Any, path: Tuple) -> None:
+            if not is_valid(record):
+                self._log_type_error(record, schema, path)
+            if normalize_children is not None:
+                normalize_children(record, path)
+
+        return normalize_record
+
+    def _compile_children(self, schema: Mapping[str, Any]) -> Optional[Callable[[Any, Tuple], None]]:
+        """
+        Compiles the normalization of the properties of an object, or of the items of an array, for the given schema.
+        Like the validator, every value is converted first, then its own properties or items are normalized.
+        """
+        fields = {key: self._compile_field(field_schema) for key, field_schema in schema.get("properties", {}).items()}
+        normalize_item = self._compile_field(schema["items"]) if "items" in schema else None
+        if not fields and normalize_item is None:
+            return None
+
+        def normalize_children(instance: Any, path: Tuple) -> None:
+            if fields and isinstance(instance, dict):
+                for key, value in instance.items():
+                    normalize_field = fields.get(key)
+                    if normalize_field is not None:
+                        instance[key] = normalize_field(value, path, key)
+            if normalize_item is not None and isinstance(instance, list):
+                for index, item in enumerate(instance):
+                    instance[index] = normalize_item(item, path, index)
+
+        return normalize_children
+
+    def _compile_field(self, field_schema: Mapping[str, Any]) -> Callable[[Any, Tuple, Union[str, int]], Any]:
+        convert = self._get_converter(field_schema)
+        is_valid = self._compile_type_check(field_schema)
+        normalize_children = self._compile_children(field_schema)
+
+        def normalize_field(value: Any, path: Tuple, key: Union[str, int]) -> Any:
+            value = convert(value)
+            if not is_valid(value):
+                self._log_type_error(value, field_schema, path + (key,))
+            if normalize_children is not None:
+                normalize_children(value, path + (key,))
+            return value
+
+        return normalize_field
+
+    def _log_type_error(self, value: Any, schema: Mapping[str, Any], path: Tuple) -> None:
+        logger.warning(self.get_error_message(ValidationError("", path=path, instance=value, validator_value=schema["type"])))
+
+    @staticmethod
+    def _compile_type_check(schema: Mapping[str, Any]) -> Callable[[Any], bool]:
+        """
+        Compiles the check of the "type" keyword of the schema, with the semantics of the jsonschema Draft 7 type checker.
+        """
+        if "type" not in schema:
+            return lambda value: True
+        target_types = [schema["type"]] if isinstance(schema["type"], str) else schema["type"]
+        python_types = tuple(python_type for target_type in target_types for python_type in JSON_SCHEMA_PYTHON_TYPES[target_type])
+        allows_boolean = "boolean" in target_types
+        # An integer is any number without a fractional part
+        allows_integral_float = "integer" in target_types
+
+        def is_valid(value: Any) -> bool:
+            if isinstance(value, bool):
+                return allows_boolean
+            return isinstance(value, python_types) or (allows_integral_float and isinstance(value, float) and value.is_integer())
+
+        return is_valid
+
+    def _get_converter(self, field_schema: Mapping[str, Any]) -> Callable[[Any], Any]:
+        # The field schema is kept with its converter so that its id can't be reused by another schema
+        converter = self._converters.get(id(field_schema))
+        if converter is None or converter[0] is not field_schema:
+            converter = self._converters[id(field_schema)] = (field_schema, self._compile_converter(field_schema))
+        return converter[1]
+
+    def _compile_converter(self, field_schema: Mapping[str, Any]) -> Callable[[Any], Any]:
+        """
+        Compiles the conversion of a value of the field, the target types and format of the field being resolved once.
+        The converter is used by the compiled normalization and by `transform_function` for the schemas walked by the validator.
+        """
+        target_type = field_schema.get("type")
+        target_format = field_schema.get("format")
+
+        # Handle oneOf schema structures by extracting and flattening all types
+        if target_type is None and "oneOf" in field_schema:
+            all_types = set()
+            for one_of_item in field_schema["oneOf"]:
+                item_type = one_of_item.get("type", [])
+                if isinstance(item_type, list):
+                    all_types.update(item_type)
+                elif isinstance(item_type, str):
+                    all_types.add(item_type)
+            target_type = list(all_types)
+
+        if target_type is None:
+            target_type = []
+        elif isinstance(target_type, str):
+            target_type = [target_type]
+
+        # Sometimes hubspot output empty string on field with format set.
+        # Set it to null to avoid errors on destination' normalization stage.
+        # Do not cast empty strings of non string fields either, return None instead to be properly cast.
+        empty_string_to_none = bool("null" in target_type and target_format) or "string" not in target_type
+        cast_to_number = "number" in target_type
+        cast_to_boolean = "boolean" in target_type
+        keep_formatted_string = bool(target_format) and field_schema.get("__ab_apply_cast_datetime") is False
+        cast_to_datetime = target_format in ("date", "date-time") and not keep_formatted_string
+        nested_converters = (
+            {key: self._get_converter(schema) for key, schema in field_schema["properties"].items() if schema}
+            if "properties" in field_schema
+            else None
+        )
+        default_convert = self._compile_default_convert(field_schema)
 
+        def convert(original_value: Any) -> Any:
             if isinstance(original_value, str):
-                if "string" not in target_type and original_value == "":
-                    # do not cast empty strings, return None instead to be properly cast.
-                    transformed_value = None
-                    return transformed_value
-                if "number" in target_type:
+                if empty_string_to_none and original_value == "":
+                    return None
+                if cast_to_number:
                     # do not cast numeric IDs into float, use integer instead
-                    target_type = int if original_value.isnumeric() else float
+                    number_type = int if original_value.isnumeric() else float
 
                     # In some cases, the returned value from Hubspot is non-numeric despite the discovered schema explicitly declaring a numeric type.
                     # For example, a field with a type of "number" might return a string: "3092727991;3881228353;15895321999"
                     # So, we attempt to cast the value to the declared type, and failing that, we log the error and return the original value.
                     # This matches the previous behavior in the Python implementation.
                     try:
-                        transformed_value = target_type(original_value.replace(",", ""))
-                        return transformed_value
+                        return number_type(original_value.replace(",", ""))
                     except ValueError:
-                        logger.exception(f"Could not cast field value {original_value} to {target_type}")
+                        logger.exception(f"Could not cast field value {original_value} to {number_type}")
                         return original_value
-                if "boolean" in target_type and original_value.lower() in ["true", "false"]:
-                    transformed_value = str(original_value).lower() == "true"
-                    return transformed_value
-                if target_format:
-                    if field_schema.get("__ab_apply_cast_datetime") is False:
+                if cast_to_boolean and original_value.lower() in ["true", "false"]:
+                    return original_value.lower() == "true"
+                if keep_formatted_string:
+                    return original_value
+                if cast_to_datetime:
+                    try:
+                        return format_datetime_string(original_value, target_format)
+                    except ValueError:
                         return original_value
-                    if "date" == target_format:
-                        dt = EntitySchemaNormalization.convert_datetime_string_to_ab_datetime(original_value)
-                        if dt:
-                            transformed_value = DatetimeParser().format(dt, "%Y-%m-%d")
-                            return transformed_value
-                        else:
-                            return original_value
-                    if "date-time" == target_format:
-                        dt = EntitySchemaNormalization.convert_datetime_string_to_ab_datetime(original_value)
-                        if dt:
-                            transformed_value = ab_datetime_format(dt)
-                            return transformed_value
-                        else:
-                            return original_value
-            if "properties" in field_schema and isinstance(original_value, dict):
-                normalized_nested_properties = dict()
-                for nested_key, nested_val in original_value.items():
-                    nested_property_schema = field_schema.get("properties").get(nested_key)
-                    if nested_property_schema:
-                        normalized_nested_properties[nested_key] = transform_function(nested_val, nested_property_schema)
-                    else:
-                        normalized_nested_properties[nested_key] = nested_val
-                return normalized_nested_properties
-            else:
-                return self.default_convert(original_value, field_schema)
+            if nested_converters is not None and isinstance(original_value, dict):
+                return {
+                    nested_key: nested_converters[nested_key](nested_val) if nested_key in nested_converters else nested_val
+                    for nested_key, nested_val in original_value.items()
+                }
+            return default_convert(original_value)
 
-        return transform_function
+        return convert
+
+    def _compile_default_convert(self, field_schema: Mapping[str, Any]) -> Callable[[Any], Any]:
+        """
+        Compiles the default conversion of the transformer for the simple casts of nullable or single types,
+        the conversions to other types are delegated to `default_convert`.
+        """
+        target_type = field_schema.get("type", [])
+        non_null_types = [t for t in target_type if t != "null"] if isinstance(target_type, list) else [target_type]
+        cast = DEFAULT_CASTS.get(non_null_types[0]) if len(non_null_types) == 1 else None
+        if cast is None:
+            return partial(self.default_convert, subschema=field_schema)
+        nullable = "null" in target_type
+
+        def default_convert(original_value: Any) -> Any:
+            if original_value is None and nullable:
+                return None
+            try:
+                return cast(original_value)
+            except (ValueError, TypeError):
+                return original_value
+
+        return default_convert
 
     @staticmethod
     def convert_datetime_string_to_ab_datetime(datetime_str: str) -> Optional[AirbyteDateTime]:
@@ -506,6 +667,18 @@ class EntitySchemaNormalization(TypeTransformer):
         return None
 
 
+@lru_cache(maxsize=DATETIME_CACHE_SIZE)
+def format_datetime_string(datetime_str: str, target_format: str) -> str:
+    """
+    Formats the date or datetime string of a field with the "date" or "date-time" format.
+    Raises a ValueError if the string can't be parsed, so that only the parsed strings are cached.
+    """
+    dt = EntitySchemaNormalization.convert_datetime_string_to_ab_datetime(datetime_str)
+    if not dt:
+        raise ValueError(f"Could not parse date/datetime string: {datetime_str}")
+    return DatetimeParser().format(dt, "%Y-%m-%d") if target_format == "date" else ab_datetime_format(dt)
+
+
 class HubspotFlattenAssociationsTransformation(RecordTransformation):
     """
     A record transformation that flattens the `associations` field in HubSpot records.
@@ -2,6 +2,8 @@
 # Copyright (c) 2025 Airbyte, Inc., all rights reserved.
 #
 
+import copy
+import logging
 from unittest.mock import Mock, patch
 
 import pytest
@@ -611,6 +613,130 @@ def test_entity_schema_normalization(components_module, original_value, field_sc
     assert normalized_value == expected_value
 
 
+# The schemas of the custom properties of a CRM object, as mapped by the dynamic schema loader, with their sample values.
+# Most of the custom properties are strings or enumerations, the dates and datetimes are templates of distinct values per record.
+_CONTACT_PROPERTY_SAMPLES = [
+    *[({"type": ["null", "string"]}, ["some text", "", None, 42])] * 6,
+    ({"oneOf": [{"type": ["null", "number"]}, {"type": ["null", "string"]}]}, ["12", "1,234.5", "", "3092727991;3881228353", None]),
+    ({"oneOf": [{"type": ["null", "boolean"]}, {"type": ["null", "string"]}]}, ["true", "FALSE", "", "yes", None]),
+    ({"type": ["null", "string"], "format": "date"}, ["2024-01-{day:02d}T03:04:05Z", "17041{timestamp}", "", None]),
+    (
+        {"type": ["null", "string"], "format": "date-time"},
+        ["2024-01-02T03:{minute:02d}:{second:02d}.123Z", "17041{timestamp}", "not a date", ""],
+    ),
+    ({"type": ["null", "string"], "format": "date-time", "__ab_apply_cast_datetime": False}, ["2024-01-02T03:04:05.123Z", ""]),
+]
+
+
+def _contacts_sample(properties_count, records_count):
+    """Builds the schema of contacts with the given number of custom properties, and records with a value for every field"""
+    property_schemas = {
+        f"custom_property_{n}": _CONTACT_PROPERTY_SAMPLES[n % len(_CONTACT_PROPERTY_SAMPLES)][0] for n in range(properties_count)
+    }
+    schema = {
+        "type": ["null", "object"],
+        "properties": {
+            "id": {"type": ["null", "string"]},
+            "createdAt": {"type": ["null", "string"], "format": "date-time"},
+            "archived": {"type": ["null", "boolean"]},
+            "companies": {"type": ["null", "array"], "items": {"type": ["null", "integer"]}},
+            "properties": {"type": "object", "properties": property_schemas},
+            **{f"properties_{name}": property_schema for name, property_schema in property_schemas.items()},
+        },
+    }
+    records = []
+    for record_number in range(records_count):
+        properties = {}
+        for n in range(properties_count):
+            values = _CONTACT_PROPERTY_SAMPLES[n % len(_CONTACT_PROPERTY_SAMPLES)][1]
+            value = values[(n + record_number) % len(values)]
+            if isinstance(value, str):
+                value = value.format(
+                    day=record_number % 28 + 1,
+                    minute=record_number % 60,
+                    second=n % 60,
+                    timestamp=f"{record_number:04d}{n:04d}",
+                )
+            properties[f"custom_property_{n}"] = value
+        records.append(
+            {
+                "id": record_number,
+                "createdAt": "2024-01-02T03:04:05.123Z",
+                "archived": "false",
+                "companies": ["408", 888],
+                "undeclared_field": "",
+                "properties": properties,
+                **{f"properties_{name}": value for name, value in properties.items()},
+            }
+        )
+    return schema, records
+
+
+def test_entity_schema_normalization_of_records_matches_schema_validation(components_module, caplog):
+    schema, records = _contacts_sample(properties_count=60, records_count=10)
+    entity_schema_normalization = components_module.EntitySchemaNormalization()
+
+    expected_records = copy.deepcopy(records)
+    with caplog.at_level(logging.WARNING, logger="airbyte"):
+        for record in expected_records:
+            components_module.TypeTransformer.transform(entity_schema_normalization, record, schema)
+    expected_warnings = sorted(caplog.messages)
+    caplog.clear()
+    with caplog.at_level(logging.WARNING, logger="airbyte"):
+        for record in records:
+            entity_schema_normalization.transform(record, schema)
+
+    assert records == expected_records
+    assert [[type(value) for value in record["properties"].values()] for record in records] == [
+        [type(value) for value in record["properties"].values()] for record in expected_records
+    ]
+    assert expected_warnings
+    assert sorted(caplog.messages) == expected_warnings
+
+
+def test_entity_schema_normalization_reports_type_errors_only_like_schema_validation(components_module, caplog):
+    schema = {
+        "type": "object",
+        "required": ["id", "missing"],
+        "additionalProperties": False,
+        "properties": {
+            "id": {"type": ["null", "string"], "minLength": 5},
+            "status": {"type": "string", "enum": ["open", "closed"]},
+            "amount": {"oneOf": [{"type": ["null", "number"]}, {"type": ["null", "string"]}]},
+            "count": {"type": "integer", "minimum": 10},
+            "tags": {"type": "array", "items": {"type": "string", "pattern": "^[a-z]+$"}, "maxItems": 1},
+        },
+    }
+    record = {"id": "1", "status": "unknown", "amount": None, "count": "many", "tags": ["A", "b"], "undeclared": True}
+    entity_schema_normalization = components_module.EntitySchemaNormalization()
+
+    expected_record = copy.deepcopy(record)
+    with caplog.at_level(logging.WARNING, logger="airbyte"):
+        components_module.TypeTransformer.transform(entity_schema_normalization, expected_record, schema)
+    expected_warnings = list(caplog.messages)
+    caplog.clear()
+    with caplog.at_level(logging.WARNING, logger="airbyte"):
+        entity_schema_normalization.transform(record, schema)
+
+    assert entity_schema_normalization._get_compiled_schema(schema) is not None
+    assert record == expected_record
+    # the values which break the other keywords of the schema are not reported, only the value of an unexpected type is
+    assert caplog.messages == expected_warnings == ["Failed to transform value from type 'string' to type 'integer' at path: 'count'"]
+
+
+def test_entity_schema_normalization_falls_back_to_schema_validation_for_references(components_module):
+    schema = {
+        "definitions": {"amount": {"type": ["null", "number"]}},
+        "type": "object",
+        "properties": {"amount": {"$ref": "#/definitions/amount"}},
+    }
+    record = {"amount": "1,234.5"}
+
+    components_module.EntitySchemaNormalization().transform(record, schema)
+
+    assert record == {"amount": 1234.5}
+
+
 @pytest.mark.parametrize(
     "json_response,last_page_size,last_record,last_page_token_value,expected_next_page_token",
     [
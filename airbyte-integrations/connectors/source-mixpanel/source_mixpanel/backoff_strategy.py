@@ -10,3 +10,14 @@ from airbyte_cdk.sources.streams.call_rate import APIBudget, HttpRequestMatcher,
 DEFAULT_API_BUDGET = APIBudget(
     policies=[MovingWindowCallRatePolicy(rates=[Rate(limit=1, interval=timedelta(seconds=60.0))], matchers=[HttpRequestMatcher()])]
 )
+
+
+def export_api_budget(reqs_per_hour_limit: int, reqs_per_second_limit: int) -> APIBudget:
+    """
+    Budget of the queries of the Export stream reading several date slices at once, shared by the threads reading them.
+    A limit of 0 queries per hour means that only the queries per second are limited.
+    """
+    rates = [Rate(limit=reqs_per_second_limit, interval=timedelta(seconds=1))]
+    if reqs_per_hour_limit > 0:
+        rates.append(Rate(limit=reqs_per_hour_limit, interval=timedelta(hours=1)))
+    return APIBudget(policies=[MovingWindowCallRatePolicy(rates=rates, matchers=[HttpRequestMatcher()])])
@@ -2,8 +2,18 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import logging
 from collections import defaultdict
-from typing import Iterable, Iterator, NamedTuple
+from functools import lru_cache
+from typing import Iterable, Iterator, NamedTuple, Tuple
+
+
+logger = logging.getLogger("airbyte")
+
+# The number of sets of property names kept translated, in a single cache shared by the Export streams of all the projects
+TRANSFORMATION_CACHE_SIZE = 4096
+# The number of transformations between the debug logs of the hits and misses of the cache
+CACHE_LOG_INTERVAL = 100_000
 
 
 class TransformationResult(NamedTuple):
@@ -17,12 +27,28 @@ def transform_property_names(property_names: Iterable[str]) -> Iterator[Transfor
     1. Remove leading "$" from property_name
     2. Resolve naming conflicts, like `userName` and `username`,
     that will break normalization in the future, by adding `_userName`to property name
+
+    The name of a property depends on the other names of the set, so the translations are cached by set of property names:
+    the names are sorted, so the records listing the same properties in a different order share the cached translations.
     """
+    results = _transform_property_names(tuple(sorted(property_names)))
+    cache_info = _transform_property_names.cache_info()
+    if (cache_info.hits + cache_info.misses) % CACHE_LOG_INTERVAL == 0 and logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"Property names transformations: {cache_info.hits} hits, {cache_info.misses} misses, "
+            f"{cache_info.currsize} sets of property names cached."
+        )
+    return iter(results)
+
+
+@lru_cache(maxsize=TRANSFORMATION_CACHE_SIZE)
+def _transform_property_names(sorted_property_names: Tuple[str, ...]) -> Tuple[TransformationResult, ...]:
     lowercase_collision_count = defaultdict(int)
     lowercase_properties = set()
+    results = []
 
-    # Sort property names for consistent result
-    for property_name in sorted(property_names):
+    # Property names are sorted for consistent result
+    for property_name in sorted_property_names:
         property_name_transformed = property_name
         if property_name_transformed.startswith("$"):
             property_name_transformed = property_name_transformed[1:]
@@ -35,4 +61,5 @@ def transform_property_names(property_names: Iterable[str]) -> Iterator[Transfor
             property_name_transformed = prefix + property_name_transformed
 
         lowercase_properties.add(lowercase_property_name)
-        yield TransformationResult(source_name=property_name, transformed_name=property_name_transformed)
+        results.append(TransformationResult(source_name=property_name, transformed_name=property_name_transformed))
+    return tuple(results)
@@ -1,12 +1,19 @@
 # Copyright (c) 2025 Airbyte, Inc., all rights reserved.
 
 import json
+import logging
+import tempfile
+import threading
 import time
 from abc import ABC
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from functools import cache
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
+from functools import cache, partial
+from itertools import islice
+from typing import IO, Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 
+import orjson
 import pendulum
 import requests
 from pendulum import Date
@@ -14,12 +21,14 @@ from requests.auth import AuthBase
 
 from airbyte_cdk import BackoffStrategy
 from airbyte_cdk.models import FailureType, SyncMode
+from airbyte_cdk.sources.streams.call_rate import APIBudget
 from airbyte_cdk.sources.streams.http import HttpStream
 from airbyte_cdk.sources.streams.http.error_handlers import ErrorHandler, ErrorResolution, HttpStatusErrorHandler, ResponseAction
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
+from source_mixpanel.backoff_strategy import export_api_budget
 from source_mixpanel.property_transformation import transform_property_names
 
-from .utils import fix_date_time
+from .utils import fix_date_time, timestamp_to_iso_format
 
 
 class MixpanelStreamBackoffStrategy(BackoffStrategy):
@@ -81,6 +90,7 @@ class MixpanelStream(HttpStream, ABC):
         select_properties_by_default: bool = True,
         project_id: int = None,
         reqs_per_hour_limit: int = DEFAULT_REQS_PER_HOUR_LIMIT,
+        api_budget: Optional[APIBudget] = None,
         **kwargs,
     ):
         self.start_date = start_date
@@ -93,7 +103,8 @@ class MixpanelStream(HttpStream, ABC):
         self.project_timezone = project_timezone
         self.project_id = project_id
         self._reqs_per_hour_limit = reqs_per_hour_limit
-        super().__init__(authenticator=authenticator)
+        self.api_budget = api_budget
+        super().__init__(authenticator=authenticator, api_budget=api_budget)
 
     def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
         """Define abstract method"""
@@ -126,8 +137,8 @@ class MixpanelStream(HttpStream, ABC):
         # parse the whole response
         yield from self.process_response(response, stream_state=stream_state, **kwargs)
 
-        if self.reqs_per_hour_limit > 0:
-            # we skip this block, if self.reqs_per_hour_limit = 0,
+        if self.reqs_per_hour_limit > 0 and self.api_budget is None:
+            # we skip this block, if self.reqs_per_hour_limit = 0 or if the requests wait for the API budget before being sent,
             # in all other cases wait for X seconds to match API limitations
             self.logger.info(f"Sleep for {3600 / self.reqs_per_hour_limit} seconds to match API limitations after reading from {self.name}")
             time.sleep(3600 / self.reqs_per_hour_limit)
@@ -285,7 +296,7 @@ class ExportErrorHandler(HttpStatusErrorHandler):
                 )
             try:
                 # trying to parse response to avoid ConnectionResetError and retry if it occurs
-                self.stream.iter_dicts(response_or_exception.iter_lines(decode_unicode=True))
+                self.stream.iter_dicts(response_or_exception.iter_lines())
             except ConnectionResetError:
                 return ErrorResolution(
                     response_action=ResponseAction.RETRY,
@@ -369,6 +380,90 @@ class ExportSchema(MixpanelStream):
                     parts = []
 
 
+class ExportSliceReader:
+    """
+    Reads the records of a date slice of the Export stream ahead in a thread, while the records of the previous slices are consumed.
+    The slice is read to the end into a temporary file, so that its response is not kept open until the previous slices are consumed.
+    The slice is read again from its start if the connection is reset while its response is read.
+    """
+
+    # The errors of a connection reset while the response is read, the errors of the requests themselves are retried by the HTTP client
+    CONNECTION_RESET_ERRORS = (ConnectionResetError, requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError)
+    # The number of times a slice is read again after a connection reset
+    MAX_RETRIES = 3
+    # The number of seconds to wait before reading the slice again, multiplied by the number of the retry
+    RETRY_BACKOFF_SECONDS = 5
+
+    def __init__(self, stream_slice: Mapping[str, Any], logger: logging.Logger):
+        self.stream_slice = stream_slice
+        self._logger = logger
+        self._records_file: Optional[IO[bytes]] = None
+        self._error: Optional[Exception] = None
+        self._done = threading.Event()
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+
+    def read(self, read_records: Callable[[], Iterable[Mapping[str, Any]]]) -> None:
+        """Reads the records of the slice into a temporary file, runs in the thread reading the slice"""
+        records_file = None
+        try:
+            for retry in range(self.MAX_RETRIES + 1):
+                if retry and self._cancelled.wait(self.RETRY_BACKOFF_SECONDS * retry):
+                    return
+                records_file = tempfile.TemporaryFile()
+                try:
+                    if not self._write_records(read_records(), records_file):
+                        return
+                    break
+                except self.CONNECTION_RESET_ERRORS as exception:
+                    records_file.close()
+                    if retry == self.MAX_RETRIES:
+                        raise
+                    self._logger.warning(f"Connection reset while reading the slice {self.stream_slice}, reading it again: {exception}")
+            records_file.seek(0)
+            with self._lock:
+                if not self._cancelled.is_set():
+                    self._records_file, records_file = records_file, None
+        except Exception as exception:
+            self._error = exception
+        finally:
+            if records_file:
+                records_file.close()
+            self._done.set()
+
+    def records(self) -> Iterable[Mapping[str, Any]]:
+        """Yields the records of the slice once it is read, raises the error of the reading if any"""
+        self._done.wait()
+        if self._error:
+            raise self._error
+        with self._lock:
+            records_file, self._records_file = self._records_file, None
+        if not records_file:
+            raise RuntimeError(f"The reading of the slice {self.stream_slice} was cancelled")
+        with records_file:
+            for line in records_file:
+                yield orjson.loads(line)
+
+    def cancel(self) -> None:
+        """Stops the reading of the slice, the records which are being consumed are still read to the end"""
+        with self._lock:
+            self._cancelled.set()
+            if self._records_file:
+                self._records_file.close()
+
+    def _write_records(self, records: Iterable[Mapping[str, Any]], records_file: IO[bytes]) -> bool:
+        """Writes the records as JSON lines, False if the reading was cancelled meanwhile"""
+        try:
+            for record in records:
+                if self._cancelled.is_set():
+                    return False
+                records_file.write(orjson.dumps(record))
+                records_file.write(b"\n")
+        finally:
+            records.close()
+        return True
+
+
 class Export(DateSlicesMixin, IncrementalMixpanelStream):
     """Export event data as it is received and stored within Mixpanel, complete with all event properties
      (including distinct_id) and the exact timestamp the event was fired.
@@ -379,6 +474,10 @@ class Export(DateSlicesMixin, IncrementalMixpanelStream):
     Raw Export API Rate Limit (https://help.mixpanel.com/hc/en-us/articles/115004602563-Rate-Limits-for-API-Endpoints):
      A maximum of 100 concurrent queries,
      3 queries per second and 60 queries per hour.
+
+    With `export_num_workers` above one, the next date slices are read ahead concurrently by as many threads, the queries waiting for
+    the API budget shared by the threads instead of sleeping after each response. The records are still emitted slice by slice,
+    in the order of the slices, so that the state only moves forward once the previous slices are read.
     """
 
     primary_key: str = None
@@ -386,6 +485,25 @@ class Export(DateSlicesMixin, IncrementalMixpanelStream):
 
     transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
 
+    # The maximum number of queries per second of the Raw Export API
+    REQS_PER_SECOND_LIMIT = 3
+    # The number of lines decoded at once
+    BATCH_SIZE = 1000
+    # The size of the chunks of the response split into lines, the default of 512 bytes is small for responses of millions of lines
+    RESPONSE_CHUNK_SIZE = 64 * 1024
+    # orjson decodes the integers which don't fit in 64 bits as floats, the lines with numbers of 19 digits or more are decoded by json.
+    # The digits are all replaced by 0 to look for the numbers, which is much faster than a regular expression.
+    DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+    LONG_NUMBER = b"0" * 19
+
+    def __init__(self, *args, export_num_workers: int = 1, **kwargs):
+        self.export_num_workers = export_num_workers
+        if export_num_workers > 1:
+            reqs_per_hour_limit = kwargs.get("reqs_per_hour_limit", self.DEFAULT_REQS_PER_HOUR_LIMIT)
+            kwargs["api_budget"] = export_api_budget(reqs_per_hour_limit, self.REQS_PER_SECOND_LIMIT)
+        super().__init__(*args, **kwargs)
+        self._slice_readers: MutableMapping[Tuple[str, str], ExportSliceReader] = {}
+
     @property
     def url_base(self):
         prefix = "-eu" if self.region == "EU" else ""
@@ -397,32 +515,62 @@ class Export(DateSlicesMixin, IncrementalMixpanelStream):
     def get_error_handler(self) -> Optional[ErrorHandler]:
         return ExportErrorHandler(logger=self.logger, stream=self)
 
-    def iter_dicts(self, lines):
+    def iter_dicts(self, lines: Iterable[bytes]):
         """
         The incoming stream has to be JSON lines format.
         From time to time for some reason, the one record can be split into multiple lines.
         We try to combine such split parts into one record only if parts go nearby.
+
+        The lines are decoded by batches of BATCH_SIZE lines at once, as a single JSON array.
+        The batches which are not made of one record per line are decoded line by line.
         """
+        lines = iter(lines)
         parts = []
-        for record_line in lines:
-            if record_line == "terminated early":
-                self.logger.warning(f"Couldn't fetch data from Export API. Response: {record_line}")
-                return
-            try:
-                yield json.loads(record_line)
-            except ValueError:
-                parts.append(record_line)
-            else:
-                parts = []
-
-            if len(parts) > 1:
+        while batch := list(islice(lines, self.BATCH_SIZE)):
+            if not parts:
+                batch_array = b"[" + b",".join(batch) + b"]"
                 try:
-                    yield json.loads("".join(parts))
-                except ValueError:
+                    records = None if self._has_long_number(batch_array) else orjson.loads(batch_array)
+                except orjson.JSONDecodeError:
                     pass
+                else:
+                    if records is not None and len(records) == len(batch):
+                        yield from records
+                        continue
+
+            for record_line in batch:
+                if record_line == b"terminated early":
+                    self.logger.warning(f"Couldn't fetch data from Export API. Response: {record_line.decode()}")
+                    return
+                try:
+                    yield self._loads(record_line)
+                except ValueError:
+                    parts.append(record_line)
                 else:
                     parts = []
 
+                if len(parts) > 1:
+                    try:
+                        yield self._loads(b"".join(parts))
+                    except ValueError:
+                        pass
+                    else:
+                        parts = []
+
+    @classmethod
+    def _has_long_number(cls, data: bytes) -> bool:
+        return cls.LONG_NUMBER in data.translate(cls.DIGITS_TO_ZERO)
+
+    @classmethod
+    def _loads(cls, line: bytes) -> Any:
+        if cls._has_long_number(line):
+            return json.loads(line)
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # e.g. NaN, which is accepted by the json module
+            return json.loads(line)
+
     def process_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
         """Export API return response in JSONL format but each line is a valid JSON object
         Raw item example:
@@ -444,20 +592,76 @@ class Export(DateSlicesMixin, IncrementalMixpanelStream):
         """
 
         # We prefer response.iter_lines() to response.text.split_lines() as the later can missparse text properties embeding linebreaks
-        for record in self.iter_dicts(response.iter_lines(decode_unicode=True)):
+        # The lines are kept as bytes, which are decoded directly by the JSON parser
+        for record in self.iter_dicts(response.iter_lines(chunk_size=self.RESPONSE_CHUNK_SIZE)):
             # transform record into flat dict structure
             item = {"event": record["event"]}
             properties = record["properties"]
-            for result in transform_property_names(properties.keys()):
+            for source_name, transformed_name in transform_property_names(properties):
                 # Convert all values to string (this is default property type)
                 # because API does not provide properties type information
-                item[result.transformed_name] = str(properties[result.source_name])
+                item[transformed_name] = str(properties[source_name])
 
             # convert timestamp to datetime string
-            item["time"] = pendulum.from_timestamp(int(item["time"]), tz="UTC").to_iso8601_string()
+            item["time"] = timestamp_to_iso_format(int(item["time"]))
 
             yield item
 
+    def stream_slices(
+        self, sync_mode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
+    ) -> Iterable[Optional[Mapping[str, Any]]]:
+        stream_slices = super().stream_slices(sync_mode, cursor_field=cursor_field, stream_state=stream_state)
+        if self.export_num_workers > 1:
+            stream_slices = self._read_slices_ahead(stream_slices, sync_mode, cursor_field, stream_state)
+        yield from stream_slices
+
+    def _read_slices_ahead(
+        self, stream_slices: Iterable[Mapping[str, Any]], sync_mode, cursor_field: List[str], stream_state: Mapping[str, Any]
+    ) -> Iterable[Mapping[str, Any]]:
+        """
+        Starts reading each slice before yielding it, up to `export_num_workers` slices ahead of the slice whose records are read.
+        As long as at most `export_num_workers` slices are pending, each of them has a thread reading it to the end.
+        """
+        readers = []
+        pending_readers = deque()
+        with ThreadPoolExecutor(max_workers=self.export_num_workers, thread_name_prefix=f"{self.name}_slice_reader") as executor:
+            try:
+                for stream_slice in stream_slices:
+                    reader = self._slice_readers[self._slice_key(stream_slice)] = ExportSliceReader(stream_slice, self.logger)
+                    read_records = partial(
+                        super().read_records, sync_mode, cursor_field=cursor_field, stream_slice=stream_slice, stream_state=stream_state
+                    )
+                    executor.submit(reader.read, read_records)
+                    readers.append(reader)
+                    pending_readers.append(reader)
+                    if len(pending_readers) == self.export_num_workers:
+                        yield pending_readers.popleft().stream_slice
+                while pending_readers:
+                    yield pending_readers.popleft().stream_slice
+            finally:
+                # stop the threads of the slices which are not read to the end, e.g. on error,
+                # the slices whose records were not requested are read again if they are requested later
+                for reader in readers:
+                    reader.cancel()
+                self._slice_readers.clear()
+
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: Optional[List[str]] = None,
+        stream_slice: Optional[Mapping[str, Any]] = None,
+        stream_state: Optional[Mapping[str, Any]] = None,
+    ) -> Iterable[Mapping[str, Any]]:
+        reader = self._slice_readers.pop(self._slice_key(stream_slice), None) if stream_slice else None
+        if reader:
+            yield from reader.records()
+        else:
+            yield from super().read_records(sync_mode, cursor_field=cursor_field, stream_slice=stream_slice, stream_state=stream_state)
+
+    @staticmethod
+    def _slice_key(stream_slice: Mapping[str, Any]) -> Tuple[str, str]:
+        return stream_slice["start_date"], stream_slice["end_date"]
+
     @cache
     def get_json_schema(self) -> Mapping[str, Any]:
         """
@@ -3,6 +3,7 @@
 #
 
 import re
+from datetime import datetime, timezone
 
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams import Stream
@@ -38,6 +39,19 @@ def to_iso_format(s: str) -> str:
     return s
 
 
+def timestamp_to_iso_format(timestamp: int) -> str:
+    """
+    Convert a Unix timestamp in seconds to an ISO 8601 datetime string in UTC, like `pendulum.from_timestamp(timestamp).to_iso8601_string()`.
+
+    Args:
+    - timestamp (int): Unix timestamp in seconds.
+
+    Returns:
+    - str: Datetime string in the "YYYY-MM-DDTHH:MM:SSZ" format.
+    """
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
 def fix_date_time(record):
     """
     Recursively process a data structure to fix date and time formats.
@@ -8,9 +8,12 @@ that will conflict in further data normalization, like:
 `userName` and `username`
 """
 
+import logging
 from unittest.mock import MagicMock
 
 import pytest
+from source_mixpanel import property_transformation
+from source_mixpanel.property_transformation import TransformationResult, transform_property_names
 from source_mixpanel.streams import Export
 
 from airbyte_cdk.models import SyncMode
@@ -62,3 +65,42 @@ def test_export_stream_conflict_names(requests_mock, export_response, config):
     assert record["userName"] == "1"
     assert record["_userName"] == "2"
     assert record["__username"] == "3"
+
+
+def test_transform_property_names_is_cached_by_set_of_names(mocker, caplog):
+    mocker.patch.object(property_transformation, "CACHE_LOG_INTERVAL", 1)
+    property_transformation._transform_property_names.cache_clear()
+    names = ["$userName", "userName", "username", "time"]
+
+    with caplog.at_level(logging.DEBUG, logger="airbyte"):
+        # the same set of names, in a different order
+        results = [list(transform_property_names(names)) for names in (names, names[::-1], names[2:] + names[:2])]
+
+    assert (
+        results[0]
+        == results[1]
+        == results[2]
+        == [
+            TransformationResult("$userName", "userName"),
+            TransformationResult("time", "time"),
+            TransformationResult("userName", "_userName"),
+            TransformationResult("username", "__username"),
+        ]
+    )
+    assert property_transformation._transform_property_names.cache_info()[:2] == (2, 1)
+    assert caplog.messages[-1] == "Property names transformations: 2 hits, 1 misses, 1 sets of property names cached."
+
+
+def test_transform_property_names_cache_evicts_sets_of_names_at_max_size():
+    property_transformation._transform_property_names.cache_clear()
+    cache_size = property_transformation.TRANSFORMATION_CACHE_SIZE
+
+    for n in range(cache_size + 1):
+        list(transform_property_names([f"$property{n}", f"Property{n}"]))
+    # the least recently used set of names is evicted, so the first set is transformed again
+    assert list(transform_property_names(["$property0", "Property0"])) == [
+        TransformationResult("$property0", "property0"),
+        TransformationResult("Property0", "_Property0"),
+    ]
+
+    assert property_transformation._transform_property_names.cache_info()[:4] == (0, cache_size + 2, cache_size, cache_size)
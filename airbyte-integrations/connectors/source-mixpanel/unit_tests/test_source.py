@@ -68,6 +68,19 @@ def test_streams(requests_mock, config_raw):
     assert len(streams) == 7
 
 
+@pytest.mark.parametrize(
+    "config_update, expected_export_num_workers",
+    [({"num_workers": 5}, 1), ({"num_workers": 5, "export_num_workers": 2}, 2)],
+    ids=["concurrency of the other streams is not used", "export_num_workers"],
+)
+def test_streams_export_num_workers(config_raw, config_update, expected_export_num_workers):
+    config = {**config_raw, **config_update}
+    streams = SourceMixpanel(MagicMock(), config, MagicMock()).streams(config)
+
+    (export,) = [stream for stream in streams if stream.name == "export"]
+    assert export.export_num_workers == expected_export_num_workers
+
+
 def test_streams_string_date(requests_mock, config_raw):
     requests_mock.register_uri("GET", "https://mixpanel.com/api/query/engage/properties", setup_response(200, {}))
     requests_mock.register_uri("GET", "https://mixpanel.com/api/query/events/properties/top", setup_response(200, {}))
@@ -2,8 +2,10 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import io
 import json
 import logging
+import threading
 import urllib.parse
 from datetime import timedelta
 from unittest import mock
@@ -11,11 +13,13 @@ from unittest.mock import MagicMock
 
 import pendulum
 import pytest
+import requests
 import responses
 import source_mixpanel
 from source_mixpanel import SourceMixpanel
 from source_mixpanel.components import iter_dicts
-from source_mixpanel.streams import Export
+from source_mixpanel.property_transformation import transform_property_names
+from source_mixpanel.streams import Export, ExportSliceReader
 from source_mixpanel.utils import read_full_refresh
 
 from airbyte_cdk.models import (
@@ -869,3 +873,226 @@ def test_export_stream_lookback_window(requests_mock, export_response, config_ra
     # Verify updated state is set to the latest record time
     new_state = stream.get_updated_state(stream_state, records[-1])
     assert new_state["time"] == "2021-06-16T17:28:00Z"
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 3, 1000])
+def test_export_iter_dicts_decodes_lines_in_batches(mocker, batch_size):
+    mocker.patch.object(Export, "BATCH_SIZE", batch_size)
+    record_string = json.dumps({"key1": "value1", "key2": "value2"})
+    lines = [
+        record_string,
+        record_string[:2],
+        record_string[2:],
+        '{"big_integer": 123456789012345678901234567890}',
+        record_string[:2],
+        record_string,
+        record_string[2:],
+        record_string,
+        "",
+        record_string,
+        "terminated early",
+        record_string,
+    ]
+    stream = Export(authenticator=MagicMock(), region="US")
+
+    assert list(stream.iter_dicts(line.encode() for line in lines)) == list(iter_dicts(lines))
+
+
+def _export_slice_response(request, context):
+    from_date = pendulum.parse(request.qs["from_date"][0])
+    return b"\n".join(
+        json.dumps(
+            {
+                "event": "Viewed Page",
+                "properties": {"time": from_date.add(minutes=n).int_timestamp, "distinct_id": f"user{n}", "$os": "Mac"},
+            }
+        ).encode()
+        for n in range(3)
+    )
+
+
+def _read_export(stream):
+    records = []
+    for stream_slice in stream.stream_slices(sync_mode=SyncMode.full_refresh):
+        records.extend(stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice=stream_slice))
+    return records
+
+
+@pytest.fixture
+def export_slices_config(config):
+    # 8 slices of 5 days, including the attribution window
+    return {**config, "date_window_size": 5}
+
+
+@pytest.fixture
+def slow_requests(requests_mock, mocker):
+    """
+    Every slice takes a while to be exported, the latency is added outside of requests_mock which serves the requests one at a time.
+    Returns the list of the numbers of requests in flight, when each request was sent.
+    """
+    mocked_send = requests.Session.send
+    in_flight, in_flight_on_send = [], []
+    lock = threading.Lock()
+
+    def send(session, request, **kwargs):
+        with lock:
+            in_flight.append(request)
+            in_flight_on_send.append(len(in_flight))
+        try:
+            threading.Event().wait(0.2)
+            return mocked_send(session, request, **kwargs)
+        finally:
+            with lock:
+                in_flight.remove(request)
+
+    mocker.patch.object(requests.Session, "send", send)
+    return in_flight_on_send
+
+
+def test_export_reads_slices_ahead_concurrently(requests_mock, slow_requests, export_slices_config, mocker):
+    sleep = mocker.patch("time.sleep")
+    sequential_stream = Export(authenticator=MagicMock(), **export_slices_config)
+    concurrent_stream = Export(authenticator=MagicMock(), export_num_workers=3, **export_slices_config)
+    requests_mock.register_uri("GET", get_url_to_mock(sequential_stream), content=_export_slice_response)
+    slices_count = len(list(sequential_stream.stream_slices(sync_mode=SyncMode.full_refresh)))
+
+    expected_records = _read_export(sequential_stream)
+    assert sleep.call_count == slices_count
+    assert max(slow_requests) == 1
+    sleep.reset_mock()
+    slow_requests.clear()
+    records = _read_export(concurrent_stream)
+
+    assert len(records) == slices_count * 3
+    assert records == expected_records
+    # the slices are read by several requests at once, up to the number of workers
+    assert 1 < max(slow_requests) <= 3
+    # the queries wait for the API budget instead
+    assert sleep.call_count == 0
+    assert concurrent_stream.api_budget is not None
+
+
+def test_export_read_ahead_raises_error_of_slice(requests_mock, export_slices_config):
+    stream = Export(authenticator=MagicMock(), export_num_workers=3, **export_slices_config)
+    url = get_url_to_mock(stream)
+    requests_mock.register_uri("GET", url, content=_export_slice_response)
+    stream_slices = list(Export(authenticator=MagicMock(), **export_slices_config).stream_slices(sync_mode=SyncMode.full_refresh))
+    requests_mock.register_uri(
+        "GET",
+        f"{url}?from_date={stream_slices[1]['start_date']}",
+        status_code=400,
+        text="Unable to authenticate request",
+    )
+
+    records = []
+    with pytest.raises(Exception, match="Your credentials might have expired"):
+        for stream_slice in stream.stream_slices(sync_mode=SyncMode.full_refresh):
+            records.extend(stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice=stream_slice))
+    assert len(records) == 3
+
+
+def test_export_read_ahead_stops_reading_slices_when_closed(requests_mock, export_slices_config):
+    stream = Export(authenticator=MagicMock(), export_num_workers=3, **export_slices_config)
+    requests_mock.register_uri("GET", get_url_to_mock(stream), content=_export_slice_response)
+
+    stream_slices = stream.stream_slices(sync_mode=SyncMode.full_refresh)
+    first_slice = next(stream_slices)
+    records = stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice=first_slice)
+    next(records)
+    stream_slices.close()
+
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith("export_slice_reader")]
+    # the slices which were not read ahead to the end are read again
+    assert len(list(stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice=first_slice))) == 3
+
+
+def test_export_read_ahead_reads_slices_to_the_end(requests_mock, export_slices_config):
+    stream = Export(authenticator=MagicMock(), export_num_workers=3, **export_slices_config)
+    requests_mock.register_uri("GET", get_url_to_mock(stream), content=_export_slice_response)
+
+    stream_slices = stream.stream_slices(sync_mode=SyncMode.full_refresh)
+    next(stream_slices)
+
+    # the responses of the slices read ahead are not kept open until their records are requested
+    readers = list(stream._slice_readers.values())
+    assert len(readers) == 3
+    assert all(reader._done.wait(timeout=5) for reader in readers)
+    assert all(reader._records_file and not reader._error for reader in readers)
+    stream_slices.close()
+
+
+class _ResetBody(io.RawIOBase):
+    """The body of a response whose connection is reset after its first line"""
+
+    def __init__(self, content):
+        self._content = io.BytesIO(content.split(b"\n")[0] + b"\n")
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._content.read(len(buffer))
+        if not data:
+            raise ConnectionResetError("Connection reset by peer")
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def test_export_read_ahead_reads_slice_again_after_connection_reset(requests_mock, export_slices_config, mocker):
+    mocker.patch.object(ExportSliceReader, "RETRY_BACKOFF_SECONDS", 0)
+    stream = Export(authenticator=MagicMock(), export_num_workers=3, **export_slices_config)
+    url = get_url_to_mock(stream)
+    requests_mock.register_uri("GET", url, content=_export_slice_response)
+    stream_slices = list(Export(authenticator=MagicMock(), **export_slices_config).stream_slices(sync_mode=SyncMode.full_refresh))
+    expected_records = _read_export(Export(authenticator=MagicMock(), **export_slices_config))
+    slice_url = f"{url}?from_date={stream_slices[1]['start_date']}"
+    slice_content = _export_slice_response(requests_mock.request_history[1], None)
+    requests_mock.register_uri(
+        "GET", slice_url, [{"body": _ResetBody(slice_content)}, {"body": _ResetBody(slice_content)}, {"content": slice_content}]
+    )
+    requests_count = requests_mock.call_count
+
+    records = _read_export(stream)
+
+    assert records == expected_records
+    assert len([request for request in requests_mock.request_history[requests_count:] if request.url.startswith(slice_url)]) == 3
+
+
+def _export_response(content):
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(content)
+    response.encoding = "utf-8"
+    return response
+
+
+def test_export_process_response_in_batches_as_line_by_line():
+    content = b"\n".join(
+        json.dumps(
+            {
+                "event": "Viewed E-commerce Page",
+                "properties": {
+                    "time": 1623860880 + n,
+                    "distinct_id": f"1d694fd9-31a5-4b99-9eef-{n:012d}",
+                    **{f"$property_{p}": f"value {p} of event {n}" for p in range(30)},
+                    **{f"property_{p}": n * p for p in range(8)},
+                },
+            }
+        ).encode()
+        for n in range(2_500)
+    )
+    stream = Export(authenticator=MagicMock(), region="US")
+
+    def process_response_line_by_line(response):
+        for record in iter_dicts(response.iter_lines(decode_unicode=True)):
+            item = {"event": record["event"]}
+            properties = record["properties"]
+            for result in transform_property_names(properties.keys()):
+                item[result.transformed_name] = str(properties[result.source_name])
+            item["time"] = pendulum.from_timestamp(int(item["time"]), tz="UTC").to_iso8601_string()
+            yield item
+
+    records = list(stream.process_response(_export_response(content)))
+
+    assert len(records) == 2_500
+    assert records == list(process_response_line_by_line(_export_response(content)))
@@ -2,8 +2,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import pendulum
 import pytest
-from source_mixpanel.utils import fix_date_time
+from source_mixpanel.utils import fix_date_time, timestamp_to_iso_format
 
 
 @pytest.mark.parametrize(
@@ -44,3 +45,8 @@ from source_mixpanel.utils import fix_date_time
 def test_fix_date_time(input_record, expected_record):
     fix_date_time(input_record)
     assert input_record == expected_record
+
+
+@pytest.mark.parametrize("timestamp", [0, 1, 1664282096, 1704067199, 1709210096, 4102444800])
+def test_timestamp_to_iso_format(timestamp):
+    assert timestamp_to_iso_format(timestamp) == pendulum.from_timestamp(timestamp).to_iso8601_string()
@@ -75,6 +75,16 @@ class Config(AbstractFileBasedSpec):
         default="use_records_transfer",
     )
 
+    start_after_last_synced_key: bool = Field(
+        title="Start Listing After the Last Synced Key",
+        default=False,
+        description="Only list the keys which sort after the greatest key synced so far under each prefix of the globs, "
+        "instead of the whole bucket. Enable it only when the new files always have greater keys than the synced ones, "
+        "e.g. keys starting with the date the file was written: files added or modified with a smaller key are not synced.",
+        order=7,
+        group="advanced",
+    )
+
     @root_validator
     def validate_optional_args(cls, values):
         aws_access_key_id = values.get("aws_access_key_id")
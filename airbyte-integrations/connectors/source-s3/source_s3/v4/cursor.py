@@ -4,7 +4,7 @@
 
 import logging
 from datetime import datetime, timedelta
-from typing import Any, MutableMapping
+from typing import Any, MutableMapping, Optional
 
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
@@ -53,6 +53,23 @@ class Cursor(DefaultFileBasedCursor):
         else:
             return state
 
+    def get_start_after(self, prefix: Optional[str] = None) -> Optional[str]:
+        """
+        The key to start the listing of the prefix after, for the buckets where the new files always sort after the synced ones.
+        The greatest key of the history under the prefix is listed again, so a file overwritten since the previous sync is still synced.
+        None if there is no history under the prefix yet or while migrating from v3, when all the files are listed again.
+        """
+        if self._running_migration:
+            return None
+        # the files inside ZIP archives are stored as <archive key>#<member name>
+        keys = (uri.split("#")[0] for uri in self._file_to_datetime_history)
+        greatest_key = max((key for key in keys if not prefix or key.startswith(prefix)), default=None)
+        start_after = greatest_key[:-1] if greatest_key else None
+        # e.g. the greatest key is the prefix itself: the whole prefix is listed
+        if not start_after or (prefix and not start_after.startswith(prefix)):
+            return None
+        return start_after
+
     def _should_sync_file(self, file: RemoteFile, logger: logging.Logger) -> bool:
         """
         Never sync files earlier than the v3 migration start date. V3 purged the history from the state, so we assume all files were already synced
@@ -0,0 +1,85 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Deque, Iterable, Iterator, TypeVar, Union
+
+
+T = TypeVar("T")
+
+# how often the workers waiting for the consumer to take the prefetched items check if their task was cancelled
+POLL_SECONDS = 1.0
+
+
+class _End:
+    pass
+
+
+_END = _End()
+
+
+class _TaskItems:
+    """Items produced by a task in a worker thread, followed by _END or the exception raised by the task"""
+
+    def __init__(self, max_items: int):
+        self.items: "queue.Queue[Union[T, Exception, _End]]" = queue.Queue(maxsize=max_items)
+        self.cancelled = threading.Event()
+
+    def put(self, item: Union[T, Exception, _End]) -> bool:
+        """Wait for a free place for the item, False if the task was cancelled meanwhile"""
+        while not self.cancelled.is_set():
+            try:
+                self.items.put(item, timeout=POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run(self, task: Callable[[], Iterable[T]]) -> None:
+        try:
+            for item in task():
+                if not self.put(item):
+                    return
+            self.put(_END)
+        except Exception as e:
+            self.put(e)
+
+    def __iter__(self) -> Iterator[T]:
+        while True:
+            item = self.items.get()
+            if item is _END:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+
+def prefetch_in_order(tasks: Iterable[Callable[[], Iterable[T]]], num_workers: int, max_prefetched_items: int) -> Iterator[T]:
+    """
+    Run the tasks in worker threads and yield their items in the order of the tasks, as if they were run one after another.
+    At most `num_workers` tasks run at once, including the task whose items are yielded, and at most `max_prefetched_items`
+    items of a task wait to be yielded, so the memory stays bounded however many items the tasks produce.
+    The tasks are only taken from `tasks` when a worker is free. The error of a task is raised once its previous items are yielded.
+    """
+    window: Deque[_TaskItems] = deque()
+    executor = ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="s3-listing")
+    try:
+        for task in tasks:
+            task_items = _TaskItems(max_prefetched_items)
+            window.append(task_items)
+            executor.submit(task_items.run, task)
+            if len(window) >= num_workers:
+                yield from window[0]
+                window.popleft()
+        while window:
+            yield from window[0]
+            window.popleft()
+    finally:
+        # the tasks left when the consumer stops early or fails must not wait for it, their workers stop after the current request
+        for task_items in window:
+            task_items.cancelled.set()
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -7,7 +7,7 @@ import sys
 import traceback
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Mapping, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 import orjson
 
@@ -28,12 +28,14 @@ from airbyte_cdk.models import (
     Type,
 )
 from airbyte_cdk.sources.file_based.file_based_source import DEFAULT_CONCURRENCY, FileBasedSource
+from airbyte_cdk.sources.file_based.stream import DefaultFileBasedStream
+from airbyte_cdk.sources.streams import Stream
 from source_s3.source import SourceS3Spec
 from source_s3.utils import airbyte_message_to_json
 from source_s3.v4.config import Config
 from source_s3.v4.cursor import Cursor
 from source_s3.v4.legacy_config_transformer import LegacyConfigTransformer
-from source_s3.v4.stream_reader import SourceS3StreamReader
+from source_s3.v4.stream_reader import SourceS3StreamReader, StartAfterStreamReader
 
 
 _V3_DEPRECATION_FIELD_MAPPING = {
@@ -142,6 +144,15 @@ class SourceS3(FileBasedSource):
 
         return "Deprecated and will be removed soon. Please do not use this field anymore. "
 
+    def streams(self, config: Mapping[str, Any]) -> List[Stream]:
+        streams = super().streams(config)
+        if self.stream_reader.config.start_after_last_synced_key:
+            for stream in streams:
+                # the streams synced with the S3 cursor list the keys after their greatest synced keys, the others list all the keys
+                if isinstance(stream, DefaultFileBasedStream) and isinstance(stream.cursor, Cursor):
+                    stream.stream_reader = StartAfterStreamReader(self.stream_reader, stream.cursor.get_start_after)
+        return streams
+
     @classmethod
     def launch(cls, args: list[str] | None = None) -> None:
         """Launch the source using the provided CLI args.
@@ -3,12 +3,17 @@
 #
 
 import logging
+import math
+import threading
 import time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from io import IOBase
 from os import getenv
 from os.path import basename, dirname
-from typing import Dict, Iterable, List, Optional, Set, Tuple, cast
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, cast
 
 import boto3.session
 import pendulum
@@ -29,6 +34,7 @@ from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFile
 from airbyte_cdk.sources.file_based.file_record_data import FileRecordData
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from source_s3.v4.config import Config
+from source_s3.v4.prefetch import prefetch_in_order
 from source_s3.v4.zip_reader import DecompressedStream, RemoteFileInsideArchive, ZipContentReader, ZipFileHandler
 
 
@@ -37,10 +43,20 @@ AWS_EXTERNAL_ID = getenv("AWS_ASSUME_ROLE_EXTERNAL_ID")
 
 class SourceS3StreamReader(AbstractFileBasedStreamReader):
     FILE_SIZE_LIMIT = 1_500_000_000
+    # The workers shared by the open files inside ZIP archives: the ranged requests stay within the default S3 client connection pool.
+    # The workers are shut down once the last of these files is closed.
+    ARCHIVE_DOWNLOAD_WORKERS = 8
+    ARCHIVE_DECOMPRESSION_WORKERS = 4
+    # The folders of the listed prefixes are listed concurrently, each worker lists up to a few pages of 1000 keys ahead of the stream
+    LISTING_WORKERS = 8
+    LISTING_PREFETCHED_PAGES = 4
 
     def __init__(self):
         super().__init__()
         self._s3_client = None
+        self._archive_executors_lock = threading.Lock()
+        self._archive_executors: Optional[Tuple[ThreadPoolExecutor, ThreadPoolExecutor]] = None
+        self._open_archive_members = 0
 
     @property
     def config(self) -> Config:
@@ -133,22 +149,68 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
 
         return autorefresh_session.client("s3", **client_kv_args)
 
-    def get_matching_files(self, globs: List[str], prefix: Optional[str], logger: logging.Logger) -> Iterable[RemoteFile]:
+    def _acquire_archive_executors(self) -> Tuple[ThreadPoolExecutor, ThreadPoolExecutor]:
+        """
+        Return the download and the decompression executors for a file inside an archive, which is opened.
+        """
+        with self._archive_executors_lock:
+            if self._archive_executors is None:
+                self._archive_executors = (
+                    ThreadPoolExecutor(max_workers=self.ARCHIVE_DOWNLOAD_WORKERS, thread_name_prefix="s3-archive-download"),
+                    ThreadPoolExecutor(max_workers=self.ARCHIVE_DECOMPRESSION_WORKERS, thread_name_prefix="s3-archive-decompression"),
+                )
+            self._open_archive_members += 1
+            return self._archive_executors
+
+    def _release_archive_executors(self) -> None:
+        """
+        Shut down the executors, when the last open file inside an archive is closed.
+        """
+        with self._archive_executors_lock:
+            self._open_archive_members -= 1
+            if self._open_archive_members == 0 and self._archive_executors is not None:
+                for executor in self._archive_executors:
+                    # the closed files have cancelled their pending requests, the running ones finish in the background
+                    executor.shutdown(wait=False, cancel_futures=True)
+                self._archive_executors = None
+
+    def get_matching_files(
+        self,
+        globs: List[str],
+        prefix: Optional[str],
+        logger: logging.Logger,
+        get_start_after: Optional[Callable[[Optional[str]], Optional[str]]] = None,
+    ) -> Iterable[RemoteFile]:
         """
         Get all files matching the specified glob patterns.
+
+        The "folders" of the prefixes are listed concurrently, the files are returned in the order of the listing tasks.
+        With `get_start_after`, only the keys of each prefix sorting after the key it returns for the prefix are listed.
         """
         s3 = self.s3_client
-        prefixes = [prefix] if prefix else self.get_prefixes_from_globs(globs)
-        seen = set()
+        prefixes = [prefix] if prefix else _without_nested_prefixes(self.get_prefixes_from_globs(globs))
         total_n_keys = 0
+        previous_uri = None
 
         try:
-            for current_prefix in prefixes if prefixes else [None]:
-                for remote_file in self._page(s3, globs, self.config.bucket, current_prefix, seen, logger):
+            tasks = (
+                task
+                for current_prefix in prefixes or [None]
+                for task in self._listing_tasks(
+                    s3, globs, self.config.bucket, current_prefix, self._get_start_after(get_start_after, current_prefix, logger), logger
+                )
+            )
+            for remote_files in prefetch_in_order(tasks, self.LISTING_WORKERS, self.LISTING_PREFETCHED_PAGES):
+                for remote_file in remote_files:
+                    # The listings do not overlap and list the keys in order: no need to remember all the listed keys to skip
+                    # a key listed twice by a listing
+                    if remote_file.uri == previous_uri:
+                        continue
+                    previous_uri = remote_file.uri
                     total_n_keys += 1
                     yield remote_file
 
-            logger.info(f"Finished listing objects from S3. Found {total_n_keys} objects total ({len(seen)} unique objects).")
+            logger.info(f"Finished listing objects from S3. Found {total_n_keys} objects total.")
         except ClientError as exc:
             if exc.response["Error"]["Code"] == "NoSuchBucket":
                 raise CustomFileBasedException(
@@ -158,6 +220,15 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
         except Exception as exc:
             self._raise_error_listing_files(globs, exc)
 
+    @staticmethod
+    def _get_start_after(
+        get_start_after: Optional[Callable[[Optional[str]], Optional[str]]], prefix: Optional[str], logger: logging.Logger
+    ) -> Optional[str]:
+        start_after = get_start_after(prefix) if get_start_after else None
+        if start_after:
+            logger.info(f"Listing the keys of the prefix '{prefix or ''}' after '{start_after}'.")
+        return start_after
+
     def _raise_error_listing_files(self, globs: List[str], exc: Optional[Exception] = None):
         """Helper method to raise the ErrorListingFiles exception."""
         raise ErrorListingFiles(
@@ -191,9 +262,14 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
         try:
             s3_uri = self._construct_s3_uri(file)
             if isinstance(file, RemoteFileInsideArchive):
-                s3_file_object = smart_open.open(s3_uri, transport_params=params, mode="rb")
-                decompressed_stream = DecompressedStream(s3_file_object, file)
-                result = ZipContentReader(decompressed_stream, encoding)
+                download_executor, decompression_executor = self._acquire_archive_executors()
+                try:
+                    archive_range = ZipFileHandler(self.s3_client, self.config).open_member(file, download_executor)
+                    decompressed_stream = DecompressedStream(archive_range, file, executor=decompression_executor)
+                except BaseException:
+                    self._release_archive_executors()
+                    raise
+                result = ZipContentReader(decompressed_stream, encoding, on_close=self._release_archive_executors)
             else:
                 result = smart_open.open(s3_uri, transport_params=params, mode=mode.value, encoding=encoding)
         except OSError:
@@ -302,42 +378,94 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
     def _is_folder(file) -> bool:
         return file["Key"].endswith("/")
 
-    def _page(
-        self, s3: BaseClient, globs: List[str], bucket: str, prefix: Optional[str], seen: Set[str], logger: logging.Logger
-    ) -> Iterable[RemoteFile]:
+    def _listing_tasks(
+        self, s3: BaseClient, globs: List[str], bucket: str, prefix: Optional[str], start_after: Optional[str], logger: logging.Logger
+    ) -> Iterable[Callable[[], Iterable[List[RemoteFile]]]]:
         """
-        Page through lists of S3 objects.
+        Split the listing of the prefix into tasks listing its folders concurrently.
+        The files and the folders directly under the prefix are listed with a delimiter. The consecutive folders of a page
+        are shared by the workers, and each share is listed by one task: this takes about as many requests as listing the
+        whole prefix at once, however many folders there are.
         """
-        total_n_keys_for_prefix = 0
-        kwargs = {"Bucket": bucket}
+        kwargs = {"Bucket": bucket, "Delimiter": "/"}
+        if prefix:
+            kwargs["Prefix"] = prefix
+        if start_after:
+            kwargs["StartAfter"] = start_after
         while True:
-            response = s3.list_objects_v2(Prefix=prefix, **kwargs) if prefix else s3.list_objects_v2(**kwargs)
-            key_count = response.get("KeyCount")
-            total_n_keys_for_prefix += key_count
-            logger.info(f"Received {key_count} objects from S3 for prefix '{prefix}'.")
+            response = s3.list_objects_v2(**kwargs)
+            logger.info(f"Received {response.get('KeyCount', 0)} objects and folders from S3 for prefix '{prefix}'.")
 
             if "Contents" in response:
-                for file in response["Contents"]:
-                    if self._is_folder(file):
-                        continue
-
-                    for remote_file in self._handle_file(file):
-                        if (
-                            self.file_matches_globs(remote_file, globs)
-                            and self.is_modified_after_start_date(remote_file.last_modified)
-                            and remote_file.uri not in seen
-                        ):
-                            seen.add(remote_file.uri)
-                            yield remote_file
-            else:
+                yield partial(self._matching_files_pages, [response["Contents"]], globs)
+            folders = [common_prefix["Prefix"] for common_prefix in response.get("CommonPrefixes", [])]
+            if "Contents" not in response and not folders and response.get("KeyCount") != 0:
                 logger.warning(f"Invalid response from S3; missing 'Contents' key. kwargs={kwargs}.")
+            folders_per_task = max(1, math.ceil(len(folders) / self.LISTING_WORKERS))
+            for start in range(0, len(folders), folders_per_task):
+                folders_of_task = folders[start : start + folders_per_task]
+                yield partial(self._list_folders, s3, globs, bucket, prefix, folders_of_task, start_after, logger)
 
             if next_token := response.get("NextContinuationToken"):
                 kwargs["ContinuationToken"] = next_token
             else:
-                logger.info(f"Finished listing objects from S3 for prefix={prefix}. Found {total_n_keys_for_prefix} objects.")
                 break
 
+    def _list_folders(
+        self,
+        s3: BaseClient,
+        globs: List[str],
+        bucket: str,
+        prefix: Optional[str],
+        folders: List[str],
+        start_after: Optional[str],
+        logger: logging.Logger,
+    ) -> Iterable[List[RemoteFile]]:
+        """
+        Page through the keys of consecutive folders of the prefix, from the first folder to the end of the last one.
+        The files between the folders are skipped, they are listed with the folders.
+        """
+        kwargs = {"Bucket": bucket}
+        if prefix:
+            kwargs["Prefix"] = prefix
+        # S3 lists the keys sorting after StartAfter, the keys of the first folder sort after the folder without its delimiter
+        if first_key := max(folders[0][:-1], start_after or ""):
+            kwargs["StartAfter"] = first_key
+        total_n_keys = 0
+        while True:
+            response = s3.list_objects_v2(**kwargs)
+            files, after_last_folder = [], False
+            for file in response.get("Contents", []):
+                key = file["Key"]
+                if key >= folders[-1] and not key.startswith(folders[-1]):
+                    after_last_folder = True
+                    break
+                # the folders do not start with each other, a key can only be in the greatest folder sorting before it
+                index = bisect_right(folders, key) - 1
+                if index >= 0 and key.startswith(folders[index]):
+                    files.append(file)
+            total_n_keys += len(files)
+            yield self._matching_files(files, globs)
+
+            next_token = response.get("NextContinuationToken")
+            if after_last_folder or not next_token:
+                logger.info(f"Finished listing objects from S3 for folders {folders[0]} to {folders[-1]}. Found {total_n_keys} objects.")
+                break
+            kwargs["ContinuationToken"] = next_token
+
+    def _matching_files_pages(self, pages: List[List[Dict]], globs: List[str]) -> Iterable[List[RemoteFile]]:
+        for files in pages:
+            yield self._matching_files(files, globs)
+
+    def _matching_files(self, files: List[Dict], globs: List[str]) -> List[RemoteFile]:
+        return [
+            remote_file
+            for file in files
+            if not self._is_folder(file)
+            for remote_file in self._handle_file(file)
+            if self.file_matches_globs(remote_file, globs) and self.is_modified_after_start_date(remote_file.last_modified)
+        ]
+
     def is_modified_after_start_date(self, last_modified_date: Optional[datetime]) -> bool:
         """Returns True if given date higher or equal than start date or something is missing"""
         if not (self.config.start_date and last_modified_date):
@@ -370,6 +498,15 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
         return remote_file
 
 
+def _without_nested_prefixes(prefixes: Iterable[str]) -> List[str]:
+    """The prefixes which do not start with another prefix, whose keys are already listed with the other prefix"""
+    outer_prefixes = []
+    for prefix in sorted(prefixes):
+        if not (outer_prefixes and prefix.startswith(outer_prefixes[-1])):
+            outer_prefixes.append(prefix)
+    return outer_prefixes
+
+
 def _get_s3_compatible_client_args(config: Config) -> dict:
     """
     Returns map of args used for creating s3 boto3 client.
@@ -381,3 +518,20 @@ def _get_s3_compatible_client_args(config: Config) -> dict:
         "verify": True,
     }
     return client_kv_args
+
+
+class StartAfterStreamReader:
+    """
+    The stream reader of a stream listing each prefix after the key returned by `get_start_after` for the prefix,
+    see the `start_after_last_synced_key` option. Everything else is done by the stream reader of the source.
+    """
+
+    def __init__(self, stream_reader: SourceS3StreamReader, get_start_after: Callable[[Optional[str]], Optional[str]]):
+        self._stream_reader = stream_reader
+        self._get_start_after = get_start_after
+
+    def get_matching_files(self, globs: List[str], prefix: Optional[str], logger: logging.Logger) -> Iterable[RemoteFile]:
+        return self._stream_reader.get_matching_files(globs, prefix, logger, get_start_after=self._get_start_after)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream_reader, name)
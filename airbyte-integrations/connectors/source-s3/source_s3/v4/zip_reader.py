@@ -1,9 +1,14 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 
+import codecs
 import io
+import re
 import struct
 import zipfile
-from typing import IO, List, Optional, Tuple, Union
+from collections import deque
+from concurrent.futures import Executor, Future
+from functools import partial
+from typing import IO, Callable, Deque, Dict, List, Optional, Tuple, Union
 
 from botocore.client import BaseClient
 
@@ -15,6 +20,10 @@ from source_s3.v4.config import Config
 BUFFER_SIZE_DEFAULT = 1024 * 1024
 MAX_BUFFER_SIZE_DEFAULT: int = 16 * BUFFER_SIZE_DEFAULT
 
+# Prefetch constants
+PREFETCH_BLOCK_SIZE_DEFAULT: int = 4 * BUFFER_SIZE_DEFAULT
+PREFETCH_BLOCKS_DEFAULT: int = 4
+
 
 class RemoteFileInsideArchive(RemoteFile):
     """
@@ -140,25 +149,172 @@ class ZipFileHandler:
             with zipfile.ZipFile(bytes_io, "r") as zf:
                 return zf.infolist(), central_dir_start
 
+    def open_member(
+        self,
+        file_info: RemoteFileInsideArchive,
+        executor: Executor,
+        block_size: int = PREFETCH_BLOCK_SIZE_DEFAULT,
+        prefetch_blocks: int = PREFETCH_BLOCKS_DEFAULT,
+    ) -> "RangePrefetchReader":
+        """
+        Open the byte range of a file inside the ZIP archive, from its local file header to the end of its compressed data.
+
+        :param file_info: Meta information about the file inside the archive.
+        :param executor: The executor running the ranged requests.
+        :param block_size: The size of the ranges fetched by a single request.
+        :param prefetch_blocks: The number of blocks fetched ahead of the current position.
+        :return: A stream over the byte range of the file, fetched ahead by concurrent ranged requests.
+        """
+        filename = file_info.uri.split("#")[0]
+        header = self._fetch_data_from_s3(filename, file_info.start_offset, DecompressedStream.LOCAL_FILE_HEADER_SIZE)
+        name_len, extra_len = struct.unpack_from("<HH", header, DecompressedStream.NAME_LENGTH_OFFSET)
+        end = file_info.start_offset + DecompressedStream.LOCAL_FILE_HEADER_SIZE + name_len + extra_len + file_info.compressed_size
+        return RangePrefetchReader(
+            partial(self._fetch_data_from_s3, filename), file_info.start_offset, end, executor, block_size, prefetch_blocks
+        )
+
+
+class RangePrefetchReader(io.IOBase):
+    """
+    A read-only stream over a byte range of a file stored in AWS S3.
+    The range is split into blocks, which are fetched by concurrent ranged requests a few blocks ahead of the current position,
+    so the download overlaps with the decompression and the parsing of the data already fetched.
+    Only the current block and the prefetched ones are kept in memory.
+    """
+
+    def __init__(
+        self,
+        fetch_range: Callable[[int, int], bytes],
+        start: int,
+        end: int,
+        executor: Executor,
+        block_size: int = PREFETCH_BLOCK_SIZE_DEFAULT,
+        prefetch_blocks: int = PREFETCH_BLOCKS_DEFAULT,
+    ):
+        """
+        Initialize a RangePrefetchReader.
+
+        :param fetch_range: A function fetching the given number of bytes from the given position of the file.
+        :param start: The starting byte position of the range.
+        :param end: The ending byte position of the range (exclusive).
+        :param executor: The executor running the ranged requests.
+        :param block_size: The size of the ranges fetched by a single request.
+        :param prefetch_blocks: The number of blocks fetched ahead of the current position.
+        """
+        self._fetch_range = fetch_range
+        self.start = start
+        self.end = end
+        self.position = start  # Current position in the file, the positions outside of the range are not readable
+        self._executor = executor
+        self.block_size = block_size
+        self.prefetch_blocks = prefetch_blocks
+        self._blocks: Dict[int, Future] = {}
+
+    def _get_block(self, index: int) -> bytes:
+        """
+        Return the block of the given index, schedule the fetching of the next blocks and release the ones behind.
+        """
+        for stale_index in [i for i in self._blocks if i < index or i > index + self.prefetch_blocks]:
+            self._blocks.pop(stale_index).cancel()
+
+        last_index = (self.end - self.start - 1) // self.block_size
+        for block_index in range(index, min(index + self.prefetch_blocks, last_index) + 1):
+            if block_index not in self._blocks:
+                block_start = self.start + block_index * self.block_size
+                self._blocks[block_index] = self._executor.submit(
+                    self._fetch_range, block_start, min(self.block_size, self.end - block_start)
+                )
+        return self._blocks[index].result()
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read a specified number of bytes from the stream.
+        """
+        if self.position < self.start or self.position >= self.end:
+            return b""
+        if size is None or size < 0:
+            size = self.end - self.position
+        size = min(size, self.end - self.position)
+
+        chunks = []
+        while size > 0:
+            index, block_offset = divmod(self.position - self.start, self.block_size)
+            chunk = self._get_block(index)[block_offset : block_offset + size]
+            if not chunk:
+                break
+            chunks.append(chunk)
+            self.position += len(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """
+        Seek to a specific position in the file, the prefetched blocks are kept until the next read.
+        """
+        if whence == io.SEEK_CUR:
+            offset = self.position + offset
+        elif whence == io.SEEK_END:
+            offset = self.end + offset
+        self.position = max(0, offset)
+        return self.position
+
+    def tell(self) -> int:
+        """
+        Return the current position in the file.
+        """
+        return self.position
+
+    def readable(self) -> bool:
+        """
+        Return if the stream is readable.
+        """
+        return True
+
+    def seekable(self) -> bool:
+        """
+        Return if the stream is seekable.
+        """
+        return True
+
+    def close(self):
+        """
+        Cancel the pending requests and release the fetched blocks.
+        """
+        for block in self._blocks.values():
+            block.cancel()
+        self._blocks.clear()
+        super().close()
+
 
 class DecompressedStream(io.IOBase):
     """
     A custom stream class that handles decompression of data from a given file object.
     This class supports seeking, reading, and other basic file operations on compressed data.
+    When an executor is given, the next chunk is decompressed in the background while the current one is consumed,
+    so the files inside the archive read at the same time are decompressed in parallel by the executor's workers.
     """
 
     LOCAL_FILE_HEADER_SIZE: int = 30
     NAME_LENGTH_OFFSET: int = 26
 
-    def __init__(self, file_obj: IO[bytes], file_info: RemoteFileInsideArchive, buffer_size: int = BUFFER_SIZE_DEFAULT):
+    def __init__(
+        self,
+        file_obj: IO[bytes],
+        file_info: RemoteFileInsideArchive,
+        buffer_size: int = BUFFER_SIZE_DEFAULT,
+        executor: Optional[Executor] = None,
+    ):
         """
         Initialize a DecompressedStream.
 
         :param file_obj: Underlying file-like object.
         :param file_info: Meta information about the file inside the archive.
         :param buffer_size: Size of the buffer for reading data.
+        :param executor: The executor decompressing the next chunk in the background (optional).
         """
         self._file = file_obj
+        self._executor = executor
+        self._pending_chunk: Optional[Future] = None
         self.file_start = self._calculate_actual_start(file_info.start_offset)
         self.compressed_size = file_info.compressed_size
         self.uncompressed_size = file_info.uncompressed_size
@@ -204,6 +360,39 @@ class DecompressedStream(io.IOBase):
             return chunk
         return self.decompressor.decompress(chunk)
 
+    def _decompress_next_chunk(self) -> Optional[bytes]:
+        """
+        Read and decompress the next chunk of the compressed data, None is returned at the end of the data.
+        """
+        max_read_size = min(self.buffer_size, self.compressed_size + self.file_start - self._file.tell())
+        if max_read_size <= 0:
+            return None
+        chunk = self._file.read(max_read_size)
+        if not chunk:
+            return None
+        return self._decompress_chunk(chunk)
+
+    def _take_next_chunk(self) -> Optional[bytes]:
+        """
+        Return the next decompressed chunk, and start decompressing the one after it in the background.
+        """
+        if self._executor is None:
+            return self._decompress_next_chunk()
+
+        pending_chunk, self._pending_chunk = self._pending_chunk, None
+        chunk = pending_chunk.result() if pending_chunk is not None else self._decompress_next_chunk()
+        if chunk is not None:
+            self._pending_chunk = self._executor.submit(self._decompress_next_chunk)
+        return chunk
+
+    def _drop_pending_chunk(self):
+        """
+        Drop the chunk decompressed in the background, waiting for it if it's running, as it uses the file and the decompressor.
+        """
+        if self._pending_chunk is not None and not self._pending_chunk.cancel():
+            self._pending_chunk.exception()
+        self._pending_chunk = None
+
     def read(self, size: int = -1) -> bytes:
         """
         Read a specified number of bytes from the stream.
@@ -221,15 +410,11 @@ class DecompressedStream(io.IOBase):
 
         data = self._buffer
         self._buffer = bytearray()
-        while len(data) < size and self._file.tell() - self.file_start < self.compressed_size:
-            max_read_size = min(self.buffer_size, self.compressed_size + self.file_start - self._file.tell())
-            chunk = self._file.read(max_read_size)
-
-            if not chunk:
+        while len(data) < size:
+            decompressed_data = self._take_next_chunk()
+            if decompressed_data is None:
                 break
 
-            decompressed_data = self._decompress_chunk(chunk)
-
             # Buffer excessive data for future reads
             if len(data) + len(decompressed_data) > size:
                 desired_length = size - len(data)
@@ -245,12 +430,12 @@ class DecompressedStream(io.IOBase):
         """
         Seek to a specific position in the uncompressed stream.
         """
-        if whence == io.SEEK_SET:
-            self._buffer = bytearray()
-        elif whence == io.SEEK_CUR:
+        if whence == io.SEEK_CUR:
             offset = self.position + offset
         elif whence == io.SEEK_END:
             offset = self.uncompressed_size + offset
+        self._buffer = bytearray()
+        self._drop_pending_chunk()
 
         # Ensure the offset is within the file's boundaries
         offset = max(0, min(offset, self.uncompressed_size))
@@ -265,7 +450,8 @@ class DecompressedStream(io.IOBase):
         # Read till desired offset
         while self.position < offset:
             read_size = min(self.buffer_size, offset - self.position)
-            self.read(read_size)
+            if not self.read(read_size):
+                break
 
         return self.position
 
@@ -291,6 +477,7 @@ class DecompressedStream(io.IOBase):
         """
         Close the stream and underlying file object.
         """
+        self._drop_pending_chunk()
         self._file.close()
 
 
@@ -298,20 +485,40 @@ class ZipContentReader:
     """
     A custom reader class that provides buffered reading capabilities on a decompressed stream.
     Supports reading lines, reading chunks, and iterating over the content.
+    The stream is read and decoded block by block, and the lines are split off the decoded blocks.
     """
 
-    def __init__(self, decompressed_stream: DecompressedStream, encoding: Optional[str] = None, buffer_size: int = BUFFER_SIZE_DEFAULT):
+    # A line ends with "\r\n", "\r" or "\n", the line endings are kept as they are.
+    # `str.splitlines` splits on the other Unicode line boundaries too, so the text containing them is split by the pattern.
+    LINE_PATTERN: "re.Pattern[str]" = re.compile(r"[^\r\n]*(?:\r\n|\r|\n)")
+    UNICODE_LINE_BOUNDARIES: "re.Pattern[str]" = re.compile("[\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+    def __init__(
+        self,
+        decompressed_stream: DecompressedStream,
+        encoding: Optional[str] = None,
+        buffer_size: int = BUFFER_SIZE_DEFAULT,
+        on_close: Optional[Callable[[], None]] = None,
+    ):
         """
         Initialize a ZipContentReader.
 
         :param decompressed_stream: A DecompressedStream object.
         :param encoding: Encoding to decode the bytes. If None, bytes are returned.
         :param buffer_size: Size of the buffer for reading data.
+        :param on_close: Called once, when the reader is closed (optional).
         """
         self.raw = decompressed_stream
+        self._on_close = on_close
         self.encoding = encoding
         self.buffer_size = buffer_size
-        self.buffer = bytearray()
+        self._empty: Union[str, bytes] = "" if encoding else b""
+        self._carriage_return: Union[str, bytes] = "\r" if encoding else b"\r"
+        self._line_feed: Union[str, bytes] = "\n" if encoding else b"\n"
+        self._decoder = codecs.getincrementaldecoder(encoding)() if encoding else None
+        self.buffer: Union[str, bytes] = self._empty  # Decoded data, which is not split into lines yet
+        self._lines: Deque[Union[str, bytes]] = deque()
+        self._eof = False
         self._closed = False
 
     def __iter__(self):
@@ -324,63 +531,117 @@ class ZipContentReader:
         """
         Iterate over the lines in the reader.
         """
+        if self._lines:
+            return self._lines.popleft()
         line = self.readline()
         if not line:
             raise StopIteration
         return line
 
+    def _read_block(self) -> Union[str, bytes]:
+        """
+        Read and decode the next block of the stream, an empty block is returned at the end of the stream.
+        """
+        if self._eof:
+            return self._empty
+        chunk = self.raw.read(self.buffer_size)
+        if not chunk:
+            self._eof = True
+        if self._decoder is None:
+            return bytes(chunk)
+        return self._decoder.decode(chunk, final=self._eof)
+
+    def _split_lines(self) -> bool:
+        """
+        Read the next block and split the complete lines off the buffered data.
+        Return False at the end of the stream, when the rest of the data is the last line.
+        """
+        block = self._read_block()
+        if not block and self._eof:
+            if self.buffer:
+                self._lines.append(self.buffer)
+                self.buffer = self._empty
+            return False
+
+        # the buffered data has no line ending, except for a trailing "\r" which can be the first half of a "\r\n"
+        search_start = max(len(self.buffer) - 1, 0)
+        data = self.buffer + block
+        end = len(data) - 1 if data.endswith(self._carriage_return) else len(data)
+        last_line_end = max(data.rfind(self._line_feed, search_start, end), data.rfind(self._carriage_return, search_start, end)) + 1
+        if not last_line_end:
+            self.buffer = data
+            return True
+        complete_lines = data[:last_line_end]
+        if self._decoder is not None and self.UNICODE_LINE_BOUNDARIES.search(complete_lines):
+            self._lines.extend(self.LINE_PATTERN.findall(complete_lines))
+        else:
+            self._lines.extend(complete_lines.splitlines(keepends=True))
+        self.buffer = data[last_line_end:]
+        return True
+
     def readline(self, limit: int = -1) -> Union[str, bytes]:
         """
         Read a single line from the stream.
         """
-        if limit != -1:
-            raise NotImplementedError("Limits other than -1 not implemented yet")
-
-        line = ""
-        while True:
-            char = self.read(1)
-            if not char:
+        while not self._lines and self._split_lines():
+            if limit >= 0 and len(self.buffer) >= limit:
                 break
 
-            line += char
-            if char in ["\n", "\r"]:
-                # Handling different types of newlines
-                next_char = self.read(1)
-                if char == "\r" and next_char == "\n":
-                    line += next_char
-                else:
-                    self.buffer = next_char.encode(self.encoding) + self.buffer
-                break
+        if self._lines:
+            line = self._lines.popleft()
+            if 0 <= limit < len(line):
+                line, rest = line[:limit], line[limit:]
+                self._lines.appendleft(rest)
+        else:
+            # the rest of the data is the last line, or the beginning of a line longer than the limit
+            size = len(self.buffer) if limit < 0 else limit
+            line, self.buffer = self.buffer[:size], self.buffer[size:]
         return line
 
     def read(self, size: int = -1) -> Union[str, bytes]:
         """
         Read a specified number of bytes/characters from the reader.
         """
-        while len(self.buffer) < size:
-            chunk = self.raw.read(self.buffer_size)
-            if not chunk:
-                break
-            self.buffer += chunk
+        if self._lines:
+            self.buffer = self._empty.join(self._lines) + self.buffer
+            self._lines.clear()
 
-        data = self.buffer[:size]
-        self.buffer = self.buffer[size:]
+        chunks = [self.buffer]
+        buffered_size = len(self.buffer)
+        while (size < 0 or buffered_size < size) and not self._eof:
+            block = self._read_block()
+            chunks.append(block)
+            buffered_size += len(block)
 
-        return data.decode(self.encoding) if self.encoding else bytes(data)
+        data = self._empty.join(chunks)
+        if size < 0:
+            size = len(data)
+        self.buffer = data[size:]
+        return data[:size]
 
     def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
         """
         Seek to a specific position in the decompressed stream.
         """
-        self.buffer = bytearray()
+        self.buffer = self._empty
+        self._lines.clear()
+        self._eof = False
+        if self._decoder is not None:
+            self._decoder.reset()
         return self.raw.seek(offset, whence)
 
     def close(self):
         """
         Close the reader and underlying decompressed stream.
         """
+        if self._closed:
+            return
         self._closed = True
-        self.raw.close()
+        try:
+            self.raw.close()
+        finally:
+            if self._on_close:
+                self._on_close()
 
     def tell(self) -> int:
         """
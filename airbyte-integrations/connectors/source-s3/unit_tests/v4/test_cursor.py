@@ -484,6 +484,63 @@ def test_get_adjusted_date_timestamp(cursor_datetime, file_datetime, expected_ad
     assert adjusted_datetime == expected_adjusted_datetime
 
 
+@pytest.mark.parametrize(
+    "input_state, expected_start_after",
+    [
+        pytest.param({}, None, id="no-state"),
+        pytest.param(
+            {
+                "history": {"a/2023-08-01/file.csv": "2023-08-01T00:00:00.000000Z", "a/2023-08-02/file.csv": "2023-08-01T00:00:00.000000Z"},
+                "_ab_source_file_last_modified": "2023-08-01T00:00:00.000000Z_a/2023-08-02/file.csv",
+            },
+            "a/2023-08-02/file.cs",
+            id="greatest-key-is-listed-again",
+        ),
+        pytest.param(
+            {
+                "history": {
+                    "a/2023-08-01/file.csv": "2023-08-02T00:00:00.000000Z",
+                    "a/2023-08-02.zip#file.csv": "2023-08-01T00:00:00.000000Z",
+                },
+                "_ab_source_file_last_modified": "2023-08-02T00:00:00.000000Z_a/2023-08-01/file.csv",
+            },
+            "a/2023-08-02.zi",
+            id="greatest-archive-is-listed-again",
+        ),
+        pytest.param(
+            {"history": {"2023-08-01": ["file1.txt"]}, "_ab_source_file_last_modified": "2023-08-01T00:00:00Z"},
+            None,
+            id="v3-migration-lists-all-keys",
+        ),
+    ],
+)
+def test_get_start_after(input_state, expected_start_after):
+    assert _init_cursor_with_state(input_state).get_start_after() == expected_start_after
+
+
+@pytest.mark.parametrize(
+    "prefix, expected_start_after",
+    [
+        pytest.param("a/", "a/2023-08-02/file.cs", id="greatest-key-of-prefix"),
+        pytest.param("b/", "b/2023-08-03/file.cs", id="greatest-key-of-other-prefix"),
+        pytest.param("c/", None, id="no-key-under-prefix"),
+        pytest.param("d/", None, id="greatest-key-is-prefix"),
+    ],
+)
+def test_get_start_after_of_prefix(prefix, expected_start_after):
+    history = {
+        "a/2023-08-01/file.csv": "2023-08-01T00:00:00.000000Z",
+        "a/2023-08-02/file.csv": "2023-08-02T00:00:00.000000Z",
+        "b/2023-08-03/file.csv": "2023-08-03T00:00:00.000000Z",
+        "d/": "2023-08-01T00:00:00.000000Z",
+    }
+    cursor = _init_cursor_with_state(
+        {"history": history, "_ab_source_file_last_modified": "2023-08-03T00:00:00.000000Z_b/2023-08-03/file.csv"}
+    )
+
+    assert cursor.get_start_after(prefix) == expected_start_after
+
+
 def _init_cursor_with_state(input_state, max_history_size: Optional[int] = None) -> Cursor:
     cursor = Cursor(stream_config=FileBasedStreamConfig(name="test", validation_policy="Emit Record", format=CsvFormat()))
     cursor.set_initial_state(input_state)
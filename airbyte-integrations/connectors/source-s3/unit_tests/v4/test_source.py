@@ -52,3 +52,23 @@ class SourceTest(unittest.TestCase):
     def test_when_spec_then_v3_nested_fields_are_not_required(self) -> None:
         spec = self._source.spec()
         assert not spec.connectionSpecification["properties"]["provider"]["required"]
+
+    def test_given_start_after_last_synced_key_when_get_files_then_list_after_greatest_synced_key(self) -> None:
+        source = SourceS3.create()
+        config = {
+            "bucket": "test",
+            "start_after_last_synced_key": True,
+            "streams": [{"name": "test", "globs": ["data/**"], "format": {"filetype": "csv"}, "validation_policy": "Emit Record"}],
+        }
+        stream = source.streams(config)[0]
+        stream.state = {
+            "history": {"data/2024-01-01/file.csv": "2024-01-01T00:00:00.000000Z"},
+            "_ab_source_file_last_modified": "2024-01-01T00:00:00.000000Z_data/2024-01-01/file.csv",
+        }
+
+        with patch.object(SourceS3StreamReader, "get_matching_files") as get_matching_files_mock:
+            stream.get_files()
+
+        get_start_after = get_matching_files_mock.call_args.kwargs["get_start_after"]
+        assert get_start_after("data/") == "data/2024-01-01/file.cs"
+        assert get_start_after("other/") is None
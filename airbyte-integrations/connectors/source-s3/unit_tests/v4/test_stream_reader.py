@@ -5,19 +5,27 @@
 
 import io
 import logging
+import threading
+import time
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
 from itertools import product
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set
 from unittest.mock import ANY, MagicMock, Mock, patch
 
 import pytest
+from botocore.exceptions import ClientError
 from botocore.stub import Stubber
 from moto import mock_sts
 from pydantic.v1 import AnyUrl
 from source_s3.v4.config import Config
+from source_s3.v4.cursor import Cursor
 from source_s3.v4.stream_reader import SourceS3StreamReader
+from source_s3.v4.zip_reader import RemoteFileInsideArchive
 
 from airbyte_cdk.sources.file_based.config.abstract_file_based_spec import AbstractFileBasedSpec
+from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.exceptions import ErrorListingFiles, FileBasedSourceError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import FileReadMode
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
@@ -214,6 +222,196 @@ def test_get_matching_files_exception():
     assert FileBasedSourceError.ERROR_LISTING_FILES.value in exc.value.args[0]
 
 
+class _FakeBucket:
+    """The listing of a bucket by S3, a page has at most `page_size` keys and folders"""
+
+    def __init__(self, keys: List[str], page_size: int = 1000, latency: float = 0):
+        self.keys = sorted(keys)
+        self.page_size = page_size
+        self.latency = latency
+
+    def list_objects_v2(self, Bucket, Prefix="", Delimiter=None, StartAfter="", ContinuationToken=None, **kwargs):
+        time.sleep(self.latency)
+        after = ContinuationToken or StartAfter
+        index = bisect_right(self.keys, after) if after else bisect_left(self.keys, Prefix)
+        contents, folders, next_token, last_listed = [], [], None, None
+        for key in self.keys[index:]:
+            if not key.startswith(Prefix):
+                break
+            folder = key[: key.index(Delimiter, len(Prefix)) + 1] if Delimiter and Delimiter in key[len(Prefix) :] else None
+            if folder and folders and folders[-1]["Prefix"] == folder:
+                continue
+            if len(contents) + len(folders) == self.page_size:
+                next_token = last_listed
+                break
+            if folder:
+                folders.append({"Prefix": folder})
+                # the next page starts after all the keys of the folder
+                last_listed = folder + "\U0010ffff"
+            else:
+                contents.append({"Key": key, "LastModified": datetime(2024, 1, 1)})
+                last_listed = key
+        response = {"KeyCount": len(contents) + len(folders), "IsTruncated": next_token is not None}
+        if contents:
+            response["Contents"] = contents
+        if folders:
+            response["CommonPrefixes"] = folders
+        if next_token:
+            response["NextContinuationToken"] = next_token
+        return response
+
+
+def _list_fake_bucket(
+    bucket: _FakeBucket, globs: List[str], get_start_after: Optional[Callable[[Optional[str]], Optional[str]]] = None
+) -> List[str]:
+    reader = SourceS3StreamReader()
+    reader.config = Config(bucket="test", aws_access_key_id="test", aws_secret_access_key="test", streams=[])
+    with patch.object(SourceS3StreamReader, "s3_client", new_callable=MagicMock) as mock_s3_client:
+        mock_s3_client.list_objects_v2 = MagicMock(side_effect=bucket.list_objects_v2)
+        uris = [remote_file.uri for remote_file in reader.get_matching_files(globs, None, logger, get_start_after=get_start_after)]
+        bucket.requests = mock_s3_client.list_objects_v2.call_count
+    return uris
+
+
+_KEYS = (
+    ["file.csv", "a.csv", "z.csv", "folder/"]
+    + [f"data/2024-01-{day:02}/file_{n}.csv" for day in range(1, 21) for n in range(7)]
+    + [f"data/2024-01-{day:02}.csv" for day in range(1, 21)]
+    + ["data/2024-01-05/nested/file.csv", "data/2024-01-05-other/file.csv", "other/file.jsonl"]
+)
+
+
+@pytest.mark.parametrize("page_size", [1, 3, 1000])
+@pytest.mark.parametrize(
+    "globs",
+    [
+        pytest.param(["**"], id="whole-bucket"),
+        pytest.param(["data/**/*.csv", "data/2024-01-05/*.csv", "other/*.jsonl"], id="nested-prefixes"),
+        pytest.param(["data/2024-01-1*/*.csv"], id="prefix-inside-folders"),
+    ],
+)
+def test_get_matching_files_lists_each_file_once(globs, page_size):
+    expected_uris = [
+        key
+        for key in _KEYS
+        if not key.endswith("/") and SourceS3StreamReader().file_matches_globs(RemoteFile(uri=key, last_modified=datetime.now()), globs)
+    ]
+
+    uris = _list_fake_bucket(_FakeBucket(_KEYS, page_size=page_size), globs)
+
+    assert sorted(uris) == sorted(expected_uris)
+
+
+@pytest.mark.parametrize("page_size", [1, 3, 1000])
+@pytest.mark.parametrize("start_after", ["data/2024-01-05/file_3.cs", "data/2024-01-05", "data/2024-01-20/file_6.csv", "a", "zz"])
+def test_get_matching_files_after_key(start_after, page_size):
+    uris = _list_fake_bucket(_FakeBucket(_KEYS, page_size=page_size), ["**"], get_start_after=lambda prefix: start_after)
+
+    assert sorted(uris) == sorted(key for key in _KEYS if key > start_after and not key.endswith("/"))
+
+
+@pytest.mark.parametrize("page_size", [1, 3, 1000])
+def test_get_matching_files_after_last_synced_key_of_each_prefix(page_size):
+    keys = [f"{prefix}/2024-01-{day:02}/file.csv" for prefix in ("a", "b") for day in range(1, 6)]
+    # the newest synced key is under b/, the new files under a/ are still listed
+    synced_keys = ["a/2024-01-01/file.csv", "a/2024-01-02/file.csv"] + [key for key in keys if key.startswith("b/")]
+    cursor = Cursor(stream_config=FileBasedStreamConfig(name="test", validation_policy="Emit Record", format=CsvFormat()))
+    cursor.set_initial_state(
+        {
+            "history": {key: "2024-01-01T00:00:00.000000Z" for key in synced_keys},
+            "_ab_source_file_last_modified": "2024-01-01T00:00:00.000000Z_b/2024-01-05/file.csv",
+        }
+    )
+
+    uris = _list_fake_bucket(_FakeBucket(keys, page_size=page_size), ["a/**", "b/**"], get_start_after=cursor.get_start_after)
+
+    assert sorted(uris) == [
+        "a/2024-01-02/file.csv",
+        "a/2024-01-03/file.csv",
+        "a/2024-01-04/file.csv",
+        "a/2024-01-05/file.csv",
+        "b/2024-01-05/file.csv",
+    ]
+
+
+def test_get_matching_files_error_of_listing_worker():
+    def list_objects_v2(Bucket, Delimiter=None, **kwargs):
+        if not Delimiter:
+            raise ClientError({"Error": {"Code": "AccessDenied", "Message": "Access Denied"}}, "ListObjectsV2")
+        return {"KeyCount": 1, "CommonPrefixes": [{"Prefix": "a/"}]}
+
+    reader = SourceS3StreamReader()
+    reader.config = Config(bucket="test", aws_access_key_id="test", aws_secret_access_key="test", streams=[])
+    with patch.object(SourceS3StreamReader, "s3_client", new_callable=MagicMock) as mock_s3_client:
+        mock_s3_client.list_objects_v2 = MagicMock(side_effect=list_objects_v2)
+        with pytest.raises(ErrorListingFiles):
+            list(reader.get_matching_files(["**"], None, logger))
+
+
+def test_get_matching_files_number_of_requests():
+    """List date partitioned keys sequentially, concurrently and after the last synced key"""
+    keys = [f"data/2024-{month:02}-{day:02}/file_{n}.csv" for month in range(1, 13) for day in range(1, 29) for n in range(10)]
+    results = {}
+    for name, workers, start_after in (
+        ("sequential", 1, None),
+        ("concurrent", 8, None),
+        ("after the last synced key", 8, "data/2024-12-28/file_0.cs"),
+    ):
+        bucket = _FakeBucket(keys, page_size=100)
+        with patch.object(SourceS3StreamReader, "LISTING_WORKERS", workers):
+            uris = _list_fake_bucket(bucket, ["data/**/*.csv"], get_start_after=lambda prefix: start_after)
+            results[name] = (len(uris), bucket.requests)
+
+    assert results["sequential"][0] == results["concurrent"][0] == len(keys)
+    # the folders are split between the workers, the last page of each share of folders takes a few more requests
+    assert results["concurrent"][1] < 2 * results["sequential"][1]
+    assert results["after the last synced key"] == (10, 2)
+
+
+def test_get_matching_files_stops_listing_workers_when_consumer_stops():
+    reader = SourceS3StreamReader()
+    reader.config = Config(bucket="test", aws_access_key_id="test", aws_secret_access_key="test", streams=[])
+    bucket = _FakeBucket(_KEYS, page_size=1)
+    with patch.object(SourceS3StreamReader, "s3_client", new_callable=MagicMock) as mock_s3_client:
+        mock_s3_client.list_objects_v2 = MagicMock(side_effect=bucket.list_objects_v2)
+        files = reader.get_matching_files(["**"], None, logger)
+        next(files)
+        files.close()
+
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith("s3-listing")]
+
+
+def test_archive_executors_are_shut_down_when_last_member_is_closed():
+    reader = SourceS3StreamReader()
+    reader.config = Config(bucket="test", aws_access_key_id="test", aws_secret_access_key="test", streams=[])
+    file = RemoteFileInsideArchive(
+        uri="archive.zip#file.csv",
+        last_modified=datetime.now(),
+        start_offset=0,
+        compressed_size=10,
+        uncompressed_size=10,
+        compression_method=0,
+    )
+    with (
+        patch.object(SourceS3StreamReader, "s3_client", new_callable=MagicMock),
+        patch("source_s3.v4.stream_reader.ZipFileHandler"),
+        patch("source_s3.v4.stream_reader.DecompressedStream"),
+    ):
+        first_member = reader.open_file(file, FileReadMode.READ, "utf-8", logger)
+        second_member = reader.open_file(file, FileReadMode.READ, "utf-8", logger)
+        download_executor, decompression_executor = reader._archive_executors
+
+        first_member.close()
+        assert reader._archive_executors is not None
+        assert not download_executor._shutdown
+
+        second_member.close()
+        second_member.close()
+        assert reader._archive_executors is None
+        assert download_executor._shutdown and decompression_executor._shutdown
+        assert reader._open_archive_members == 0
+
+
 def test_get_matching_files_without_config_raises_exception():
     with pytest.raises(ValueError):
         next(SourceS3StreamReader().get_matching_files([], None, logger))
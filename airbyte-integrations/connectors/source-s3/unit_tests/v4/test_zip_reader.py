@@ -4,10 +4,11 @@ import datetime
 import io
 import struct
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
-from source_s3.v4.zip_reader import DecompressedStream, RemoteFileInsideArchive, ZipContentReader, ZipFileHandler
+from source_s3.v4.zip_reader import DecompressedStream, RangePrefetchReader, RemoteFileInsideArchive, ZipContentReader, ZipFileHandler
 
 
 # Mocking the S3 client and config for testing
@@ -138,3 +139,104 @@ def test_zip_content_reader_iteration():
 
     # Verify the lines extracted match expected values
     assert lines == ["line1\n", "line2\r", "line3\r\n", "line4\n"]
+
+
+def _archive(members: dict, compression: int = zipfile.ZIP_DEFLATED) -> bytes:
+    with io.BytesIO() as archive:
+        with zipfile.ZipFile(archive, "w", compression=compression) as zf:
+            for name, content in members.items():
+                zf.writestr(name, content)
+        return archive.getvalue()
+
+
+def _s3_client(data: bytes) -> MagicMock:
+    def get_object(Bucket, Key, Range):
+        start, end = Range.removeprefix("bytes=").split("-")
+        return {"Body": io.BytesIO(data[int(start) : int(end) + 1 if end else None])}
+
+    s3_client = MagicMock()
+    s3_client.get_object.side_effect = get_object
+    return s3_client
+
+
+def _members(data: bytes):
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        for zip_member in zf.infolist():
+            yield RemoteFileInsideArchive(
+                uri=f"archive.zip#{zip_member.filename}",
+                last_modified=datetime.datetime(2022, 12, 28),
+                start_offset=zip_member.header_offset,
+                compressed_size=zip_member.compress_size,
+                uncompressed_size=zip_member.file_size,
+                compression_method=zip_member.compress_type,
+            )
+
+
+def test_range_prefetch_reader_fetches_blocks_ahead():
+    data = bytes(range(256)) * 4
+    fetched = []
+
+    def fetch_range(start, size):
+        fetched.append((start, size))
+        return data[start : start + size]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        reader = RangePrefetchReader(fetch_range, start=10, end=1000, executor=executor, block_size=100, prefetch_blocks=2)
+        assert reader.read(5) == data[10:15]
+        assert sorted(fetched) == [(10, 100), (110, 100), (210, 100)]
+        assert reader.read(150) == data[15:165]
+        # the blocks behind the current position are released
+        assert sorted(reader._blocks) == [1, 2, 3]
+
+        reader.seek(900)
+        assert reader.read() == data[900:1000]
+        assert reader.read() == b""
+        assert sorted(reader._blocks) == [9]
+        reader.close()
+        assert reader._blocks == {}
+
+
+@pytest.mark.parametrize("compression", [zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED])
+def test_zip_content_reader_reads_members_concurrently(mock_config, compression):
+    contents = {
+        "first.csv": "id,name\r\n" + "".join(f"{i},náme {i}\r\n" for i in range(5000)),
+        "second.jsonl": "".join(f'{{"id": {i}, "text": "ünïcode"}}\n' for i in range(5000)) + "last line without newline",
+        "third.txt": "a\rb\x0bvertical tab\u2028separator\r\nc\n\nd",
+    }
+    data = _archive(contents, compression)
+    handler = ZipFileHandler(_s3_client(data), mock_config)
+
+    def read_lines(file_info):
+        archive_range = handler.open_member(file_info, download_executor, block_size=1000, prefetch_blocks=3)
+        stream = DecompressedStream(archive_range, file_info, buffer_size=777, executor=decompression_executor)
+        with ZipContentReader(stream, encoding="utf-8", buffer_size=333) as reader:
+            return list(reader)
+
+    with ThreadPoolExecutor(max_workers=4) as download_executor, ThreadPoolExecutor(max_workers=2) as decompression_executor:
+        with ThreadPoolExecutor(max_workers=3) as readers:
+            results = list(readers.map(read_lines, _members(data)))
+
+    assert results == [io.StringIO(content, newline="").readlines() for content in contents.values()]
+
+
+def test_zip_content_reader_readline_limit_and_read():
+    mock_stream = MagicMock(spec=DecompressedStream)
+    mock_stream.read.side_effect = [b"first line\nsecond", b" line\nthird line", b""]
+    reader = ZipContentReader(mock_stream)
+
+    assert reader.readline(5) == b"first"
+    assert reader.readline() == b" line\n"
+    assert reader.read(6) == b"second"
+    assert reader.read() == b" line\nthird line"
+    assert reader.readline() == b""
+
+
+def test_zip_content_reader_decodes_characters_split_across_blocks():
+    mock_stream = MagicMock(spec=DecompressedStream)
+    content = "ünïcödé\r\nlïne\r".encode("utf-8")
+    # the multibyte characters and the "\r\n" are split between the blocks
+    mock_stream.read.side_effect = [content[i : i + 1] for i in range(len(content))] + [b""]
+    reader = ZipContentReader(mock_stream, encoding="utf-8", buffer_size=1)
+
+    assert reader.readline(3) == "ünï"
+    assert list(reader) == ["cödé\r\n", "lïne\r"]
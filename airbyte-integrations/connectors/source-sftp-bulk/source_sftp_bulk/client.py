@@ -5,7 +5,10 @@
 
 import io
 import logging
-from typing import Optional
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
 
 import backoff
 import paramiko
@@ -57,12 +60,7 @@ class SFTPClient:
             self.transport = paramiko.Transport((self.host, self.port))
             self.transport.use_compression(True)
             self.transport.connect(username=self.username, password=self.password, hostkey=None, pkey=self.key)
-            self._connection = paramiko.SFTPClient.from_transport(self.transport)
-
-            # get 'socket' to set the timeout
-            socket = self._connection.get_channel()
-            # set request timeout
-            socket.settimeout(self.timeout)
+            self._connection = self.open_session()
 
         except AuthenticationException as ex:
             raise AirbyteTracedException(
@@ -82,6 +80,55 @@ class SFTPClient:
                 if str(e) != "'NoneType' object has no attribute 'time'":
                     raise
 
+    def open_session(self) -> paramiko.SFTPClient:
+        """Open a new SFTP session over the SSH connection, the sessions run their requests independently"""
+        session = paramiko.SFTPClient.from_transport(self.transport)
+
+        # get 'socket' to set the timeout
+        socket = session.get_channel()
+        # set request timeout
+        socket.settimeout(self.timeout)
+        return session
+
     @property
     def sftp_connection(self) -> paramiko.SFTPClient:
         return self._connection
+
+
+class SFTPSessionPool:
+    """
+    SFTP sessions shared by the threads listing and reading the files, opened over the SSH connection of the client when needed.
+    A session is used by one thread at a time, a thread waits for a free session once `max_sessions` sessions are in use.
+    """
+
+    def __init__(self, client: SFTPClient, max_sessions: int):
+        self._client = client
+        self._available_sessions = threading.BoundedSemaphore(max_sessions)
+        self._idle_sessions: "queue.LifoQueue[paramiko.SFTPClient]" = queue.LifoQueue()
+        self._idle_sessions.put(client.sftp_connection)
+
+    def acquire(self) -> paramiko.SFTPClient:
+        self._available_sessions.acquire()
+        try:
+            return self._idle_sessions.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            return self._client.open_session()
+        except Exception:
+            self._available_sessions.release()
+            raise
+
+    def release(self, session: paramiko.SFTPClient) -> None:
+        # a session closed by the server is replaced by a new one
+        if not session.get_channel().closed:
+            self._idle_sessions.put(session)
+        self._available_sessions.release()
+
+    @contextmanager
+    def session(self) -> Iterator[paramiko.SFTPClient]:
+        session = self.acquire()
+        try:
+            yield session
+        finally:
+            self.release(session)
@@ -0,0 +1,74 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+
+import io
+from typing import Callable
+
+import paramiko
+
+
+class PipelinedSFTPReader(io.RawIOBase):
+    """
+    Raw reader of a remote file sending the read requests of a window of the file at once, instead of waiting for the
+    response of each request of 32 KB before sending the next one. The requests are pipelined by the prefetch of paramiko,
+    with up to `window` requests in flight. Only the current window is kept in memory.
+
+    `on_close` is called once the file is closed, e.g. to give the SFTP session of the file back.
+    """
+
+    def __init__(self, sftp_file: paramiko.SFTPFile, size: int, window: int, on_close: Callable[[], None]):
+        super().__init__()
+        self._file = sftp_file
+        self._size = size
+        self._window = window
+        self._on_close = on_close
+        self._position = 0
+        self._buffer = b""
+        self._buffer_start = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._size
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        self._position = offset
+        return offset
+
+    def readinto(self, buffer) -> int:
+        if self._position >= self._size:
+            return 0
+        offset_in_window = self._position - self._buffer_start
+        if not 0 <= offset_in_window < len(self._buffer):
+            self._read_window()
+            offset_in_window = 0
+        read_bytes = min(len(buffer), len(self._buffer) - offset_in_window)
+        buffer[:read_bytes] = self._buffer[offset_in_window : offset_in_window + read_bytes]
+        self._position += read_bytes
+        return read_bytes
+
+    def _read_window(self) -> None:
+        # readv splits the window in requests of at most MAX_REQUEST_SIZE bytes
+        window_size = min(self._window * paramiko.SFTPFile.MAX_REQUEST_SIZE, self._size - self._position)
+        self._buffer = b"".join(self._file.readv([(self._position, window_size)], max_concurrent_prefetch_requests=self._window))
+        self._buffer_start = self._position
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            self._file.close()
+        finally:
+            self._buffer = b""
+            super().close()
+            self._on_close()
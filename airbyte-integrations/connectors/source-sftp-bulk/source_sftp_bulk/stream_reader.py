@@ -2,12 +2,16 @@
 
 
 import datetime
+import io
 import logging
 import stat
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
 from io import IOBase
 from typing import Iterable, List, Optional, Tuple
 
+import paramiko
 import psutil
 from typing_extensions import override
 
@@ -17,16 +21,22 @@ from airbyte_cdk.sources.file_based.exceptions import FileSizeLimitError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
 from airbyte_cdk.sources.file_based.file_record_data import FileRecordData
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
-from source_sftp_bulk.client import SFTPClient
+from source_sftp_bulk.client import SFTPClient, SFTPSessionPool
+from source_sftp_bulk.pipelined_reader import PipelinedSFTPReader
 from source_sftp_bulk.spec import SourceSFTPBulkSpec
 
 
 class SourceSFTPBulkStreamReader(AbstractFileBasedStreamReader):
     FILE_SIZE_LIMIT = 1_500_000_000
+    # The SFTP sessions opened over the SSH connection to list the directories and read the files concurrently
+    MAX_SESSIONS = 4
+    # The read requests of 32 KB in flight for each file read or downloaded
+    READ_REQUEST_WINDOW = 64
 
     def __init__(self):
         super().__init__()
         self._sftp_client = None
+        self._sftp_pool = None
 
     @property
     def config(self) -> SourceSFTPBulkSpec:
@@ -62,35 +72,76 @@ class SourceSFTPBulkStreamReader(AbstractFileBasedStreamReader):
             )
         return self._sftp_client
 
+    @property
+    def sftp_pool(self) -> SFTPSessionPool:
+        if self._sftp_pool is None:
+            self._sftp_pool = SFTPSessionPool(self.sftp_client, max_sessions=self.MAX_SESSIONS)
+        return self._sftp_pool
+
     def get_matching_files(
         self,
         globs: List[str],
         prefix: Optional[str],
         logger: logging.Logger,
     ) -> Iterable[RemoteFile]:
-        directories = [self._config.folder_path or "/"]
-
-        # Iterate through directories and subdirectories
-        while directories:
-            current_dir = directories.pop()
-            try:
-                items = self.sftp_client.sftp_connection.listdir_attr(current_dir)
-            except Exception as e:
-                logger.warning(f"Failed to list files in directory: {e}")
-                continue
-
-            for item in items:
-                if item.st_mode and stat.S_ISDIR(item.st_mode):
-                    directories.append(f"{current_dir}/{item.filename}")
-                else:
-                    yield from self.filter_files_by_globs_and_start_date(
-                        [RemoteFile(uri=f"{current_dir}/{item.filename}", last_modified=datetime.datetime.fromtimestamp(item.st_mtime))],
-                        globs,
-                    )
+        """
+        The directories are listed concurrently, one SFTP session per directory being listed.
+        The files of a directory are returned once it is listed, in the order the directories are listed in.
+        """
+        pool = self.sftp_pool
+        executor = ThreadPoolExecutor(max_workers=self.MAX_SESSIONS, thread_name_prefix="sftp-listing")
+        pending = {executor.submit(self._list_directory, pool, self._config.folder_path or "/", logger)}
+
+        try:
+            # Iterate through directories and subdirectories
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for listed in done:
+                    current_dir, items = listed.result()
+                    for item in items:
+                        if item.st_mode and stat.S_ISDIR(item.st_mode):
+                            pending.add(executor.submit(self._list_directory, pool, f"{current_dir}/{item.filename}", logger))
+                        else:
+                            yield from self.filter_files_by_globs_and_start_date(
+                                [
+                                    RemoteFile(
+                                        uri=f"{current_dir}/{item.filename}", last_modified=datetime.datetime.fromtimestamp(item.st_mtime)
+                                    )
+                                ],
+                                globs,
+                            )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _list_directory(pool: SFTPSessionPool, directory: str, logger: logging.Logger) -> Tuple[str, List[paramiko.SFTPAttributes]]:
+        try:
+            with pool.session() as session:
+                return directory, session.listdir_attr(directory)
+        except Exception as e:
+            logger.warning(f"Failed to list files in directory: {e}")
+            return directory, []
 
     def open_file(self, file: RemoteFile, mode: FileReadMode, encoding: Optional[str], logger: logging.Logger) -> IOBase:
-        remote_file = self.sftp_client.sftp_connection.open(file.uri, mode=mode.value)
-        return remote_file
+        """
+        Read the file with its own SFTP session, given back to the pool once the file is closed.
+        The reads are pipelined, see PipelinedSFTPReader.
+        """
+        pool = self.sftp_pool
+        session = pool.acquire()
+        try:
+            remote_file = session.open(file.uri, mode="rb")
+            size = remote_file.stat().st_size
+        except Exception:
+            pool.release(session)
+            raise
+        reader = io.BufferedReader(
+            PipelinedSFTPReader(remote_file, size, self.READ_REQUEST_WINDOW, on_close=partial(pool.release, session))
+        )
+        if mode == FileReadMode.READ_BINARY:
+            return reader
+        # paramiko decoded the lines of the files opened in text mode as UTF-8
+        return io.TextIOWrapper(reader, encoding=encoding or "utf-8")
 
     @staticmethod
     def create_progress_handler(local_file_path: str, logger: logging.Logger):
@@ -168,7 +219,8 @@ class SourceSFTPBulkStreamReader(AbstractFileBasedStreamReader):
         progress_handler = self.create_progress_handler(local_file_path, logger)
         start_download_time = time.time()
         # Copy a remote file in remote path from the SFTP server to the local host as local path.
-        self.sftp_client.sftp_connection.get(file.uri, local_file_path, callback=progress_handler)
+        with self.sftp_pool.session() as session:
+            session.get(file.uri, local_file_path, callback=progress_handler, max_concurrent_prefetch_requests=self.READ_REQUEST_WINDOW)
 
         download_duration = time.time() - start_download_time
         logger.info(f"Time taken to download the file {file.uri}: {download_duration:,.2f} seconds.")
@@ -191,5 +243,6 @@ class SourceSFTPBulkStreamReader(AbstractFileBasedStreamReader):
         return file_record_data, file_reference
 
     def file_size(self, file: RemoteFile):
-        file_size = self.sftp_client.sftp_connection.stat(file.uri).st_size
+        with self.sftp_pool.session() as session:
+            file_size = session.stat(file.uri).st_size
         return file_size
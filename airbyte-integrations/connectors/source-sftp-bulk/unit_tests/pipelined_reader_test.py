@@ -0,0 +1,115 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+
+import io
+import time
+from unittest.mock import Mock
+
+import paramiko
+import pytest
+from source_sftp_bulk.pipelined_reader import PipelinedSFTPReader
+
+
+_CONTENT = "".join(f"{n},name {n},sécond column\n" for n in range(10_000)).encode()
+
+
+class FakeSFTPFile:
+    """Serves `readv` from memory, waiting `latency` seconds per call as a server would per round trip"""
+
+    MAX_REQUEST_SIZE = paramiko.SFTPFile.MAX_REQUEST_SIZE
+
+    def __init__(self, content: bytes, latency: float = 0):
+        self.content = content
+        self.latency = latency
+        self.readv_calls = []
+        self.closed = False
+
+    def readv(self, chunks, max_concurrent_prefetch_requests=None):
+        self.readv_calls.append((chunks, max_concurrent_prefetch_requests))
+        time.sleep(self.latency)
+        for offset, size in chunks:
+            yield from (
+                self.content[start : min(start + self.MAX_REQUEST_SIZE, offset + size)]
+                for start in range(offset, offset + size, self.MAX_REQUEST_SIZE)
+            )
+
+    def read(self, size):
+        # a plain read is one round trip per request of at most MAX_REQUEST_SIZE bytes
+        return b"".join(self.readv([(self.position, min(size, self.MAX_REQUEST_SIZE))]))
+
+    def close(self):
+        self.closed = True
+
+
+def _reader(sftp_file, window=4, on_close=None):
+    return io.BufferedReader(PipelinedSFTPReader(sftp_file, len(sftp_file.content), window, on_close or Mock()))
+
+
+def test_read_requests_a_window_at_once():
+    sftp_file = FakeSFTPFile(_CONTENT)
+
+    with _reader(sftp_file, window=4) as reader:
+        assert reader.read() == _CONTENT
+
+    window_size = 4 * FakeSFTPFile.MAX_REQUEST_SIZE
+    assert sftp_file.readv_calls == [
+        ([(offset, min(window_size, len(_CONTENT) - offset))], 4) for offset in range(0, len(_CONTENT), window_size)
+    ]
+
+
+def test_rewind_and_seek_read_again():
+    with _reader(FakeSFTPFile(_CONTENT)) as reader:
+        header = reader.readline()
+        reader.read()
+
+        assert reader.seek(0) == 0
+        assert reader.readline() == header
+        assert reader.seek(-5, io.SEEK_END) == len(_CONTENT) - 5
+        assert reader.read() == _CONTENT[-5:]
+        assert reader.read() == b""
+
+
+def test_text_mode_decodes_lines():
+    with io.TextIOWrapper(_reader(FakeSFTPFile(_CONTENT)), encoding="utf-8") as reader:
+        lines = list(reader)
+
+    assert lines == _CONTENT.decode().splitlines(keepends=True)
+
+
+def test_close_closes_the_file_and_calls_on_close_once():
+    sftp_file = FakeSFTPFile(_CONTENT)
+    on_close = Mock()
+    reader = _reader(sftp_file, on_close=on_close)
+
+    reader.close()
+    reader.close()
+
+    assert sftp_file.closed
+    on_close.assert_called_once_with()
+    with pytest.raises(ValueError):
+        reader.read()
+
+
+def test_pipelined_read_benchmark():
+    """Read a file of about 2 MB from a server answering each round trip in 5 ms"""
+    content = _CONTENT * 6
+    latency = 0.005
+
+    sftp_file = FakeSFTPFile(content, latency)
+    sftp_file.position = 0
+    started = time.perf_counter()
+    while sftp_file.position < len(content):
+        sftp_file.position += len(sftp_file.read(FakeSFTPFile.MAX_REQUEST_SIZE))
+    sequential_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    with _reader(FakeSFTPFile(content, latency), window=64) as reader:
+        assert reader.read() == content
+    pipelined_seconds = time.perf_counter() - started
+
+    print(
+        f"\nRead benchmark of a file of {len(content) / 1024 / 1024:.1f} MB with a latency of {latency * 1000:.0f} ms:\n"
+        f"one request at a time: {sequential_seconds:.2f} s\n"
+        f"pipelined requests: {pipelined_seconds:.2f} s"
+    )
+    assert pipelined_seconds * 5 < sequential_seconds
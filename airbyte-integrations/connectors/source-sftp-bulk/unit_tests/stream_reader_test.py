@@ -3,6 +3,9 @@
 
 import datetime
 import logging
+import stat
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import freezegun
@@ -10,6 +13,9 @@ import paramiko
 from source_sftp_bulk.spec import SourceSFTPBulkSpec
 from source_sftp_bulk.stream_reader import SourceSFTPBulkStreamReader
 
+from airbyte_cdk.sources.file_based.file_based_stream_reader import FileReadMode
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+
 
 logger = logging.Logger("")
 
@@ -40,3 +46,77 @@ def test_stream_reader_files_read_and_filter_by_date():
         assert len(files) == 1
         assert files[0].uri == "//sample_file_1.csv"
         assert files[0].last_modified == datetime.datetime(2024, 1, 1, 0, 0)
+
+
+def _reader_with_sessions(session_factory, max_sessions=2):
+    client = MagicMock()
+    client.sftp_connection = session_factory()
+    client.open_session.side_effect = session_factory
+    reader = SourceSFTPBulkStreamReader()
+    reader.MAX_SESSIONS = max_sessions
+    reader._sftp_client = client
+    reader.config = SourceSFTPBulkSpec(
+        host="localhost",
+        username="username",
+        credentials={"auth_type": "password", "password": "password"},
+        port=123,
+        streams=[],
+        folder_path="/files",
+        start_date="2024-01-01T00:00:00.000000Z",
+    )
+    return reader, client
+
+
+def test_stream_reader_lists_directories_concurrently():
+    directories = {
+        "/files": [MagicMock(filename=name, st_mode=stat.S_IFDIR, st_mtime=1704067200) for name in ("a", "b", "c")],
+        "/files/a": [MagicMock(filename="a.csv", st_mode=stat.S_IFREG, st_mtime=1704067200)],
+        "/files/b": [MagicMock(filename="b.csv", st_mode=stat.S_IFREG, st_mtime=1704067200)],
+        "/files/c": [MagicMock(filename="d", st_mode=stat.S_IFDIR, st_mtime=1704067200)],
+        "/files/c/d": [MagicMock(filename="d.csv", st_mode=stat.S_IFREG, st_mtime=1704067200)],
+    }
+    listing, max_listing = [0], [0]
+    lock = threading.Lock()
+
+    def listdir_attr(directory):
+        with lock:
+            listing[0] += 1
+            max_listing[0] = max(max_listing[0], listing[0])
+        time.sleep(0.05)
+        with lock:
+            listing[0] -= 1
+        if directory == "/files/b":
+            raise OSError("Permission denied")
+        return directories[directory]
+
+    def session():
+        return MagicMock(listdir_attr=MagicMock(side_effect=listdir_attr), **{"get_channel.return_value.closed": False})
+
+    reader, client = _reader_with_sessions(session)
+
+    files = list(reader.get_matching_files(globs=["**"], prefix=None, logger=logger))
+
+    assert sorted(file.uri for file in files) == ["/files/a/a.csv", "/files/c/d/d.csv"]
+    assert max_listing[0] == 2
+    assert client.open_session.call_count == 1
+
+
+def test_stream_reader_open_file_reads_with_a_pooled_session():
+    content = b"id,name\n1,first\n"
+    sessions = []
+
+    def session():
+        sftp_file = MagicMock(**{"stat.return_value.st_size": len(content), "readv.return_value": [content]})
+        sessions.append(MagicMock(**{"open.return_value": sftp_file, "get_channel.return_value.closed": False}))
+        return sessions[-1]
+
+    reader, client = _reader_with_sessions(session, max_sessions=1)
+    file = RemoteFile(uri="/files/a.csv", last_modified=datetime.datetime(2024, 1, 1))
+
+    for _ in range(2):
+        with reader.open_file(file, FileReadMode.READ, None, logger) as f:
+            assert f.readlines() == ["id,name\n", "1,first\n"]
+
+    assert len(sessions) == 1
+    sessions[0].open.assert_called_with("/files/a.csv", mode="rb")
+    sessions[0].open.return_value.readv.assert_called_with([(0, len(content))], max_concurrent_prefetch_requests=reader.READ_REQUEST_WINDOW)
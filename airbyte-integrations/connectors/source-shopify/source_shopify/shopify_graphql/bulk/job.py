@@ -20,6 +20,7 @@ from .exceptions import AirbyteTracedException, ShopifyBulkExceptions
 from .query import ShopifyBulkQuery, ShopifyBulkTemplates
 from .record import ShopifyBulkRecord
 from .retry import bulk_retry_on_exception
+from .scheduler import ShopifyBulkScheduledJob, ShopifyBulkScheduler
 from .status import ShopifyBulkJobStatus
 from .tools import END_OF_FILE, BulkTools
 
@@ -45,6 +46,10 @@ class ShopifyBulkManager:
 
     parent_stream_name: Optional[str] = None
     parent_stream_cursor: Optional[str] = None
+    # whether or not the job result should be parsed while downloading, instead of saving it to the file first
+    job_stream_results: bool = False
+    # the shop-level scheduler, which creates the BULK Jobs for the next streams ahead of time
+    scheduler: Optional[ShopifyBulkScheduler] = None
 
     # 10Mb chunk size to save the file
     _retrieve_chunk_size: Final[int] = 1024 * 1024 * 10
@@ -68,6 +73,8 @@ class ShopifyBulkManager:
     _job_state: str | None = field(init=False, default=None)  # this string is based on ShopifyBulkJobStatus
     # completed and saved Bulk Job result filename
     _job_result_filename: Optional[str] = field(init=False, default=None)
+    # completed Bulk Job result url, used when the results are streamed
+    _job_result_url: Optional[str] = field(init=False, default=None)
     # date-time when the Bulk Job was created on the server
     _job_created_at: Optional[str] = field(init=False, default=None)
     # indicated whether or not we manually force-cancel the current job
@@ -208,6 +215,8 @@ class ShopifyBulkManager:
         self._job_state = None
         # reset the filename to default
         self._job_result_filename = None
+        # reset the result url to default
+        self._job_result_url = None
         # setting self-cancelation to default
         self._job_self_canceled = False
         # set the running job message counter to default
@@ -288,12 +297,15 @@ class ShopifyBulkManager:
         else:
             LOGGER.info(pattern)
 
-    def _job_get_result(self, response: Optional[requests.Response] = None) -> Optional[str]:
+    def _job_get_result_url(self, response: Optional[requests.Response] = None) -> Optional[str]:
         parsed_response = response.json().get("data", {}).get("node", {}) if response else None
         # get `complete` or `partial` result from collected Bulk Job results
         full_result_url = parsed_response.get("url") if parsed_response else None
         partial_result_url = parsed_response.get("partialDataUrl") if parsed_response else None
-        job_result_url = full_result_url if full_result_url else partial_result_url
+        return full_result_url if full_result_url else partial_result_url
+
+    def _job_get_result(self, response: Optional[requests.Response] = None) -> Optional[str]:
+        job_result_url = self._job_get_result_url(response)
         if job_result_url:
             # save to local file using chunks to avoid OOM
             filename = self._tools.filename_from_url(job_result_url)
@@ -306,12 +318,32 @@ class ShopifyBulkManager:
                 file.write(END_OF_FILE.encode())
             return filename
 
+    def _job_stream_result(self) -> Iterable[str]:
+        """
+        Yields the lines of the Bulk Job result, while it's being downloaded.
+        Only the single chunk of `_retrieve_chunk_size` is kept in memory at a time.
+        """
+        _, response = self.http_client.send_request(http_method="GET", url=self._job_result_url, request_kwargs={"stream": True})
+        try:
+            response.raise_for_status()
+            for line in response.iter_lines(chunk_size=self._retrieve_chunk_size):
+                yield line.decode("utf-8")
+        finally:
+            response.close()
+
+    def _job_collect_result(self, response: Optional[requests.Response] = None) -> None:
+        if self.job_stream_results:
+            # the result is fetched later on, while the records are produced
+            self._job_result_url = self._job_get_result_url(response)
+        else:
+            self._job_result_filename = self._job_get_result(response)
+
     def _job_get_checkpointed_result(self, response: Optional[requests.Response]) -> None:
         if self._job_any_lines_collected or self._job_should_checkpoint:
             # set the flag to adjust the next slice from the checkpointed cursor value
             self._set_checkpointing()
             # fetch the collected records from CANCELED Job on checkpointing
-            self._job_result_filename = self._job_get_result(response)
+            self._job_collect_result(response)
 
     def _job_update_state(self, response: Optional[requests.Response] = None) -> None:
         if response:
@@ -327,8 +359,13 @@ class ShopifyBulkManager:
             else:
                 self._log_state()
 
+    def _job_poll_scheduled(self) -> None:
+        # while waiting for the current job, keep the jobs for the next streams running
+        if self.scheduler:
+            self.scheduler.poll()
+
     def _on_created_job(self, **kwargs) -> None:
-        pass
+        self._job_poll_scheduled()
 
     def _on_canceled_job(self, response: requests.Response) -> Optional[AirbyteTracedException]:
         if not self._job_self_canceled:
@@ -358,10 +395,11 @@ class ShopifyBulkManager:
         elif self._job_should_checkpoint:
             self._cancel_on_checkpointing()
         else:
+            self._job_poll_scheduled()
             sleep(self._job_check_interval)
 
     def _on_completed_job(self, response: Optional[requests.Response] = None) -> None:
-        self._job_result_filename = self._job_get_result(response)
+        self._job_collect_result(response)
 
     def _on_failed_job(self, response: requests.Response) -> AirbyteTracedException | None:
         if not self._supports_checkpointing:
@@ -475,12 +513,31 @@ class ShopifyBulkManager:
             else:
                 self._job_track_running()
 
-    @bulk_retry_on_exception()
-    def create_job(self, stream_slice: Mapping[str, str], filter_field: str) -> None:
+    def get_job_query(self, stream_slice: Optional[Mapping[str, str]], filter_field: Optional[str]) -> str:
         if stream_slice:
-            query = self.query.get(filter_field, stream_slice["start"], stream_slice["end"])
+            return self.query.get(filter_field, stream_slice["start"], stream_slice["end"])
         else:
-            query = self.query.get()
+            return self.query.get()
+
+    def get_slices_end(self) -> datetime:
+        """
+        The stream slices end now, or where they ended, when the BULK Job for the first slice was scheduled ahead of time.
+        """
+        slices_end = self.scheduler.get_slices_end(self.http_client.name) if self.scheduler else None
+        return slices_end or pdm.now()
+
+    def _job_adopt_scheduled(self, query: str) -> bool:
+        scheduled_job: Optional[ShopifyBulkScheduledJob] = self.scheduler.adopt(self.http_client.name, query) if self.scheduler else None
+        if scheduled_job:
+            self._job_process_scheduled(scheduled_job)
+            return True
+        return False
+
+    @bulk_retry_on_exception()
+    def create_job(self, stream_slice: Mapping[str, str], filter_field: str) -> None:
+        query = self.get_job_query(stream_slice, filter_field)
+        if self._job_adopt_scheduled(query):
+            return None
 
         _, response = self.http_client.send_request(
             http_method="POST",
@@ -517,6 +574,16 @@ class ShopifyBulkManager:
             self._job_state = ShopifyBulkJobStatus.CREATED.value
             LOGGER.info(f"Stream: `{self.http_client.name}`, the BULK Job: `{self._job_id}` is {ShopifyBulkJobStatus.CREATED.value}")
 
+    def _job_process_scheduled(self, scheduled_job: ShopifyBulkScheduledJob) -> None:
+        """
+        The Bulk Job created ahead of time by the `ShopifyBulkScheduler` is processed as if it was just created,
+        the status checks would pick up its actual status.
+        """
+        self._job_id = scheduled_job.job_id
+        self._job_created_at = scheduled_job.created_at
+        self._job_state = ShopifyBulkJobStatus.CREATED.value
+        LOGGER.info(f"Stream: `{self.http_client.name}`, the BULK Job: `{self._job_id}` is taken from the scheduled jobs.")
+
     def job_size_normalize(self, start: datetime, end: datetime) -> None:
         # adjust slice size when it's bigger than the loop point when it should end,
         # to preserve correct job size adjustments when this is the only job we need to run, based on STATE provided
@@ -527,6 +594,14 @@ class ShopifyBulkManager:
         step = self._job_size if self._job_size else self._job_size_min
         return slice_start.add(days=step)
 
+    def get_first_job_end(self, start: datetime, end: datetime) -> datetime:
+        """
+        Returns the end of the first slice, without normalizing the job size, like `job_size_normalize` does.
+        """
+        requested_slice_size = (end - start).total_days()
+        step = requested_slice_size if requested_slice_size < self._job_size else self._job_size
+        return start.add(days=step if step else self._job_size_min)
+
     def _adjust_slice_end(
         self, slice_end: datetime, checkpointed_cursor: Optional[str] = None, filter_checkpointed_cursor: Optional[str] = None
     ) -> datetime:
@@ -587,6 +662,9 @@ class ShopifyBulkManager:
         if self._job_result_filename:
             # produce records from saved bulk job result
             yield from self.record_producer.read_file(self._job_result_filename)
+        elif self._job_result_url:
+            # produce records while the bulk job result is downloaded
+            yield from self.record_producer.read_stream(self._job_stream_result())
         else:
             yield from []
 
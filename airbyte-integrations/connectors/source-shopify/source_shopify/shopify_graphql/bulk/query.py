@@ -6,6 +6,7 @@
 from abc import abstractmethod
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 from string import Template
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
 
@@ -36,6 +37,22 @@ class ShopifyBulkTemplates:
                 }"""
         ).substitute(job_id=bulk_job_id)
 
+    @staticmethod
+    def status_many(bulk_job_ids: List[str]) -> str:
+        return Template(
+            """query {
+                    nodes(ids: [$job_ids]) {
+                        ... on BulkOperation {
+                            id
+                            status
+                            errorCode
+                            createdAt
+                            objectCount
+                        }
+                    }
+                }"""
+        ).substitute(job_ids=", ".join(f'"{job_id}"' for job_id in bulk_job_ids))
+
     @staticmethod
     def cancel(bulk_job_id: str) -> str:
         return Template(
@@ -88,7 +105,7 @@ class ShopifyBulkQuery:
     def shop_id(self) -> int:
         return self.config.get("shop_id")
 
-    @property
+    @cached_property
     def tools(self) -> BulkTools:
         return BulkTools()
 
@@ -6,10 +6,10 @@
 from dataclasses import dataclass, field
 from functools import cached_property
 from io import TextIOWrapper
-from json import loads
 from os import remove
 from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Union
 
+from orjson import loads
 from source_shopify.utils import LOGGER
 
 from .exceptions import ShopifyBulkExceptions
@@ -48,10 +48,12 @@ class ShopifyBulkRecord:
         component_prepare(record): Prepares the given record by initializing a "record_components" dictionary.
         buffer_flush(): Flushes the buffer by processing each record in the buffer.
         record_compose(record): Processes a given record and yields buffered records if certain conditions are met.
-        process_line(jsonl_file): Processes a JSON Lines (jsonl) file and yields records.
+        process_line(jsonl_file): Processes JSON Lines (jsonl) content and yields records.
         record_resolve_id(record): Resolves and updates the 'id' field in the given record.
         produce_records(filename): Reads the JSONL content saved from `job.job_retrieve_result()` line-by-line to avoid OOM.
+        produce_records_from_lines(lines): Produces records from the JSONL lines, converting the field names to snake_case.
         read_file(filename, remove_file): Reads a file and produces records from it.
+        read_stream(lines): Produces records from the JSONL lines, while they are downloaded.
     """
 
     query: ShopifyBulkQuery
@@ -99,7 +101,7 @@ class ShopifyBulkRecord:
 
         record_type = record.get("__typename")
         if isinstance(types, list):
-            return any(record_type == t for t in types)
+            return record_type in types
         else:
             return record_type == types
 
@@ -269,12 +271,12 @@ class ShopifyBulkRecord:
         elif self.check_type(record, self.components):
             self.record_new_component(record)
 
-    def process_line(self, jsonl_file: TextIOWrapper) -> Iterable[MutableMapping[str, Any]]:
+    def process_line(self, jsonl_file: Union[TextIOWrapper, Iterable[str]]) -> Iterable[MutableMapping[str, Any]]:
         """
         Processes a JSON Lines (jsonl) file and yields records.
 
         Args:
-            jsonl_file (TextIOWrapper): A file-like object containing JSON Lines data.
+            jsonl_file (Union[TextIOWrapper, Iterable[str]]): A file-like object or an iterable of lines containing JSON Lines data.
 
         Yields:
             Iterable[MutableMapping[str, Any]]: An iterable of dictionaries representing the processed records.
@@ -334,12 +336,26 @@ class ShopifyBulkRecord:
         """
 
         with open(filename, "r") as jsonl_file:
-            # reset the counter
-            self.record_composed = 0
+            yield from self.produce_records_from_lines(jsonl_file)
 
-            for record in self.process_line(jsonl_file):
-                yield self.tools.fields_names_to_snake_case(record)
-                self.record_composed += 1
+    def produce_records_from_lines(self, lines: Union[TextIOWrapper, Iterable[str]]) -> Iterable[MutableMapping[str, Any]]:
+        """
+        Produce records from JSON Lines (jsonl) content, converting the field names to snake_case.
+        It also keeps track of the number of records processed.
+
+        Args:
+            lines (Union[TextIOWrapper, Iterable[str]]): The opened file or an iterable of lines to process.
+
+        Yields:
+            MutableMapping[str, Any]: A dictionary representing a processed record with field names in snake_case.
+        """
+
+        # reset the counter
+        self.record_composed = 0
+
+        for record in self.process_line(lines):
+            yield self.tools.fields_names_to_snake_case(record)
+            self.record_composed += 1
 
     def read_file(self, filename: str, remove_file: Optional[bool] = True) -> Iterable[Mapping[str, Any]]:
         """
@@ -380,3 +396,24 @@ class ShopifyBulkRecord:
                 except Exception as e:
                     LOGGER.info(f"Failed to remove the `tmp job result` file, the file doen't exist. Details: {repr(e)}.")
                     pass
+
+    def read_stream(self, lines: Iterable[str]) -> Iterable[Mapping[str, Any]]:
+        """
+        Read the JSONL content line-by-line, while it's being downloaded, without saving it to the file first.
+
+        Args:
+            lines (Iterable[str]): The lines of the BULK Job result, typically taken from `job._job_stream_result()`.
+
+        Yields:
+            Iterable[Mapping[str, Any]]: An iterable of records produced from the lines.
+
+        Raises:
+            ShopifyBulkExceptions.BulkRecordProduceError: If an error occurs while producing records from the lines.
+        """
+
+        try:
+            yield from self.produce_records_from_lines(lines)
+        except Exception as e:
+            raise ShopifyBulkExceptions.BulkRecordProduceError(
+                f"An error occured while producing records from BULK Job result. Trace: {repr(e)}.",
+            )
@@ -0,0 +1,205 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from time import time
+from typing import Any, Callable, Final, List, Mapping, MutableMapping, Optional, Tuple
+
+import pendulum as pdm
+from requests.exceptions import JSONDecodeError
+from source_shopify.utils import LOGGER
+
+from airbyte_cdk.sources.streams.http import HttpClient
+
+from .query import ShopifyBulkTemplates
+from .status import ShopifyBulkJobStatus
+
+
+@dataclass
+class ShopifyBulkScheduledJob:
+    """
+    The BULK Job created by the `ShopifyBulkScheduler` ahead of time, for the stream waiting for its turn.
+    """
+
+    stream_name: str
+    query: str
+    job_id: str
+    created_at: Optional[str] = None
+    # the end of the stream slices, when the job was scheduled
+    slices_end: Optional[datetime] = None
+    status: str = ShopifyBulkJobStatus.CREATED.value
+
+    @property
+    def is_running(self) -> bool:
+        return self.status in [
+            ShopifyBulkJobStatus.CREATED.value,
+            ShopifyBulkJobStatus.RUNNING.value,
+            ShopifyBulkJobStatus.CANCELING.value,
+        ]
+
+
+@dataclass
+class ShopifyBulkScheduler:
+    """
+    The shop-level BULK Job scheduler.
+
+    The streams selected for the sync are queued in the order of the sync, each with the factory of the BULK query
+    for its first slice, which takes the end of the stream slices. While the current stream waits for its own BULK Job, the scheduler keeps up to `max_concurrent_jobs`
+    BULK Jobs running for the shop (the current one included), by creating the jobs for the queued streams ahead of time.
+    All scheduled jobs are tracked with the single status query.
+
+    Once the queued stream starts, its slices end where they ended when the job was scheduled, so the first slice
+    is the same. Its `ShopifyBulkManager` adopts the scheduled job, if the BULK query is the same,
+    otherwise the scheduled job is canceled and the stream creates the job as usual.
+    """
+
+    http_client: HttpClient
+    base_url: str
+    max_concurrent_jobs: int = 1
+
+    # the min time between the status checks of the scheduled jobs
+    _poll_interval: Final[int] = 10
+    # the last time the scheduled jobs were checked
+    _last_poll_time: float = field(init=False, default=0.0)
+    # the streams waiting for their BULK Job to be created, in order of the sync
+    _queue: List[Tuple[str, Callable[[datetime], Optional[str]]]] = field(init=False, default_factory=list)
+    # the BULK Jobs created ahead of time, by the stream name
+    _jobs: MutableMapping[str, ShopifyBulkScheduledJob] = field(init=False, default_factory=dict)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_concurrent_jobs > 1
+
+    @property
+    def _running_jobs(self) -> List[ShopifyBulkScheduledJob]:
+        return [job for job in self._jobs.values() if job.is_running]
+
+    @property
+    def _has_free_slot(self) -> bool:
+        # the job of the stream that is currently synced always takes one slot
+        return len(self._running_jobs) + 1 < self.max_concurrent_jobs
+
+    def enqueue(self, stream_name: str, query_factory: Callable[[datetime], Optional[str]]) -> None:
+        """
+        Adds the stream to the queue. The `query_factory` returns the BULK query for the first slice of the stream,
+        with the stream slices ending at the given time, or `None`, if there is nothing to fetch.
+        """
+        self._queue.append((stream_name, query_factory))
+
+    def _send(self, query: str) -> Mapping[str, Any]:
+        _, response = self.http_client.send_request(
+            http_method="POST",
+            url=self.base_url,
+            json={"query": query},
+            request_kwargs={},
+        )
+        try:
+            return response.json()
+        except (Exception, JSONDecodeError) as e:
+            LOGGER.warning(f"The BULK Job Scheduler couldn't parse the `response`, status: {response.status_code}. Trace: {repr(e)}.")
+            return {}
+
+    def _submit(self, stream_name: str, query: str, slices_end: datetime) -> bool:
+        """
+        Creates the BULK Job for the queued stream.
+        Returns `False`, when the shop has reached the limit of concurrent BULK Jobs.
+        """
+        data = self._send(ShopifyBulkTemplates.prepare(query)).get("data", {}) or {}
+        bulk_response = data.get("bulkOperationRunQuery", {}) or {}
+        user_errors = bulk_response.get("userErrors", []) or []
+        if any(isinstance(error, dict) and error.get("code") == "OPERATION_IN_PROGRESS" for error in user_errors):
+            return False
+
+        job = bulk_response.get("bulkOperation") or {}
+        if job.get("id"):
+            self._jobs[stream_name] = ShopifyBulkScheduledJob(
+                stream_name=stream_name,
+                query=query,
+                job_id=job.get("id"),
+                created_at=job.get("createdAt"),
+                slices_end=slices_end,
+                status=job.get("status", ShopifyBulkJobStatus.CREATED.value),
+            )
+            LOGGER.info(f"Stream: `{stream_name}`, the BULK Job: `{job.get('id')}` is scheduled ahead of time.")
+        else:
+            # the stream will create the job on its own, when it starts
+            LOGGER.info(f"Stream: `{stream_name}`, the BULK Job couldn't be scheduled ahead of time. Errors: {user_errors}.")
+        return True
+
+    def _schedule_next(self) -> None:
+        while self._queue and self._has_free_slot:
+            stream_name, query_factory = self._queue[0]
+            slices_end = pdm.now()
+            try:
+                query = query_factory(slices_end)
+            except Exception as e:
+                LOGGER.info(f"Stream: `{stream_name}`, the BULK Job couldn't be scheduled ahead of time. Trace: {repr(e)}.")
+                query = None
+
+            if query and not self._submit(stream_name, query, slices_end):
+                # the concurrency limit has reached, try again on the next poll
+                break
+            self._queue.pop(0)
+
+    def _update_jobs_status(self) -> None:
+        running_jobs = {job.job_id: job for job in self._running_jobs}
+        if running_jobs:
+            data = self._send(ShopifyBulkTemplates.status_many(list(running_jobs.keys()))).get("data", {}) or {}
+            for node in data.get("nodes", []) or []:
+                job = running_jobs.get(node.get("id")) if node else None
+                if job and node.get("status"):
+                    job.status = node.get("status")
+
+    def poll(self) -> None:
+        """
+        Checks the status of the scheduled jobs with the single request and schedules the next jobs, if there are free slots.
+        """
+        if not self.enabled or time() - self._last_poll_time < self._poll_interval:
+            return
+        self._last_poll_time = time()
+        try:
+            self._update_jobs_status()
+            self._schedule_next()
+        except Exception as e:
+            # the scheduling ahead of time should never break the sync of the current stream
+            LOGGER.warning(f"The BULK Job Scheduler failed to check the scheduled jobs. Trace: {repr(e)}.")
+
+    def _cancel(self, job: ShopifyBulkScheduledJob) -> None:
+        if job.is_running:
+            LOGGER.info(f"Stream: `{job.stream_name}`, canceling the BULK Job: `{job.job_id}` scheduled ahead of time.")
+            self._send(ShopifyBulkTemplates.cancel(job.job_id))
+
+    def get_slices_end(self, stream_name: str) -> Optional[datetime]:
+        """
+        Returns the end of the stream slices, the BULK Job scheduled for the stream was created with.
+        """
+        job = self._jobs.get(stream_name)
+        return job.slices_end if job else None
+
+    def adopt(self, stream_name: str, query: str) -> Optional[ShopifyBulkScheduledJob]:
+        """
+        Returns the BULK Job scheduled for the stream, when it was created for the same BULK query.
+        The job scheduled for the different query is canceled, to free the slot.
+        """
+        # the stream has started, the scheduling is no longer needed
+        self._queue = [(name, factory) for name, factory in self._queue if name != stream_name]
+        job = self._jobs.pop(stream_name, None)
+        if job:
+            if job.query == query:
+                return job
+            self._cancel(job)
+        return None
+
+    def cancel_pending(self) -> None:
+        """
+        Cancels the scheduled jobs, that were never adopted by their streams.
+        """
+        self._queue.clear()
+        for job in list(self._jobs.values()):
+            try:
+                self._cancel(job)
+            except Exception as e:
+                LOGGER.info(f"Stream: `{job.stream_name}`, failed to cancel the BULK Job: `{job.job_id}`. Trace: {repr(e)}.")
+        self._jobs.clear()
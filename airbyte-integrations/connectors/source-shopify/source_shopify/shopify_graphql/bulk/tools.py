@@ -3,7 +3,9 @@
 #
 
 
+import logging
 import re
+from functools import lru_cache
 from typing import Any, Mapping, MutableMapping, Optional, Union
 from urllib.parse import parse_qsl, urlparse
 
@@ -16,8 +18,21 @@ from .exceptions import ShopifyBulkExceptions
 END_OF_FILE: str = "<end_of_file>"
 BULK_PARENT_KEY: str = "__parentId"
 
+LOGGER = logging.getLogger("airbyte")
+
 
 class BulkTools:
+    # the number of `camelCase` to `snake_case` field names translations kept, for all the entities of the BULK query
+    SNAKE_CASE_CACHE_SIZE: int = 4096
+    # the number of translated JSONL lines of the BULK Job result between the debug logs of the hits and misses of the cache
+    CACHE_LOG_INTERVAL: int = 100_000
+
+    def __init__(self) -> None:
+        # each line of the BULK Job result is a record or a nested entity (`__parentId`) of the same GraphQL query,
+        # so the field names of the query entities are translated once per stream
+        self.field_name_to_snake_case = lru_cache(maxsize=self.SNAKE_CASE_CACHE_SIZE)(self._field_name_to_snake_case)
+        self._translated_entities: int = 0
+
     @staticmethod
     def camel_to_snake(camel_case: str) -> str:
         snake_case = []
@@ -80,11 +95,25 @@ class BulkTools:
         target_value = record.get(field)
         return BulkTools._datetime_str_to_rfc3339(target_value) if target_value else record.get(field)
 
+    @staticmethod
+    def _field_name_to_snake_case(field_name: str) -> str:
+        # leaving the `__parent_id` relation in place
+        return field_name if field_name == BULK_PARENT_KEY else BulkTools.camel_to_snake(field_name)
+
     def fields_names_to_snake_case(self, dict_input: Optional[Mapping[str, Any]] = None) -> Optional[MutableMapping[str, Any]]:
         # transforming record field names from camel to snake case, leaving the `__parent_id` relation in place
         if dict_input:
             # the `None` type check is required, to properly handle nested missing entities (return None)
-            return {self.camel_to_snake(k) if dict_input and k != BULK_PARENT_KEY else k: v for k, v in dict_input.items()}
+            translate = self.field_name_to_snake_case
+            translated = {translate(k): v for k, v in dict_input.items()}
+            self._translated_entities += 1
+            if self._translated_entities % self.CACHE_LOG_INTERVAL == 0 and LOGGER.isEnabledFor(logging.DEBUG):
+                cache_info = translate.cache_info()
+                LOGGER.debug(
+                    f"Field names to snake_case after {self._translated_entities} entities: {cache_info.hits} hits, "
+                    f"{cache_info.misses} misses, {cache_info.currsize} names cached."
+                )
+            return translated
 
     @staticmethod
     def resolve_str_id(
@@ -93,6 +122,11 @@ class BulkTools:
         # some fields that expected to be resolved as ids, might not be populated for the particular `RECORD`,
         # we should return `None` to make the field `null` in the output as the result of the transformation.
         if str_input:
-            return output_type(re.search(r"\d+", str_input).group())
+            # the `gid://shopify/Order/19435458986123` ends with the numeric id, in the vast majority of cases
+            str_id = str_input.rpartition("/")[2]
+            # `isdigit` is also true for the digits like `²`, which `int` can't parse
+            if not (str_id.isascii() and str_id.isdigit()):
+                str_id = re.search(r"\d+", str_input).group()
+            return output_type(str_id)
         else:
             return None
@@ -4,17 +4,27 @@
 
 
 import logging
-from typing import Any, List, Mapping, Tuple
+from functools import partial
+from typing import Any, Iterator, List, Mapping, MutableMapping, Optional, Tuple
 
 from requests.exceptions import ConnectionError, RequestException, SSLError
 
-from airbyte_cdk.models import FailureType, SyncMode
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteStateMessage,
+    ConfiguredAirbyteCatalog,
+    FailureType,
+    SyncMode,
+)
 from airbyte_cdk.sources import AbstractSource
+from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.utils import AirbyteTracedException
 
 from .auth import MissingAccessTokenError, ShopifyAuthenticator
 from .scopes import ShopifyScopes
+from .shopify_graphql.bulk.scheduler import ShopifyBulkScheduler
+from .streams.base_streams import IncrementalShopifyGraphQlBulkStream
 from .streams.streams import (
     AbandonedCheckouts,
     Articles,
@@ -127,6 +137,12 @@ class ConnectionCheckTest:
 
 
 class SourceShopify(AbstractSource):
+    # the catalog, the state and the BULK Jobs concurrency of the current sync, used to schedule the BULK Jobs ahead of time
+    _configured_catalog: Optional[ConfiguredAirbyteCatalog] = None
+    _bulk_concurrent_jobs: int = 1
+    _bulk_state_manager: Optional[ConnectorStateManager] = None
+    _bulk_scheduler: Optional[ShopifyBulkScheduler] = None
+
     @property
     def continue_sync_on_stream_failure(self) -> bool:
         return True
@@ -159,6 +175,57 @@ class SourceShopify(AbstractSource):
         else:
             return TransactionsGraphql(config)
 
+    def read(
+        self,
+        logger: logging.Logger,
+        config: Mapping[str, Any],
+        catalog: ConfiguredAirbyteCatalog,
+        state: Optional[List[AirbyteStateMessage]] = None,
+    ) -> Iterator[AirbyteMessage]:
+        self._configured_catalog = catalog
+        self._bulk_concurrent_jobs = int(config.get("bulk_concurrent_jobs", 1))
+        self._bulk_state_manager = ConnectorStateManager(state=state)
+        self._bulk_scheduler = None
+        try:
+            yield from super().read(logger, config, catalog, state)
+        finally:
+            # cancel the BULK Jobs scheduled for the streams, that were never synced
+            if self._bulk_scheduler:
+                self._bulk_scheduler.cancel_pending()
+            self._configured_catalog = None
+            self._bulk_state_manager = None
+
+    def schedule_bulk_jobs(self, streams: List[Stream], state_manager: ConnectorStateManager) -> None:
+        """
+        Queues the selected BULK streams, in order of the sync, to have their BULK Jobs created ahead of time.
+        """
+        max_concurrent_jobs = self._bulk_concurrent_jobs
+        if max_concurrent_jobs <= 1 or not self._configured_catalog:
+            return
+
+        bulk_streams: MutableMapping[str, IncrementalShopifyGraphQlBulkStream] = {
+            stream.name: stream for stream in streams if isinstance(stream, IncrementalShopifyGraphQlBulkStream)
+        }
+        if not bulk_streams:
+            return
+
+        any_stream = next(iter(bulk_streams.values()))
+        self._bulk_scheduler = ShopifyBulkScheduler(
+            http_client=any_stream.bulk_http_client,
+            base_url=any_stream.job_manager.base_url,
+            max_concurrent_jobs=max_concurrent_jobs,
+        )
+        for configured_stream in self._configured_catalog.streams:
+            stream = bulk_streams.get(configured_stream.stream.name)
+            if stream:
+                stream_state = (
+                    state_manager.get_stream_state(stream.name, configured_stream.stream.namespace)
+                    if configured_stream.sync_mode == SyncMode.incremental
+                    else {}
+                )
+                self._bulk_scheduler.enqueue(stream.name, partial(stream.get_first_job_query, stream_state))
+                stream.job_manager.scheduler = self._bulk_scheduler
+
     def streams(self, config: Mapping[str, Any]) -> List[Stream]:
         """
         Mapping a input config of the user input configuration as defined in the connector spec.
@@ -220,6 +287,10 @@ class SourceShopify(AbstractSource):
             Countries(config=config, parent=ProfileLocationGroups(config)),
         ]
 
-        return [
+        permitted_stream_instances = [
             stream_instance for stream_instance in stream_instances if self.format_stream_name(stream_instance.name) in permitted_streams
         ]
+        if self._bulk_state_manager and not self._bulk_scheduler:
+            # the stream instances are created for the sync, the BULK Jobs are scheduled before the first stream is synced
+            self.schedule_bulk_jobs(permitted_stream_instances, self._bulk_state_manager)
+        return permitted_stream_instances
@@ -668,6 +668,8 @@ class IncrementalShopifyGraphQlBulkStream(IncrementalShopifyStream):
             job_checkpoint_interval=config.get("job_checkpoint_interval", 200_000),
             parent_stream_name=self.parent_stream_name,
             parent_stream_cursor=self.parent_stream_cursor,
+            # parse the job results while downloading, instead of saving them to the file first
+            job_stream_results=config.get("job_stream_results", False),
         )
 
     @property
@@ -819,11 +821,13 @@ class IncrementalShopifyGraphQlBulkStream(IncrementalShopifyStream):
             self.logger.info(f"Stream {self.name}, continue from checkpoint: `{self._checkpoint_cursor}`.")
 
     @stream_state_cache.cache_stream_state
-    def stream_slices(self, stream_state: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
+    def stream_slices(
+        self, stream_state: Optional[Mapping[str, Any]] = None, slices_end: Optional[datetime] = None, **kwargs
+    ) -> Iterable[Optional[Mapping[str, Any]]]:
         if self.filter_field:
             state = self._get_state_value(stream_state)
             start = pdm.parse(state)
-            end = pdm.now()
+            end = slices_end or self.job_manager.get_slices_end()
             while start < end:
                 self.job_manager.job_size_normalize(start, end)
                 slice_end = self.job_manager.get_adjusted_job_start(start)
@@ -835,6 +839,23 @@ class IncrementalShopifyGraphQlBulkStream(IncrementalShopifyStream):
             # for the streams that don't support filtering
             yield {}
 
+    def get_first_job_query(self, stream_state: Optional[Mapping[str, Any]], slices_end: datetime) -> Optional[str]:
+        """
+        Returns the BULK query for the first slice of the stream, used to create the BULK Job ahead of time.
+        The slice is built the same way `stream_slices` builds it, without caching the state or changing the job size.
+        """
+        if self.filter_field:
+            start = pdm.parse(self._get_state_value(stream_state))
+            if start >= slices_end:
+                return None
+            stream_slice = {
+                "start": start.to_rfc3339_string(),
+                "end": self.job_manager.get_first_job_end(start, slices_end).to_rfc3339_string(),
+            }
+        else:
+            stream_slice = {}
+        return self.job_manager.get_job_query(stream_slice, self.filter_field)
+
     def sort_output_asc(self, non_sorted_records: Iterable[Mapping[str, Any]] = None) -> Iterable[Mapping[str, Any]]:
         """
         Apply sorting for collected records, to guarantee the `ASC` output.
@@ -64,7 +64,7 @@ def catalog_with_streams():
         for name in names:
             streams.append(
                 ConfiguredAirbyteStream(
-                    stream=AirbyteStream(name=name, json_schema={"type": "object"}),
+                    stream=AirbyteStream(name=name, json_schema={"type": "object"}, supported_sync_modes=[SyncMode.full_refresh]),
                     sync_mode=SyncMode.full_refresh,
                     destination_sync_mode=DestinationSyncMode.overwrite,
                 )
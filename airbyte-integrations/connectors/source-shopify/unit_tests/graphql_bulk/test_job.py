@@ -4,6 +4,7 @@
 
 
 from os import remove
+from os.path import exists
 
 import pytest
 import requests
@@ -444,6 +445,53 @@ def test_bulk_stream_parse_response(
         assert test_records == expected_result
 
 
+@pytest.mark.parametrize(
+    "stream, json_content_example, expected",
+    [
+        (MetafieldOrders, "metafield_jsonl_content_example", "metafield_parse_response_expected_result"),
+        (Products, "products_jsonl_content_example", "products_response_expected_result"),
+        (ProductVariants, "product_variants_jsonl_content_example", "product_variants_response_expected_result"),
+    ],
+    ids=[
+        "MetafieldOrders",
+        "Products",
+        "ProductVariants",
+    ],
+)
+def test_bulk_stream_parse_response_with_streamed_results(
+    request,
+    requests_mock,
+    bulk_job_completed_response,
+    stream,
+    json_content_example,
+    expected,
+    auth_config,
+) -> None:
+    stream = stream({**auth_config, "job_stream_results": True})
+    test_result_url = bulk_job_completed_response.get("data").get("node").get("url")
+    requests_mock.post(stream.job_manager.base_url, json=bulk_job_completed_response)
+    requests_mock.get(test_result_url, text=request.getfixturevalue(json_content_example))
+    test_records = list(stream.read_records(SyncMode.full_refresh, stream_slice={}))
+    expected_result = request.getfixturevalue(expected)
+    if isinstance(expected_result, dict):
+        assert test_records == [expected_result]
+    elif isinstance(expected_result, list):
+        assert test_records == expected_result
+    # the result is never saved to the file
+    assert not exists("bulk-123456789.jsonl")
+    assert not stream.job_manager._job_result_url
+
+
+def test_job_read_stream_error(mocker, auth_config) -> None:
+    stream = MetafieldOrders(auth_config)
+    expected = "An error occured while producing records from BULK Job result"
+    mocker.patch("source_shopify.shopify_graphql.bulk.record.ShopifyBulkRecord.process_line", side_effect=Exception)
+    with pytest.raises(ShopifyBulkExceptions.BulkRecordProduceError) as error:
+        list(stream.job_manager.record_producer.read_stream(iter(['{"id": "gid://shopify/Metafield/1"}'])))
+
+    assert expected in repr(error.value)
+
+
 @pytest.mark.parametrize(
     "stream, stream_state, with_start_date, expected_start",
     [
@@ -0,0 +1,178 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+from functools import partial
+
+import pendulum as pdm
+import pytest
+from source_shopify.shopify_graphql.bulk.scheduler import ShopifyBulkScheduledJob, ShopifyBulkScheduler
+from source_shopify.shopify_graphql.bulk.status import ShopifyBulkJobStatus
+from source_shopify.streams.streams import MetafieldOrders, Products
+
+
+_ANY_QUERY = "{ products { edges { node { id } } } }"
+_OTHER_QUERY = "{ orders { edges { node { id } } } }"
+
+
+def _get_scheduler(stream, max_concurrent_jobs: int = 3) -> ShopifyBulkScheduler:
+    scheduler = ShopifyBulkScheduler(
+        http_client=stream.bulk_http_client,
+        base_url=stream.job_manager.base_url,
+        max_concurrent_jobs=max_concurrent_jobs,
+    )
+    scheduler._poll_interval = 0
+    return scheduler
+
+
+def test_scheduler_disabled_by_default(requests_mock, auth_config) -> None:
+    stream = Products(auth_config)
+    scheduler = _get_scheduler(stream, max_concurrent_jobs=1)
+    scheduler.enqueue("products", lambda slices_end: _ANY_QUERY)
+    scheduler.poll()
+
+    assert not scheduler.enabled
+    assert requests_mock.call_count == 0
+    assert not scheduler._jobs
+
+
+def test_scheduler_schedules_up_to_free_slots(requests_mock, bulk_successful_response, auth_config) -> None:
+    stream = Products(auth_config)
+    scheduler = _get_scheduler(stream, max_concurrent_jobs=2)
+    requests_mock.post(stream.job_manager.base_url, json=bulk_successful_response)
+    scheduler.enqueue("products", lambda slices_end: _ANY_QUERY)
+    scheduler.enqueue("metafield_orders", lambda slices_end: _OTHER_QUERY)
+    scheduler.poll()
+
+    # the single slot is always reserved for the stream that is currently synced
+    assert list(scheduler._jobs.keys()) == ["products"]
+    assert [name for name, _ in scheduler._queue] == ["metafield_orders"]
+    assert scheduler._jobs["products"].job_id == "gid://shopify/BulkOperation/4046733967549"
+
+
+def test_scheduler_stops_on_concurrency_limit(requests_mock, bulk_error_with_concurrent_job, auth_config) -> None:
+    stream = Products(auth_config)
+    scheduler = _get_scheduler(stream)
+    requests_mock.post(stream.job_manager.base_url, json=bulk_error_with_concurrent_job)
+    scheduler.enqueue("products", lambda slices_end: _ANY_QUERY)
+    scheduler.enqueue("metafield_orders", lambda slices_end: _OTHER_QUERY)
+    scheduler.poll()
+
+    assert requests_mock.call_count == 1
+    assert not scheduler._jobs
+    # the streams are kept in the queue, until the next poll
+    assert len(scheduler._queue) == 2
+
+
+def test_scheduler_updates_status_with_single_query(requests_mock, auth_config) -> None:
+    stream = Products(auth_config)
+    scheduler = _get_scheduler(stream)
+    scheduler._jobs = {
+        "products": ShopifyBulkScheduledJob("products", _ANY_QUERY, "gid://shopify/BulkOperation/1"),
+        "metafield_orders": ShopifyBulkScheduledJob("metafield_orders", _OTHER_QUERY, "gid://shopify/BulkOperation/2"),
+    }
+    requests_mock.post(
+        stream.job_manager.base_url,
+        json={
+            "data": {
+                "nodes": [
+                    {"id": "gid://shopify/BulkOperation/1", "status": "COMPLETED"},
+                    {"id": "gid://shopify/BulkOperation/2", "status": "RUNNING"},
+                ]
+            }
+        },
+    )
+    scheduler.poll()
+
+    assert requests_mock.call_count == 1
+    assert "nodes(ids:" in requests_mock.last_request.json()["query"]
+    assert scheduler._jobs["products"].status == ShopifyBulkJobStatus.COMPLETED.value
+    assert scheduler._jobs["metafield_orders"].status == ShopifyBulkJobStatus.RUNNING.value
+
+
+@pytest.mark.parametrize(
+    "query, expected_adopted, expected_cancel_calls",
+    [
+        (_ANY_QUERY, True, 0),
+        (_OTHER_QUERY, False, 1),
+    ],
+    ids=["same query is adopted", "different query is canceled"],
+)
+def test_scheduler_adopt(requests_mock, auth_config, query, expected_adopted, expected_cancel_calls) -> None:
+    stream = Products(auth_config)
+    scheduler = _get_scheduler(stream)
+    scheduler._jobs = {"products": ShopifyBulkScheduledJob("products", _ANY_QUERY, "gid://shopify/BulkOperation/1")}
+    requests_mock.post(stream.job_manager.base_url, json={"data": {}})
+
+    adopted = scheduler.adopt("products", query)
+
+    assert bool(adopted) == expected_adopted
+    assert requests_mock.call_count == expected_cancel_calls
+    assert not scheduler._jobs
+
+
+def test_job_manager_adopts_scheduled_job(requests_mock, auth_config) -> None:
+    stream = MetafieldOrders(auth_config)
+    scheduler = _get_scheduler(stream)
+    query = stream.job_manager.get_job_query({}, stream.filter_field)
+    scheduler._jobs = {stream.name: ShopifyBulkScheduledJob(stream.name, query, "gid://shopify/BulkOperation/1", "2024-01-01T00:00:00Z")}
+    stream.job_manager.scheduler = scheduler
+
+    stream.job_manager.create_job({}, stream.filter_field)
+
+    # no BULK Job creation request is sent
+    assert requests_mock.call_count == 0
+    assert stream.job_manager._job_id == "gid://shopify/BulkOperation/1"
+    assert stream.job_manager._job_state == ShopifyBulkJobStatus.CREATED.value
+
+
+def test_stream_adopts_job_scheduled_for_its_first_slice(requests_mock, bulk_successful_response, auth_config) -> None:
+    stream = MetafieldOrders(auth_config)
+    scheduler = _get_scheduler(stream)
+    requests_mock.post(stream.job_manager.base_url, json=bulk_successful_response)
+    scheduler.enqueue(stream.name, partial(stream.get_first_job_query, {}))
+    scheduler.poll()
+    stream.job_manager.scheduler = scheduler
+
+    # the stream starts later, but its first slice ends where it ended when the job was scheduled
+    first_slice = next(iter(stream.stream_slices(stream_state={})))
+    stream.job_manager.create_job(first_slice, stream.filter_field)
+
+    # only the BULK Job creation request of the scheduler is sent
+    assert requests_mock.call_count == 1
+    assert stream.job_manager._job_id == "gid://shopify/BulkOperation/4046733967549"
+
+
+def test_first_job_query_is_built_without_stream_slices(auth_config) -> None:
+    stream = MetafieldOrders(auth_config)
+    job_size = stream.job_manager._job_size
+    slices_end = pdm.parse("2023-01-03T00:00:00Z")
+
+    query = stream.get_first_job_query({}, slices_end)
+
+    # the job size of the stream isn't normalized to the requested period, before the stream is synced
+    assert stream.job_manager._job_size == job_size
+    first_slice = next(iter(stream.stream_slices(stream_state={}, slices_end=slices_end)))
+    assert query == stream.job_manager.get_job_query(first_slice, stream.filter_field)
+    # nothing to fetch, when the state is ahead of the slices end
+    assert stream.get_first_job_query({"updated_at": "2023-01-04T00:00:00Z"}, slices_end) is None
+
+
+def test_scheduler_cancel_pending(requests_mock, auth_config) -> None:
+    stream = Products(auth_config)
+    scheduler = _get_scheduler(stream)
+    scheduler.enqueue("orders", lambda slices_end: _OTHER_QUERY)
+    scheduler._jobs = {
+        "products": ShopifyBulkScheduledJob("products", _ANY_QUERY, "gid://shopify/BulkOperation/1"),
+        "metafield_orders": ShopifyBulkScheduledJob(
+            "metafield_orders", _OTHER_QUERY, "gid://shopify/BulkOperation/2", status=ShopifyBulkJobStatus.COMPLETED.value
+        ),
+    }
+    requests_mock.post(stream.job_manager.base_url, json={"data": {}})
+    scheduler.cancel_pending()
+
+    # only the running job is canceled
+    assert requests_mock.call_count == 1
+    assert "bulkOperationCancel" in requests_mock.last_request.json()["query"]
+    assert not scheduler._jobs
+    assert not scheduler._queue
@@ -1,6 +1,8 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 
 
+import logging
+
 import pytest
 from source_shopify.shopify_graphql.bulk.exceptions import ShopifyBulkExceptions
 from source_shopify.shopify_graphql.bulk.tools import BulkTools
@@ -52,3 +54,20 @@ def test_resolve_str_id() -> None:
     assert BulkTools.resolve_str_id("123") == 123
     assert BulkTools.resolve_str_id("456", str) == "456"
     assert BulkTools.resolve_str_id(None) is None
+    assert BulkTools.resolve_str_id("gid://shopify/Order/19435458986123") == 19435458986123
+    assert BulkTools.resolve_str_id("gid://shopify/Order/19435458986123?from=1") == 19435458986123
+    assert BulkTools.resolve_str_id("gid://shopify/Order/1²") == 1
+
+
+def test_fields_names_to_snake_case_translates_each_name_once(caplog) -> None:
+    tools = BulkTools()
+    tools.CACHE_LOG_INTERVAL = 3
+    entity = {"__parentId": "gid://shopify/Product/1", "createdAt": "2023-01-01", "totalPriceSet": {"amount": 1}}
+
+    with caplog.at_level(logging.DEBUG, logger="airbyte"):
+        translated = [tools.fields_names_to_snake_case(entity) for _ in range(3)]
+
+    assert translated[-1] == {"__parentId": "gid://shopify/Product/1", "created_at": "2023-01-01", "total_price_set": {"amount": 1}}
+    assert tools.field_name_to_snake_case.cache_info()[:2] == (6, 3)
+    assert "Field names to snake_case after 3 entities: 6 hits, 3 misses, 3 names cached." in caplog.messages
+    assert tools.fields_names_to_snake_case(None) is None
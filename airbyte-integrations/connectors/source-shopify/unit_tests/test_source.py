@@ -9,6 +9,7 @@ import pytest
 import requests
 from source_shopify.auth import ShopifyAuthenticator
 from source_shopify.source import ConnectionCheckTest, ShopifyScopes, SourceShopify
+from source_shopify.streams.base_streams import IncrementalShopifyGraphQlBulkStream
 from source_shopify.streams.streams import (
     AbandonedCheckouts,
     Articles,
@@ -354,6 +355,33 @@ def test_user_scopes_generate_full_list_of_streams(config, mocker):
     assert len(source.streams(config)) == expected_streams_number
 
 
+def test_read_schedules_bulk_jobs_for_the_synced_streams(config, mocker, catalog_with_streams):
+    source = SourceShopify()
+    config["bulk_concurrent_jobs"] = 3
+    mocker.patch.object(ShopifyAuthenticator, "get_auth_header", return_value={"X-Shopify-Access-Token": "test_toke"})
+    mocker.patch.object(ConnectionCheckTest, "get_shop_id", return_value=123456)
+    mocker.patch.object(ShopifyScopes, "get_user_scopes", return_value=["read_orders", "read_products"])
+
+    # the scheduled streams, as seen by the stream instances synced by the source
+    scheduled_streams = {}
+
+    def read_records(stream, *args, **kwargs):
+        scheduler = stream.job_manager.scheduler
+        scheduled_streams[stream.name] = [stream_name for stream_name, _ in scheduler._queue] if scheduler else None
+        return []
+
+    mocker.patch.object(IncrementalShopifyGraphQlBulkStream, "read_records", read_records)
+    list(source.read(logger=MagicMock(), config=config, catalog=catalog_with_streams(["products", "metafield_orders"])))
+
+    # the BULK Jobs of all synced streams are queued, in order of the sync, before the first stream is synced
+    assert scheduled_streams == {
+        "products": ["products", "metafield_orders"],
+        "metafield_orders": ["products", "metafield_orders"],
+    }
+    # the state of the sync isn't kept after the sync
+    assert not source._bulk_state_manager
+
+
 @pytest.mark.parametrize(
     "response_data, expected_token",
     [